@@ -0,0 +1,356 @@
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks import payloads
+
+# Paths served for every host; the /v2 prefix of the live API is optional
+AUCTIONS_PATH: str = '/skyblock/auctions'
+BAZAAR_PATH: str = '/skyblock/bazaar'
+PROFILE_PATH: str = '/skyblock/profile'
+PROFILES_PATH: str = '/skyblock/profiles'
+MOJANG_USERNAME_PATH: str = '/users/profiles/minecraft/'
+MOJANG_SESSION_PATH: str = '/session/minecraft/profile/'
+
+# Endpoints that need an API key and count against its rate limit
+KEYED_PATHS: frozenset[str] = frozenset({PROFILE_PATH, PROFILES_PATH})
+
+class MockServer:
+    """
+    A local stand-in for the Hypixel and Mojang APIs, serving generated data over HTTP.
+
+    Auctions, bazaar products, profiles and usernames come from the synthetic payload generators,
+    so every response is realistic in shape and size while costing no quota. The auction house
+    and the bazaar roll over every rollover seconds: lastUpdated advances and a new snapshot is
+    generated, as when the live API refreshes its caches.
+
+    To load-test failure handling, responses can be delayed, a share of requests can be answered
+    with a global throttle 429, and keyed endpoints enforce a per-key rate limit and send the
+    RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset headers of the live API.
+
+    Attributes:
+        auctions (int): The number of active auctions.
+        bazaar_products (int): The number of bazaar products.
+        coop_members (int): The number of members of every profile.
+        profiles_per_player (int): The number of profiles returned per player.
+        latency (float): Seconds every response is delayed by.
+        latency_jitter (float): Additional random delay of up to this many seconds.
+        throttle_rate (float): The share of requests, between 0 and 1, answered with a global throttle 429.
+        retry_after (float or None): The Retry-After of injected 429 responses, or None to send none.
+        rate_limit (int or None): Requests allowed per API key and window on keyed endpoints, or None for no limit.
+        rate_window (float): Seconds after which the request count of a key resets.
+        rollover (float): Seconds between two snapshots of the auction house and the bazaar.
+        api_keys (set of str or None): The valid API keys, or None to accept any key.
+        seed (int): The random seed of the generated data.
+        requests (Counter): The number of requests served by path.
+        throttled (int): The number of requests answered with 429.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, auctions: int = payloads.PRODUCTION_AUCTIONS, bazaar_products: int = payloads.PRODUCTION_BAZAAR_PRODUCTS, coop_members: int = 4, profiles_per_player: int = 2, latency: float = 0.0, latency_jitter: float = 0.0, throttle_rate: float = 0.0, retry_after: float | None = 1.0, rate_limit: int | None = None, rate_window: float = 300.0, rollover: float = 60.0, api_keys: Iterable[str] | None = None, seed: int = 0, clock: Callable[[], float] = time.time) -> None:
+        if rollover <= 0:
+            raise ValueError("rollover must be positive")
+        if not 0 <= throttle_rate <= 1:
+            raise ValueError("throttle_rate must be between 0 and 1")
+        self.auctions: int = auctions
+        self.bazaar_products: int = bazaar_products
+        self.coop_members: int = coop_members
+        self.profiles_per_player: int = profiles_per_player
+        self.latency: float = latency
+        self.latency_jitter: float = latency_jitter
+        self.throttle_rate: float = throttle_rate
+        self.retry_after: float | None = retry_after
+        self.rate_limit: int | None = rate_limit
+        self.rate_window: float = rate_window
+        self.rollover: float = rollover
+        self.api_keys: set[str] | None = set(api_keys) if api_keys is not None else None
+        self.seed: int = seed
+        self.requests: Counter = Counter()
+        self.throttled: int = 0
+        self._clock: Callable[[], float] = clock
+        self._started_at: float = clock()
+        self._rng: random.Random = random.Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._generation: int = -1
+        self._snapshot: dict[str, bytes] = {}
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server, without a trailing slash."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rewrite(self, url: str) -> str:
+        """
+        Point a live API URL at the server, e.g. to pass as a manager's api_endpoint.
+
+        Args:
+            url (str): A Hypixel or Mojang URL, such as ACTIVE_AUCTIONS_API_URL.
+
+        Returns:
+            str: The same path on the server.
+        """
+        parsed = urlparse(url)
+        return self.url + parsed.path + (f"?{parsed.query}" if parsed.query else '')
+
+    @contextmanager
+    def redirect_mojang(self) -> Iterator[None]:
+        """Send the username and UUID lookups of hypixel_api_lib.utils to the server while active."""
+        from hypixel_api_lib import utils
+        with patch.object(utils, 'MOJANG_API_URL', self.rewrite(utils.MOJANG_API_URL)), patch.object(utils, 'MOJANG_SESSION_API_URL', self.rewrite(utils.MOJANG_SESSION_API_URL)):
+            yield
+
+    def start(self) -> 'MockServer':
+        """
+        Serve requests from a background thread.
+
+        Returns:
+            MockServer: The server itself, for chaining.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='hypixel-mock-server', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve requests from the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self) -> 'MockServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def get_last_updated(self) -> int:
+        """
+        Get the lastUpdated timestamp of the current snapshot.
+
+        Returns:
+            int: The time the current snapshot started, in milliseconds since the epoch.
+        """
+        return self._get_generation_start(int((self._clock() - self._started_at) // self.rollover))
+
+    def _get_generation_start(self, generation: int) -> int:
+        """Get the time a snapshot generation started, in milliseconds since the epoch."""
+        return int((self._started_at + generation * self.rollover) * 1000)
+
+    def _get_snapshot(self) -> tuple[int, dict[str, bytes]]:
+        """Get the generation and encoded responses of the current snapshot, clearing outdated ones."""
+        generation = int((self._clock() - self._started_at) // self.rollover)
+        with self._lock:
+            if generation != self._generation:
+                self._generation = generation
+                self._snapshot = {}
+            return generation, self._snapshot
+
+    def _get_cached(self, name: str, build: Callable[[int], dict]) -> bytes:
+        generation, snapshot = self._get_snapshot()
+        body = snapshot.get(name)
+        if body is None:
+            # Concurrent first requests may both build; the snapshot is the same either way
+            data = build(self.seed + generation)
+            # Taken from the snapshot's generation, the clock may have rolled over while building
+            data['lastUpdated'] = self._get_generation_start(generation)
+            body = snapshot[name] = json.dumps(data).encode()
+        return body
+
+    def _check_rate_limit(self, key: str) -> tuple[bool, dict[str, str]]:
+        """Count a request of a key, returning whether it is allowed and the rate limit headers."""
+        if self.rate_limit is None:
+            return True, {}
+        now = self._clock()
+        with self._lock:
+            window_start, count = self._windows.get(key, (now, 0))
+            if now - window_start >= self.rate_window:
+                window_start, count = now, 0
+            allowed = count < self.rate_limit
+            if allowed:
+                count += 1
+            self._windows[key] = (window_start, count)
+        reset = max(int(window_start + self.rate_window - now + 0.999), 0)
+        headers = {'RateLimit-Limit': str(self.rate_limit), 'RateLimit-Remaining': str(self.rate_limit - count), 'RateLimit-Reset': str(reset)}
+        return allowed, headers
+
+    def handle(self, path: str, query: dict[str, str], headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """
+        Answer a request.
+
+        Args:
+            path (str): The request path.
+            query (dict of str to str): The query parameters.
+            headers (dict of str to str): The request headers.
+
+        Returns:
+            tuple of (int, dict, bytes): The status code, the response headers and the JSON body.
+        """
+        if path.startswith('/v2/'):
+            path = path[3:]
+        endpoint = path
+        for prefix in (MOJANG_USERNAME_PATH, MOJANG_SESSION_PATH):
+            if path.startswith(prefix):
+                endpoint = prefix
+        with self._lock:
+            self.requests[endpoint] += 1
+            injected_throttle = self.throttle_rate and self._rng.random() < self.throttle_rate
+            delay = self.latency + (self._rng.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if injected_throttle:
+            return self._throttle({}, {"success": False, "cause": "Global throttle in effect", "throttle": True, "global": True})
+
+        response_headers = {}
+        if endpoint in KEYED_PATHS:
+            key = query.get('key') or headers.get('API-Key')
+            if not key or (self.api_keys is not None and key not in self.api_keys):
+                return 403, {}, _encode({"success": False, "cause": "Invalid API key"})
+            allowed, response_headers = self._check_rate_limit(key)
+            if not allowed:
+                return self._throttle(response_headers, {"success": False, "cause": "Key throttle"})
+
+        if endpoint == AUCTIONS_PATH:
+            return self._auctions(query, response_headers)
+        if endpoint == BAZAAR_PATH:
+            return 200, response_headers, self._get_cached('bazaar', lambda seed: payloads.generate_bazaar(self.bazaar_products, seed=seed))
+        if endpoint == PROFILES_PATH:
+            return self._profiles(query, response_headers)
+        if endpoint == PROFILE_PATH:
+            return self._profile(query, response_headers)
+        if endpoint == MOJANG_USERNAME_PATH:
+            username = path[len(MOJANG_USERNAME_PATH):]
+            return 200, {}, _encode({"id": _player_uuid(username), "name": username})
+        if endpoint == MOJANG_SESSION_PATH:
+            uuid = path[len(MOJANG_SESSION_PATH):]
+            return 200, {}, _encode({"id": uuid, "name": f"Player_{uuid[:8]}"})
+        return 404, {}, _encode({"success": False, "cause": "Invalid endpoint"})
+
+    def _throttle(self, headers: dict[str, str], body: dict) -> tuple[int, dict[str, str], bytes]:
+        with self._lock:
+            self.throttled += 1
+        headers = dict(headers)
+        if self.retry_after is not None:
+            headers['Retry-After'] = str(self.retry_after)
+        return 429, headers, _encode(body)
+
+    def _auctions(self, query: dict[str, str], headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        try:
+            page = int(query.get('page', 0))
+        except ValueError:
+            return 422, headers, _encode({"success": False, "cause": "Invalid page"})
+        total_pages = max(-(-self.auctions // payloads.AUCTIONS_PER_PAGE), 1)
+        if not 0 <= page < total_pages:
+            return 404, headers, _encode({"success": False, "cause": "Page not found"})
+        size = min(payloads.AUCTIONS_PER_PAGE, self.auctions - page * payloads.AUCTIONS_PER_PAGE)
+        body = self._get_cached(f'auctions:{page}', lambda seed: payloads.generate_auctions_page(page, size, total_pages, seed))
+        return 200, headers, body
+
+    def _profiles(self, query: dict[str, str], headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        uuid = query.get('uuid')
+        if not uuid:
+            return 400, headers, _encode({"success": False, "cause": "Missing one or more fields [uuid]"})
+        profiles = []
+        for index in range(self.profiles_per_player):
+            profile_id = _profile_id(uuid, index)
+            profile = self._generate_profile(profile_id, uuid)
+            profile['selected'] = index == 0
+            profiles.append(profile)
+        return 200, headers, _encode({"success": True, "profiles": profiles})
+
+    def _profile(self, query: dict[str, str], headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        profile_id = query.get('profile')
+        if not profile_id:
+            return 400, headers, _encode({"success": False, "cause": "Missing one or more fields [profile]"})
+        return 200, headers, _encode({"success": True, "profile": self._generate_profile(profile_id)})
+
+    def _generate_profile(self, profile_id: str, player_uuid: str | None = None) -> dict:
+        profile = payloads.generate_profile(self.coop_members, self.seed + zlib.crc32(profile_id.encode()), player_uuid)['profile']
+        profile['profile_id'] = profile_id
+        return profile
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                query = {name: values[-1] for name, values in parse_qs(parsed.query).items()}
+                status, headers, body = server.handle(parsed.path, query, dict(self.headers))
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __str__(self) -> str:
+        return f"Mock Hypixel API at {self.url} ({sum(self.requests.values())} requests, {self.throttled} throttled)"
+
+def _encode(data: dict) -> bytes:
+    return json.dumps(data).encode()
+
+def _player_uuid(username: str) -> str:
+    """Derive a stable UUID from a username, like Mojang's offline-mode UUIDs."""
+    return hashlib.md5(f"OfflinePlayer:{username.lower()}".encode()).hexdigest()
+
+def _profile_id(player_uuid: str, index: int) -> str:
+    return hashlib.md5(f"{player_uuid}:{index}".encode()).hexdigest()
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve generated Hypixel and Mojang API responses locally.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--auctions', type=int, default=payloads.PRODUCTION_AUCTIONS, help="number of active auctions")
+    parser.add_argument('--bazaar-products', type=int, default=payloads.PRODUCTION_BAZAAR_PRODUCTS, help="number of bazaar products")
+    parser.add_argument('--coop-members', type=int, default=4, help="members of every profile")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds every response is delayed by")
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help="additional random delay in seconds")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="share of requests answered with a global throttle 429")
+    parser.add_argument('--rate-limit', type=int, help="requests per key and window on keyed endpoints")
+    parser.add_argument('--rate-window', type=float, default=300.0, help="seconds of a rate limit window")
+    parser.add_argument('--rollover', type=float, default=60.0, help="seconds between auction and bazaar snapshots")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = MockServer(args.host, args.port, args.auctions, args.bazaar_products, args.coop_members, latency=args.latency, latency_jitter=args.latency_jitter, throttle_rate=args.throttle_rate, rate_limit=args.rate_limit, rate_window=args.rate_window, rollover=args.rollover, seed=args.seed)
+    print(f"Serving the mock Hypixel API at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
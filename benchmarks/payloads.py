@@ -0,0 +1,281 @@
+import base64
+import random
+import zlib
+from hypixel_api_lib.ItemBytes import build_nbt, encode_item_bytes
+
+# Sizes of the live API at the time of writing
+PRODUCTION_AUCTIONS: int = 60000
+PRODUCTION_BAZAAR_PRODUCTS: int = 1400
+PRODUCTION_COOP_MEMBERS: int = 10
+
+# The Hypixel API returns at most 1000 auctions per page
+AUCTIONS_PER_PAGE: int = 1000
+
+BASE_TIMESTAMP: int = 1730000000000
+
+ITEM_NAMES: list[str] = [
+    "Hyperion", "Necron's Blade", "Aspect of the Dragons", "Terminator", "Juju Shortbow", "Livid Dagger",
+    "Giant's Sword", "Shadow Fury", "Enchanted Diamond", "Enchanted Iron Block", "Golden Dragon",
+    "Spirit Sceptre", "Wither Goggles", "Storm's Chestplate", "Flower of Truth", "Gemstone Gauntlet",
+]
+ITEM_MODIFIERS: list[str] = ["", "Heroic ", "Fabled ", "Withered ", "Ancient ", "Spiritual ", "Renowned "]
+TIERS: list[str] = ["COMMON", "UNCOMMON", "RARE", "EPIC", "LEGENDARY", "MYTHIC"]
+CATEGORIES: list[str] = ["weapon", "armor", "accessories", "consumables", "blocks", "misc"]
+BAZAAR_PREFIXES: list[str] = ["", "ENCHANTED_", "ENCHANTMENT_", "ENCHANTMENT_ULTIMATE_", "DUNGEON_"]
+BAZAAR_BASES: list[str] = [
+    "DIAMOND", "IRON", "GOLD", "COAL", "REDSTONE", "LAPIS", "EMERALD", "OBSIDIAN", "SUGAR_CANE", "CACTUS",
+    "WHEAT", "CARROT", "POTATO", "PUMPKIN", "MELON", "MUSHROOM", "COCOA", "NETHER_WART", "RAW_FISH", "SLIME",
+    "BLAZE_ROD", "ENDER_PEARL", "BONE", "STRING", "SPIDER_EYE", "GUNPOWDER", "SHARPNESS", "PROTECTION",
+]
+SKILLS: list[str] = ["FARMING", "MINING", "COMBAT", "FORAGING", "FISHING", "ENCHANTING", "ALCHEMY", "TAMING", "CARPENTRY", "RUNECRAFTING", "SOCIAL"]
+
+def _uuid(rng: random.Random) -> str:
+    return '%032x' % rng.getrandbits(128)
+
+def generate_item_tags(rng: random.Random, count: int) -> list[dict]:
+    """
+    Generate item compounds shaped like the NBT of SkyBlock items.
+
+    Args:
+        rng (random.Random): The random number generator.
+        count (int): The number of items.
+
+    Returns:
+        list of dict: The item compounds, one per slot.
+    """
+    tags = []
+    for slot in range(count):
+        name = rng.choice(ITEM_MODIFIERS) + rng.choice(ITEM_NAMES)
+        tags.append({
+            'id': 276,
+            'Count': rng.randint(1, 64),
+            'Damage': 0,
+            'tag': {
+                'display': {'Name': name, 'Lore': [f"Lore line {line} of {name}" for line in range(8)]},
+                'ExtraAttributes': {
+                    'id': name.upper().replace(' ', '_').replace("'", ''),
+                    'uuid': _uuid(rng),
+                    'hot_potato_count': rng.randint(0, 15),
+                    'rarity_upgrades': rng.randint(0, 1),
+                    'enchantments': {'sharpness': rng.randint(1, 7), 'critical': rng.randint(1, 7)},
+                    'timestamp': BASE_TIMESTAMP + slot,
+                },
+            },
+        })
+    return tags
+
+def generate_auction(rng: random.Random, index: int) -> dict:
+    """
+    Generate an active auction shaped like those of the auctions endpoint.
+
+    Args:
+        rng (random.Random): The random number generator.
+        index (int): The index of the auction, used to keep identifiers unique.
+
+    Returns:
+        dict: The auction data.
+    """
+    name = rng.choice(ITEM_MODIFIERS) + rng.choice(ITEM_NAMES)
+    starting_bid = rng.randint(1, 500) * 10000
+    bids = []
+    if rng.random() < 0.2:
+        amount = starting_bid
+        for number in range(rng.randint(1, 5)):
+            amount += rng.randint(1, 50) * 1000
+            bids.append({"auction_id": f"auction{index}", "bidder": _uuid(rng), "profile_id": _uuid(rng), "amount": amount, "timestamp": BASE_TIMESTAMP + number * 60000})
+    start = BASE_TIMESTAMP - rng.randint(0, 86400000)
+    return {
+        "uuid": f"auction{index}",
+        "auctioneer": _uuid(rng),
+        "profile_id": _uuid(rng),
+        "coop": [],
+        "start": start,
+        "end": start + 86400000,
+        "item_name": name,
+        "item_lore": "\n".join(f"§7Lore line {line} of {name}" for line in range(8)),
+        "extra": f"{name} {rng.choice(CATEGORIES)}",
+        "category": rng.choice(CATEGORIES),
+        "tier": rng.choice(TIERS),
+        "starting_bid": starting_bid,
+        "item_bytes": encode_item_bytes(generate_item_tags(rng, 1)),
+        "claimed": False,
+        "claimed_bidders": [],
+        "highest_bid_amount": bids[-1]["amount"] if bids else 0,
+        "bids": bids,
+    }
+
+def generate_auctions_page(page: int = 0, auctions: int = AUCTIONS_PER_PAGE, total_pages: int = 1, seed: int = 0) -> dict:
+    """
+    Generate a response of the auctions endpoint.
+
+    Args:
+        page (int, optional): The page number.
+        auctions (int, optional): The number of auctions on the page.
+        total_pages (int, optional): The total number of pages reported.
+        seed (int, optional): The random seed; the same arguments always give the same payload.
+
+    Returns:
+        dict: The decoded JSON response.
+    """
+    rng = random.Random(f"{seed}:auctions:{page}")
+    offset = page * AUCTIONS_PER_PAGE
+    return {
+        "success": True,
+        "page": page,
+        "totalPages": total_pages,
+        "totalAuctions": total_pages * auctions,
+        "lastUpdated": BASE_TIMESTAMP,
+        "auctions": [generate_auction(rng, offset + index) for index in range(auctions)],
+    }
+
+def generate_auction_pages(auctions: int = PRODUCTION_AUCTIONS, seed: int = 0) -> list[dict]:
+    """
+    Generate every page of an auction house of the given size.
+
+    Args:
+        auctions (int, optional): The total number of auctions.
+        seed (int, optional): The random seed.
+
+    Returns:
+        list of dict: The responses of every page, in page order.
+    """
+    total_pages = max(-(-auctions // AUCTIONS_PER_PAGE), 1)
+    pages = []
+    for page in range(total_pages):
+        size = min(AUCTIONS_PER_PAGE, auctions - page * AUCTIONS_PER_PAGE)
+        pages.append(generate_auctions_page(page, max(size, 0), total_pages, seed))
+    return pages
+
+def _order_summary(rng: random.Random, price: float, depth: int, step: float) -> list[dict]:
+    return [{"amount": rng.randint(1, 100000), "pricePerUnit": round(max(price + step * level, 0.1), 1), "orders": rng.randint(1, 20)} for level in range(depth)]
+
+def generate_bazaar(products: int = PRODUCTION_BAZAAR_PRODUCTS, depth: int = 30, seed: int = 0) -> dict:
+    """
+    Generate a response of the bazaar endpoint.
+
+    Product identifiers combine the prefixes and suffixes Bazaar.search_product normalizes.
+
+    Args:
+        products (int, optional): The number of products.
+        depth (int, optional): The number of orders in each buy and sell summary.
+        seed (int, optional): The random seed.
+
+    Returns:
+        dict: The decoded JSON response.
+    """
+    rng = random.Random(f"{seed}:bazaar")
+    data = {}
+    for index in range(products):
+        base = BAZAAR_BASES[index % len(BAZAAR_BASES)]
+        prefix = BAZAAR_PREFIXES[(index // len(BAZAAR_BASES)) % len(BAZAAR_PREFIXES)]
+        generation = index // (len(BAZAAR_BASES) * len(BAZAAR_PREFIXES))
+        product_id = f"{prefix}{base}_{generation}" if generation else f"{prefix}{base}"
+        sell_price = round(rng.uniform(1, 1000000), 1)
+        buy_price = round(sell_price * rng.uniform(1.0, 1.2), 1)
+        data[product_id] = {
+            "product_id": product_id,
+            "sell_summary": _order_summary(rng, sell_price, depth, -0.1),
+            "buy_summary": _order_summary(rng, buy_price, depth, 0.1),
+            "quick_status": {
+                "productId": product_id, "sellPrice": sell_price, "sellVolume": rng.randint(0, 10000000),
+                "sellMovingWeek": rng.randint(0, 100000000), "sellOrders": rng.randint(0, 1000),
+                "buyPrice": buy_price, "buyVolume": rng.randint(0, 10000000),
+                "buyMovingWeek": rng.randint(0, 100000000), "buyOrders": rng.randint(0, 1000),
+            },
+        }
+    return {"success": True, "lastUpdated": BASE_TIMESTAMP, "products": data}
+
+def generate_inventory(items: int = 36, seed: int = 0, compression: str = 'gzip') -> dict:
+    """
+    Generate inventory data as stored in profile members, base64 encoded and compressed NBT.
+
+    Args:
+        items (int, optional): The number of item slots.
+        seed (int, optional): The random seed.
+        compression (str, optional): 'gzip' as the API sends it, or 'zlib'.
+
+    Returns:
+        dict: The inventory data with its type and data.
+
+    Raises:
+        ValueError: If the compression is unknown.
+    """
+    rng = random.Random(f"{seed}:inventory:{items}")
+    tags = generate_item_tags(rng, items)
+    if compression == 'gzip':
+        return {"type": 0, "data": encode_item_bytes(tags)}
+    if compression == 'zlib':
+        return {"type": 0, "data": base64.b64encode(zlib.compress(build_nbt({'i': tags}))).decode('ascii')}
+    raise ValueError(f"Unknown compression '{compression}'")
+
+def generate_member(rng: random.Random, uuid: str, seed: int = 0) -> dict:
+    """
+    Generate the data of a profile member.
+
+    Args:
+        rng (random.Random): The random number generator.
+        uuid (str): The UUID of the member.
+        seed (int, optional): The random seed of the member's inventories.
+
+    Returns:
+        dict: The member data.
+    """
+    return {
+        "player_id": uuid,
+        "rift": {
+            "village_plaza": {"murder": {"step_index": 1}},
+            "lifetime_purchased_boundaries": ["VAMPIRE_FANGS"],
+            "inventory": {"inv_contents": generate_inventory(36, seed)},
+            "ender_chest_contents": generate_inventory(45, seed + 1),
+            "equipment_contents": generate_inventory(4, seed + 2),
+        },
+        "player_data": {
+            "experience": {f"SKILL_{skill}": rng.uniform(0, 55000000) for skill in SKILLS},
+            "perks": {"permanent_strength": rng.randint(0, 5)},
+            "visited_zones": ["village", "hub", "dwarven_mines"],
+            "death_count": rng.randint(0, 10000),
+        },
+        "currencies": {"coin_purse": rng.uniform(0, 1e9), "motes_purse": rng.uniform(0, 1e6), "essence": {"WITHER": {"current": rng.randint(0, 100000)}}},
+        "leveling": {"experience": rng.randint(0, 50000)},
+        "profile": {"first_join": BASE_TIMESTAMP, "bank_account": rng.uniform(0, 1e9)},
+        "collection": {base: rng.randint(0, 10000000) for base in BAZAAR_BASES},
+        "slayer": {"slayer_bosses": {boss: {"xp": rng.randint(0, 5000000), "claimed_levels": {"level_1": True}} for boss in ("zombie", "spider", "wolf", "enderman", "blaze", "vampire")}},
+        "inventory": {"inv_contents": generate_inventory(36, seed + 3)},
+        "fairy_soul": {"total_collected": rng.randint(0, 250)},
+    }
+
+def generate_profile(members: int = PRODUCTION_COOP_MEMBERS, seed: int = 0, player_uuid: str | None = None) -> dict:
+    """
+    Generate a response of the profile endpoint for a coop.
+
+    Args:
+        members (int, optional): The number of coop members.
+        seed (int, optional): The random seed.
+        player_uuid (str, optional): The UUID of the first member, random if not given.
+
+    Returns:
+        dict: The decoded JSON response.
+    """
+    rng = random.Random(f"{seed}:profile")
+    uuids = [_uuid(rng) for _ in range(members)]
+    if player_uuid is not None:
+        uuids[0] = player_uuid
+    transactions = [
+        {"timestamp": BASE_TIMESTAMP + index * 60000, "action": rng.choice(["DEPOSIT", "WITHDRAW"]), "initiator_name": f"Player{index % members}", "amount": rng.uniform(1, 1e7)}
+        for index in range(50)
+    ]
+    return {
+        "success": True,
+        "profile": {
+            "profile_id": _uuid(rng),
+            "members": {uuid: generate_member(rng, uuid, seed + index * 4) for index, uuid in enumerate(uuids)},
+            "community_upgrades": {
+                "currently_upgrading": None,
+                "upgrade_states": [{"upgrade": "island_size", "tier": tier, "started_ms": BASE_TIMESTAMP, "started_by": uuids[0], "claimed_ms": BASE_TIMESTAMP, "claimed_by": uuids[0], "fasttracked": False} for tier in range(1, 11)],
+            },
+            "banking": {"balance": rng.uniform(0, 1e9), "transactions": transactions},
+            "cute_name": "Mango",
+            "selected": True,
+            "game_mode": "Normal",
+        },
+    }
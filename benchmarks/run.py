@@ -0,0 +1,388 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Iterator
+from unittest.mock import patch
+
+from hypixel_api_lib.Auctions import ActiveAuctions, AuctionsPage
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.member.Rift import InventoryData
+from benchmarks import payloads
+
+RESULTS_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Payload sizes by scale; production matches the live API, smoke keeps a full run to seconds
+SCALES: dict[str, dict[str, int]] = {
+    'production': {'auctions': payloads.PRODUCTION_AUCTIONS, 'bazaar_products': payloads.PRODUCTION_BAZAAR_PRODUCTS, 'coop_members': payloads.PRODUCTION_COOP_MEMBERS, 'inventory_items': 45},
+    'smoke': {'auctions': 1500, 'bazaar_products': 100, 'coop_members': 2, 'inventory_items': 9},
+}
+
+class Benchmark:
+    """
+    A named operation to time, built from the payloads of a scale.
+
+    Attributes:
+        name (str): The unique name of the benchmark.
+        setup (callable): Takes the scale's sizes and returns the operation and the number of
+            items it processes per call.
+        description (str): What the operation does.
+    """
+
+    def __init__(self, name: str, setup: Callable[[dict[str, int]], tuple[Callable[[], Any], int]], description: str) -> None:
+        self.name: str = name
+        self.setup: Callable[[dict[str, int]], tuple[Callable[[], Any], int]] = setup
+        self.description: str = description
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.description}"
+
+BENCHMARKS: list[Benchmark] = []
+
+def benchmark(name: str, description: str) -> Callable:
+    """Register a setup function as a benchmark."""
+    def register(setup: Callable) -> Callable:
+        BENCHMARKS.append(Benchmark(name, setup, description))
+        return setup
+    return register
+
+class _StaticResponse:
+    status_code = 200
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self._data
+
+class _EncodedResponse(_StaticResponse):
+    def __init__(self, data: dict) -> None:
+        super().__init__(data)
+        self.content: bytes = json.dumps(data).encode()
+
+class _StaticTransport:
+    """Answers every request with the same payload, so managers load without the network."""
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def get(self, url: str, params: dict | None = None) -> _StaticResponse:
+        return _StaticResponse(self._data)
+
+class _PagesTransport:
+    """Answers each auctions page request with its pre-encoded body."""
+
+    def __init__(self, pages: list[dict]) -> None:
+        self._pages = [_EncodedResponse(page) for page in pages]
+
+    def get(self, url: str, params: dict | None = None) -> _EncodedResponse:
+        return self._pages[params['page']]
+
+@contextmanager
+def offline() -> Iterator[None]:
+    """Answer the Mojang username lookups of profile members without the network."""
+    with patch('hypixel_api_lib.member.ProfileMember.get_username_from_uuid', side_effect=lambda uuid: f"Player_{uuid[:8]}"):
+        yield
+
+def _load_auctions(sizes: dict[str, int]) -> ActiveAuctions:
+    pages = payloads.generate_auction_pages(sizes['auctions'])
+    auctions = ActiveAuctions()
+    auctions.all_auctions = [auction for page in pages for auction in AuctionsPage(page).auctions]
+    return auctions
+
+@benchmark('auctions_page_parse', "Build an AuctionsPage from a full page of 1000 auctions")
+def _auctions_page_parse(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    page = payloads.generate_auctions_page(auctions=min(sizes['auctions'], payloads.AUCTIONS_PER_PAGE))
+    return (lambda: AuctionsPage(page)), len(page['auctions'])
+
+@benchmark('auctions_parse_all', "Build the AuctionsPage of every page of the auction house")
+def _auctions_parse_all(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    pages = payloads.generate_auction_pages(sizes['auctions'])
+    return (lambda: [AuctionsPage(page) for page in pages]), sizes['auctions']
+
+@benchmark('auctions_parse_processes', "Parse every page into columns in a process pool and merge them")
+def _auctions_parse_processes(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    transport = _PagesTransport(payloads.generate_auction_pages(sizes['auctions']))
+    return (lambda: ActiveAuctions(transport=transport).get_all_auctions(processes=os.cpu_count())), sizes['auctions']
+
+@benchmark('search_auctions_filter', "Filter every auction by item name and price range")
+def _search_auctions_filter(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    auctions = _load_auctions(sizes)
+    return (lambda: auctions.search_auctions(item_name="hyperion", min_price=100000, max_price=3000000)), sizes['auctions']
+
+@benchmark('search_auctions_sorted', "Filter by item name and sort every match by price")
+def _search_auctions_sorted(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    auctions = _load_auctions(sizes)
+    return (lambda: auctions.search_auctions(item_name="hyperion", sort_by_price=True)), sizes['auctions']
+
+@benchmark('search_auctions_top', "Select the 50 cheapest auctions of the whole auction house")
+def _search_auctions_top(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    auctions = _load_auctions(sizes)
+    return (lambda: auctions.search_auctions(sort_by_price=True, limit=50)), sizes['auctions']
+
+@benchmark('bazaar_load', "Build every BazaarProduct and the normalized search index")
+def _bazaar_load(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    transport = _StaticTransport(payloads.generate_bazaar(sizes['bazaar_products']))
+    return (lambda: Bazaar(transport=transport)), sizes['bazaar_products']
+
+# Exact names, names missing a prefix or suffix, and misspellings that reach the fuzzy search
+BAZAAR_SEARCH_TERMS: list[str] = ["diamond", "Enchanted Diamond", "sharpness", "ultimate protection", "enchanted sugar cane", "nether wort", "enchnted diamnd", "blaze rdo"]
+
+@benchmark('bazaar_search_product', "Search products by exact, partial and misspelled names")
+def _bazaar_search_product(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    bazaar = Bazaar(transport=_StaticTransport(payloads.generate_bazaar(sizes['bazaar_products'])))
+    return (lambda: [bazaar.search_product(term) for term in BAZAAR_SEARCH_TERMS]), len(BAZAAR_SEARCH_TERMS)
+
+@benchmark('profile_build', "Build a SkyBlockProfile of a full coop")
+def _profile_build(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    profile = payloads.generate_profile(sizes['coop_members'])['profile']
+    return (lambda: SkyBlockProfile(profile)), sizes['coop_members']
+
+@benchmark('inventory_decode', "Decode gzip compressed Rift inventory data")
+def _inventory_decode(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    inventory = payloads.generate_inventory(sizes['inventory_items'])
+    return (lambda: InventoryData(inventory)), sizes['inventory_items']
+
+@benchmark('inventory_decode_zlib', "Decode zlib compressed Rift inventory data")
+def _inventory_decode_zlib(sizes: dict[str, int]) -> tuple[Callable[[], Any], int]:
+    inventory = payloads.generate_inventory(sizes['inventory_items'], compression='zlib')
+    return (lambda: InventoryData(inventory)), sizes['inventory_items']
+
+def measure(operation: Callable[[], Any], min_time: float = 1.0, repeat: int = 5) -> dict[str, Any]:
+    """
+    Time an operation and measure its peak memory.
+
+    Like timeit, the number of calls per round is calibrated so that each round takes at least
+    min_time / repeat seconds, and the garbage collector is paused while timing. Peak memory is
+    measured with tracemalloc on a separate call, so tracing does not slow down the timed rounds.
+
+    Args:
+        operation (callable): The operation to time.
+        min_time (float, optional): The total time to spend on the timed rounds, in seconds.
+        repeat (int, optional): The number of timed rounds.
+
+    Returns:
+        dict: The best and median operations per second, the calls per round and the peak memory in bytes.
+
+    Raises:
+        ValueError: If repeat is less than 1.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    round_time = min_time / repeat
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        elapsed = time.perf_counter() - started
+        if elapsed >= round_time or loops >= 1 << 20:
+            break
+        loops = max(loops * 2, int(loops * round_time / max(elapsed, 1e-9)) + 1)
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(loops):
+                operation()
+            timings.append((time.perf_counter() - started) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops_per_sec': 1 / max(min(timings), 1e-12),
+        'median_ops_per_sec': 1 / max(statistics.median(timings), 1e-12),
+        'loops': loops,
+        'peak_memory': peak_memory,
+    }
+
+def run(scale: str = 'production', names: list[str] | None = None, min_time: float = 1.0, repeat: int = 5, progress: Callable[[str], None] | None = None) -> dict[str, Any]:
+    """
+    Run the benchmarks at a scale.
+
+    Args:
+        scale (str, optional): 'production' or 'smoke'.
+        names (list of str, optional): Only run benchmarks whose name contains one of these.
+        min_time (float, optional): The time to spend timing each benchmark, in seconds.
+        repeat (int, optional): The number of timed rounds of each benchmark.
+        progress (callable, optional): Called with a line of output after each benchmark.
+
+    Returns:
+        dict: The run's metadata and the results by benchmark name.
+
+    Raises:
+        ValueError: If the scale is unknown.
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale '{scale}', expected one of {', '.join(SCALES)}")
+    sizes = SCALES[scale]
+
+    results = {}
+    with offline():
+        for bench in BENCHMARKS:
+            if names and not any(name in bench.name for name in names):
+                continue
+            operation, items = bench.setup(sizes)
+            result = measure(operation, min_time, repeat)
+            result['items'] = items
+            result['items_per_sec'] = result['ops_per_sec'] * items
+            results[bench.name] = result
+            if progress is not None:
+                progress(format_result(bench.name, result))
+
+    return {
+        'commit': get_commit(),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': scale,
+        'sizes': sizes,
+        'results': results,
+    }
+
+def get_commit() -> str:
+    """
+    Get the current commit of the repository, marked dirty if there are uncommitted changes.
+
+    Returns:
+        str: The abbreviated commit hash, or 'unknown' outside a git checkout.
+    """
+    try:
+        output = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True, check=True, cwd=os.path.dirname(RESULTS_DIR))
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return output.stdout.strip() or 'unknown'
+
+def format_memory(size: float) -> str:
+    """Format a number of bytes for display."""
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def format_result(name: str, result: dict[str, Any]) -> str:
+    """Format the result of a benchmark as a line of output."""
+    return f"{name:<26} {result['ops_per_sec']:>12.2f} ops/s {result['items_per_sec']:>14.0f} items/s {format_memory(result['peak_memory']):>12} peak"
+
+def save(report: dict[str, Any], directory: str = RESULTS_DIR) -> str:
+    """
+    Store a report as JSON, named after its commit and scale.
+
+    Args:
+        report (dict): The report returned by run.
+        directory (str, optional): The directory of stored results.
+
+    Returns:
+        str: The path of the stored file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{report['commit']}-{report['scale']}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    return path
+
+def load(path: str) -> dict[str, Any]:
+    """
+    Load a stored report.
+
+    Args:
+        path (str): The path of the report, or the commit it was stored under in the results directory.
+
+    Returns:
+        dict: The report.
+
+    Raises:
+        FileNotFoundError: If no report exists at the path or for the commit.
+    """
+    if not os.path.exists(path):
+        matches = sorted(name for name in os.listdir(RESULTS_DIR) if name.startswith(path)) if os.path.isdir(RESULTS_DIR) else []
+        if not matches:
+            raise FileNotFoundError(f"No benchmark results found for '{path}'")
+        path = os.path.join(RESULTS_DIR, matches[0])
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """
+    Compare two reports benchmark by benchmark.
+
+    Args:
+        baseline (dict): The report to compare against.
+        current (dict): The new report.
+
+    Returns:
+        dict: By benchmark present in both reports, the relative change of ops/s and of peak
+            memory, e.g. -0.1 for 10% slower or 10% less memory.
+    """
+    changes = {}
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        changes[name] = {
+            'ops_per_sec': result['ops_per_sec'] / before['ops_per_sec'] - 1,
+            'peak_memory': result['peak_memory'] / before['peak_memory'] - 1 if before['peak_memory'] else 0.0,
+        }
+    return changes
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parsing and search hot paths of hypixel_api_lib.")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='production', help="payload sizes to benchmark with")
+    parser.add_argument('--filter', action='append', dest='names', metavar='NAME', help="only run benchmarks whose name contains NAME")
+    parser.add_argument('--min-time', type=float, default=1.0, help="seconds spent timing each benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="timed rounds per benchmark")
+    parser.add_argument('--compare', metavar='RESULTS', help="results file or commit to compare against")
+    parser.add_argument('--max-regression', type=float, metavar='PERCENT', help="exit with status 1 if any benchmark is this much slower than the comparison")
+    parser.add_argument('--no-save', action='store_true', help="do not store the results")
+    parser.add_argument('--list', action='store_true', help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(bench)
+        return 0
+
+    baseline = load(args.compare) if args.compare else None
+    report = run(args.scale, args.names, args.min_time, args.repeat, progress=print)
+    if not args.no_save:
+        print(f"Results stored in {save(report)}")
+
+    if baseline is None:
+        return 0
+    print(f"\nCompared to {baseline['commit']} ({baseline['scale']}):")
+    regressed = False
+    for name, change in compare(baseline, report).items():
+        print(f"{name:<26} {change['ops_per_sec']:>+8.1%} ops/s {change['peak_memory']:>+8.1%} peak memory")
+        if args.max_regression is not None and -change['ops_per_sec'] * 100 > args.max_regression:
+            regressed = True
+    return 1 if regressed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from hypixel_api_lib.Auctions import RecentlyEndedAuction, RecentlyEndedAuctions, RECENTLY_ENDED_AUCTIONS_API_URL
+from hypixel_api_lib.transport import NO_RETRY_TRANSPORT
+from hypixel_api_lib.utils import convert_to_millis
+
+# The auctions_ended endpoint is regenerated roughly once a minute
+ENDED_AUCTIONS_UPDATE_INTERVAL: float = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sales (
+    auction_id TEXT PRIMARY KEY,
+    seller TEXT,
+    seller_profile TEXT,
+    buyer TEXT,
+    buyer_profile TEXT,
+    timestamp INTEGER,
+    price INTEGER,
+    bin INTEGER,
+    item_id TEXT,
+    item_bytes TEXT
+);
+CREATE INDEX IF NOT EXISTS sales_seller ON sales (seller, timestamp);
+CREATE INDEX IF NOT EXISTS sales_buyer ON sales (buyer, timestamp);
+CREATE INDEX IF NOT EXISTS sales_item ON sales (item_id, timestamp);
+CREATE INDEX IF NOT EXISTS sales_timestamp ON sales (timestamp);
+"""
+
+class SaleHistory:
+    """
+    A persistent SQLite store of ended auctions, indexed by seller, buyer, item and time.
+
+    Attributes:
+        path (str): The database file, or ':memory:' for an in-memory store.
+    """
+
+    def __init__(self, path: str = ':memory:') -> None:
+        self.path: str = path
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+
+    def add_sales(self, auctions: Iterable[RecentlyEndedAuction]) -> int:
+        """
+        Append sales to the history, ignoring auctions that were already stored.
+
+        Args:
+            auctions (iterable of RecentlyEndedAuction): The ended auctions to store.
+
+        Returns:
+            int: The number of new sales stored.
+        """
+        rows = [
+            (auction.auction_id, auction.seller, auction.seller_profile, auction.buyer, auction.buyer_profile,
+             convert_to_millis(auction.timestamp), auction.price, int(bool(auction.bin)), auction.item_id, auction.item_bytes)
+            for auction in auctions
+        ]
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany("INSERT OR IGNORE INTO sales VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            return self._connection.total_changes - before
+
+    def get_sales(self, seller: str | None = None, buyer: str | None = None, item_id: str | None = None, start: datetime | None = None, end: datetime | None = None, bin_only: bool | None = None, limit: int | None = None) -> list[RecentlyEndedAuction]:
+        """
+        Search the history for sales matching the specified criteria.
+
+        Args:
+            seller (str, optional): The UUID of the seller.
+            buyer (str, optional): The UUID of the buyer.
+            item_id (str, optional): The SkyBlock item ID.
+            start (datetime, optional): The earliest sale time, inclusive.
+            end (datetime, optional): The latest sale time, exclusive.
+            bin_only (bool, optional): If True, only include BIN sales; if False, exclude them; if None, include all.
+            limit (int, optional): The maximum number of sales to return.
+
+        Returns:
+            list of RecentlyEndedAuction: The matching sales, newest first.
+        """
+        conditions, params = [], []
+        for column, value in (('seller', seller), ('buyer', buyer), ('item_id', item_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if start is not None:
+            conditions.append("timestamp >= ?")
+            params.append(convert_to_millis(start))
+        if end is not None:
+            conditions.append("timestamp < ?")
+            params.append(convert_to_millis(end))
+        if bin_only is not None:
+            conditions.append("bin = ?")
+            params.append(int(bin_only))
+
+        query = "SELECT * FROM sales"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY timestamp DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [RecentlyEndedAuction({**dict(row), 'bin': bool(row['bin'])}) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM sales").fetchone()[0]
+
+    def __str__(self) -> str:
+        return f"SaleHistory at {self.path} with {len(self)} sales"
+
+class RecentlyEndedAuctionsPoller:
+    """
+    Continuously polls recently ended auctions, deduplicating overlapping windows.
+
+    Polls are scheduled just after the endpoint's next expected update, based on its
+    lastUpdated timestamp. Auction IDs already seen are remembered in a bounded set.
+
+    Attributes:
+        history (SaleHistory or None): The store new sales are appended to.
+        seen_size (int): The maximum number of auction IDs remembered for deduplication.
+        interval (float): The expected number of seconds between endpoint updates.
+        margin (float): Seconds to wait past the expected update before polling.
+        retry_delay (float): Seconds to wait after a failed poll.
+        last_updated (datetime or None): The lastUpdated timestamp of the latest poll.
+    """
+
+    def __init__(self, history: SaleHistory | None = None, seen_size: int = 10000, interval: float = ENDED_AUCTIONS_UPDATE_INTERVAL, margin: float = 2.0, retry_delay: float = 5.0, api_endpoint: str = RECENTLY_ENDED_AUCTIONS_API_URL) -> None:
+        self._api_endpoint: str = api_endpoint
+        self.history: SaleHistory | None = history
+        self.seen_size: int = seen_size
+        self.interval: float = interval
+        self.margin: float = margin
+        self.retry_delay: float = retry_delay
+        self.last_updated: datetime | None = None
+        self._auctions: RecentlyEndedAuctions | None = None
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _mark_seen(self, auction_id: str) -> bool:
+        """Remember an auction ID, returning False if it was already seen."""
+        if auction_id in self._seen:
+            self._seen.move_to_end(auction_id)
+            return False
+        self._seen[auction_id] = None
+        if len(self._seen) > self.seen_size:
+            self._seen.popitem(last=False)
+        return True
+
+    def poll(self) -> list[RecentlyEndedAuction]:
+        """
+        Fetch the endpoint once and store the sales not seen before.
+
+        Returns:
+            list of RecentlyEndedAuction: The new sales.
+
+        Raises:
+            ConnectionError: If the request fails.
+            ValueError: If the API response was not successful.
+        """
+        if self._auctions is None:
+            # Failed polls are retried on the poller's own schedule, see retry_delay
+            self._auctions = RecentlyEndedAuctions(self._api_endpoint, transport=NO_RETRY_TRANSPORT)
+        else:
+            self._auctions.refresh()
+        self.last_updated = self._auctions.last_updated
+
+        new_sales = [auction for auction in self._auctions.auctions if auction.auction_id and self._mark_seen(auction.auction_id)]
+        if new_sales and self.history is not None:
+            self.history.add_sales(new_sales)
+        return new_sales
+
+    def get_next_delay(self) -> float:
+        """
+        Get the number of seconds to wait before the next poll.
+
+        Returns:
+            float: The time until shortly after the endpoint's next expected update.
+        """
+        if self.last_updated is None:
+            return 0.0
+        next_update = self.last_updated.timestamp() + self.interval + self.margin
+        return min(max(next_update - datetime.now(timezone.utc).timestamp(), self.margin), self.interval)
+
+    def run(self, callback: Callable[[list[RecentlyEndedAuction]], None] | None = None, max_polls: int | None = None) -> None:
+        """
+        Poll until stopped, or until max_polls polls were made.
+
+        Failed polls are retried after retry_delay seconds instead of stopping the poller.
+
+        Args:
+            callback (callable, optional): Called with the new sales after every successful poll.
+            max_polls (int, optional): The number of polls to make before returning.
+        """
+        polls = 0
+        while not self._stop.is_set() and (max_polls is None or polls < max_polls):
+            polls += 1
+            try:
+                new_sales = self.poll()
+            except (ConnectionError, ValueError):
+                delay = self.retry_delay
+            else:
+                if callback is not None:
+                    callback(new_sales)
+                delay = self.get_next_delay()
+            if max_polls is not None and polls >= max_polls:
+                break
+            self._stop.wait(delay)
+
+    def start(self, callback: Callable[[list[RecentlyEndedAuction]], None] | None = None) -> None:
+        """
+        Start polling in a background thread.
+
+        Args:
+            callback (callable, optional): Called with the new sales after every successful poll.
+
+        Raises:
+            ValueError: If the poller is already running.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise ValueError("Poller is already running.")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, args=(callback,), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            self._stop.clear()
+
+    def __str__(self) -> str:
+        last_updated_str = self.last_updated.strftime("%Y-%m-%d %H:%M:%S %Z") if self.last_updated else "N/A"
+        return f"RecentlyEndedAuctionsPoller tracking {len(self._seen)} auctions as of {last_updated_str}"
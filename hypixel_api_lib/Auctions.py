@@ -1,11 +1,52 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime, timezone, tzinfo
+from itertools import islice
+import heapq
+import json
 import requests
-from hypixel_api_lib.utils import get_uuid_from_username, convert_timestamp
+from hypixel_api_lib.utils import get_uuid_from_username, convert_timestamp, convert_to_millis
+from hypixel_api_lib.ItemBytes import decode_item_bytes
+from hypixel_api_lib.singleflight import DEFAULT_SINGLE_FLIGHT, request_key
+from hypixel_api_lib.cache import ResponseCache
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
+from hypixel_api_lib.export import batches_to_table, rows_to_arrow, table_to_arrow, write_parquet
+from hypixel_api_lib.columnar import Column, ColumnarTable, LazyRows, encode_table, merge_tables, write_bytes, write_table, STR, INT, BOOL, STR_LIST, RECORDS
+import numpy as np
 
 ACTIVE_AUCTIONS_API_URL = r"https://api.hypixel.net/skyblock/auctions"
 RECENTLY_ENDED_AUCTIONS_API_URL = r"https://api.hypixel.net/skyblock/auctions_ended"
 PLAYER_AUCTION_API_URL = r"https://api.hypixel.net/skyblock/auction"
 
+# The stored fields of an auction in a snapshot file, named like the API's JSON keys
+AUCTION_COLUMNS = [
+    Column('_id', STR), Column('uuid', STR), Column('auctioneer', STR), Column('profile_id', STR),
+    Column('coop', STR_LIST), Column('start', INT), Column('end', INT), Column('item_name', STR),
+    Column('item_lore', STR), Column('extra', STR), Column('category', STR), Column('tier', STR),
+    Column('starting_bid', INT), Column('item_bytes', STR), Column('claimed', BOOL),
+    Column('claimed_bidders', STR_LIST), Column('highest_bid_amount', INT),
+    Column('bids', RECORDS, [Column('auction_id', STR), Column('bidder', STR), Column('profile_id', STR), Column('amount', INT), Column('timestamp', INT)]),
+]
+
+# The integer columns of auctions holding epoch milliseconds, exported as timestamps
+AUCTION_TIMESTAMPS = ('start', 'end', 'bids/timestamp')
+
+ENDED_AUCTION_COLUMNS = [
+    Column('auction_id', STR), Column('seller', STR), Column('seller_profile', STR), Column('buyer', STR),
+    Column('buyer_profile', STR), Column('timestamp', INT), Column('price', INT), Column('bin', BOOL), Column('item_bytes', STR),
+]
+
+def _parse_page_columns(content: bytes) -> bytes:
+    """Parse the raw body of an auctions page into an encoded columnar table, in a worker process."""
+    data = json.loads(content)
+    if not data.get('success'):
+        raise ValueError("API response was not successful")
+    metadata = {key: data.get(key) for key in ('page', 'totalPages', 'totalAuctions', 'lastUpdated')}
+    return encode_table(data.get('auctions', []), AUCTION_COLUMNS, metadata)
+
 class Bid:
     """
     Represents a single bid in an auction.
@@ -25,6 +66,16 @@ class Bid:
         self.amount: int = bid_data.get('amount')
         self.timestamp: datetime | None = convert_timestamp(bid_data.get('timestamp'))
 
+    def to_dict(self) -> dict:
+        """
+        Convert the bid back to the API's JSON representation.
+
+        Returns:
+            dict: The bid data, with the timestamp in milliseconds.
+        """
+        return {'auction_id': self.auction_id, 'bidder': self.bidder, 'profile_id': self.profile_id,
+                'amount': self.amount, 'timestamp': convert_to_millis(self.timestamp)}
+
     def __str__(self) -> str:
         timestamp_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S %Z") if self.timestamp else "N/A"
         return f"Bid of {self.amount} by {self.bidder} at {timestamp_str}"
@@ -129,6 +180,22 @@ class SkyBlockAuction:
         # Since I can't know from the API, I'm assume auctions with no bids are BIN
         return not self.bids
 
+    def to_dict(self) -> dict:
+        """
+        Convert the auction back to the API's JSON representation.
+
+        Returns:
+            dict: The auction data, with timestamps in milliseconds.
+        """
+        return {
+            '_id': self._id, 'uuid': self.uuid, 'auctioneer': self.auctioneer, 'profile_id': self.profile_id,
+            'coop': self.coop, 'start': convert_to_millis(self.start), 'end': convert_to_millis(self.end),
+            'item_name': self.item_name, 'item_lore': self.item_lore, 'extra': self.extra,
+            'category': self.category, 'tier': self.tier, 'starting_bid': self.starting_bid,
+            'item_bytes': self.item_bytes, 'claimed': self.claimed, 'claimed_bidders': self.claimed_bidders,
+            'highest_bid_amount': self.highest_bid_amount, 'bids': [bid.to_dict() for bid in self.bids],
+        }
+
     def __str__(self) -> str:
         auction_type = "BIN" if self.is_bin else "Auction"
         return f"{auction_type} '{self.item_name}' by {self.auctioneer}, Price: {self.current_price}"
@@ -187,23 +254,46 @@ class ActiveAuctions:
 
     Attributes:
         api_endpoint (str): The API endpoint URL.
-        all_auctions (list of SkyBlockAuction): Cached list of all auctions.
+        all_auctions (list of SkyBlockAuction): Cached list of all auctions, or a LazyRows view of a snapshot.
         cache_pages (dict): Cached pages of auctions.
+        transport (Transport): Sends the requests and retries transient failures of single pages.
     """
 
-    def __init__(self, api_endpoint: str = ACTIVE_AUCTIONS_API_URL, preload_all: bool = False) -> None:
+    def __init__(self, api_endpoint: str = ACTIVE_AUCTIONS_API_URL, preload_all: bool = False, transport: Transport | None = None, snapshot: str | None = None) -> None:
+        """
+        Args:
+            api_endpoint (str, optional): The API endpoint URL.
+            preload_all (bool, optional): Whether to fetch every page immediately.
+            transport (Transport, optional): The transport sending the requests.
+            snapshot (str, optional): A file written by save_snapshot to serve all auctions from
+                instead of the API. It is memory-mapped, so worker processes opening the same file
+                share one copy, and auctions are only built when accessed.
+
+        Raises:
+            ValueError: If the snapshot is not an auction snapshot.
+        """
         self._api_endpoint: str = api_endpoint
-        self.all_auctions: list[SkyBlockAuction] | list = []
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self.all_auctions: list[SkyBlockAuction] | LazyRows | list = []
         self.cache_pages: dict[int, AuctionsPage] | dict = {}
-        if preload_all:
+        if snapshot is not None:
+            table = ColumnarTable(snapshot)
+            if table.metadata.get('kind') != 'auctions':
+                table.close()
+                raise ValueError(f"{snapshot} is not an auction snapshot")
+            self.all_auctions = LazyRows(table, SkyBlockAuction)
+        elif preload_all:
             self.all_auctions = self.get_all_auctions()
 
-    def get_page(self, page_number: int = 0) -> AuctionsPage:
+    def get_page(self, page_number: int = 0, retain: bool = True) -> AuctionsPage:
         """
         Fetch a specific page of auctions, using cache if available.
 
+        Concurrent requests for the same page share a single request.
+
         Args:
             page_number (int): The page number to fetch.
+            retain (bool, optional): Whether to store the fetched page in the page cache.
 
         Returns:
             AuctionsPage: The AuctionsPage object for the requested page.
@@ -212,30 +302,206 @@ class ActiveAuctions:
             return self.cache_pages[page_number]
 
         params = {'page': page_number}
+        page = DEFAULT_SINGLE_FLIGHT.do(request_key(self._api_endpoint, params), self._fetch_page, page_number)
+        if retain:
+            self.cache_pages[page_number] = page
+        return page
+
+    def _fetch_page(self, page_number: int) -> AuctionsPage:
+        """Request and parse a single page of auctions."""
+        params = {'page': page_number}
+        with DEFAULT_INSTRUMENTATION.track(self._api_endpoint):
+            try:
+                response = self.transport.get(self._api_endpoint, params=params)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get('success'):
+                    with time_phase('build'):
+                        return AuctionsPage(data)
+                else:
+                    raise ValueError("API response was not successful")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred while fetching page {page_number}: {e}")
+
+    def iter_pages(self, max_pages: int | None = None, retain: bool = True, workers: int = 1, ordered: bool = True) -> Iterator[AuctionsPage]:
+        """
+        Yield pages of auctions as they arrive.
+
+        The first page is fetched on its own to learn the page count. With more than one worker,
+        the remaining pages are fetched concurrently with at most two requests per worker in
+        flight, so memory stays bounded however large the auction house is.
+
+        Args:
+            max_pages (int, optional): Maximum number of pages to fetch.
+            retain (bool, optional): Whether to store fetched pages in the page cache. Pipelines
+                that only aggregate should pass False.
+            workers (int, optional): The number of pages fetched concurrently.
+            ordered (bool, optional): Whether to yield pages in page order. With False, pages are
+                yielded as soon as they arrive.
+
+        Yields:
+            AuctionsPage: The fetched pages.
+
+        Raises:
+            ConnectionError: If fetching a page fails.
+            ValueError: If the API response was not successful.
+        """
+        first_page = self.get_page(0, retain)
+        total_pages = first_page.totalPages
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        yield first_page
+
+        remaining = range(1, total_pages)
+        if workers <= 1:
+            for page_number in remaining:
+                yield self.get_page(page_number, retain)
+            return
+
+        page_numbers = iter(remaining)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(executor.submit(self.get_page, page_number, retain) for page_number in islice(page_numbers, workers * 2))
+            try:
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in finished]
+                        for future in done:
+                            pending.remove(future)
+                    for future in done:
+                        page = future.result()
+                        next_page = next(page_numbers, None)
+                        if next_page is not None:
+                            pending.append(executor.submit(self.get_page, next_page, retain))
+                        yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_auctions(self, max_pages: int | None = None, retain: bool = True, workers: int = 1, ordered: bool = True) -> Iterator[SkyBlockAuction]:
+        """
+        Yield individual auctions as their pages arrive.
+
+        Args:
+            max_pages (int, optional): Maximum number of pages to fetch.
+            retain (bool, optional): Whether to store fetched pages in the page cache.
+            workers (int, optional): The number of pages fetched concurrently.
+            ordered (bool, optional): Whether to yield pages in page order.
+
+        Yields:
+            SkyBlockAuction: The auctions of every fetched page.
+        """
+        for page in self.iter_pages(max_pages, retain, workers, ordered):
+            yield from page.auctions
+
+    async def aiter_pages(self, max_pages: int | None = None, retain: bool = True, workers: int = 4, ordered: bool = False) -> AsyncIterator[AuctionsPage]:
+        """
+        Asynchronously yield pages of auctions as they arrive.
+
+        Requests run in worker threads through asyncio.to_thread, so the event loop is never
+        blocked. At most workers pages are in flight at once.
+
+        Args:
+            max_pages (int, optional): Maximum number of pages to fetch.
+            retain (bool, optional): Whether to store fetched pages in the page cache.
+            workers (int, optional): The number of pages fetched concurrently.
+            ordered (bool, optional): Whether to yield pages in page order.
+
+        Yields:
+            AuctionsPage: The fetched pages.
+
+        Raises:
+            ConnectionError: If fetching a page fails.
+            ValueError: If the API response was not successful.
+        """
+        first_page = await asyncio.to_thread(self.get_page, 0, retain)
+        total_pages = first_page.totalPages
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        yield first_page
+
+        page_numbers = iter(range(1, total_pages))
+        pending = deque(asyncio.ensure_future(asyncio.to_thread(self.get_page, page_number, retain)) for page_number in islice(page_numbers, max(workers, 1)))
         try:
-            response = requests.get(self._api_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                    await done[0]
+                else:
+                    finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    done = [task for task in pending if task in finished]
+                    for task in done:
+                        pending.remove(task)
+                for task in done:
+                    next_page = next(page_numbers, None)
+                    if next_page is not None:
+                        pending.append(asyncio.ensure_future(asyncio.to_thread(self.get_page, next_page, retain)))
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aiter_auctions(self, max_pages: int | None = None, retain: bool = True, workers: int = 4, ordered: bool = False) -> AsyncIterator[SkyBlockAuction]:
+        """
+        Asynchronously yield individual auctions as their pages arrive.
 
-            if data.get('success'):
-                page = AuctionsPage(data)
-                self.cache_pages[page_number] = page
-                return page
-            else:
-                raise ValueError("API response was not successful")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred while fetching page {page_number}: {e}")
+        Args:
+            max_pages (int, optional): Maximum number of pages to fetch.
+            retain (bool, optional): Whether to store fetched pages in the page cache.
+            workers (int, optional): The number of pages fetched concurrently.
+            ordered (bool, optional): Whether to yield pages in page order.
 
-    def get_all_auctions(self) -> list[SkyBlockAuction]:
+        Yields:
+            SkyBlockAuction: The auctions of every fetched page.
+        """
+        async for page in self.aiter_pages(max_pages, retain, workers, ordered):
+            for auction in page.auctions:
+                yield auction
+
+    def _fetch_page_content(self, page_number: int) -> bytes:
+        """Request the raw body of a single page of auctions."""
+        with DEFAULT_INSTRUMENTATION.track(self._api_endpoint):
+            try:
+                response = self.transport.get(self._api_endpoint, params={'page': page_number})
+                response.raise_for_status()
+                return response.content
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred while fetching page {page_number}: {e}")
+
+    def get_all_auctions(self, processes: int | None = None, workers: int = 1) -> list[SkyBlockAuction] | LazyRows:
         """
         Fetch all auctions by iterating through all available pages.
 
+        With processes, the raw pages are parsed in a pool of worker processes instead of being
+        built into objects in this one. Each worker returns its pages in the columnar snapshot
+        form, the parts are merged into one in-memory table, and the auctions are built from it
+        only when accessed. Searches then run on the columns, as for a snapshot.
+
+        Args:
+            processes (int, optional): The number of worker processes parsing pages. By default
+                pages are parsed in this process.
+            workers (int, optional): The number of pages downloaded concurrently when parsing
+                in worker processes.
+
         Returns:
-            list of SkyBlockAuction: A list of all auctions.
+            list of SkyBlockAuction or LazyRows: All auctions, as a LazyRows sequence when
+                parsed in worker processes.
+
+        Raises:
+            ConnectionError: If fetching a page fails.
+            ValueError: If the API response was not successful.
         """
         if self.all_auctions:
             return self.all_auctions  # Return cached data
 
+        if processes is not None:
+            self.all_auctions = self._parse_all_auctions(processes, workers)
+            return self.all_auctions
+
         all_auctions = []
         first_page = self.get_page(0)
         total_pages = first_page.totalPages
@@ -248,42 +514,49 @@ class ActiveAuctions:
         self.all_auctions = all_auctions  # Cache the results
         return all_auctions
 
-    def search_auctions(self, item_name: str | None = None, min_price: int | None = None, max_price: int | None = None, sort_by_price: bool = False, descending: bool = False, max_pages: int | None = None) -> list[SkyBlockAuction]:
+    def _parse_all_auctions(self, processes: int, workers: int) -> LazyRows:
+        """Download every page and parse them into one columnar table in worker processes."""
+        # The pool is started before the download threads, so no thread is running when it forks
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            first = ColumnarTable(pool.submit(_parse_page_columns, self._fetch_page_content(0)).result())
+            total_pages = first.metadata.get('totalPages') or 1
+            with ThreadPoolExecutor(max_workers=max(workers, 1)) as downloads:
+                futures = [pool.submit(_parse_page_columns, content) for content in downloads.map(self._fetch_page_content, range(1, total_pages))]
+            tables = [first] + [ColumnarTable(future.result()) for future in futures]
+
+        metadata = {'kind': 'auctions', 'totalPages': total_pages, 'lastUpdated': first.metadata.get('lastUpdated')}
+        return LazyRows(ColumnarTable(merge_tables(tables, metadata)), SkyBlockAuction)
+
+    def _iter_search_pages(self, max_pages: int | None = None) -> Iterator[list[SkyBlockAuction]]:
+        """Yield the auctions to search one page at a time, using cached data if available."""
+        if self.all_auctions:
+            yield self.all_auctions
+            return
+
+        for page in self.iter_pages(max_pages):
+            yield page.auctions
+
+    def iter_search_auctions(self, item_name: str | None = None, min_price: int | None = None, max_price: int | None = None, max_pages: int | None = None) -> Iterator[SkyBlockAuction]:
         """
-        Search for auctions matching the specified criteria.
+        Search for auctions matching the specified criteria, filtering each page as it arrives.
+
+        Pages are only fetched as the results are consumed, so the first matches are available
+        before the whole auction house has been downloaded.
 
         Args:
             item_name (str, optional): The name of the item to search for.
             min_price (int, optional): The minimum price.
             max_price (int, optional): The maximum price.
-            sort_by_price (bool, optional): Whether to sort the results by price.
-            descending (bool, optional): Whether to sort in descending order.
             max_pages (int, optional): Maximum number of pages to search.
 
-        Returns:
-            list of SkyBlockAuction: A list of auctions matching the criteria.
+        Yields:
+            SkyBlockAuction: The auctions matching the criteria, in page order.
         """
-        matching_auctions = []
-
-        # Use cached data if available
-        if self.all_auctions:
-            auctions_to_search = self.all_auctions
-        else:
-            first_page = self.get_page(0)
-            total_pages = first_page.totalPages
-            if max_pages:
-                total_pages = min(total_pages, max_pages)
-
-            auctions_to_search = []
-            auctions_to_search.extend(first_page.auctions)
-
-            for page_number in range(1, total_pages):
-                page = self.get_page(page_number)
-                auctions_to_search.extend(page.auctions)
+        item_name = item_name.lower() if item_name else None
 
         # Function to check if an auction matches the criteria
         def matches(auction: SkyBlockAuction) -> bool:
-            if item_name and item_name.lower() not in auction.item_name.lower():
+            if item_name and item_name not in auction.item_name.lower():
                 return False
             price = auction.current_price
             if min_price is not None and price < min_price:
@@ -292,14 +565,86 @@ class ActiveAuctions:
                 return False
             return True
 
-        for auction in auctions_to_search:
-            if matches(auction):
-                matching_auctions.append(auction)
+        if isinstance(self.all_auctions, LazyRows):
+            yield from self._search_snapshot(item_name, min_price, max_price)
+            return
+
+        for auctions in self._iter_search_pages(max_pages):
+            yield from filter(matches, auctions)
+
+    def _search_snapshot(self, item_name: str | None, min_price: int | None, max_price: int | None) -> Iterator[SkyBlockAuction]:
+        """Filter a snapshot on its columns, building only the matching auctions."""
+        table = self.all_auctions.table
+        starting_bid = table.get_column('starting_bid')
+        price = np.where(table.get_counts('bids') > 0, np.maximum(starting_bid, table.get_column('highest_bid_amount')), starting_bid)
+        mask = np.ones(len(table), dtype=bool)
+        if item_name:
+            mask &= table.match_strings('item_name', lambda name: item_name in name.lower())
+        if min_price is not None:
+            mask &= price >= min_price
+        if max_price is not None:
+            mask &= price <= max_price
+        for index in np.flatnonzero(mask):
+            yield self.all_auctions[int(index)]
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        Write all auctions to a memory-mappable snapshot file, fetching them first if needed.
+
+        Args:
+            path (str): The path of the snapshot.
 
+        Returns:
+            int: The number of auctions written.
+        """
+        if isinstance(self.all_auctions, LazyRows):
+            # Already columnar, so the table is copied without building any auction
+            table = self.all_auctions.table
+            write_bytes(path, merge_tables([table], table.metadata))
+            return len(self.all_auctions)
+        return write_table(path, (auction.to_dict() for auction in self.get_all_auctions()), AUCTION_COLUMNS, {'kind': 'auctions'})
+
+    def search_auctions(self, item_name: str | None = None, min_price: int | None = None, max_price: int | None = None, sort_by_price: bool = False, descending: bool = False, max_pages: int | None = None, limit: int | None = None, offset: int = 0) -> list[SkyBlockAuction]:
+        """
+        Search for auctions matching the specified criteria.
+
+        With a limit and sort_by_price, only the best offset + limit matches are kept in a bounded
+        heap instead of sorting every match. With a limit and no sorting, pages stop being fetched
+        as soon as enough matches were found.
+
+        Args:
+            item_name (str, optional): The name of the item to search for.
+            min_price (int, optional): The minimum price.
+            max_price (int, optional): The maximum price.
+            sort_by_price (bool, optional): Whether to sort the results by price.
+            descending (bool, optional): Whether to sort in descending order.
+            max_pages (int, optional): Maximum number of pages to search.
+            limit (int, optional): Maximum number of auctions to return.
+            offset (int, optional): Number of matching auctions to skip.
+
+        Returns:
+            list of SkyBlockAuction: A list of auctions matching the criteria.
+
+        Raises:
+            ValueError: If limit or offset is negative.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("limit and offset must not be negative")
+
+        matching_auctions = self.iter_search_auctions(item_name, min_price, max_price, max_pages)
+        price_key = lambda x: x.current_price
+
+        if limit is not None:
+            if sort_by_price:
+                select = heapq.nlargest if descending else heapq.nsmallest
+                return select(offset + limit, matching_auctions, key=price_key)[offset:]
+            return list(islice(matching_auctions, offset, offset + limit))
+
+        matching_auctions = list(matching_auctions)
         if sort_by_price:
-            matching_auctions.sort(key=lambda x: x.current_price, reverse=descending)
+            matching_auctions.sort(key=price_key, reverse=descending)
 
-        return matching_auctions
+        return matching_auctions[offset:]
 
     def get_auction_by_id(self, auction_id: str) -> SkyBlockAuction | None:
         """
@@ -321,6 +666,70 @@ class ActiveAuctions:
                 return auction
         return None
 
+    def _iter_raw_pages(self, workers: int) -> Iterator[dict]:
+        """Yield the decoded JSON of every page without building any auction."""
+        def decode(content: bytes) -> dict:
+            data = json.loads(content)
+            if not data.get('success'):
+                raise ValueError("API response was not successful")
+            return data
+
+        first_page = decode(self._fetch_page_content(0))
+        yield first_page
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            for content in executor.map(self._fetch_page_content, range(1, first_page.get('totalPages', 0))):
+                yield decode(content)
+
+    def to_arrow(self, workers: int = 1) -> 'pyarrow.Table':
+        """
+        Export all auctions to an Arrow table with typed columns and UTC timestamps.
+
+        Auctions parsed in worker processes or loaded from a snapshot are converted from their
+        columns directly. Otherwise, if no auctions are cached, the pages are fetched and their raw
+        JSON converted one column at a time without building any auction; cached auctions are
+        converted back to their JSON form first.
+
+        Args:
+            workers (int, optional): The number of pages downloaded concurrently.
+
+        Returns:
+            pyarrow.Table: One row per auction, with the bids as a list of structs. Call to_pandas
+                on it for a DataFrame.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ConnectionError: If fetching a page fails.
+            ValueError: If the API response was not successful.
+        """
+        if isinstance(self.all_auctions, LazyRows):
+            return table_to_arrow(self.all_auctions.table, AUCTION_TIMESTAMPS)
+        if self.all_auctions:
+            batches = [rows_to_arrow([auction.to_dict() for auction in self.all_auctions], AUCTION_COLUMNS, AUCTION_TIMESTAMPS)]
+        else:
+            batches = (rows_to_arrow(page.get('auctions', []), AUCTION_COLUMNS, AUCTION_TIMESTAMPS) for page in self._iter_raw_pages(workers))
+        return batches_to_table(batches, AUCTION_COLUMNS, AUCTION_TIMESTAMPS)
+
+    def to_parquet(self, path: str, workers: int = 1, compression: str = 'zstd') -> int:
+        """
+        Export all auctions to a Parquet file.
+
+        Args:
+            path (str): The path of the Parquet file.
+            workers (int, optional): The number of pages downloaded concurrently.
+            compression (str, optional): The Parquet compression codec.
+
+        Returns:
+            int: The number of auctions written.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ConnectionError: If fetching a page fails.
+            ValueError: If the API response was not successful.
+        """
+        table = self.to_arrow(workers)
+        write_parquet(table, path, compression)
+        return table.num_rows
+
     def __str__(self) -> str:
         return f"Auctions Manager using endpoint {self._api_endpoint}"
 
@@ -354,6 +763,35 @@ class RecentlyEndedAuction:
         self.bin: bool = auction_data.get('bin', False)
         self.item_bytes: str = auction_data.get('item_bytes')
 
+    def to_dict(self) -> dict:
+        """
+        Convert the auction back to the API's JSON representation.
+
+        Returns:
+            dict: The auction data, with the timestamp in milliseconds.
+        """
+        return {
+            'auction_id': self.auction_id, 'seller': self.seller, 'seller_profile': self.seller_profile,
+            'buyer': self.buyer, 'buyer_profile': self.buyer_profile, 'timestamp': convert_to_millis(self.timestamp),
+            'price': self.price, 'bin': self.bin, 'item_bytes': self.item_bytes,
+        }
+
+    @property
+    def item_id(self) -> str | None:
+        """
+        Get the SkyBlock item ID of the sold item by decoding its item bytes.
+
+        Returns:
+            str or None: The item ID, or None if the item bytes are missing or invalid.
+        """
+        if not self.item_bytes:
+            return None
+        try:
+            items = decode_item_bytes(self.item_bytes)
+        except ValueError:
+            return None
+        return items[0].item_id if items else None
+
     def __str__(self) -> str:
         auction_type = "BIN" if self.bin else "Auction"
         timestamp_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S %Z") if self.timestamp else "N/A"
@@ -366,30 +804,50 @@ class RecentlyEndedAuctions:
     Attributes:
         last_updated (datetime): The last updated timestamp.
         auctions (list of RecentlyEndedAuction): The list of recently ended auctions.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
-    def __init__(self, api_endpoint: str = RECENTLY_ENDED_AUCTIONS_API_URL) -> None:
+    def __init__(self, api_endpoint: str = RECENTLY_ENDED_AUCTIONS_API_URL, transport: Transport | None = None) -> None:
         self._api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.last_updated: datetime | None = None
         self.auctions: list[RecentlyEndedAuction] | list = []
         self._load_ended_auctions()
 
+    def refresh(self) -> bool:
+        """
+        Fetch the recently ended auctions again, replacing the current ones.
+
+        Returns:
+            bool: True if the API returned a newer snapshot than the one already loaded.
+
+        Raises:
+            ConnectionError: If the request fails.
+            ValueError: If the API response was not successful.
+        """
+        previous = self.last_updated
+        self._load_ended_auctions()
+        return self.last_updated != previous
+
     def _load_ended_auctions(self) -> None:
         """
         Fetch recently ended auctions from the API.
         """
-        try:
-            response = requests.get(self._api_endpoint)
-            response.raise_for_status()
-            data = response.json()
-            if data.get('success'):
-                self.last_updated = convert_timestamp(data.get('lastUpdated'))
-                auctions_data = data.get('auctions', [])
-                self.auctions = [RecentlyEndedAuction(auction_data) for auction_data in auctions_data]
-            else:
-                raise ValueError("API response was not successful")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred while fetching recently ended auctions: {e}")
+        with DEFAULT_INSTRUMENTATION.track(self._api_endpoint):
+            try:
+                response = self.transport.get(self._api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+                if data.get('success'):
+                    self.last_updated = convert_timestamp(data.get('lastUpdated'))
+                    auctions_data = data.get('auctions', [])
+                    with time_phase('build'):
+                        self.auctions = [RecentlyEndedAuction(auction_data) for auction_data in auctions_data]
+                else:
+                    raise ValueError("API response was not successful")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred while fetching recently ended auctions: {e}")
 
     def get_auction_by_id(self, auction_id: str) -> RecentlyEndedAuction | None:
         """
@@ -436,6 +894,37 @@ class RecentlyEndedAuctions:
 
         return matching_auctions
 
+    def to_arrow(self) -> 'pyarrow.Table':
+        """
+        Export the recently ended auctions to an Arrow table with typed columns and UTC timestamps.
+
+        Returns:
+            pyarrow.Table: One row per auction. Call to_pandas on it for a DataFrame.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        batch = rows_to_arrow([auction.to_dict() for auction in self.auctions], ENDED_AUCTION_COLUMNS, ('timestamp',))
+        return batches_to_table([batch], ENDED_AUCTION_COLUMNS, ('timestamp',))
+
+    def to_parquet(self, path: str, compression: str = 'zstd') -> int:
+        """
+        Export the recently ended auctions to a Parquet file.
+
+        Args:
+            path (str): The path of the Parquet file.
+            compression (str, optional): The Parquet compression codec.
+
+        Returns:
+            int: The number of auctions written.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        table = self.to_arrow()
+        write_parquet(table, path, compression)
+        return table.num_rows
+
     def __str__(self) -> str:
         last_updated_str = self.last_updated.strftime("%Y-%m-%d %H:%M:%S %Z") if self.last_updated else "N/A"
         return f"RecentlyEndedAuctions with {len(self.auctions)} auctions as of {last_updated_str}"
@@ -447,11 +936,47 @@ class PlayerAuctions:
     Attributes:
         api_key (str): The API key for accessing the Hypixel API.
         api_endpoint (str): The API endpoint URL.
+        cache (ResponseCache or None): The response cache, or None to always use the network.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
-    def __init__(self, api_key: str, api_endpoint: str = PLAYER_AUCTION_API_URL) -> None:
+    def __init__(self, api_key: str, api_endpoint: str = PLAYER_AUCTION_API_URL, cache: ResponseCache | None = None, transport: Transport | None = None) -> None:
         self._api_endpoint: str = api_endpoint
         self.api_key: str = api_key
+        self.cache: ResponseCache | None = cache
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
+
+    def _get_json(self, params: dict) -> dict:
+        """Request the endpoint, serving and storing successful responses through the cache."""
+        def fetch() -> dict:
+            response = self.transport.get(self._api_endpoint, params=params)
+            response.raise_for_status()
+            with time_phase('decode'):
+                return response.json()
+
+        with DEFAULT_INSTRUMENTATION.track(self._api_endpoint):
+            if self.cache is None:
+                return fetch()
+            return self.cache.get_or_fetch(self._api_endpoint, params, fetch, lambda data: bool(data.get('success')))
+
+    def _raise_http_error(self, error: requests.exceptions.HTTPError) -> None:
+        """Translate an HTTP error response of the endpoint into the matching exception."""
+        status_code = error.response.status_code
+        error_data = error.response.json()
+        cause = error_data.get('cause', 'Unknown error')
+        if status_code == 400:
+            raise ValueError(f"Bad Request (400): {cause}")
+        elif status_code == 403:
+            raise PermissionError(f"Forbidden (403): {cause}")
+        elif status_code == 422:
+            raise ValueError(f"Unprocessable Entity (422): {cause}")
+        elif status_code == 429:
+            if error_data.get('global', False):
+                raise ConnectionError(f"Global Throttle (429): {cause}")
+            else:
+                raise ConnectionError(f"Rate Limit Exceeded (429): {cause}")
+        else:
+            raise ConnectionError(f"HTTP Error {status_code}: {cause}")
 
     def _convert_timestamp(self, timestamp: int | None) -> datetime | None:
         """Convert a timestamp in milliseconds to a timezone-aware datetime object in UTC."""
@@ -478,9 +1003,7 @@ class PlayerAuctions:
             'key': self.api_key
         }
         try:
-            response = requests.get(self._api_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             if data.get('success'):
                 auctions_data = data.get('auctions', [])
                 if auctions_data:
@@ -493,24 +1016,7 @@ class PlayerAuctions:
                 cause = data.get('cause', 'Unknown error')
                 raise ValueError(f"API response was not successful: {cause}")
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            error_data = e.response.json()
-            cause = error_data.get('cause', 'Unknown error')
-            if status_code == 400:
-                raise ValueError(f"Bad Request (400): {cause}")
-            elif status_code == 403:
-                raise PermissionError(f"Forbidden (403): {cause}")
-            elif status_code == 422:
-                raise ValueError(f"Unprocessable Entity (422): {cause}")
-            elif status_code == 429:
-                throttle = error_data.get('throttle', False)
-                global_throttle = error_data.get('global', False)
-                if global_throttle:
-                    raise ConnectionError(f"Global Throttle (429): {cause}")
-                else:
-                    raise ConnectionError(f"Rate Limit Exceeded (429): {cause}")
-            else:
-                raise ConnectionError(f"HTTP Error {status_code}: {cause}")
+            self._raise_http_error(e)
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"An error occurred while fetching auction {auction_uuid}: {e}")
 
@@ -533,9 +1039,7 @@ class PlayerAuctions:
             'key': self.api_key
         }
         try:
-            response = requests.get(self._api_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             if data.get('success'):
                 auctions_data = data.get('auctions', [])
                 return [SkyBlockAuction(auction_data) for auction_data in auctions_data]
@@ -543,24 +1047,7 @@ class PlayerAuctions:
                 cause = data.get('cause', 'Unknown error')
                 raise ValueError(f"API response was not successful: {cause}")
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            error_data = e.response.json()
-            cause = error_data.get('cause', 'Unknown error')
-            if status_code == 400:
-                raise ValueError(f"Bad Request (400): {cause}")
-            elif status_code == 403:
-                raise PermissionError(f"Forbidden (403): {cause}")
-            elif status_code == 422:
-                raise ValueError(f"Unprocessable Entity (422): {cause}")
-            elif status_code == 429:
-                throttle = error_data.get('throttle', False)
-                global_throttle = error_data.get('global', False)
-                if global_throttle:
-                    raise ConnectionError(f"Global Throttle (429): {cause}")
-                else:
-                    raise ConnectionError(f"Rate Limit Exceeded (429): {cause}")
-            else:
-                raise ConnectionError(f"HTTP Error {status_code}: {cause}")
+            self._raise_http_error(e)
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"An error occurred while fetching auctions for player {player_uuid}: {e}")
 
@@ -583,9 +1070,7 @@ class PlayerAuctions:
             'key': self.api_key
         }
         try:
-            response = requests.get(self._api_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             if data.get('success'):
                 auctions_data = data.get('auctions', [])
                 return [SkyBlockAuction(auction_data) for auction_data in auctions_data]
@@ -593,24 +1078,7 @@ class PlayerAuctions:
                 cause = data.get('cause', 'Unknown error')
                 raise ValueError(f"API response was not successful: {cause}")
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            error_data = e.response.json()
-            cause = error_data.get('cause', 'Unknown error')
-            if status_code == 400:
-                raise ValueError(f"Bad Request (400): {cause}")
-            elif status_code == 403:
-                raise PermissionError(f"Forbidden (403): {cause}")
-            elif status_code == 422:
-                raise ValueError(f"Unprocessable Entity (422): {cause}")
-            elif status_code == 429:
-                throttle = error_data.get('throttle', False)
-                global_throttle = error_data.get('global', False)
-                if global_throttle:
-                    raise ConnectionError(f"Global Throttle (429): {cause}")
-                else:
-                    raise ConnectionError(f"Rate Limit Exceeded (429): {cause}")
-            else:
-                raise ConnectionError(f"HTTP Error {status_code}: {cause}")
+            self._raise_http_error(e)
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"An error occurred while fetching auctions for profile {profile_uuid}: {e}")
 
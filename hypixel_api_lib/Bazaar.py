@@ -1,10 +1,36 @@
 from datetime import datetime
+from collections.abc import Iterable
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
+import numpy as np
 from hypixel_api_lib.utils import convert_timestamp
+from hypixel_api_lib.export import batches_to_table, rows_to_arrow, write_parquet
+from hypixel_api_lib.columnar import Column, ColumnarTable, LazyMapping, write_table, STR, INT, FLOAT, RECORDS
 import re
 from difflib import get_close_matches
 
 BAZAAR_API_URL = "https://api.hypixel.net/skyblock/bazaar"
+BAZAAR_TAX_RATE = 0.0125
+
+_SUMMARY_COLUMNS = [Column('amount', INT), Column('pricePerUnit', FLOAT), Column('orders', INT)]
+
+# The stored fields of a product in a snapshot file, named like the API's JSON keys
+BAZAAR_COLUMNS = [
+    Column('product_id', STR),
+    Column('sell_summary', RECORDS, _SUMMARY_COLUMNS),
+    Column('buy_summary', RECORDS, _SUMMARY_COLUMNS),
+    Column('quick_status.productId', STR),
+    Column('quick_status.sellPrice', FLOAT), Column('quick_status.sellVolume', INT),
+    Column('quick_status.sellMovingWeek', INT), Column('quick_status.sellOrders', INT),
+    Column('quick_status.buyPrice', FLOAT), Column('quick_status.buyVolume', INT),
+    Column('quick_status.buyMovingWeek', INT), Column('quick_status.buyOrders', INT),
+]
+
+QUICK_STATUS_COLUMNS = [
+    Column('productId', STR), Column('sellPrice', FLOAT), Column('sellVolume', INT), Column('sellMovingWeek', INT),
+    Column('sellOrders', INT), Column('buyPrice', FLOAT), Column('buyVolume', INT), Column('buyMovingWeek', INT), Column('buyOrders', INT),
+]
 
 class BazaarOrderSummaryItem:
     """
@@ -21,9 +47,68 @@ class BazaarOrderSummaryItem:
         self.price_per_unit: float = data.get('pricePerUnit', 0.0)
         self.orders: int = data.get('orders', 0)
 
+    def to_dict(self) -> dict:
+        """Convert the order summary item back to the API's JSON representation."""
+        return {'amount': self.amount, 'pricePerUnit': self.price_per_unit, 'orders': self.orders}
+
     def __str__(self) -> str:
         return f"Amount: {self.amount}, Price per Unit: {self.price_per_unit}, Orders: {self.orders}"
 
+class BazaarOrderBook:
+    """
+    Represents one side of a product's order book as NumPy arrays, in the order the API returns it.
+
+    Attributes:
+        prices (np.ndarray): The price per unit of each level.
+        amounts (np.ndarray): The total amount of items at each level.
+        orders (np.ndarray): The number of orders at each level.
+    """
+
+    def __init__(self, summary: list[dict]) -> None:
+        depth = len(summary)
+        self.prices: np.ndarray = np.fromiter((level.get('pricePerUnit', 0.0) for level in summary), dtype=np.float64, count=depth)
+        self.amounts: np.ndarray = np.fromiter((level.get('amount', 0) for level in summary), dtype=np.int64, count=depth)
+        self.orders: np.ndarray = np.fromiter((level.get('orders', 0) for level in summary), dtype=np.int64, count=depth)
+
+    def _walk(self, quantity: int) -> tuple[float, int]:
+        """Walk the book for up to quantity units, returning the total cost and the units filled."""
+        before = np.cumsum(self.amounts) - self.amounts
+        take = np.clip(quantity - before, 0, self.amounts)
+        return float(np.dot(take, self.prices)), int(take.sum())
+
+    def fill_cost(self, quantity: int) -> float | None:
+        """
+        Calculate the total cost of filling a quantity by walking the book from the top.
+
+        Args:
+            quantity (int): The number of units to fill.
+
+        Returns:
+            float or None: The total cost, or None if the book is not deep enough.
+        """
+        cost, filled = self._walk(quantity)
+        return cost if filled >= quantity else None
+
+    def vwap(self, quantity: int) -> float | None:
+        """
+        Calculate the volume-weighted average price of the first quantity units in the book.
+
+        Args:
+            quantity (int): The depth in units to average over.
+
+        Returns:
+            float or None: The VWAP over the available units, or None if the book is empty.
+        """
+        cost, filled = self._walk(quantity)
+        return cost / filled if filled else None
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __str__(self) -> str:
+        top = self.prices[0] if len(self.prices) else None
+        return f"Order Book: {len(self.prices)} levels, Top Price: {top}"
+
 class BazaarProductQuickStatus:
     """
     Represents the quick status of a bazaar product.
@@ -51,6 +136,14 @@ class BazaarProductQuickStatus:
         self.buy_moving_week: int = data.get('buyMovingWeek', 0)
         self.buy_orders: int = data.get('buyOrders', 0)
 
+    def to_dict(self) -> dict:
+        """Convert the quick status back to the API's JSON representation."""
+        return {
+            'productId': self.product_id, 'sellPrice': self.sell_price, 'sellVolume': self.sell_volume,
+            'sellMovingWeek': self.sell_moving_week, 'sellOrders': self.sell_orders, 'buyPrice': self.buy_price,
+            'buyVolume': self.buy_volume, 'buyMovingWeek': self.buy_moving_week, 'buyOrders': self.buy_orders,
+        }
+
     def __str__(self) -> str:
         return (f"Product ID: {self.product_id}, Sell Price: {self.sell_price}, Sell Volume: {self.sell_volume}, "
                 f"Sell Moving Week: {self.sell_moving_week}, Sell Orders: {self.sell_orders}, "
@@ -66,6 +159,8 @@ class BazaarProduct:
         sell_summary (list of BazaarOrderSummaryItem): The sell order summaries.
         buy_summary (list of BazaarOrderSummaryItem): The buy order summaries.
         quick_status (BazaarProductQuickStatus): The quick status of the product.
+        sell_book (BazaarOrderBook): The sell summary as NumPy arrays.
+        buy_book (BazaarOrderBook): The buy summary as NumPy arrays.
     """
 
     def __init__(self, product_id: str, data: dict) -> None:
@@ -73,6 +168,8 @@ class BazaarProduct:
         self.sell_summary: list[BazaarOrderSummaryItem] = [BazaarOrderSummaryItem(item) for item in data.get('sell_summary', [])]
         self.buy_summary: list[BazaarOrderSummaryItem] = [BazaarOrderSummaryItem(item) for item in data.get('buy_summary', [])]
         self.quick_status: BazaarProductQuickStatus = BazaarProductQuickStatus(data.get('quick_status', {}))
+        self.sell_book: BazaarOrderBook = BazaarOrderBook(data.get('sell_summary', []))
+        self.buy_book: BazaarOrderBook = BazaarOrderBook(data.get('buy_summary', []))
 
     def get_top_buy_order(self) -> BazaarOrderSummaryItem | None:
         """
@@ -92,17 +189,182 @@ class BazaarProduct:
         """
         return self.sell_summary[0] if self.sell_summary else None
 
+    def to_dict(self) -> dict:
+        """
+        Convert the product back to the API's JSON representation.
+
+        Returns:
+            dict: The product data.
+        """
+        return {
+            'product_id': self.product_id,
+            'sell_summary': [item.to_dict() for item in self.sell_summary],
+            'buy_summary': [item.to_dict() for item in self.buy_summary],
+            'quick_status': self.quick_status.to_dict(),
+        }
+
     def __str__(self) -> str:
         return f"Bazaar Product: {self.product_id}"
 
+class BazaarMarketDepth:
+    """
+    Packs the order books of many products into zero-padded 2-D arrays (one row per product)
+    so book metrics are computed for every product in a single vectorized pass.
+
+    The buy side is the buy summary, which is walked when instantly buying. The sell side is the
+    sell summary, which is walked when instantly selling.
+
+    Attributes:
+        product_ids (list of str): The product ID of each row.
+        buy_prices (np.ndarray): Buy summary prices, shape (products, depth).
+        buy_amounts (np.ndarray): Buy summary amounts, shape (products, depth).
+        buy_orders (np.ndarray): Buy summary order counts, shape (products, depth).
+        sell_prices (np.ndarray): Sell summary prices, shape (products, depth).
+        sell_amounts (np.ndarray): Sell summary amounts, shape (products, depth).
+        sell_orders (np.ndarray): Sell summary order counts, shape (products, depth).
+    """
+
+    def __init__(self, products: Iterable[BazaarProduct]) -> None:
+        products = list(products)
+        self.product_ids: list[str] = [product.product_id for product in products]
+        self._index: dict[str, int] = {product_id: row for row, product_id in enumerate(self.product_ids)}
+        self.buy_prices, self.buy_amounts, self.buy_orders = self._pack([product.buy_book for product in products])
+        self.sell_prices, self.sell_amounts, self.sell_orders = self._pack([product.sell_book for product in products])
+
+    @staticmethod
+    def _pack(books: list[BazaarOrderBook]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copy each book into a row of zero-padded price, amount and order matrices."""
+        depth = max((len(book) for book in books), default=0)
+        prices = np.zeros((len(books), depth), dtype=np.float64)
+        amounts = np.zeros((len(books), depth), dtype=np.int64)
+        orders = np.zeros((len(books), depth), dtype=np.int64)
+        for row, book in enumerate(books):
+            levels = len(book)
+            prices[row, :levels] = book.prices
+            amounts[row, :levels] = book.amounts
+            orders[row, :levels] = book.orders
+        return prices, amounts, orders
+
+    def _side(self, side: str) -> tuple[np.ndarray, np.ndarray]:
+        if side == 'buy':
+            return self.buy_prices, self.buy_amounts
+        if side == 'sell':
+            return self.sell_prices, self.sell_amounts
+        raise ValueError(f"Unknown order book side '{side}', expected 'buy' or 'sell'")
+
+    def _walk(self, quantity: int | np.ndarray, side: str) -> tuple[np.ndarray, np.ndarray]:
+        """Walk every book for up to quantity units, returning the cost and units filled per product."""
+        prices, amounts = self._side(side)
+        quantity = np.broadcast_to(np.asarray(quantity, dtype=np.int64), (len(self.product_ids),))
+        before = np.cumsum(amounts, axis=1) - amounts
+        take = np.clip(quantity[:, None] - before, 0, amounts)
+        return (take * prices).sum(axis=1), take.sum(axis=1)
+
+    def fill_cost(self, quantity: int | np.ndarray, side: str = 'buy') -> np.ndarray:
+        """
+        Calculate the cost of filling a quantity of every product by walking its book.
+
+        Args:
+            quantity (int or np.ndarray): The units to fill, either one value or one per product.
+            side (str): 'buy' to walk the buy summary, 'sell' to walk the sell summary.
+
+        Returns:
+            np.ndarray: The total cost per product, NaN where the book is not deep enough.
+        """
+        cost, filled = self._walk(quantity, side)
+        return np.where(filled >= quantity, cost, np.nan)
+
+    def vwap(self, quantity: int | np.ndarray, side: str = 'buy') -> np.ndarray:
+        """
+        Calculate the volume-weighted average price of the first quantity units of every book.
+
+        Args:
+            quantity (int or np.ndarray): The depth in units, either one value or one per product.
+            side (str): 'buy' to walk the buy summary, 'sell' to walk the sell summary.
+
+        Returns:
+            np.ndarray: The VWAP per product over the available units, NaN where the book is empty.
+        """
+        cost, filled = self._walk(quantity, side)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(filled > 0, cost / filled, np.nan)
+
+    def top_prices(self, side: str = 'buy') -> np.ndarray:
+        """
+        Get the top price of every book.
+
+        Args:
+            side (str): 'buy' for the buy summary, 'sell' for the sell summary.
+
+        Returns:
+            np.ndarray: The top price per product, NaN where the book is empty.
+        """
+        prices, amounts = self._side(side)
+        if prices.shape[1] == 0:
+            return np.full(len(self.product_ids), np.nan)
+        return np.where(amounts[:, 0] > 0, prices[:, 0], np.nan)
+
+    def spread(self) -> np.ndarray:
+        """
+        Calculate the spread between the top buy summary and top sell summary price of every product.
+
+        Returns:
+            np.ndarray: The spread per product, NaN where either side is empty.
+        """
+        return self.top_prices('buy') - self.top_prices('sell')
+
+    def margin_after_tax(self, tax_rate: float = BAZAAR_TAX_RATE) -> np.ndarray:
+        """
+        Calculate the per-unit flip margin of every product after the bazaar tax, buying at the
+        top sell summary price and selling at the top buy summary price.
+
+        Args:
+            tax_rate (float): The tax taken from the sale, as a fraction.
+
+        Returns:
+            np.ndarray: The margin per product, NaN where either side is empty.
+        """
+        return self.top_prices('buy') * (1.0 - tax_rate) - self.top_prices('sell')
+
+    def to_dict(self, values: np.ndarray) -> dict[str, float]:
+        """
+        Map a per-product result array back to product IDs.
+
+        Args:
+            values (np.ndarray): An array with one value per product.
+
+        Returns:
+            dict of str to float: The values keyed by product ID.
+        """
+        return dict(zip(self.product_ids, values.tolist()))
+
+    def get_row(self, product_id: str) -> int | None:
+        """
+        Retrieve the row index of a product.
+
+        Args:
+            product_id (str): The product ID.
+
+        Returns:
+            int or None: The row index, or None if the product is not included.
+        """
+        return self._index.get(product_id)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def __str__(self) -> str:
+        return f"Bazaar Market Depth: {len(self.product_ids)} products, Depth: {self.buy_prices.shape[1]}/{self.sell_prices.shape[1]}"
+
 class Bazaar:
     """
     Manages fetching and storing the bazaar data from the API.
 
     Attributes:
         last_updated (datetime): The timestamp of the last update.
-        products (dict of str to BazaarProduct): The bazaar products.
+        products (dict of str to BazaarProduct): The bazaar products, or a LazyMapping view of a snapshot.
         normalized_product_ids (dict of str to str): Mapping of normalized product names to actual product IDs.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
     COMMON_PREFIXES = [
@@ -128,31 +390,75 @@ class Bazaar:
         "_10",
     ]
 
-    def __init__(self, api_endpoint: str = BAZAAR_API_URL) -> None:
+    def __init__(self, api_endpoint: str = BAZAAR_API_URL, transport: Transport | None = None, snapshot: str | None = None) -> None:
+        """
+        Args:
+            api_endpoint (str, optional): The API endpoint URL.
+            transport (Transport, optional): The transport sending the requests.
+            snapshot (str, optional): A file written by save_snapshot to load the products from
+                instead of the API. It is memory-mapped, so worker processes opening the same file
+                share one copy, and products are only built when accessed.
+
+        Raises:
+            ValueError: If the snapshot is not a bazaar snapshot.
+        """
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.last_updated: datetime | None = None
-        self.products: dict[str, BazaarProduct] = {}
+        self.products: dict[str, BazaarProduct] | LazyMapping = {}
         self.normalized_product_ids: dict[str, str] = {}
-        self._load_bazaar_data()
+        self._market_depth: BazaarMarketDepth | None = None
+        if snapshot is not None:
+            self._load_snapshot(snapshot)
+        else:
+            self._load_bazaar_data()
+
+    def _load_snapshot(self, path: str) -> None:
+        """Map the products of a snapshot file."""
+        table = ColumnarTable(path)
+        if table.metadata.get('kind') != 'bazaar':
+            table.close()
+            raise ValueError(f"{path} is not a bazaar snapshot")
+        self.last_updated = convert_timestamp(table.metadata.get('lastUpdated'))
+        self.products = LazyMapping(table, 'product_id', lambda row: BazaarProduct(row['product_id'], row))
+        for product_id in self.products:
+            self.normalized_product_ids[self._normalize_product_id(product_id)] = product_id
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        Write the products to a memory-mappable snapshot file.
+
+        Args:
+            path (str): The path of the snapshot.
+
+        Returns:
+            int: The number of products written.
+        """
+        last_updated = round(self.last_updated.timestamp() * 1000) if self.last_updated else None
+        rows = (product.to_dict() for product in self.products.values())
+        return write_table(path, rows, BAZAAR_COLUMNS, {'kind': 'bazaar', 'lastUpdated': last_updated})
 
     def _load_bazaar_data(self) -> None:
         """Fetch the bazaar data from the API."""
-        try:
-            response = requests.get(self.api_endpoint)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success'):
-                self.last_updated = convert_timestamp(data.get('lastUpdated'))
-                products_data = data.get('products', {})
-                for product_id, product_data in products_data.items():
-                    self.products[product_id] = BazaarProduct(product_id, product_data)
-                    normalized_id = self._normalize_product_id(product_id)
-                    self.normalized_product_ids[normalized_id] = product_id
-            else:
-                raise ValueError("Failed to fetch bazaar data")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred: {e}")
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                response = self.transport.get(self.api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get('success'):
+                    self.last_updated = convert_timestamp(data.get('lastUpdated'))
+                    products_data = data.get('products', {})
+                    with time_phase('build'):
+                        for product_id, product_data in products_data.items():
+                            self.products[product_id] = BazaarProduct(product_id, product_data)
+                            normalized_id = self._normalize_product_id(product_id)
+                            self.normalized_product_ids[normalized_id] = product_id
+                else:
+                    raise ValueError("Failed to fetch bazaar data")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred: {e}")
 
     def _normalize_product_id(self, product_id: str) -> str:
         """Normalize the product ID for easier searching."""
@@ -233,6 +539,49 @@ class Bazaar:
         """
         return self.products.get(product_id)
 
+    def get_market_depth(self) -> BazaarMarketDepth:
+        """
+        Get the packed order books of all products, built once per load.
+
+        Returns:
+            BazaarMarketDepth: The order books of every product as 2-D arrays.
+        """
+        if self._market_depth is None:
+            self._market_depth = BazaarMarketDepth(self.products.values())
+        return self._market_depth
+
+    def to_arrow(self) -> 'pyarrow.Table':
+        """
+        Export the quick status of every product to an Arrow table with typed columns.
+
+        Returns:
+            pyarrow.Table: One row per product, with the API's quick status fields as columns. Call
+                to_pandas on it for a DataFrame.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        batch = rows_to_arrow([product.quick_status.to_dict() for product in self.products.values()], QUICK_STATUS_COLUMNS)
+        return batches_to_table([batch], QUICK_STATUS_COLUMNS)
+
+    def to_parquet(self, path: str, compression: str = 'zstd') -> int:
+        """
+        Export the quick status of every product to a Parquet file.
+
+        Args:
+            path (str): The path of the Parquet file.
+            compression (str, optional): The Parquet compression codec.
+
+        Returns:
+            int: The number of products written.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        table = self.to_arrow()
+        write_parquet(table, path, compression)
+        return table.num_rows
+
     def __str__(self) -> str:
         product_ids = ', '.join(self.products.keys())
         return f"Bazaar Data (Last Updated: {self.last_updated})\nProducts: {product_ids}"
\ No newline at end of file
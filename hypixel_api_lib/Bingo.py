@@ -1,6 +1,8 @@
 from datetime import datetime, tzinfo
 import re
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 from hypixel_api_lib.utils import convert_timestamp
 
 BINGO_EVENT_API_URL = r"https://api.hypixel.net/resources/skyblock/bingo"
@@ -163,26 +165,30 @@ class BingoEvents:
     Attributes:
         api_endpoint (str): The API endpoint URL.
         current_event (BingoEvent): The current bingo event.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
-    def __init__(self, api_endpoint: str = BINGO_EVENT_API_URL) -> None:
+    def __init__(self, api_endpoint: str = BINGO_EVENT_API_URL, transport: Transport | None = None) -> None:
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self._current_event: BingoEvent | None = None
         self._load_current_event()
 
     def _load_current_event(self) -> None:
         """Fetch the current bingo event data from the API."""
-        try:
-            response = requests.get(self.api_endpoint)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success') and data.get('goals'):
-                self._current_event = BingoEvent(data)
-            else:
-                raise ValueError("No current bingo event data available in the response")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred: {e}")
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                response = self.transport.get(self.api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get('success') and data.get('goals'):
+                    self._current_event = BingoEvent(data)
+                else:
+                    raise ValueError("No current bingo event data available in the response")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred: {e}")
 
     def get_current_event(self) -> BingoEvent | None:
         """
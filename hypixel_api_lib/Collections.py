@@ -1,6 +1,10 @@
 from datetime import datetime
+from bisect import bisect_right
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 from hypixel_api_lib.utils import convert_timestamp
+from hypixel_api_lib.member.CollectionsStats import CollectionsStats
 
 COLLECTIONS_API_URL = r"https://api.hypixel.net/v2/resources/skyblock/collections"
 
@@ -21,6 +25,40 @@ class CollectionTier:
     def __str__(self) -> str:
         return f"Tier {self.tier}: Requires {self.amount_required}, Unlocks: {', '.join(self.unlocks)}"
 
+class CollectionTierProgress:
+    """
+    Represents a player's standing in a single collection item.
+
+    Attributes:
+        item_key (str): The collection item key.
+        amount (int): The amount collected.
+        tier (int): The highest tier unlocked, or 0 if none.
+        next_tier (CollectionTier or None): The next tier to unlock, or None if maxed.
+        progress (float): The fraction of the way from the current tier to the next, 1.0 once maxed.
+    """
+    def __init__(self, item_key: str, amount: int, tier: int, next_tier: CollectionTier | None, progress: float) -> None:
+        self.item_key: str = item_key
+        self.amount: int = amount
+        self.tier: int = tier
+        self.next_tier: CollectionTier | None = next_tier
+        self.progress: float = progress
+
+    @property
+    def is_maxed(self) -> bool:
+        """
+        Check whether every tier of the item is unlocked.
+
+        Returns:
+            bool: True if there is no next tier.
+        """
+        return self.next_tier is None
+
+    def __str__(self) -> str:
+        if self.next_tier is None:
+            return f"{self.item_key}: Tier {self.tier} (Maxed), Collected: {self.amount}"
+        return (f"{self.item_key}: Tier {self.tier}, Collected: {self.amount}/{self.next_tier.amount_required} "
+                f"({self.progress:.1%} to Tier {self.next_tier.tier})")
+
 class CollectionItem:
     """
     Represents an item within a collection category.
@@ -36,6 +74,8 @@ class CollectionItem:
         self.name: str = item_data.get('name', 'Unknown Item')
         self.max_tiers: int = item_data.get('maxTiers', 0)
         self.tiers: list[CollectionTier] = [CollectionTier(tier) for tier in item_data.get('tiers', [])]
+        self._sorted_tiers: list[CollectionTier] = sorted(self.tiers, key=lambda tier: tier.amount_required or 0)
+        self._amounts_required: list[int] = [tier.amount_required or 0 for tier in self._sorted_tiers]
 
     def get_tier(self, tier_number: int) -> CollectionTier | None:
         """
@@ -49,6 +89,25 @@ class CollectionItem:
         """
         return next((tier for tier in self.tiers if tier.tier == tier_number), None)
 
+    def tier_for_amount(self, amount: int) -> CollectionTierProgress:
+        """
+        Resolve the tier unlocked by a collected amount using bisection over the tier requirements.
+
+        Args:
+            amount (int): The amount collected.
+
+        Returns:
+            CollectionTierProgress: The unlocked tier, the next tier and the progress towards it.
+        """
+        unlocked = bisect_right(self._amounts_required, amount)
+        tier = self._sorted_tiers[unlocked - 1].tier if unlocked else 0
+        if unlocked >= len(self._sorted_tiers):
+            return CollectionTierProgress(self.key, amount, tier, None, 1.0)
+        next_tier = self._sorted_tiers[unlocked]
+        previous = self._amounts_required[unlocked - 1] if unlocked else 0
+        progress = (amount - previous) / (self._amounts_required[unlocked] - previous)
+        return CollectionTierProgress(self.key, amount, tier, next_tier, progress)
+
     def __str__(self) -> str:
         return f"Collection Item: {self.name} (Key: {self.key}), Max Tiers: {self.max_tiers}"
 
@@ -104,31 +163,37 @@ class Collections:
         last_updated (datetime): The timestamp of the last update.
         version (str): The version of the data.
         categories (dict of str to CollectionCategory): The collection categories.
+        transport (Transport): Sends the requests and retries transient failures.
     """
-    def __init__(self, api_endpoint: str = COLLECTIONS_API_URL) -> None:
+    def __init__(self, api_endpoint: str = COLLECTIONS_API_URL, transport: Transport | None = None) -> None:
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.last_updated: datetime | None = None
         self.version: str = ''
         self.categories: dict[str,CollectionCategory] = {}
+        self._items_by_key: dict[str,CollectionItem] = {}
         self._load_collections_data()
 
     def _load_collections_data(self) -> None:
         """Fetch the collections data from the API."""
-        try:
-            response = requests.get(self.api_endpoint)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success'):
-                self.last_updated = convert_timestamp(data.get('lastUpdated'))
-                self.version = data.get('version', '')
-                collections_data = data.get('collections', {})
-                for category_key, category_data in collections_data.items():
-                    self.categories[category_key] = CollectionCategory(category_key, category_data)
-            else:
-                raise ValueError("Failed to fetch collections data")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred: {e}")
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                response = self.transport.get(self.api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get('success'):
+                    self.last_updated = convert_timestamp(data.get('lastUpdated'))
+                    self.version = data.get('version', '')
+                    collections_data = data.get('collections', {})
+                    for category_key, category_data in collections_data.items():
+                        self.categories[category_key] = CollectionCategory(category_key, category_data)
+                        self._items_by_key.update(self.categories[category_key].items)
+                else:
+                    raise ValueError("Failed to fetch collections data")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred: {e}")
 
     def get_category_by_key(self, category_key: str) -> CollectionCategory | None:
         """
@@ -164,11 +229,7 @@ class Collections:
         Returns:
             CollectionItem or None: The CollectionItem object, or None if not found.
         """
-        for category in self.categories.values():
-            item = category.get_item_by_key(item_key)
-            if item:
-                return item
-        return None
+        return self._items_by_key.get(item_key)
 
     def get_item_by_name(self, item_name: str) -> CollectionItem | None:
         """
@@ -186,6 +247,36 @@ class Collections:
                 return item
         return None
 
+    def resolve_tiers(self, stats: CollectionsStats) -> dict[str, CollectionTierProgress]:
+        """
+        Resolve the unlocked tier of every collection a member has progress in.
+
+        Args:
+            stats (CollectionsStats): The member's collection amounts.
+
+        Returns:
+            dict of str to CollectionTierProgress: The tier progress keyed by collection item key.
+                Items unknown to the collections data are skipped.
+        """
+        resolved = {}
+        for key, collected in stats.items.items():
+            item = self._items_by_key.get(key)
+            if item is not None:
+                resolved[key] = item.tier_for_amount(collected.amount)
+        return resolved
+
+    def resolve_tiers_batch(self, stats_list: list[CollectionsStats]) -> list[dict[str, CollectionTierProgress]]:
+        """
+        Resolve the unlocked collection tiers of many members.
+
+        Args:
+            stats_list (list of CollectionsStats): The collection amounts of each member.
+
+        Returns:
+            list of dict of str to CollectionTierProgress: The tier progress of each member, in the order given.
+        """
+        return [self.resolve_tiers(stats) for stats in stats_list]
+
     def __str__(self) -> str:
         categories_str = ', '.join([category.name for category in self.categories.values()])
         return f"Collections Data (Version: {self.version}, Last Updated: {self.last_updated})\nCategories: {categories_str}"
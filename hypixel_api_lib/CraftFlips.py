@@ -0,0 +1,240 @@
+import json
+import math
+from datetime import datetime
+from hypixel_api_lib.Bazaar import Bazaar, BAZAAR_TAX_RATE
+from hypixel_api_lib.Items import Items
+
+class Recipe:
+    """
+    Represents a crafting recipe whose inputs and output can be priced on the bazaar.
+
+    Attributes:
+        recipe_id (str): The unique identifier of the recipe.
+        output (str): The item ID produced by the recipe.
+        output_amount (int): The number of items produced per craft.
+        ingredients (dict of str to int): The item IDs consumed per craft and their amounts.
+    """
+
+    def __init__(self, recipe_id: str, data: dict) -> None:
+        self.recipe_id: str = recipe_id
+        self.output: str = data.get('output', recipe_id)
+        self.output_amount: int = data.get('amount', 1)
+        self.ingredients: dict[str, int] = dict(data.get('ingredients', {}))
+        if not self.ingredients:
+            raise ValueError(f"Recipe '{recipe_id}' has no ingredients")
+        if self.output_amount <= 0:
+            raise ValueError(f"Recipe '{recipe_id}' must produce a positive amount")
+
+    def __str__(self) -> str:
+        ingredients_str = ', '.join(f"{amount}x {item_id}" for item_id, amount in self.ingredients.items())
+        return f"Recipe {self.recipe_id}: {ingredients_str} -> {self.output_amount}x {self.output}"
+
+def load_recipes(path: str) -> list[Recipe]:
+    """
+    Load recipe definitions from a local JSON file.
+
+    The file maps recipe IDs to objects with an 'ingredients' mapping and optional 'output'
+    (defaults to the recipe ID) and 'amount' (defaults to 1) fields.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        list of Recipe: The recipes defined in the file.
+
+    Raises:
+        ValueError: If the file is not valid JSON or a recipe is malformed.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid recipe file '{path}': {e}")
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid recipe file '{path}': expected an object of recipes")
+    return [Recipe(recipe_id, recipe_data) for recipe_id, recipe_data in data.items()]
+
+class CraftFlipResult:
+    """
+    Represents the profitability of a recipe at one bazaar snapshot.
+
+    Attributes:
+        recipe (Recipe): The recipe that was priced.
+        craft_cost (float or None): The cost of buying all ingredients instantly, or None if any is unpriced.
+        sell_value (float or None): The value of the output, or None if it cannot be sold.
+        missing (list of str): Item IDs that could not be priced.
+    """
+
+    def __init__(self, recipe: Recipe, craft_cost: float | None, sell_value: float | None, missing: list[str]) -> None:
+        self.recipe: Recipe = recipe
+        self.craft_cost: float | None = craft_cost
+        self.sell_value: float | None = sell_value
+        self.missing: list[str] = missing
+
+    @property
+    def profit(self) -> float | None:
+        """
+        Get the profit of one craft.
+
+        Returns:
+            float or None: The sell value minus the craft cost, or None if either is unknown.
+        """
+        if self.craft_cost is None or self.sell_value is None:
+            return None
+        return self.sell_value - self.craft_cost
+
+    @property
+    def margin(self) -> float | None:
+        """
+        Get the profit as a fraction of the craft cost.
+
+        Returns:
+            float or None: The margin, or None if the profit is unknown or the craft is free.
+        """
+        profit = self.profit
+        if profit is None or not self.craft_cost:
+            return None
+        return profit / self.craft_cost
+
+    def __str__(self) -> str:
+        if self.profit is None:
+            return f"{self.recipe.recipe_id}: Unpriced ({', '.join(self.missing)})"
+        return f"{self.recipe.recipe_id}: Cost {self.craft_cost:.1f}, Value {self.sell_value:.1f}, Profit {self.profit:.1f}"
+
+class CraftFlipEngine:
+    """
+    Prices recipes against bazaar snapshots, recomputing only the recipes whose inputs changed.
+
+    Ingredients are bought at the top of the buy summary. Outputs are valued at the better of
+    selling to the top of the sell summary after tax or selling to an NPC.
+
+    Attributes:
+        recipes (dict of str to Recipe): The recipes by recipe ID.
+        items (Items or None): Item metadata used for NPC sell prices.
+        tax_rate (float): The bazaar tax applied to output sales.
+        last_updated (datetime or None): The timestamp of the bazaar snapshot last evaluated.
+    """
+
+    def __init__(self, recipes: list[Recipe], items: Items | None = None, tax_rate: float = BAZAAR_TAX_RATE) -> None:
+        self.recipes: dict[str, Recipe] = {recipe.recipe_id: recipe for recipe in recipes}
+        self.items: Items | None = items
+        self.tax_rate: float = tax_rate
+        self.last_updated: datetime | None = None
+        self._snapshot_id: object = None
+        self._prices: dict[str, tuple[float | None, float | None]] = {}
+        self._results: dict[str, CraftFlipResult] = {}
+        self._dependents: dict[str, set[str]] = {}
+        for recipe in self.recipes.values():
+            for item_id in [recipe.output, *recipe.ingredients]:
+                self._dependents.setdefault(item_id, set()).add(recipe.recipe_id)
+
+    @classmethod
+    def from_file(cls, path: str, items: Items | None = None, tax_rate: float = BAZAAR_TAX_RATE) -> 'CraftFlipEngine':
+        """
+        Create an engine from a recipe file.
+
+        Args:
+            path (str): The path of the JSON recipe file.
+            items (Items, optional): Item metadata used for NPC sell prices.
+            tax_rate (float, optional): The bazaar tax applied to output sales.
+
+        Returns:
+            CraftFlipEngine: The engine for the recipes in the file.
+        """
+        return cls(load_recipes(path), items, tax_rate)
+
+    def _snapshot_prices(self, bazaar: Bazaar) -> dict[str, tuple[float | None, float | None]]:
+        """Read the top buy and sell summary prices of every referenced product in one pass."""
+        depth = bazaar.get_market_depth()
+        buy_prices = depth.top_prices('buy').tolist()
+        sell_prices = depth.top_prices('sell').tolist()
+        prices = {}
+        for item_id in self._dependents:
+            row = depth.get_row(item_id)
+            if row is not None:
+                # NaN never compares equal, so empty books are stored as None for change detection
+                buy_price, sell_price = buy_prices[row], sell_prices[row]
+                prices[item_id] = (None if math.isnan(buy_price) else buy_price, None if math.isnan(sell_price) else sell_price)
+        return prices
+
+    def _npc_sell_price(self, item_id: str) -> float | None:
+        if self.items is None or not self.items.items:
+            return None
+        item = self.items.items.get(item_id)
+        return item.npc_sell_price if item is not None else None
+
+    def _price_recipe(self, recipe: Recipe) -> CraftFlipResult:
+        """Price a single recipe against the current snapshot prices."""
+        missing = []
+        craft_cost = 0.0
+        for item_id, amount in recipe.ingredients.items():
+            buy_price = self._prices.get(item_id, (None, None))[0]
+            if buy_price is None:
+                missing.append(item_id)
+            else:
+                craft_cost += buy_price * amount
+
+        candidates = []
+        sell_price = self._prices.get(recipe.output, (None, None))[1]
+        if sell_price is not None:
+            candidates.append(sell_price * (1.0 - self.tax_rate))
+        npc_price = self._npc_sell_price(recipe.output)
+        if npc_price:
+            candidates.append(float(npc_price))
+        sell_value = max(candidates) * recipe.output_amount if candidates else None
+
+        return CraftFlipResult(
+            recipe,
+            None if missing else craft_cost,
+            sell_value,
+            missing if sell_value is not None else missing + [recipe.output],
+        )
+
+    def evaluate(self, bazaar: Bazaar) -> dict[str, CraftFlipResult]:
+        """
+        Price every recipe against a bazaar snapshot.
+
+        Results are cached per snapshot. When the snapshot changes, only recipes that use an
+        item whose price changed are recomputed.
+
+        Args:
+            bazaar (Bazaar): The bazaar snapshot to price against.
+
+        Returns:
+            dict of str to CraftFlipResult: The result for every recipe by recipe ID.
+        """
+        snapshot_id = (id(bazaar), bazaar.last_updated)
+        if snapshot_id == self._snapshot_id:
+            return self._results
+
+        prices = self._snapshot_prices(bazaar)
+        changed = {item_id for item_id in self._dependents if prices.get(item_id) != self._prices.get(item_id)}
+        stale = set().union(*(self._dependents[item_id] for item_id in changed)) if changed else set()
+        stale.update(recipe_id for recipe_id in self.recipes if recipe_id not in self._results)
+
+        self._prices = prices
+        for recipe_id in stale:
+            self._results[recipe_id] = self._price_recipe(self.recipes[recipe_id])
+        self._snapshot_id = snapshot_id
+        self.last_updated = bazaar.last_updated
+        return self._results
+
+    def get_top_flips(self, bazaar: Bazaar, n: int = 10, by: str = 'profit') -> list[CraftFlipResult]:
+        """
+        Retrieve the most profitable recipes for a bazaar snapshot.
+
+        Args:
+            bazaar (Bazaar): The bazaar snapshot to price against.
+            n (int): The number of results to return.
+            by (str): 'profit' or 'margin'.
+
+        Returns:
+            list of CraftFlipResult: The priced results sorted from best to worst.
+        """
+        if by not in ('profit', 'margin'):
+            raise ValueError(f"Unknown ranking '{by}', expected 'profit' or 'margin'")
+        priced = [result for result in self.evaluate(bazaar).values() if getattr(result, by) is not None]
+        return sorted(priced, key=lambda result: getattr(result, by), reverse=True)[:n]
+
+    def __str__(self) -> str:
+        return f"CraftFlipEngine with {len(self.recipes)} recipes (Last Updated: {self.last_updated})"
@@ -1,5 +1,7 @@
 from datetime import datetime
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 from hypixel_api_lib.utils import convert_timestamp
 
 ELECTIONS_API_URL = r"https://api.hypixel.net/v2/resources/skyblock/election"
@@ -154,9 +156,11 @@ class Elections:
         last_updated (datetime): The timestamp of the last update.
         mayor (Mayor): The current mayor.
         current_election (Election): The current election.
+        transport (Transport): Sends the requests and retries transient failures.
     """
-    def __init__(self, api_endpoint: str = ELECTIONS_API_URL) -> None:
+    def __init__(self, api_endpoint: str = ELECTIONS_API_URL, transport: Transport | None = None) -> None:
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.last_updated: datetime | None = None
         self.mayor: Mayor | None = None
         self.current_election: Election | None = None
@@ -164,19 +168,21 @@ class Elections:
 
     def _load_elections_data(self) -> None:
         """Fetch the elections data from the API."""
-        try:
-            response = requests.get(self.api_endpoint)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success'):
-                self.last_updated = convert_timestamp(data.get('lastUpdated'))
-                self.mayor = Mayor(data.get('mayor', {}))
-                self.current_election = Election(data.get('current', {}))
-            else:
-                raise ValueError("Failed to fetch elections data")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred: {e}")
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                response = self.transport.get(self.api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get('success'):
+                    self.last_updated = convert_timestamp(data.get('lastUpdated'))
+                    self.mayor = Mayor(data.get('mayor', {}))
+                    self.current_election = Election(data.get('current', {}))
+                else:
+                    raise ValueError("Failed to fetch elections data")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred: {e}")
 
     def get_current_election(self) -> Election | None:
         """
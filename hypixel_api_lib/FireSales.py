@@ -1,5 +1,7 @@
 from datetime import datetime, timezone, timedelta
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 from hypixel_api_lib.utils import convert_timestamp
 
 FIRE_SALES_API_URL = "https://api.hypixel.net/skyblock/firesales"
@@ -80,10 +82,12 @@ class FireSales:
     Attributes:
         api_endpoint (str): The API endpoint URL.
         sales (list of FireSaleItem): List of active or upcoming fire sales.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
-    def __init__(self, api_endpoint: str = FIRE_SALES_API_URL) -> None:
+    def __init__(self, api_endpoint: str = FIRE_SALES_API_URL, transport: Transport | None = None) -> None:
         self._api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.sales: list[FireSaleItem] = self._get_fire_sales()
 
     def _get_fire_sales(self) -> list[FireSaleItem]:
@@ -93,19 +97,21 @@ class FireSales:
         Returns:
             list of FireSaleItem: A list of fire sale items.
         """
-        try:
-            response = requests.get(self._api_endpoint)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success'):
-                sales_data = data.get('sales', [])
-                sales = [FireSaleItem(sale) for sale in sales_data]
-                return sales
-            else:
-                raise ValueError("API response was not successful")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred while fetching fire sales: {e}")
+        with DEFAULT_INSTRUMENTATION.track(self._api_endpoint):
+            try:
+                response = self.transport.get(self._api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get('success'):
+                    sales_data = data.get('sales', [])
+                    sales = [FireSaleItem(sale) for sale in sales_data]
+                    return sales
+                else:
+                    raise ValueError("API response was not successful")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred while fetching fire sales: {e}")
 
     def get_sale_by_item_id(self, item_id: str) -> FireSaleItem | None:
         """
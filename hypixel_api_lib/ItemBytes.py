@@ -0,0 +1,286 @@
+import base64
+import gzip
+import json
+import struct
+import zlib
+
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+_SCALAR_FORMATS: dict[int, struct.Struct] = {
+    TAG_BYTE: struct.Struct('>b'),
+    TAG_SHORT: struct.Struct('>h'),
+    TAG_INT: struct.Struct('>i'),
+    TAG_LONG: struct.Struct('>q'),
+    TAG_FLOAT: struct.Struct('>f'),
+    TAG_DOUBLE: struct.Struct('>d'),
+}
+_UNSIGNED_SHORT = struct.Struct('>H')
+
+class _NBTReader:
+    """Reads big-endian NBT tags from a byte buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data: bytes = data
+        self.offset: int = 0
+
+    def _unpack(self, fmt: struct.Struct):
+        value = fmt.unpack_from(self.data, self.offset)[0]
+        self.offset += fmt.size
+        return value
+
+    def _read_string(self) -> str:
+        length = self._unpack(_UNSIGNED_SHORT)
+        value = self.data[self.offset:self.offset + length].decode('utf-8', errors='replace')
+        self.offset += length
+        return value
+
+    def _read_array(self, item_format: str) -> list:
+        length = self._unpack(_SCALAR_FORMATS[TAG_INT])
+        fmt = struct.Struct(f'>{length}{item_format}')
+        values = list(fmt.unpack_from(self.data, self.offset))
+        self.offset += fmt.size
+        return values
+
+    def read_payload(self, tag_type: int):
+        fmt = _SCALAR_FORMATS.get(tag_type)
+        if fmt is not None:
+            return self._unpack(fmt)
+        if tag_type == TAG_STRING:
+            return self._read_string()
+        if tag_type == TAG_COMPOUND:
+            compound = {}
+            while True:
+                child_type = self._unpack(_SCALAR_FORMATS[TAG_BYTE])
+                if child_type == TAG_END:
+                    return compound
+                name = self._read_string()
+                compound[name] = self.read_payload(child_type)
+        if tag_type == TAG_LIST:
+            item_type = self._unpack(_SCALAR_FORMATS[TAG_BYTE])
+            length = self._unpack(_SCALAR_FORMATS[TAG_INT])
+            return [self.read_payload(item_type) for _ in range(length)]
+        if tag_type == TAG_BYTE_ARRAY:
+            return self._read_array('b')
+        if tag_type == TAG_INT_ARRAY:
+            return self._read_array('i')
+        if tag_type == TAG_LONG_ARRAY:
+            return self._read_array('q')
+        raise ValueError(f"Unknown NBT tag type {tag_type} at offset {self.offset}")
+
+def parse_nbt(data: bytes) -> dict:
+    """
+    Parse an uncompressed NBT document.
+
+    Args:
+        data (bytes): The raw NBT bytes, starting with the named root compound.
+
+    Returns:
+        dict: The root compound.
+
+    Raises:
+        ValueError: If the data is not a valid NBT document.
+    """
+    reader = _NBTReader(data)
+    try:
+        root_type = reader.read_payload(TAG_BYTE)
+        if root_type != TAG_COMPOUND:
+            raise ValueError(f"NBT root must be a compound, found tag type {root_type}")
+        reader._read_string()
+        return reader.read_payload(TAG_COMPOUND)
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated NBT data: {e}")
+
+def decompress_item_bytes(data: str | bytes) -> bytes:
+    """
+    Decode base64 item bytes and decompress them into raw NBT.
+
+    Args:
+        data (str or bytes): The base64 encoded, gzip or zlib compressed item bytes.
+
+    Returns:
+        bytes: The raw NBT bytes.
+
+    Raises:
+        ValueError: If the data cannot be decoded or decompressed.
+    """
+    try:
+        compressed = base64.b64decode(data)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid base64 item bytes: {e}")
+    try:
+        return gzip.decompress(compressed)
+    except (OSError, EOFError):
+        try:
+            return zlib.decompress(compressed)
+        except zlib.error as e:
+            raise ValueError(f"Could not decompress item bytes: {e}")
+
+class DecodedItem:
+    """
+    Represents a single item decoded from NBT item bytes.
+
+    Attributes:
+        item_id (str): The SkyBlock item ID from ExtraAttributes.
+        count (int): The stack size.
+        uuid (str or None): The unique item UUID, if the item has one.
+        name (str or None): The display name, including formatting codes.
+        extra_attributes (dict): The raw ExtraAttributes compound.
+    """
+
+    def __init__(self, tag: dict) -> None:
+        item_tag = tag.get('tag', {})
+        self.extra_attributes: dict = item_tag.get('ExtraAttributes', {})
+        self.item_id: str = self.extra_attributes.get('id', '')
+        self.count: int = tag.get('Count', 1)
+        self.uuid: str | None = self.extra_attributes.get('uuid')
+        self.name: str | None = item_tag.get('display', {}).get('Name')
+
+    @property
+    def pet_info(self) -> dict | None:
+        """
+        Get the pet info of a pet item.
+
+        Returns:
+            dict or None: The parsed petInfo JSON, or None if the item is not a pet.
+        """
+        pet_info = self.extra_attributes.get('petInfo')
+        if not pet_info:
+            return None
+        try:
+            return json.loads(pet_info) if isinstance(pet_info, str) else pet_info
+        except json.JSONDecodeError:
+            return None
+
+    @property
+    def price_key(self) -> str:
+        """
+        Get the key used to look the item up in price data.
+
+        Pets are keyed by type and tier (e.g. 'PET_ENDER_DRAGON_LEGENDARY'), everything else by item ID.
+
+        Returns:
+            str: The price key.
+        """
+        pet_info = self.pet_info
+        if self.item_id == 'PET' and pet_info:
+            return pet_price_key(pet_info.get('type', ''), pet_info.get('tier', ''))
+        return self.item_id
+
+    def __str__(self) -> str:
+        return f"DecodedItem({self.count}x {self.item_id}, UUID: {self.uuid})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+def pet_price_key(pet_type: str, tier: str) -> str:
+    """
+    Build the price key for a pet.
+
+    Args:
+        pet_type (str): The pet type, e.g. 'ENDER_DRAGON'.
+        tier (str): The pet rarity, e.g. 'LEGENDARY'.
+
+    Returns:
+        str: The price key, e.g. 'PET_ENDER_DRAGON_LEGENDARY'.
+    """
+    return f"PET_{pet_type}_{tier}".upper()
+
+def decode_item_bytes(data: str | bytes) -> list[DecodedItem]:
+    """
+    Decode base64 item bytes, as found in auctions and inventories, into items.
+
+    Empty inventory slots are skipped.
+
+    Args:
+        data (str or bytes): The base64 encoded, compressed NBT item bytes.
+
+    Returns:
+        list of DecodedItem: The decoded items in slot order.
+
+    Raises:
+        ValueError: If the data cannot be decoded.
+    """
+    root = parse_nbt(decompress_item_bytes(data))
+    return [DecodedItem(tag) for tag in root.get('i', []) if tag and tag.get('tag', {}).get('ExtraAttributes', {}).get('id')]
+
+def _tag_type_of(value) -> int:
+    if isinstance(value, bool):
+        return TAG_BYTE
+    if isinstance(value, int):
+        return TAG_INT if -2**31 <= value < 2**31 else TAG_LONG
+    if isinstance(value, float):
+        return TAG_DOUBLE
+    if isinstance(value, str):
+        return TAG_STRING
+    if isinstance(value, dict):
+        return TAG_COMPOUND
+    if isinstance(value, list):
+        return TAG_LIST
+    if isinstance(value, (bytes, bytearray)):
+        return TAG_BYTE_ARRAY
+    raise ValueError(f"Cannot encode {type(value).__name__} as NBT")
+
+def _write_payload(out: bytearray, tag_type: int, value) -> None:
+    fmt = _SCALAR_FORMATS.get(tag_type)
+    if fmt is not None:
+        out += fmt.pack(value)
+    elif tag_type == TAG_STRING:
+        encoded = value.encode('utf-8')
+        out += _UNSIGNED_SHORT.pack(len(encoded)) + encoded
+    elif tag_type == TAG_COMPOUND:
+        for name, child in value.items():
+            child_type = _tag_type_of(child)
+            out += _SCALAR_FORMATS[TAG_BYTE].pack(child_type)
+            _write_payload(out, TAG_STRING, name)
+            _write_payload(out, child_type, child)
+        out += _SCALAR_FORMATS[TAG_BYTE].pack(TAG_END)
+    elif tag_type == TAG_LIST:
+        item_type = _tag_type_of(value[0]) if value else TAG_END
+        out += _SCALAR_FORMATS[TAG_BYTE].pack(item_type) + _SCALAR_FORMATS[TAG_INT].pack(len(value))
+        for item in value:
+            _write_payload(out, item_type, item)
+    elif tag_type == TAG_BYTE_ARRAY:
+        out += _SCALAR_FORMATS[TAG_INT].pack(len(value)) + bytes(value)
+
+def build_nbt(root: dict) -> bytes:
+    """
+    Encode a dictionary as an uncompressed NBT document with an unnamed root compound.
+
+    Tag types are inferred from Python types: int becomes Int (or Long when out of range),
+    float becomes Double and bool becomes Byte.
+
+    Args:
+        root (dict): The root compound.
+
+    Returns:
+        bytes: The raw NBT bytes.
+    """
+    out = bytearray()
+    out += _SCALAR_FORMATS[TAG_BYTE].pack(TAG_COMPOUND)
+    _write_payload(out, TAG_STRING, '')
+    _write_payload(out, TAG_COMPOUND, root)
+    return bytes(out)
+
+def encode_item_bytes(tags: list[dict]) -> str:
+    """
+    Encode item compounds into base64, gzip compressed item bytes as the API returns them.
+
+    Args:
+        tags (list of dict): The item compounds, one per slot.
+
+    Returns:
+        str: The base64 encoded item bytes.
+    """
+    return base64.b64encode(gzip.compress(build_nbt({'i': tags}))).decode('ascii')
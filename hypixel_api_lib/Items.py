@@ -1,4 +1,6 @@
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 
 ITEMS_API_URL = r"https://api.hypixel.net/v2/resources/skyblock/items"
 
@@ -58,40 +60,45 @@ class Items:
     Attributes:
         api_endpoint (str): The endpoint URL to fetch the items data.
         items (dict of [str: SkyBlockItem]): A dictionary of item IDs to SkyBlockItem objects.
+        transport (Transport): Sends the requests and retries transient failures.
     """
     
-    def __init__(self, api_endpoint: str = ITEMS_API_URL) -> None:
+    def __init__(self, api_endpoint: str = ITEMS_API_URL, transport: Transport | None = None) -> None:
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.items: dict[str,SkyBlockItem] | None = None
         self._load_items()
 
     def _load_items(self) -> None:
         """Fetch items data from the API and initialize SkyBlockItem objects."""
-        try:
-            response = requests.get(self.api_endpoint)
-            response.raise_for_status()
-            data = response.json()
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                response = self.transport.get(self.api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
             
-            if "items" in data and data["items"]:
-                self.items = {}
-                for item_data in data["items"]:
-                    item = SkyBlockItem(
-                        id=item_data.get('id'),
-                        material=item_data.get('material'),
-                        name=item_data.get('name'),
-                        tier=item_data.get('tier'),
-                        category=item_data.get('category'),
-                        stats=item_data.get('stats'),
-                        npc_sell_price=item_data.get('npc_sell_price'),
-                        color=item_data.get('color'),
-                        skin=item_data.get('skin'),
-                        durability=item_data.get('durability'),
-                    )
-                    self.items[item.id] = item
-            else:
-                raise ValueError("No items data available in the response")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred: {e}")
+                if "items" in data and data["items"]:
+                    self.items = {}
+                    with time_phase('build'):
+                        for item_data in data["items"]:
+                            item = SkyBlockItem(
+                                id=item_data.get('id'),
+                                material=item_data.get('material'),
+                                name=item_data.get('name'),
+                                tier=item_data.get('tier'),
+                                category=item_data.get('category'),
+                                stats=item_data.get('stats'),
+                                npc_sell_price=item_data.get('npc_sell_price'),
+                                color=item_data.get('color'),
+                                skin=item_data.get('skin'),
+                                durability=item_data.get('durability'),
+                            )
+                            self.items[item.id] = item
+                else:
+                    raise ValueError("No items data available in the response")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred: {e}")
 
     def get_item(self, item_id: str) -> SkyBlockItem | str:
         """
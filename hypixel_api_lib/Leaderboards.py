@@ -0,0 +1,299 @@
+import heapq
+import math
+from array import array
+from collections.abc import Callable, Iterable
+import numpy as np
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.Skills import Skills
+from hypixel_api_lib.member.ProfileMember import SkyBlockProfileMember
+
+# Skills left out of the skill average, matching the in-game calculation
+COSMETIC_SKILLS: tuple[str, ...] = ('RUNECRAFTING', 'SOCIAL')
+
+class LeaderboardEntry:
+    """
+    Represents a single ranked member on a leaderboard.
+
+    Attributes:
+        uuid (str): The UUID of the member.
+        profile_id (str or None): The profile the member was read from.
+        value (float): The metric value.
+        rank (int): The 1-based position on the leaderboard.
+    """
+
+    def __init__(self, uuid: str, profile_id: str | None, value: float, rank: int) -> None:
+        self.uuid: str = uuid
+        self.profile_id: str | None = profile_id
+        self.value: float = value
+        self.rank: int = rank
+
+    def __str__(self) -> str:
+        return f"#{self.rank} {self.uuid} ({self.profile_id}): {self.value}"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+class LeaderboardMetric:
+    """
+    Represents a metric extracted from every member added to a leaderboard.
+
+    Attributes:
+        name (str): The metric name.
+        func (callable): Extracts the value from a SkyBlockProfileMember, returning None when not applicable.
+        k (int): The number of top entries kept.
+        missing (int): The number of members the function returned None for.
+    """
+
+    def __init__(self, name: str, func: Callable[[SkyBlockProfileMember], float | None], k: int) -> None:
+        self.name: str = name
+        self.func: Callable[[SkyBlockProfileMember], float | None] = func
+        self.k: int = k
+        self.missing: int = 0
+        self.values: array = array('d')
+        self._heap: list[tuple[float, int]] = []
+        self._sorted: np.ndarray | None = None
+
+    def add(self, value: float | None, row: int) -> None:
+        """Append a value to the metric column and update the top-k heap."""
+        value = math.nan if value is None else float(value)
+        self.values.append(value)
+        self._sorted = None
+        if math.isnan(value):
+            self.missing += 1
+            return
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (value, row))
+        elif value > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (value, row))
+
+    def sorted_values(self) -> np.ndarray:
+        """Get the non-missing values in ascending order, sorting lazily after new values arrive."""
+        if self._sorted is None:
+            column = np.frombuffer(self.values, dtype=np.float64) if self.values else np.empty(0)
+            self._sorted = np.sort(column[~np.isnan(column)])
+        return self._sorted
+
+    def __str__(self) -> str:
+        return f"LeaderboardMetric({self.name}, Top {self.k}, Values: {len(self.values)})"
+
+def skill_average_metric(skills: Skills) -> Callable[[SkyBlockProfileMember], float | None]:
+    """
+    Create a metric computing a member's average skill level.
+
+    Args:
+        skills (Skills): The skill level tables used to convert XP into levels.
+
+    Returns:
+        callable: A metric function for LeaderboardBuilder.register.
+    """
+    def skill_average(member: SkyBlockProfileMember) -> float | None:
+        levels = []
+        for experience in member.player_data.experience:
+            key = experience.skill_name.upper().removeprefix('SKILL_')
+            if key in COSMETIC_SKILLS or key not in skills.skills:
+                continue
+            levels.append(skills.skills[key].level_for_xp(experience.experience))
+        return sum(levels) / len(levels) if levels else None
+    return skill_average
+
+DEFAULT_METRICS: dict[str, Callable[[SkyBlockProfileMember], float | None]] = {
+    'slayer_xp': lambda member: member.slayer.total_xp(),
+    'bestiary_kills': lambda member: member.bestiary.total_kills(),
+    'collected_items': lambda member: member.collection.get_total_amount_collected(),
+    'catacombs_level': lambda member: member.dungeons.get_catacombs_level(),
+    'class_average': lambda member: member.dungeons.player_classes.get_class_average(),
+}
+
+class LeaderboardBuilder:
+    """
+    Streams profiles into compact numeric columns and ranks members by registered metrics.
+
+    Only the metric values and member identifiers are kept, so profiles can be discarded as soon
+    as they are added. Each metric keeps its top-k in a heap and answers rank and percentile
+    queries from a sorted copy of its column that is rebuilt only after new values arrive.
+
+    Attributes:
+        k (int): The default number of top entries kept per metric.
+        metrics (dict of str to LeaderboardMetric): The registered metrics by name.
+    """
+
+    def __init__(self, k: int = 100, metrics: dict[str, Callable[[SkyBlockProfileMember], float | None]] | None = None) -> None:
+        self.k: int = k
+        self.metrics: dict[str, LeaderboardMetric] = {}
+        self._uuids: list[str] = []
+        self._profile_ids: list[str | None] = []
+        self._rows: dict[tuple[str, str | None], int] = {}
+        for name, func in (DEFAULT_METRICS if metrics is None else metrics).items():
+            self.register(name, func)
+
+    def register(self, name: str, func: Callable[[SkyBlockProfileMember], float | None], k: int | None = None) -> None:
+        """
+        Register a metric. Metrics must be registered before any member is added.
+
+        Args:
+            name (str): The metric name.
+            func (callable): Extracts the value from a SkyBlockProfileMember, returning None when not applicable.
+            k (int, optional): The number of top entries kept, defaults to the builder's k.
+
+        Raises:
+            ValueError: If the metric already exists or members were already added.
+        """
+        if name in self.metrics:
+            raise ValueError(f"Metric '{name}' is already registered.")
+        if self._uuids:
+            raise ValueError("Metrics must be registered before members are added.")
+        self.metrics[name] = LeaderboardMetric(name, func, k if k is not None else self.k)
+
+    def _get_metric(self, name: str) -> LeaderboardMetric:
+        metric = self.metrics.get(name)
+        if metric is None:
+            raise ValueError(f"Metric '{name}' not found.")
+        return metric
+
+    def add_member(self, member: SkyBlockProfileMember, profile_id: str | None = None) -> None:
+        """
+        Extract every metric from a member.
+
+        A metric function returning None records the member as missing for that metric. Errors
+        raised by a metric function propagate, leaving the builder unchanged. Adding the same
+        member of the same profile twice is ignored.
+
+        Args:
+            member (SkyBlockProfileMember): The member to add.
+            profile_id (str, optional): The profile the member belongs to.
+        """
+        key = (member.uuid, profile_id)
+        if key in self._rows:
+            return
+        values = [metric.func(member) for metric in self.metrics.values()]
+        row = len(self._uuids)
+        self._rows[key] = row
+        self._uuids.append(member.uuid)
+        self._profile_ids.append(profile_id)
+        for metric, value in zip(self.metrics.values(), values):
+            metric.add(value, row)
+
+    def add_profile(self, profile: SkyBlockProfile) -> None:
+        """
+        Add every member of a profile.
+
+        Args:
+            profile (SkyBlockProfile): The profile to add.
+        """
+        for member in profile.members.values():
+            self.add_member(member, profile.profile_id)
+
+    def add_profiles(self, profiles: Iterable[SkyBlockProfile]) -> None:
+        """
+        Add profiles from any iterable, such as a generator fetching them one by one.
+
+        Args:
+            profiles (iterable of SkyBlockProfile): The profiles to add.
+        """
+        for profile in profiles:
+            self.add_profile(profile)
+
+    def get_top(self, name: str, n: int | None = None) -> list[LeaderboardEntry]:
+        """
+        Retrieve the top members for a metric.
+
+        Args:
+            name (str): The metric name.
+            n (int, optional): The number of entries, at most the metric's k.
+
+        Returns:
+            list of LeaderboardEntry: The best members, highest value first.
+
+        Raises:
+            ValueError: If the metric does not exist.
+        """
+        metric = self._get_metric(name)
+        top = heapq.nlargest(n if n is not None else metric.k, metric._heap, key=lambda item: (item[0], -item[1]))
+        return [
+            LeaderboardEntry(self._uuids[row], self._profile_ids[row], value, position)
+            for position, (value, row) in enumerate(top, start=1)
+        ]
+
+    def get_value(self, name: str, uuid: str, profile_id: str | None = None) -> float | None:
+        """
+        Retrieve the recorded metric value of a member.
+
+        Args:
+            name (str): The metric name.
+            uuid (str): The UUID of the member.
+            profile_id (str, optional): The profile the member was added with.
+
+        Returns:
+            float or None: The value, or None if the member or value is missing.
+
+        Raises:
+            ValueError: If the metric does not exist.
+        """
+        metric = self._get_metric(name)
+        row = self._rows.get((uuid, profile_id))
+        if row is None or math.isnan(metric.values[row]):
+            return None
+        return metric.values[row]
+
+    def rank(self, name: str, value: float) -> int:
+        """
+        Get the rank a value would have on a leaderboard.
+
+        Args:
+            name (str): The metric name.
+            value (float): The value to rank.
+
+        Returns:
+            int: 1 plus the number of recorded values strictly greater than the value.
+
+        Raises:
+            ValueError: If the metric does not exist.
+        """
+        values = self._get_metric(name).sorted_values()
+        return int(len(values) - np.searchsorted(values, value, side='right')) + 1
+
+    def percentile(self, name: str, value: float) -> float:
+        """
+        Get the percentage of recorded values that are less than or equal to a value.
+
+        Args:
+            name (str): The metric name.
+            value (float): The value to look up.
+
+        Returns:
+            float: The percentile between 0 and 100, or 0.0 if the metric has no values.
+
+        Raises:
+            ValueError: If the metric does not exist.
+        """
+        values = self._get_metric(name).sorted_values()
+        if not len(values):
+            return 0.0
+        return 100.0 * int(np.searchsorted(values, value, side='right')) / len(values)
+
+    def value_at_percentile(self, name: str, percentile: float) -> float | None:
+        """
+        Get the metric value at a percentile, e.g. the cutoff for the top 1% at 99.
+
+        Args:
+            name (str): The metric name.
+            percentile (float): The percentile between 0 and 100.
+
+        Returns:
+            float or None: The interpolated value, or None if the metric has no values.
+
+        Raises:
+            ValueError: If the metric does not exist or the percentile is out of range.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percentile}")
+        values = self._get_metric(name).sorted_values()
+        if not len(values):
+            return None
+        return float(np.percentile(values, percentile))
+
+    def __len__(self) -> int:
+        return len(self._uuids)
+
+    def __str__(self) -> str:
+        return f"LeaderboardBuilder with {len(self.metrics)} metrics and {len(self._uuids)} members"
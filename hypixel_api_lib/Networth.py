@@ -0,0 +1,339 @@
+import math
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from hypixel_api_lib.Auctions import SkyBlockAuction
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.Items import Items
+from hypixel_api_lib.ItemBytes import DecodedItem, decode_item_bytes, pet_price_key
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.member.ProfileMember import SkyBlockProfileMember
+
+class PriceSnapshot:
+    """
+    A flat price lookup built once per bazaar and auction house snapshot.
+
+    Attributes:
+        prices (dict of str to float): Unit prices keyed by price key (item ID, or pet type and tier).
+        last_updated (datetime or None): The timestamp of the bazaar data the prices came from.
+    """
+
+    def __init__(self, prices: dict[str, float], last_updated: datetime | None = None) -> None:
+        self.prices: dict[str, float] = prices
+        self.last_updated: datetime | None = last_updated
+
+    @classmethod
+    def from_sources(cls, bazaar: Bazaar | None = None, lowest_bins: dict[str, float] | None = None, items: Items | None = None) -> 'PriceSnapshot':
+        """
+        Build a price snapshot from the available price sources.
+
+        Bazaar instant-sell prices take precedence over lowest BIN prices, which take precedence
+        over NPC sell prices.
+
+        Args:
+            bazaar (Bazaar, optional): The bazaar snapshot.
+            lowest_bins (dict of str to float, optional): Lowest BIN unit prices by price key, see get_lowest_bins.
+            items (Items, optional): Item metadata providing NPC sell prices.
+
+        Returns:
+            PriceSnapshot: The merged prices.
+        """
+        prices = {}
+        if items is not None and items.items:
+            prices.update({item_id: float(item.npc_sell_price) for item_id, item in items.items.items() if item.npc_sell_price})
+        if lowest_bins:
+            prices.update(lowest_bins)
+        last_updated = None
+        if bazaar is not None:
+            depth = bazaar.get_market_depth()
+            for product_id, sell_price in zip(depth.product_ids, depth.top_prices('sell').tolist()):
+                if math.isnan(sell_price):
+                    sell_price = bazaar.products[product_id].quick_status.sell_price
+                if sell_price:
+                    prices[product_id] = sell_price
+            last_updated = bazaar.last_updated
+        return cls(prices, last_updated)
+
+    def get_price(self, key: str) -> float | None:
+        """
+        Retrieve the unit price of an item.
+
+        Args:
+            key (str): The price key.
+
+        Returns:
+            float or None: The unit price, or None if the item is unpriced.
+        """
+        return self.prices.get(key)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __str__(self) -> str:
+        return f"PriceSnapshot with {len(self.prices)} prices (Last Updated: {self.last_updated})"
+
+def get_lowest_bins(auctions: Iterable[SkyBlockAuction]) -> dict[str, float]:
+    """
+    Compute the lowest BIN unit price of every item on the auction house.
+
+    Auctions whose item bytes cannot be decoded are skipped.
+
+    Args:
+        auctions (iterable of SkyBlockAuction): The active auctions, e.g. from ActiveAuctions.get_all_auctions.
+
+    Returns:
+        dict of str to float: The lowest unit price keyed by price key.
+    """
+    lowest = {}
+    for auction in auctions:
+        if not auction.is_bin or not auction.item_bytes or not auction.starting_bid:
+            continue
+        item_bytes = auction.item_bytes.get('data') if isinstance(auction.item_bytes, dict) else auction.item_bytes
+        try:
+            decoded = decode_item_bytes(item_bytes)
+        except ValueError:
+            continue
+        if not decoded:
+            continue
+        item = decoded[0]
+        unit_price = auction.starting_bid / max(item.count, 1)
+        key = item.price_key
+        if unit_price < lowest.get(key, math.inf):
+            lowest[key] = unit_price
+    return lowest
+
+class MemberNetworth:
+    """
+    Represents the valuation of a single profile member.
+
+    Attributes:
+        uuid (str): The UUID of the member.
+        categories (dict of str to float): The value of each category, e.g. 'inventory', 'pets', 'purse'.
+        unpriced (dict of str to int): Counts of items that had no price, by price key.
+    """
+
+    def __init__(self, uuid: str) -> None:
+        self.uuid: str = uuid
+        self.categories: dict[str, float] = {}
+        self.unpriced: dict[str, int] = {}
+
+    def add(self, category: str, value: float) -> None:
+        """Add a value to a category."""
+        self.categories[category] = self.categories.get(category, 0.0) + value
+
+    @property
+    def total(self) -> float:
+        """
+        Get the total value of the member.
+
+        Returns:
+            float: The sum of all categories.
+        """
+        return sum(self.categories.values())
+
+    def __str__(self) -> str:
+        return f"MemberNetworth({self.uuid}, Total: {self.total:,.0f})"
+
+class ProfileNetworth:
+    """
+    Represents the valuation of a whole SkyBlock profile.
+
+    Attributes:
+        profile_id (str): The profile ID.
+        members (dict of str to MemberNetworth): The valuation of each member by UUID.
+        bank (float): The shared bank balance.
+    """
+
+    def __init__(self, profile_id: str, members: dict[str, MemberNetworth], bank: float) -> None:
+        self.profile_id: str = profile_id
+        self.members: dict[str, MemberNetworth] = members
+        self.bank: float = bank
+
+    @property
+    def categories(self) -> dict[str, float]:
+        """
+        Get the value of each category summed over all members, including the bank.
+
+        Returns:
+            dict of str to float: The combined category values.
+        """
+        combined = {'bank': self.bank}
+        for member in self.members.values():
+            for category, value in member.categories.items():
+                combined[category] = combined.get(category, 0.0) + value
+        return combined
+
+    @property
+    def total(self) -> float:
+        """
+        Get the total value of the profile.
+
+        Returns:
+            float: The bank balance plus every member's total.
+        """
+        return self.bank + sum(member.total for member in self.members.values())
+
+    def __str__(self) -> str:
+        return f"ProfileNetworth({self.profile_id}, Members: {len(self.members)}, Total: {self.total:,.0f})"
+
+class NetworthEngine:
+    """
+    Values profiles against a price snapshot.
+
+    Decoded inventories are kept in a bounded LRU cache keyed by their raw item bytes, so
+    unchanged inventories are never decoded twice. Item values are cached by item UUID for the
+    current price snapshot, and an item UUID is only counted once per member.
+
+    Attributes:
+        prices (PriceSnapshot): The prices used for valuation.
+        cache_size (int): The maximum number of decoded inventories kept in memory.
+    """
+
+    INVENTORY_CATEGORIES: dict[str, str] = {
+        'inv_contents': 'inventory',
+        'inv_armor': 'armor',
+        'equipment_contents': 'equipment',
+        'wardrobe_contents': 'wardrobe',
+        'ender_chest_contents': 'ender_chest',
+        'personal_vault_contents': 'personal_vault',
+    }
+
+    BAG_CATEGORIES: dict[str, str] = {
+        'talisman_bag': 'accessories',
+        'potion_bag': 'bags',
+        'fishing_bag': 'bags',
+        'quiver': 'bags',
+    }
+
+    def __init__(self, prices: PriceSnapshot, cache_size: int = 10000) -> None:
+        self.prices: PriceSnapshot = prices
+        self.cache_size: int = cache_size
+        self._decoded: OrderedDict[str, tuple[DecodedItem, ...]] = OrderedDict()
+        self._item_values: dict[str, float | None] = {}
+
+    def set_prices(self, prices: PriceSnapshot) -> None:
+        """
+        Switch to a new price snapshot, keeping decoded inventories but dropping cached item values.
+
+        Args:
+            prices (PriceSnapshot): The new prices.
+        """
+        self.prices = prices
+        self._item_values.clear()
+
+    def decode(self, item_bytes: str) -> tuple[DecodedItem, ...]:
+        """
+        Decode inventory item bytes, using the cache when the same bytes were seen before.
+
+        Args:
+            item_bytes (str): The base64 encoded inventory data.
+
+        Returns:
+            tuple of DecodedItem: The decoded items, or an empty tuple if the data is invalid.
+        """
+        cached = self._decoded.get(item_bytes)
+        if cached is not None:
+            self._decoded.move_to_end(item_bytes)
+            return cached
+        try:
+            decoded = tuple(decode_item_bytes(item_bytes))
+        except ValueError:
+            decoded = ()
+        self._decoded[item_bytes] = decoded
+        if len(self._decoded) > self.cache_size:
+            self._decoded.popitem(last=False)
+        return decoded
+
+    def _item_value(self, item: DecodedItem) -> float | None:
+        if item.uuid is not None and item.uuid in self._item_values:
+            return self._item_values[item.uuid]
+        price = self.prices.get_price(item.price_key)
+        value = price * item.count if price is not None else None
+        if item.uuid is not None:
+            self._item_values[item.uuid] = value
+        return value
+
+    def _value_items(self, result: MemberNetworth, category: str, items: Iterable[DecodedItem], seen: set[str]) -> None:
+        total = 0.0
+        for item in items:
+            if item.uuid is not None:
+                if item.uuid in seen:
+                    continue
+                seen.add(item.uuid)
+            value = self._item_value(item)
+            if value is None:
+                result.unpriced[item.price_key] = result.unpriced.get(item.price_key, 0) + item.count
+            else:
+                total += value
+        result.add(category, total)
+
+    def _value_counts(self, result: MemberNetworth, category: str, counts: dict[str, int]) -> None:
+        total = 0.0
+        for key, count in counts.items():
+            if not count:
+                continue
+            price = self.prices.get_price(key)
+            if price is None:
+                result.unpriced[key] = result.unpriced.get(key, 0) + count
+            else:
+                total += price * count
+        result.add(category, total)
+
+    def value_member(self, member: SkyBlockProfileMember) -> MemberNetworth:
+        """
+        Value a single profile member.
+
+        Args:
+            member (SkyBlockProfileMember): The member to value.
+
+        Returns:
+            MemberNetworth: The value of each category of the member.
+        """
+        result = MemberNetworth(member.uuid)
+        seen = set()
+        inventory = member.inventory or {}
+
+        for key, category in self.INVENTORY_CATEGORIES.items():
+            blob = inventory.get(key, {}).get('data')
+            self._value_items(result, category, self.decode(blob) if blob else (), seen)
+
+        storage = []
+        for backpack in inventory.get('backpack_contents', {}).values():
+            if backpack.get('data'):
+                storage.extend(self.decode(backpack['data']))
+        self._value_items(result, 'storage', storage, seen)
+
+        bags = inventory.get('bag_contents', {})
+        for key, category in self.BAG_CATEGORIES.items():
+            blob = bags.get(key, {}).get('data')
+            self._value_items(result, category, self.decode(blob) if blob else (), seen)
+
+        self._value_counts(result, 'sacks', inventory.get('sacks_counts', {}))
+
+        pet_counts = {}
+        for pet in member.pets_data.pets:
+            for key in (pet_price_key(pet.type or '', pet.tier or ''), pet.held_item, f"PET_SKIN_{pet.skin}" if pet.skin else None):
+                if key:
+                    pet_counts[key] = pet_counts.get(key, 0) + 1
+        self._value_counts(result, 'pets', pet_counts)
+
+        self._value_counts(result, 'essence', {f"ESSENCE_{essence_type}": essence.current for essence_type, essence in member.currencies.essence.items()})
+        result.add('purse', member.currencies.coin_purse or 0.0)
+        return result
+
+    def value_profile(self, profile: SkyBlockProfile) -> ProfileNetworth:
+        """
+        Value every member of a profile plus the shared bank.
+
+        Args:
+            profile (SkyBlockProfile): The profile to value.
+
+        Returns:
+            ProfileNetworth: The per-member, per-category and total value of the profile.
+        """
+        members = {uuid: self.value_member(member) for uuid, member in profile.members.items()}
+        bank = profile.banking.balance if profile.banking is not None else 0.0
+        return ProfileNetworth(profile.profile_id, members, bank)
+
+    def __str__(self) -> str:
+        return f"NetworthEngine using {self.prices}, Cached Inventories: {len(self._decoded)}"
@@ -1,6 +1,8 @@
 import requests
 import re
 from datetime import datetime, date
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 
 NEWS_API_URL = r"https://api.hypixel.net/skyblock/news"
 
@@ -44,47 +46,51 @@ class SkyBlockNews:
         api_endpoint (str): The endpoint URL to fetch the news data.
         api_key (str): The API key required for the request.
         news_items (list[SkyBlockNewsItem]): A list of SkyBlockNewsItem objects.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
-    def __init__(self, api_key: str, api_endpoint: str = NEWS_API_URL) -> None:
+    def __init__(self, api_key: str, api_endpoint: str = NEWS_API_URL, transport: Transport | None = None) -> None:
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.api_key: str = api_key
         self.news_items: list[SkyBlockNewsItem] = []
         self._load_news()
 
     def _load_news(self) -> None:
         """Fetch news data from the API and initialize SkyBlockNewsItem objects."""
-        try:
-            params = {'key': self.api_key}
-            response = requests.get(self.api_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("success") and "items" in data and data["items"]:
-                self.news_items = []
-                for news_data in data["items"]:
-                    material_data = news_data.get('item', {})
-                    material = material_data.get('material')
-
-                    news_item = SkyBlockNewsItem(
-                        material=material,
-                        link=news_data.get('link'),
-                        date_str=news_data.get('text'),
-                        title=news_data.get('title'),
-                    )
-                    self.news_items.append(news_item)
-            else:
-                raise ValueError("No news data available in the response")
-        except requests.exceptions.HTTPError as e:
-            response_status = response.status_code
-            if response_status == 403:
-                raise PermissionError("Access forbidden: Invalid API key.")
-            elif response_status == 429:
-                raise ConnectionError("Request limit reached: Throttling in effect.")
-            else:
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                params = {'key': self.api_key}
+                response = self.transport.get(self.api_endpoint, params=params)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
+
+                if data.get("success") and "items" in data and data["items"]:
+                    self.news_items = []
+                    for news_data in data["items"]:
+                        material_data = news_data.get('item', {})
+                        material = material_data.get('material')
+
+                        news_item = SkyBlockNewsItem(
+                            material=material,
+                            link=news_data.get('link'),
+                            date_str=news_data.get('text'),
+                            title=news_data.get('title'),
+                        )
+                        self.news_items.append(news_item)
+                else:
+                    raise ValueError("No news data available in the response")
+            except requests.exceptions.HTTPError as e:
+                response_status = response.status_code
+                if response_status == 403:
+                    raise PermissionError("Access forbidden: Invalid API key.")
+                elif response_status == 429:
+                    raise ConnectionError("Request limit reached: Throttling in effect.")
+                else:
+                    raise ConnectionError(f"An error occurred while fetching news: {e}")
+            except requests.exceptions.RequestException as e:
                 raise ConnectionError(f"An error occurred while fetching news: {e}")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred while fetching news: {e}")
 
     def get_latest_news(self) -> SkyBlockNewsItem | None:
         """
@@ -0,0 +1,274 @@
+import heapq
+import math
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from hypixel_api_lib.Auctions import RecentlyEndedAuction
+from hypixel_api_lib.ItemBytes import decode_item_bytes
+
+PRICE_WINDOWS: dict[str, float] = {
+    '1h': 3600.0,
+    '24h': 86400.0,
+    '7d': 604800.0,
+}
+
+# Bucket size of _SortedPrices, buckets are split at twice and merged below half of it
+_BUCKET_LOAD: int = 256
+
+class _SortedPrices:
+    """
+    A sorted list of prices split into buckets of bounded size.
+
+    Adding or removing a price finds its bucket by binary search over the bucket maxima and only
+    moves the elements of that bucket, so an update costs O(log n) comparisons plus a copy of at
+    most 2 * _BUCKET_LOAD elements, independent of the number of prices. Indexing walks the bucket
+    sizes, which is only done by quantile queries.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[list[float]] = []
+        self._maxes: list[float] = []
+        self._len: int = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        for bucket in self._buckets:
+            yield from bucket
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("price index out of range")
+        for bucket in self._buckets:
+            if index < len(bucket):
+                return bucket[index]
+            index -= len(bucket)
+        raise IndexError("price index out of range")
+
+    def add(self, price: float) -> None:
+        if not self._buckets:
+            self._buckets.append([price])
+            self._maxes.append(price)
+        else:
+            i = min(bisect_left(self._maxes, price), len(self._maxes) - 1)
+            bucket = self._buckets[i]
+            insort(bucket, price)
+            self._maxes[i] = bucket[-1]
+            self._split(i)
+        self._len += 1
+
+    def remove(self, price: float) -> None:
+        i = bisect_left(self._maxes, price)
+        bucket = self._buckets[i] if i < len(self._buckets) else []
+        j = bisect_left(bucket, price)
+        if j == len(bucket) or bucket[j] != price:
+            raise ValueError(f"{price} is not in the list")
+        del bucket[j]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[i]
+            del self._maxes[i]
+            return
+        self._maxes[i] = bucket[-1]
+        if len(bucket) < _BUCKET_LOAD // 2 and len(self._buckets) > 1:
+            # Merge into a neighbour so buckets do not shrink to a few elements each
+            if i == len(self._buckets) - 1:
+                i -= 1
+            self._buckets[i].extend(self._buckets.pop(i + 1))
+            self._maxes.pop(i + 1)
+            self._maxes[i] = self._buckets[i][-1]
+            self._split(i)
+
+    def _split(self, i: int) -> None:
+        bucket = self._buckets[i]
+        if len(bucket) > 2 * _BUCKET_LOAD:
+            self._buckets.insert(i + 1, bucket[_BUCKET_LOAD:])
+            self._maxes.insert(i + 1, bucket[-1])
+            del bucket[_BUCKET_LOAD:]
+            self._maxes[i] = bucket[-1]
+
+class _RollingWindow:
+    """Keeps the unit prices of one item within a time window in sorted order, updated in O(log n)."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds: float = seconds
+        self.prices: _SortedPrices = _SortedPrices()
+        self._expiry: list[tuple[float, float]] = []
+
+    @property
+    def coins(self) -> float:
+        # Summed on demand, as a running total drifts after many additions and subtractions
+        return math.fsum(self.prices)
+
+    def add(self, timestamp: float, price: float, now: float) -> None:
+        if timestamp <= now - self.seconds:
+            return
+        self.prices.add(price)
+        heapq.heappush(self._expiry, (timestamp, price))
+
+    def expire(self, now: float) -> None:
+        cutoff = now - self.seconds
+        while self._expiry and self._expiry[0][0] <= cutoff:
+            _, price = heapq.heappop(self._expiry)
+            self.prices.remove(price)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.prices:
+            return None
+        position = q * (len(self.prices) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(self.prices) - 1)
+        return self.prices[lower] + (self.prices[upper] - self.prices[lower]) * (position - lower)
+
+class PriceWindowStats:
+    """
+    Represents the price statistics of an item over one window.
+
+    Attributes:
+        item_id (str): The SkyBlock item ID.
+        window (str): The window name, e.g. '24h'.
+        bin (bool): Whether the statistics cover BIN sales or regular auctions.
+        volume (int): The number of sales in the window.
+        coins (float): The total coins spent per unit across the sales.
+        median (float or None): The median unit price.
+        p10 (float or None): The 10th percentile unit price.
+        p90 (float or None): The 90th percentile unit price.
+        min_price (float or None): The lowest unit price.
+        max_price (float or None): The highest unit price.
+    """
+
+    def __init__(self, item_id: str, window: str, bin: bool, rolling: _RollingWindow) -> None:
+        self.item_id: str = item_id
+        self.window: str = window
+        self.bin: bool = bin
+        self.volume: int = len(rolling.prices)
+        self.coins: float = rolling.coins
+        self.median: float | None = rolling.quantile(0.5)
+        self.p10: float | None = rolling.quantile(0.1)
+        self.p90: float | None = rolling.quantile(0.9)
+        self.min_price: float | None = rolling.prices[0] if rolling.prices else None
+        self.max_price: float | None = rolling.prices[-1] if rolling.prices else None
+
+    def __str__(self) -> str:
+        auction_type = "BIN" if self.bin else "Auction"
+        return f"{self.item_id} {auction_type} {self.window}: Median {self.median}, P10 {self.p10}, P90 {self.p90}, Volume {self.volume}"
+
+class RollingPriceStats:
+    """
+    Maintains rolling per-item unit price statistics over ended auctions.
+
+    Every (item, BIN flag, window) keeps its prices in a sorted list split into bounded buckets,
+    so adding or expiring a sale is O(log n) in the window's sale count and quantile queries
+    only walk the bucket sizes. Time is driven by the sale timestamps, so replaying a stored
+    history gives the same results as live polling.
+    Pass add_sales as the callback of a RecentlyEndedAuctionsPoller to keep the statistics current.
+
+    Attributes:
+        windows (dict of str to float): The window lengths in seconds by name.
+        now (datetime or None): The latest sale time seen, used as the end of every window.
+    """
+
+    def __init__(self, windows: dict[str, float] | None = None) -> None:
+        self.windows: dict[str, float] = dict(PRICE_WINDOWS if windows is None else windows)
+        self.now: datetime | None = None
+        self._rolling: dict[tuple[str, bool], dict[str, _RollingWindow]] = {}
+
+    def add_sale(self, auction: RecentlyEndedAuction) -> bool:
+        """
+        Add a sale, valued per unit of the sold stack.
+
+        Args:
+            auction (RecentlyEndedAuction): The ended auction.
+
+        Returns:
+            bool: False if the sale was skipped because its item or time could not be read.
+        """
+        if not auction.item_bytes or auction.timestamp is None or not auction.price:
+            return False
+        try:
+            items = decode_item_bytes(auction.item_bytes)
+        except ValueError:
+            return False
+        if not items:
+            return False
+        item = items[0]
+
+        if self.now is None or auction.timestamp > self.now:
+            self.now = auction.timestamp
+        now = self.now.timestamp()
+        windows = self._rolling.setdefault((item.price_key, bool(auction.bin)), {
+            name: _RollingWindow(seconds) for name, seconds in self.windows.items()
+        })
+        for rolling in windows.values():
+            rolling.add(auction.timestamp.timestamp(), auction.price / max(item.count, 1), now)
+            rolling.expire(now)
+        return True
+
+    def add_sales(self, auctions: Iterable[RecentlyEndedAuction]) -> int:
+        """
+        Add many sales.
+
+        Args:
+            auctions (iterable of RecentlyEndedAuction): The ended auctions.
+
+        Returns:
+            int: The number of sales added.
+        """
+        return sum(self.add_sale(auction) for auction in auctions)
+
+    def get_stats(self, item_id: str, window: str = '24h', bin: bool = True, now: datetime | None = None) -> PriceWindowStats:
+        """
+        Retrieve the price statistics of an item over a window.
+
+        Args:
+            item_id (str): The item ID, or pet price key such as 'PET_BEE_RARE'.
+            window (str): The window name, e.g. '1h', '24h' or '7d'.
+            bin (bool): True for BIN sales, False for regular auctions.
+            now (datetime, optional): The end of the window, defaults to the latest sale seen.
+                Sales that fall out of the window are discarded, so times should not go backwards.
+
+        Returns:
+            PriceWindowStats: The statistics, empty if the item has no sales in the window.
+
+        Raises:
+            ValueError: If the window does not exist.
+        """
+        if window not in self.windows:
+            raise ValueError(f"Unknown window '{window}', expected one of {', '.join(self.windows)}")
+        rolling = self._rolling.get((item_id, bin), {}).get(window)
+        if rolling is None:
+            return PriceWindowStats(item_id, window, bin, _RollingWindow(self.windows[window]))
+        end = now or self.now or datetime.now(timezone.utc)
+        rolling.expire(end.timestamp())
+        return PriceWindowStats(item_id, window, bin, rolling)
+
+    def get_all_stats(self, item_id: str, now: datetime | None = None) -> dict[tuple[str, bool], PriceWindowStats]:
+        """
+        Retrieve the statistics of an item for every window, for both BIN sales and auctions.
+
+        Args:
+            item_id (str): The item ID.
+            now (datetime, optional): The end of the windows, defaults to the latest sale seen.
+
+        Returns:
+            dict of (str, bool) to PriceWindowStats: The statistics keyed by window name and BIN flag.
+        """
+        return {
+            (window, bin): self.get_stats(item_id, window, bin, now)
+            for window in self.windows for bin in (True, False)
+        }
+
+    def list_items(self) -> list[str]:
+        """
+        List the items with recorded sales.
+
+        Returns:
+            list of str: The item IDs, sorted.
+        """
+        return sorted({item_id for item_id, _ in self._rolling})
+
+    def __str__(self) -> str:
+        return f"RollingPriceStats tracking {len(self.list_items())} items over {', '.join(self.windows)}"
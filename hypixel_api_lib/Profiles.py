@@ -2,6 +2,12 @@ import requests
 from datetime import datetime
 from .member.ProfileMember import SkyBlockProfileMember
 from hypixel_api_lib.utils import convert_timestamp, get_uuid_from_username, get_username_from_uuid
+from hypixel_api_lib.singleflight import SingleFlight, DEFAULT_SINGLE_FLIGHT, request_key
+from hypixel_api_lib.cache import ResponseCache
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
+from hypixel_api_lib.columnar import Column, STR, FLOAT
+from hypixel_api_lib.export import batches_to_table, flatten_stats, rows_to_arrow
 
 PROFILE_API_URL = r"https://api.hypixel.net/v2/skyblock/profile"
 PROFILES_API_URL = r"https://api.hypixel.net/v2/skyblock/profiles"
@@ -96,6 +102,8 @@ class Banking:
         return f"Banking Balance: {self.balance}, Transactions: {len(self.transactions)}"
 
 
+MEMBER_STATS_COLUMNS = [Column('profile_id', STR), Column('uuid', STR), Column('username', STR), Column('stat', STR), Column('value', FLOAT)]
+
 class SkyBlockProfile:
     """
     Represents a SkyBlock profile.
@@ -192,6 +200,27 @@ class SkyBlockProfile:
                 print(f"Could not retrieve username for UUID {uuid}: {e}")
         return usernames
 
+    def stats_to_arrow(self) -> 'pyarrow.Table':
+        """
+        Export the player stats of every member to an Arrow table in long form.
+
+        Nested statistics are flattened to dotted names, e.g. 'kills.zombie', so members with
+        different statistics share one schema.
+
+        Returns:
+            pyarrow.Table: One row per member and statistic, with the profile_id, uuid, username,
+                stat and value columns. Call to_pandas on it for a DataFrame.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        rows = [
+            {'profile_id': self.profile_id, 'uuid': uuid, 'username': member.username, 'stat': stat, 'value': value}
+            for uuid, member in self.members.items()
+            for stat, value in flatten_stats(member.player_stats.raw).items()
+        ]
+        return batches_to_table([rows_to_arrow(rows, MEMBER_STATS_COLUMNS)], MEMBER_STATS_COLUMNS)
+
     def __str__(self) -> str:
         cute_name_str = f", Cute Name: {self.cute_name}" if self.cute_name else ""
         selected_str = ", Selected" if self.selected else ""
@@ -203,14 +232,52 @@ class SkyBlockProfiles:
     """
     Handles fetching and managing SkyBlock profile data from the Hypixel API.
 
+    Concurrent identical requests, from threads or asyncio tasks, share a single request and
+    parsed result through a SingleFlight registry. Successful responses can additionally be kept
+    in a short-TTL ResponseCache. Transient failures are retried by the Transport.
+
     Attributes:
         api_key (str): The API key required for the requests.
+        single_flight (SingleFlight): The registry used to coalesce identical in-flight requests.
+        cache (ResponseCache or None): The response cache, or None to always use the network.
+        transport (Transport): Sends the requests and retries transient failures.
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, single_flight: SingleFlight | None = None, cache: ResponseCache | None = None, transport: Transport | None = None, profile_endpoint: str = PROFILE_API_URL, profiles_endpoint: str = PROFILES_API_URL) -> None:
         self.api_key: str = api_key
-        self._profile_endpoint: str = PROFILE_API_URL
-        self._profiles_endpoint: str = PROFILES_API_URL
+        self.single_flight: SingleFlight = single_flight if single_flight is not None else DEFAULT_SINGLE_FLIGHT
+        self.cache: ResponseCache | None = cache
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self._profile_endpoint: str = profile_endpoint
+        self._profiles_endpoint: str = profiles_endpoint
+
+    def _get_json(self, endpoint: str, params: dict) -> dict:
+        """Request an endpoint, serving and storing successful responses through the cache."""
+        def fetch() -> dict:
+            response = self.transport.get(endpoint, params=params)
+            response.raise_for_status()
+            with time_phase('decode'):
+                return response.json()
+
+        if self.cache is None:
+            return fetch()
+        return self.cache.get_or_fetch(endpoint, params, fetch, lambda data: bool(data.get('success')))
+
+    def _raise_http_error(self, error: requests.exceptions.HTTPError) -> None:
+        """Translate an HTTP error response into the matching exception."""
+        response_status = error.response.status_code if error.response is not None else None
+        if response_status == 403:
+            raise PermissionError("Access forbidden: Invalid API key.")
+        elif response_status == 429:
+            raise ConnectionError("Request limit reached: Throttling in effect.")
+        else:
+            raise ConnectionError(f"HTTP error occurred: {error}")
+
+    def _profile_key(self, profile_id: str) -> tuple:
+        return request_key(self._profile_endpoint, {'key': self.api_key, 'profile': profile_id})
+
+    def _profiles_key(self, player_uuid: str) -> tuple:
+        return request_key(self._profiles_endpoint, {'key': self.api_key, 'uuid': player_uuid})
 
     def get_profile(self, profile_id: str) -> SkyBlockProfile:
         """
@@ -227,29 +294,42 @@ class SkyBlockProfiles:
             PermissionError: If access is forbidden (e.g., invalid API key).
             ConnectionError: If there's an issue with the connection or request.
         """
-        try:
-            params = {'key': self.api_key, 'profile': profile_id}
-            response = requests.get(self._profile_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success') and data.get('profile') is not None:
-                profile_data = data['profile']
-                return SkyBlockProfile(profile_data)
-            else:
-                raise ValueError("No profile data available in the response")
-        except requests.exceptions.HTTPError as e:
-            response_status = None
-            if e.response is not None:
-                response_status = e.response.status_code
-            if response_status == 403:
-                raise PermissionError("Access forbidden: Invalid API key.")
-            elif response_status == 429:
-                raise ConnectionError("Request limit reached: Throttling in effect.")
-            else:
-                raise ConnectionError(f"HTTP error occurred: {e}")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred while fetching the profile: {e}")
+        return self.single_flight.do(self._profile_key(profile_id), self._fetch_profile, profile_id)
+
+    async def aget_profile(self, profile_id: str) -> SkyBlockProfile:
+        """
+        Asynchronously fetches a single profile by profile ID, see get_profile.
+
+        Args:
+            profile_id (str): The profile ID to fetch.
+
+        Returns:
+            SkyBlockProfile: The SkyBlockProfile object containing profile data.
+
+        Raises:
+            ValueError: If no profile data is available in the response.
+            PermissionError: If access is forbidden (e.g., invalid API key).
+            ConnectionError: If there's an issue with the connection or request.
+        """
+        return await self.single_flight.do_async(self._profile_key(profile_id), self._fetch_profile, profile_id)
+
+    def _fetch_profile(self, profile_id: str) -> SkyBlockProfile:
+        """Request and parse a single profile."""
+        with DEFAULT_INSTRUMENTATION.track(self._profile_endpoint):
+            try:
+                params = {'key': self.api_key, 'profile': profile_id}
+                data = self._get_json(self._profile_endpoint, params)
+
+                if data.get('success') and data.get('profile') is not None:
+                    profile_data = data['profile']
+                    with time_phase('build'):
+                        return SkyBlockProfile(profile_data)
+                else:
+                    raise ValueError("No profile data available in the response")
+            except requests.exceptions.HTTPError as e:
+                self._raise_http_error(e)
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred while fetching the profile: {e}")
 
     def get_profiles_by_player_uuid(self, player_uuid: str) -> list[SkyBlockProfile]:
         """
@@ -266,28 +346,43 @@ class SkyBlockProfiles:
             PermissionError: If access is forbidden (e.g., invalid API key).
             ConnectionError: If there's an issue with the connection or request.
         """
-        try:
-            params = {'key': self.api_key, 'uuid': player_uuid}
-            response = requests.get(self._profiles_endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('success') and 'profiles' in data:
-                profiles_data = data['profiles']
-                profiles = [SkyBlockProfile(profile_data) for profile_data in profiles_data]
-                return profiles
-            else:
-                raise ValueError("No profiles data available in the response")
-        except requests.exceptions.HTTPError as e:
-            response_status = e.response.status_code
-            if response_status == 403:
-                raise PermissionError("Access forbidden: Invalid API key.")
-            elif response_status == 429:
-                raise ConnectionError("Request limit reached: Throttling in effect.")
-            else:
-                raise ConnectionError(f"HTTP error occurred: {e}")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred while fetching the profiles: {e}")
+        return self.single_flight.do(self._profiles_key(player_uuid), self._fetch_profiles, player_uuid)
+
+    async def aget_profiles_by_player_uuid(self, player_uuid: str) -> list[SkyBlockProfile]:
+        """
+        Asynchronously fetches all profiles associated with a player UUID, see get_profiles_by_player_uuid.
+
+        Args:
+            player_uuid (str): The UUID of the player.
+
+        Returns:
+            list of SkyBlockProfile: A list of SkyBlockProfile objects.
+
+        Raises:
+            ValueError: If no profiles data is available in the response.
+            PermissionError: If access is forbidden (e.g., invalid API key).
+            ConnectionError: If there's an issue with the connection or request.
+        """
+        return await self.single_flight.do_async(self._profiles_key(player_uuid), self._fetch_profiles, player_uuid)
+
+    def _fetch_profiles(self, player_uuid: str) -> list[SkyBlockProfile]:
+        """Request and parse all profiles of a player."""
+        with DEFAULT_INSTRUMENTATION.track(self._profiles_endpoint):
+            try:
+                params = {'key': self.api_key, 'uuid': player_uuid}
+                data = self._get_json(self._profiles_endpoint, params)
+
+                if data.get('success') and 'profiles' in data:
+                    profiles_data = data['profiles']
+                    with time_phase('build'):
+                        profiles = [SkyBlockProfile(profile_data) for profile_data in profiles_data]
+                    return profiles
+                else:
+                    raise ValueError("No profiles data available in the response")
+            except requests.exceptions.HTTPError as e:
+                self._raise_http_error(e)
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred while fetching the profiles: {e}")
 
     def get_selected_profile_by_player_uuid(self, player_uuid: str) -> SkyBlockProfile | None:
         """
@@ -1,4 +1,9 @@
+from bisect import bisect_right
 import requests
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
+import numpy as np
+from hypixel_api_lib.member.PlayerData import SkillExperience
 
 SKILLS_API_URL = r"https://api.hypixel.net/v2/resources/skyblock/skills"
 
@@ -29,13 +34,20 @@ class Skill:
         description (str): A brief description of the skill.
         max_level (int): The maximum level a player can reach in this skill.
         levels (list of SkillLevel): A list of SkillLevel objects representing the different levels.
+        cumulative_xp (np.ndarray): The total XP required for each level, in level order.
     """
     
     def __init__(self, name: str, description: str, max_level: int, levels_data: list) -> None:
         self.name: str = name
         self.description: str = description
         self.max_level: int = max_level
-        self.levels: list[SkillLevel] = [SkillLevel(lvl['level'], lvl['totalExpRequired'], lvl['unlocks']) for lvl in levels_data]
+        self.levels: list[SkillLevel] = sorted(
+            (SkillLevel(lvl['level'], lvl['totalExpRequired'], lvl['unlocks']) for lvl in levels_data),
+            key=lambda lvl: lvl.level
+        )
+        self._levels_by_number: dict[int, SkillLevel] = {lvl.level: lvl for lvl in self.levels}
+        self._thresholds: list[float] = [lvl.total_exp_required for lvl in self.levels]
+        self.cumulative_xp: np.ndarray = np.array(self._thresholds, dtype=np.float64)
 
     def get_level(self, level: int) -> SkillLevel | None:
         """
@@ -47,7 +59,45 @@ class Skill:
         Returns:
             SkillLevel or None: The SkillLevel object for the requested level, or None if it does not exist.
         """
-        return next((lvl for lvl in self.levels if lvl.level == level), None)
+        return self._levels_by_number.get(level)
+
+    def level_for_xp(self, xp: float) -> float:
+        """
+        Convert a total XP amount into a level with fractional progress towards the next level.
+
+        Args:
+            xp (float): The total XP earned in the skill.
+
+        Returns:
+            float: The level reached plus the fraction of the way to the next level, e.g. 24.5.
+                Once the last level is reached the result is that level with no progress.
+        """
+        reached = bisect_right(self._thresholds, xp)
+        if reached >= len(self._thresholds):
+            return float(reached)
+        previous = self._thresholds[reached - 1] if reached else 0.0
+        return reached + (xp - previous) / (self._thresholds[reached] - previous)
+
+    def levels_for_xp(self, xp: np.ndarray) -> np.ndarray:
+        """
+        Convert many total XP amounts into fractional levels at once.
+
+        Args:
+            xp (np.ndarray): The total XP amounts.
+
+        Returns:
+            np.ndarray: The fractional level for each amount, as returned by level_for_xp.
+        """
+        xp = np.asarray(xp, dtype=np.float64)
+        thresholds = self.cumulative_xp
+        if len(thresholds) == 0:
+            return np.zeros_like(xp)
+        reached = np.searchsorted(thresholds, xp, side='right')
+        previous = np.where(reached > 0, thresholds[np.maximum(reached - 1, 0)], 0.0)
+        following = thresholds[np.minimum(reached, len(thresholds) - 1)]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            progress = np.where(reached < len(thresholds), (xp - previous) / (following - previous), 0.0)
+        return reached + progress
 
     def __str__(self) -> str:
         return f"{self.name} (Max Level: {self.max_level}): {self.description}"
@@ -59,34 +109,38 @@ class Skills:
     Attributes:
         api_endpoint (str): The endpoint URL to fetch the skills data.
         skills (dict of str: Skill): A dictionary of skill names (keys) to Skill objects.
+        transport (Transport): Sends the requests and retries transient failures.
     """
     
-    def __init__(self, api_endpoint: str = SKILLS_API_URL) -> None:
+    def __init__(self, api_endpoint: str = SKILLS_API_URL, transport: Transport | None = None) -> None:
         self.api_endpoint: str = api_endpoint
+        self.transport: Transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.skills: dict[str,Skill] | None = None
         self._load_skills()
 
     def _load_skills(self) -> None:
         """Fetch skills data from the API and initialize Skill objects."""
-        try:
-            response = requests.get(self.api_endpoint)
-            response.raise_for_status()
-            data = response.json()
+        with DEFAULT_INSTRUMENTATION.track(self.api_endpoint):
+            try:
+                response = self.transport.get(self.api_endpoint)
+                response.raise_for_status()
+                with time_phase('decode'):
+                    data = response.json()
             
-            if "skills" in data and data["skills"]:
-                self.skills = {
-                    key: Skill(
-                        value['name'],
-                        value.get('description', ''),
-                        value['maxLevel'],
-                        value['levels']
-                    )
-                    for key, value in data["skills"].items()
-                }
-            else:
-                raise ValueError("No skills data available in the response")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"An error occurred: {e}")
+                if "skills" in data and data["skills"]:
+                    self.skills = {
+                        key: Skill(
+                            value['name'],
+                            value.get('description', ''),
+                            value['maxLevel'],
+                            value['levels']
+                        )
+                        for key, value in data["skills"].items()
+                    }
+                else:
+                    raise ValueError("No skills data available in the response")
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"An error occurred: {e}")
 
     def get_skill(self, name: str) -> Skill | str:
         """
@@ -120,3 +174,55 @@ class Skills:
             list of str: A list of all skill names.
         """
         return [skill.name for skill in self.skills.values()]
+
+    def _resolve_skill(self, name: str) -> Skill:
+        """Resolve a skill key, display name, or player experience key such as 'SKILL_FARMING'."""
+        key = name.upper()
+        if key.startswith('SKILL_'):
+            key = key[len('SKILL_'):]
+        skill = self.skills.get(key)
+        if skill is None:
+            raise ValueError(f"Skill '{name}' not found.")
+        return skill
+
+    def level_for_xp(self, skill: str, xp: float) -> float:
+        """
+        Convert a total XP amount in a skill into a fractional level.
+
+        Args:
+            skill (str): The skill key or name, e.g. 'FARMING' or 'SKILL_FARMING'.
+            xp (float): The total XP earned in the skill.
+
+        Returns:
+            float: The level reached plus the fraction of the way to the next level.
+
+        Raises:
+            ValueError: If the skill does not exist.
+        """
+        return self._resolve_skill(skill).level_for_xp(xp)
+
+    def levels_for_players(self, experiences: list[list[SkillExperience]]) -> dict[str, np.ndarray]:
+        """
+        Convert the skill experience of many players into fractional levels, one array per skill.
+
+        Skills a player has no experience in are reported as level 0. Experience in skills
+        that are not known to the API is ignored.
+
+        Args:
+            experiences (list of list of SkillExperience): The experience list of each player,
+                as found in PlayerData.experience.
+
+        Returns:
+            dict of str to np.ndarray: The fractional levels keyed by skill key, with one entry per player
+                in the order given.
+        """
+        xp_columns = {key: np.zeros(len(experiences), dtype=np.float64) for key in self.skills}
+        for row, player_experience in enumerate(experiences):
+            for entry in player_experience:
+                key = entry.skill_name.upper()
+                if key.startswith('SKILL_'):
+                    key = key[len('SKILL_'):]
+                column = xp_columns.get(key)
+                if column is not None:
+                    column[row] = entry.experience
+        return {key: self.skills[key].levels_for_xp(column) for key, column in xp_columns.items()}
@@ -0,0 +1,409 @@
+import os
+import struct
+import zlib
+from bisect import bisect_right, insort
+from collections import OrderedDict
+from datetime import datetime, timezone
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.member.ProfileMember import SkyBlockProfileMember
+from hypixel_api_lib.member.dungeons.DungeonLevels import DUNGEON_CLASSES
+
+FIELDS_FILE = 'fields.txt'
+BLOCKS_FILE = 'blocks.bin'
+INDEX_FILE = 'index.bin'
+
+_BLOCK_HEADER = struct.Struct('>II')
+_RECORD_HEADER = struct.Struct('>36s36sdI')
+_INDEX_ENTRY = struct.Struct('>36s36sdqI')
+
+def extract_member_stats(member: SkyBlockProfileMember, bank: float | None = None) -> dict[str, float]:
+    """
+    Extract the tracked numeric stats of a member into a flat mapping.
+
+    Args:
+        member (SkyBlockProfileMember): The member to read.
+        bank (float, optional): The bank balance of the member's profile.
+
+    Returns:
+        dict of str to float: Values keyed by field name, e.g. 'skill.SKILL_FARMING',
+            'slayer.zombie', 'collection.WHEAT', 'coins.purse', 'dungeons.catacombs'.
+    """
+    stats = {f"skill.{experience.skill_name}": float(experience.experience) for experience in member.player_data.experience}
+    stats.update({f"slayer.{boss_type}": float(boss.xp) for boss_type, boss in member.slayer.slayer_bosses.items()})
+    stats.update({f"collection.{name}": float(item.amount) for name, item in member.collection.items.items()})
+    stats['coins.purse'] = float(member.currencies.coin_purse or 0.0)
+    if bank is not None:
+        stats['coins.bank'] = float(bank)
+    stats['dungeons.catacombs'] = float(member.dungeons.dungeon_types.catacombs.experience or 0.0)
+    for name in DUNGEON_CLASSES:
+        stats[f"dungeons.class.{name}"] = float(getattr(member.dungeons.player_classes, name).experience or 0.0)
+    return stats
+
+def _pack_id(value: str | None) -> bytes:
+    encoded = (value or '').encode('ascii')
+    if len(encoded) > 36:
+        raise ValueError(f"Identifier '{value}' is longer than 36 characters")
+    return encoded
+
+def _unpack_id(value: bytes) -> str:
+    return value.rstrip(b'\x00').decode('ascii')
+
+class MemberSnapshot:
+    """
+    Represents the stats of a member at one point in time.
+
+    Attributes:
+        uuid (str): The UUID of the member.
+        profile_id (str or None): The profile the stats were read from.
+        timestamp (datetime): When the stats were recorded.
+        stats (dict of str to float): Values keyed by field name.
+    """
+
+    def __init__(self, uuid: str, profile_id: str | None, timestamp: datetime, stats: dict[str, float]) -> None:
+        self.uuid: str = uuid
+        self.profile_id: str | None = profile_id
+        self.timestamp: datetime = timestamp
+        self.stats: dict[str, float] = stats
+
+    def __str__(self) -> str:
+        return f"MemberSnapshot({self.uuid} at {self.timestamp:%Y-%m-%d %H:%M:%S}, Fields: {len(self.stats)})"
+
+class SnapshotDiff:
+    """
+    Represents the change in a member's stats between two snapshots.
+
+    Attributes:
+        start (MemberSnapshot): The earlier snapshot.
+        end (MemberSnapshot): The later snapshot.
+        deltas (dict of str to float): The change in every field present in either snapshot.
+    """
+
+    def __init__(self, start: MemberSnapshot, end: MemberSnapshot) -> None:
+        self.start: MemberSnapshot = start
+        self.end: MemberSnapshot = end
+        fields = start.stats.keys() | end.stats.keys()
+        self.deltas: dict[str, float] = {field: end.stats.get(field, 0.0) - start.stats.get(field, 0.0) for field in fields}
+
+    @property
+    def seconds(self) -> float:
+        """
+        Get the time between the two snapshots.
+
+        Returns:
+            float: The elapsed seconds.
+        """
+        return (self.end.timestamp - self.start.timestamp).total_seconds()
+
+    def get_rates(self, period: float = 3600.0) -> dict[str, float]:
+        """
+        Get the rate of change of every field.
+
+        Args:
+            period (float): The period in seconds the rates are expressed in, one hour by default.
+
+        Returns:
+            dict of str to float: The change per period, or an empty dict if no time elapsed.
+        """
+        if self.seconds <= 0:
+            return {}
+        return {field: delta * period / self.seconds for field, delta in self.deltas.items()}
+
+    def get_changed(self) -> dict[str, float]:
+        """
+        Get only the fields that changed.
+
+        Returns:
+            dict of str to float: The non-zero deltas.
+        """
+        return {field: delta for field, delta in self.deltas.items() if delta}
+
+    def __str__(self) -> str:
+        return f"SnapshotDiff({self.end.uuid}, {self.start.timestamp:%Y-%m-%d} -> {self.end.timestamp:%Y-%m-%d}, Changed: {len(self.get_changed())})"
+
+class SnapshotStore:
+    """
+    An append-only, compressed on-disk store of member stat snapshots.
+
+    Snapshots are stored as sparse vectors of field indices and values. Records are buffered and
+    written in zlib-compressed blocks; a small fixed-size index entry per record lets a single
+    block be read back without scanning the rest of the store.
+
+    A player can be a member of several profiles, so snapshots are looked up by member UUID and
+    profile ID together and stats of different profiles are never compared with each other.
+
+    Attributes:
+        path (str): The directory holding the store.
+        block_size (int): The number of records buffered before a block is written.
+        cache_size (int): The number of decompressed blocks kept in memory.
+    """
+
+    def __init__(self, path: str, block_size: int = 1024, cache_size: int = 16) -> None:
+        self.path: str = path
+        self.block_size: int = block_size
+        self.cache_size: int = cache_size
+        os.makedirs(path, exist_ok=True)
+        self._fields: list[str] = []
+        self._field_index: dict[str, int] = {}
+        self._written_fields: int = 0
+        self._pending: list[tuple[str, str | None, float, dict[int, float]]] = []
+        self._index: dict[tuple[str, str | None], list[tuple[float, int, int]]] = {}
+        self._blocks: OrderedDict[int, list[MemberSnapshot]] = OrderedDict()
+        self._load()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _load(self) -> None:
+        """
+        Read the field registry and record index, repairing the files after an incomplete write.
+
+        A write interrupted by a crash can leave a torn field line, a torn index entry, or a block
+        whose index entries were never written. These tails are truncated, so later appends start
+        at a record boundary instead of misaligning everything written after them.
+        """
+        fields_path = self._file(FIELDS_FILE)
+        if os.path.exists(fields_path):
+            with open(fields_path, 'rb') as f:
+                data = f.read()
+            complete = data.rfind(b'\n') + 1
+            if complete < len(data):
+                os.truncate(fields_path, complete)
+            for line in data[:complete].decode('utf-8').splitlines():
+                self._register_field(line)
+        self._written_fields = len(self._fields)
+
+        # Offsets and ends of the blocks that were written completely
+        blocks_path = self._file(BLOCKS_FILE)
+        block_ends: dict[int, int] = {}
+        if os.path.exists(blocks_path):
+            blocks_size = os.path.getsize(blocks_path)
+            with open(blocks_path, 'rb') as f:
+                offset = 0
+                while offset + _BLOCK_HEADER.size <= blocks_size:
+                    f.seek(offset)
+                    length, _ = _BLOCK_HEADER.unpack(f.read(_BLOCK_HEADER.size))
+                    end = offset + _BLOCK_HEADER.size + length
+                    if end > blocks_size:
+                        break
+                    block_ends[offset] = end
+                    offset = end
+
+        # Entries are appended after their block, so the valid entries are a prefix of the index
+        index_path = self._file(INDEX_FILE)
+        valid_entries = 0
+        blocks_end = 0
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as f:
+                data = f.read()
+            usable = len(data) - len(data) % _INDEX_ENTRY.size
+            for uuid, profile_id, timestamp, offset, position in _INDEX_ENTRY.iter_unpack(data[:usable]):
+                if offset not in block_ends:
+                    break
+                key = (_unpack_id(uuid), _unpack_id(profile_id) or None)
+                insort(self._index.setdefault(key, []), (timestamp, offset, position))
+                valid_entries += 1
+                blocks_end = max(blocks_end, block_ends[offset])
+            if valid_entries * _INDEX_ENTRY.size < len(data):
+                os.truncate(index_path, valid_entries * _INDEX_ENTRY.size)
+        if os.path.exists(blocks_path) and os.path.getsize(blocks_path) > blocks_end:
+            os.truncate(blocks_path, blocks_end)
+
+    def _register_field(self, field: str) -> int:
+        index = self._field_index.get(field)
+        if index is None:
+            index = len(self._fields)
+            self._fields.append(field)
+            self._field_index[field] = index
+        return index
+
+    def add_member(self, member: SkyBlockProfileMember, timestamp: datetime | None = None, profile_id: str | None = None, bank: float | None = None) -> None:
+        """
+        Record a snapshot of a member.
+
+        Args:
+            member (SkyBlockProfileMember): The member to record.
+            timestamp (datetime, optional): When the stats were fetched, defaults to now.
+            profile_id (str, optional): The profile the member belongs to.
+            bank (float, optional): The bank balance of the profile.
+        """
+        self.add_stats(member.uuid, extract_member_stats(member, bank), timestamp, profile_id)
+
+    def add_profile(self, profile: SkyBlockProfile, timestamp: datetime | None = None) -> None:
+        """
+        Record a snapshot of every member of a profile, including the shared bank balance.
+
+        Args:
+            profile (SkyBlockProfile): The profile to record.
+            timestamp (datetime, optional): When the profile was fetched, defaults to now.
+        """
+        bank = profile.banking.balance if profile.banking is not None else None
+        for member in profile.members.values():
+            self.add_member(member, timestamp, profile.profile_id, bank)
+
+    def add_stats(self, uuid: str, stats: dict[str, float], timestamp: datetime | None = None, profile_id: str | None = None) -> None:
+        """
+        Record a snapshot from an already extracted stat mapping.
+
+        Args:
+            uuid (str): The UUID of the member.
+            stats (dict of str to float): Values keyed by field name.
+            timestamp (datetime, optional): When the stats were fetched, defaults to now.
+            profile_id (str, optional): The profile the member belongs to.
+
+        Raises:
+            ValueError: If the UUID or profile ID is longer than 36 characters.
+        """
+        _pack_id(uuid)
+        _pack_id(profile_id)
+        seconds = (timestamp or datetime.now(timezone.utc)).timestamp()
+        vector = {self._register_field(field): float(value) for field, value in stats.items()}
+        insort(self._index.setdefault((uuid, profile_id), []), (seconds, -1, len(self._pending)))
+        self._pending.append((uuid, profile_id, seconds, vector))
+        if len(self._pending) >= self.block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered snapshots to disk as one compressed block."""
+        if not self._pending:
+            return
+        if self._written_fields < len(self._fields):
+            with open(self._file(FIELDS_FILE), 'a', encoding='utf-8') as f:
+                f.writelines(f"{field}\n" for field in self._fields[self._written_fields:])
+            self._written_fields = len(self._fields)
+
+        payload = bytearray()
+        for uuid, profile_id, seconds, vector in self._pending:
+            payload += _RECORD_HEADER.pack(_pack_id(uuid), _pack_id(profile_id), seconds, len(vector))
+            payload += struct.pack(f'>{len(vector)}I{len(vector)}d', *vector.keys(), *vector.values())
+        compressed = zlib.compress(bytes(payload))
+
+        with open(self._file(BLOCKS_FILE), 'ab') as f:
+            offset = f.tell()
+            f.write(_BLOCK_HEADER.pack(len(compressed), len(self._pending)) + compressed)
+        with open(self._file(INDEX_FILE), 'ab') as f:
+            f.write(b''.join(
+                _INDEX_ENTRY.pack(_pack_id(uuid), _pack_id(profile_id), seconds, offset, position)
+                for position, (uuid, profile_id, seconds, _) in enumerate(self._pending)
+            ))
+
+        for position, (uuid, profile_id, seconds, _) in enumerate(self._pending):
+            entries = self._index[(uuid, profile_id)]
+            entries[entries.index((seconds, -1, position))] = (seconds, offset, position)
+            entries.sort()
+        self._pending = []
+
+    def _read_block(self, offset: int) -> list[MemberSnapshot]:
+        cached = self._blocks.get(offset)
+        if cached is not None:
+            self._blocks.move_to_end(offset)
+            return cached
+        with open(self._file(BLOCKS_FILE), 'rb') as f:
+            f.seek(offset)
+            length, count = _BLOCK_HEADER.unpack(f.read(_BLOCK_HEADER.size))
+            payload = zlib.decompress(f.read(length))
+
+        records = []
+        cursor = 0
+        for _ in range(count):
+            uuid, profile_id, seconds, size = _RECORD_HEADER.unpack_from(payload, cursor)
+            cursor += _RECORD_HEADER.size
+            values = struct.unpack_from(f'>{size}I{size}d', payload, cursor)
+            cursor += size * 12
+            stats = {self._fields[index]: value for index, value in zip(values[:size], values[size:])}
+            records.append(MemberSnapshot(_unpack_id(uuid), _unpack_id(profile_id) or None, datetime.fromtimestamp(seconds, tz=timezone.utc), stats))
+
+        self._blocks[offset] = records
+        if len(self._blocks) > self.cache_size:
+            self._blocks.popitem(last=False)
+        return records
+
+    def _load_entry(self, entry: tuple[float, int, int]) -> MemberSnapshot:
+        seconds, offset, position = entry
+        if offset < 0:
+            uuid, profile_id, seconds, vector = self._pending[position]
+            stats = {self._fields[index]: value for index, value in vector.items()}
+            return MemberSnapshot(uuid, profile_id, datetime.fromtimestamp(seconds, tz=timezone.utc), stats)
+        return self._read_block(offset)[position]
+
+    def get_profile_ids(self, uuid: str) -> list[str | None]:
+        """
+        List the profiles a member was recorded in.
+
+        Args:
+            uuid (str): The UUID of the member.
+
+        Returns:
+            list of str or None: The profile IDs, None for snapshots recorded without one.
+        """
+        return [profile_id for member_uuid, profile_id in self._index if member_uuid == uuid]
+
+    def get_timestamps(self, uuid: str, profile_id: str | None) -> list[datetime]:
+        """
+        List when a member was recorded in a profile.
+
+        Args:
+            uuid (str): The UUID of the member.
+            profile_id (str or None): The profile the member was recorded in.
+
+        Returns:
+            list of datetime: The snapshot timestamps in ascending order.
+        """
+        return [datetime.fromtimestamp(entry[0], tz=timezone.utc) for entry in self._index.get((uuid, profile_id), [])]
+
+    def get_snapshot(self, uuid: str, profile_id: str | None, timestamp: datetime | None = None) -> MemberSnapshot | None:
+        """
+        Retrieve the latest snapshot of a member in a profile taken at or before a time.
+
+        Args:
+            uuid (str): The UUID of the member.
+            profile_id (str or None): The profile the member was recorded in.
+            timestamp (datetime, optional): The point in time, defaults to the latest snapshot.
+
+        Returns:
+            MemberSnapshot or None: The snapshot, or None if there is none at or before the time.
+        """
+        entries = self._index.get((uuid, profile_id), [])
+        if timestamp is None:
+            position = len(entries)
+        else:
+            position = bisect_right(entries, (timestamp.timestamp(), float('inf'), float('inf')))
+        return self._load_entry(entries[position - 1]) if position else None
+
+    def diff(self, uuid: str, profile_id: str | None, start: datetime, end: datetime | None = None) -> SnapshotDiff:
+        """
+        Compare a member's stats in a profile between two points in time.
+
+        Args:
+            uuid (str): The UUID of the member.
+            profile_id (str or None): The profile the member was recorded in.
+            start (datetime): The earlier point in time.
+            end (datetime, optional): The later point in time, defaults to the latest snapshot.
+
+        Returns:
+            SnapshotDiff: The per-field deltas and rates.
+
+        Raises:
+            ValueError: If there is no snapshot of the member in the profile at or before either time.
+        """
+        start_snapshot = self.get_snapshot(uuid, profile_id, start)
+        end_snapshot = self.get_snapshot(uuid, profile_id, end)
+        if start_snapshot is None or end_snapshot is None:
+            raise ValueError(f"No snapshot of '{uuid}' in profile '{profile_id}' found for the requested time range.")
+        return SnapshotDiff(start_snapshot, end_snapshot)
+
+    def close(self) -> None:
+        """Flush buffered snapshots and release cached blocks."""
+        self.flush()
+        self._blocks.clear()
+
+    def __enter__(self) -> 'SnapshotStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._index.values())
+
+    def __str__(self) -> str:
+        return f"SnapshotStore at {self.path} with {len(self)} snapshots of {len({uuid for uuid, _ in self._index})} members"
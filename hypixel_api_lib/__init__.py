@@ -1,10 +1,15 @@
+from .AuctionHistory import RecentlyEndedAuctionsPoller, SaleHistory
 from .Auctions import ActiveAuctions, PlayerAuctions, RecentlyEndedAuctions
 from .Bazaar import Bazaar
 from .Bingo import BingoEvents
 from .Collections import Collections
+from .CraftFlips import CraftFlipEngine
 from .Elections import Elections
 from .FireSales import FireSales
 from .Items import Items
+from .Leaderboards import LeaderboardBuilder
+from .Networth import NetworthEngine
 from .News import SkyBlockNews
 from .Profiles import SkyBlockProfiles
 from .Skills import Skills
+from .Snapshots import SnapshotStore
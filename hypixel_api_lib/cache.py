@@ -0,0 +1,421 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlencode
+from hypixel_api_lib.circuitbreaker import CircuitOpenError
+from hypixel_api_lib.instrumentation import get_current_event
+
+# The Hypixel API itself caches profile and auction data for about a minute
+DEFAULT_TTL: float = 60.0
+
+# How long expired responses remain available as a fallback while the API is unreachable
+DEFAULT_STALE_TTL: float = 600.0
+
+class CacheBackend(ABC):
+    """
+    Base class for response cache storage.
+
+    Values are JSON-compatible objects stored with an absolute expiry time in seconds since the epoch.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[float, Any] | None:
+        """
+        Retrieve an entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            tuple of (float, Any) or None: The expiry time and value, or None if missing.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The JSON-compatible value.
+            expires_at (float): When the entry expires, in seconds since the epoch.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key (str): The cache key.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+class MemoryBackend(CacheBackend):
+    """
+    An in-process LRU cache backend.
+
+    Attributes:
+        max_entries (int): The maximum number of entries kept before the least recently used is evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries: int = max_entries
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[float, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class DiskBackend(CacheBackend):
+    """
+    A cache backend storing one JSON file per entry, shared between processes and restarts.
+
+    Attributes:
+        directory (str): The directory holding the cache files.
+        max_entries (int): The maximum number of files kept before the least recently used is evicted.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 10000) -> None:
+        self.directory: str = directory
+        self.max_entries: int = max_entries
+        os.makedirs(directory, exist_ok=True)
+        self._lock: threading.Lock = threading.Lock()
+        files = [name for name in os.listdir(directory) if name.endswith('.json')]
+        files.sort(key=lambda name: os.path.getmtime(os.path.join(directory, name)))
+        self._order: OrderedDict[str, None] = OrderedDict((name, None) for name in files)
+
+    def _file_name(self, key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json'
+
+    def get(self, key: str) -> tuple[float, Any] | None:
+        name = self._file_name(key)
+        try:
+            with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._order[name] = None
+            self._order.move_to_end(name)
+        return entry['expires_at'], entry['value']
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        name = self._file_name(key)
+        path = os.path.join(self.directory, name)
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'expires_at': expires_at, 'value': value}, f)
+        os.replace(temporary_path, path)
+        with self._lock:
+            self._order[name] = None
+            self._order.move_to_end(name)
+            while len(self._order) > self.max_entries:
+                evicted, _ = self._order.popitem(last=False)
+                try:
+                    os.remove(os.path.join(self.directory, evicted))
+                except OSError:
+                    pass
+
+    def delete(self, key: str) -> None:
+        name = self._file_name(key)
+        with self._lock:
+            self._order.pop(name, None)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            names = list(self._order)
+            self._order.clear()
+        for name in names:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+class RedisBackend(CacheBackend):
+    """
+    A cache backend for a Redis-compatible client, such as redis.Redis, LocalRedis or any object
+    with the same get, set and delete methods.
+
+    Expiry is delegated to the server, and size is bounded by the server's eviction policy.
+
+    Attributes:
+        client (object): The Redis-compatible client.
+        prefix (str): The prefix of every key written by this backend.
+    """
+
+    def __init__(self, client: Any, prefix: str = 'hypixel_api_lib:') -> None:
+        self.client: Any = client
+        self.prefix: str = prefix
+
+    def get(self, key: str) -> tuple[float, Any] | None:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry['expires_at'], entry['value']
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        ttl_ms = max(int((expires_at - time.time()) * 1000), 1)
+        self.client.set(self.prefix + key, json.dumps({'expires_at': expires_at, 'value': value}), px=ttl_ms)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + '*'):
+            self.client.delete(key)
+
+class LocalRedis:
+    """
+    An in-process stand-in for a Redis client, implementing the commands used by RedisBackend.
+
+    It lets RedisBackend run in tests and offline without a server. Expired keys are dropped
+    when they are read.
+
+    Attributes:
+        data (dict of str to tuple): The values and their expiry times, None for none.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[Any, float | None]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        with self._lock:
+            value, expires_at = self.data.get(name, (None, None))
+            if expires_at is not None and expires_at <= time.time():
+                del self.data[name]
+                return None
+            return value
+
+    def set(self, name: str, value: Any, ex: float | None = None, px: int | None = None) -> bool:
+        if px is not None:
+            ex = px / 1000
+        with self._lock:
+            self.data[name] = (value, time.time() + ex if ex else None)
+        return True
+
+    def setex(self, name: str, time_seconds: float, value: Any) -> bool:
+        return self.set(name, value, ex=time_seconds)
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self.data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str = '*') -> list[str]:
+        prefix = match.rstrip('*')
+        with self._lock:
+            return [name for name in self.data if name.startswith(prefix)]
+
+    def __str__(self) -> str:
+        return f"LocalRedis with {len(self.data)} keys"
+
+class ResponseCache:
+    """
+    Caches successful JSON API responses for a short, per-endpoint time to live.
+
+    Entries are keyed by endpoint and query parameters without the API key, so every key holder
+    shares the same cached data. Only successful responses should be stored. Expired entries are
+    kept for another stale_ttl seconds, so they can still be served while the upstream host's
+    circuit is open.
+
+    Attributes:
+        backend (CacheBackend): Where entries are stored.
+        ttls (dict of str to float): Time to live in seconds by endpoint URL.
+        default_ttl (float): Time to live of endpoints without their own entry in ttls.
+        stale_ttl (float): Seconds an expired entry is kept for serving while its host is unavailable.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that were missing or expired.
+        stale_hits (int): The number of expired responses served because the host was unavailable.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttls: dict[str, float] | None = None, default_ttl: float = DEFAULT_TTL, stale_ttl: float = DEFAULT_STALE_TTL) -> None:
+        self.backend: CacheBackend = backend if backend is not None else MemoryBackend()
+        self.ttls: dict[str, float] = dict(ttls or {})
+        self.default_ttl: float = default_ttl
+        self.stale_ttl: float = stale_ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale_hits: int = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict | None = None) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            endpoint (str): The request URL.
+            params (dict, optional): The query parameters; the 'key' parameter is ignored.
+
+        Returns:
+            str: The cache key.
+        """
+        query = urlencode(sorted((name, value) for name, value in (params or {}).items() if name != 'key'))
+        return f"{endpoint}?{query}"
+
+    def get_ttl(self, endpoint: str) -> float:
+        """
+        Get the time to live of an endpoint.
+
+        Args:
+            endpoint (str): The request URL.
+
+        Returns:
+            float: The time to live in seconds.
+        """
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _get_entry(self, endpoint: str, params: dict | None) -> tuple[float, Any] | None:
+        """Get the freshness deadline and value of a retained entry, dropping it once fully expired."""
+        key = self.make_key(endpoint, params)
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            self.backend.delete(key)
+            return None
+        fresh_until, value = entry[1]
+        return fresh_until, value
+
+    def get(self, endpoint: str, params: dict | None = None) -> Any | None:
+        """
+        Retrieve a cached response.
+
+        Args:
+            endpoint (str): The request URL.
+            params (dict, optional): The query parameters.
+
+        Returns:
+            Any or None: The cached response, or None if missing or expired.
+        """
+        entry = self._get_entry(endpoint, params)
+        if entry is None or entry[0] <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def get_stale(self, endpoint: str, params: dict | None = None) -> Any | None:
+        """
+        Retrieve a cached response even if it expired, as long as it is within stale_ttl.
+
+        Args:
+            endpoint (str): The request URL.
+            params (dict, optional): The query parameters.
+
+        Returns:
+            Any or None: The cached response, or None if it is no longer retained.
+        """
+        entry = self._get_entry(endpoint, params)
+        return None if entry is None else entry[1]
+
+    def set(self, endpoint: str, params: dict | None, value: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            endpoint (str): The request URL.
+            params (dict or None): The query parameters.
+            value (Any): The JSON-compatible response.
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl > 0:
+            fresh_until = time.time() + ttl
+            self.backend.set(self.make_key(endpoint, params), [fresh_until, value], fresh_until + self.stale_ttl)
+
+    def get_or_fetch(self, endpoint: str, params: dict | None, fetch: Callable[[], Any], cacheable: Callable[[Any], bool] | None = None) -> Any:
+        """
+        Retrieve a cached response, fetching and storing it when missing.
+
+        If the fetch fails fast because the host's circuit is open, an expired response still
+        within stale_ttl is served instead.
+
+        Args:
+            endpoint (str): The request URL.
+            params (dict or None): The query parameters.
+            fetch (callable): Fetches the response when it is not cached.
+            cacheable (callable, optional): Decides whether a fetched response may be stored.
+
+        Returns:
+            Any: The cached or fetched response.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open and no stale response is retained.
+        """
+        event = get_current_event()
+        value = self.get(endpoint, params)
+        if value is not None:
+            if event is not None:
+                event.cache = 'hit'
+            return value
+        if event is not None:
+            event.cache = 'miss'
+        try:
+            value = fetch()
+        except CircuitOpenError:
+            stale = self.get_stale(endpoint, params)
+            if stale is None:
+                raise
+            self.stale_hits += 1
+            if event is not None:
+                event.cache = 'stale'
+            return stale
+        if cacheable is None or cacheable(value):
+            self.set(endpoint, params, value)
+        return value
+
+    def invalidate(self, endpoint: str, params: dict | None = None) -> None:
+        """
+        Remove a cached response.
+
+        Args:
+            endpoint (str): The request URL.
+            params (dict, optional): The query parameters.
+        """
+        self.backend.delete(self.make_key(endpoint, params))
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
+
+    def __str__(self) -> str:
+        return f"ResponseCache using {type(self.backend).__name__} (Hits: {self.hits}, Misses: {self.misses})"
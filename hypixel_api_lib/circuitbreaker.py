@@ -0,0 +1,243 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlparse
+import requests
+
+CLOSED: str = 'closed'
+OPEN: str = 'open'
+HALF_OPEN: str = 'half_open'
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Raised instead of sending a request while the circuit of its host is open.
+
+    It is a requests ConnectionError, so every manager reports it like any other connection failure.
+
+    Attributes:
+        host (str): The host whose circuit is open.
+        retry_in (float): Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.1f}s")
+        self.host: str = host
+        self.retry_in: float = retry_in
+
+def is_upstream_failure(response: Any = None, error: Exception | None = None) -> bool:
+    """
+    Decide whether an outcome means the upstream host is degraded.
+
+    Connection errors, timeouts, 408 and 5xx responses count as failures. Client errors and rate
+    limits mean the host is answering, so they do not.
+
+    Args:
+        response (requests.Response, optional): The response, if one was received.
+        error (Exception, optional): The exception raised by the request, if any.
+
+    Returns:
+        bool: True if the outcome counts against the host.
+    """
+    if error is not None:
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+    status_code = getattr(response, 'status_code', None)
+    return isinstance(status_code, int) and (status_code == 408 or status_code >= 500)
+
+class CircuitBreaker:
+    """
+    Tracks the error rate of one host and stops sending it requests while it is degraded.
+
+    The circuit starts closed. When at least min_requests outcomes were recorded within the last
+    window seconds and the share of failures reaches failure_threshold, it opens and every request
+    fails fast. After reset_timeout seconds it becomes half-open and lets up to half_open_max
+    probe requests through: a successful probe closes it, a failed one opens it again.
+
+    Attributes:
+        host (str): The host guarded by the circuit.
+        failure_threshold (float): The share of failed requests, between 0 and 1, that opens the circuit.
+        min_requests (int): The number of recent outcomes needed before the circuit can open.
+        window (float): Seconds of outcomes taken into account.
+        reset_timeout (float): Seconds the circuit stays open before probing.
+        half_open_max (int): The number of concurrent probe requests allowed while half-open.
+        state (str): 'closed', 'open' or 'half_open'.
+        trips (int): The number of times the circuit opened.
+    """
+
+    def __init__(self, host: str, failure_threshold: float = 0.5, min_requests: int = 20, window: float = 30.0, reset_timeout: float = 30.0, half_open_max: int = 1, clock: Callable[[], float] = time.monotonic) -> None:
+        self.host: str = host
+        self.failure_threshold: float = failure_threshold
+        self.min_requests: int = min_requests
+        self.window: float = window
+        self.reset_timeout: float = reset_timeout
+        self.half_open_max: int = half_open_max
+        self.state: str = CLOSED
+        self.trips: int = 0
+        self._clock: Callable[[], float] = clock
+        self._lock: threading.Lock = threading.Lock()
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probes: int = 0
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self.trips += 1
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent, reserving a probe slot when half-open.
+
+        Every allowed request must be followed by a call to record, or to release if it ended
+        without an outcome.
+
+        Returns:
+            bool: True if the request may be sent.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_max:
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, failed: bool) -> None:
+        """
+        Record the outcome of an allowed request.
+
+        Args:
+            failed (bool): Whether the request failed because of the host, see is_upstream_failure.
+        """
+        with self._lock:
+            now = self._clock()
+            if self.state == HALF_OPEN:
+                self._probes = max(self._probes - 1, 0)
+                if failed:
+                    self._open(now)
+                else:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                    self._failures = 0
+                return
+            if self.state == OPEN:
+                # A request allowed before the circuit opened finished late
+                return
+            self._outcomes.append((now, failed))
+            self._failures += failed
+            self._trim(now)
+            if len(self._outcomes) >= self.min_requests and self._failures / len(self._outcomes) >= self.failure_threshold:
+                self._open(now)
+
+    def release(self) -> None:
+        """
+        Free the probe slot of an allowed request that ended without an outcome, such as one
+        interrupted by KeyboardInterrupt, without changing the state of the circuit.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes = max(self._probes - 1, 0)
+
+    def get_error_rate(self) -> float:
+        """
+        Get the share of failed requests within the window.
+
+        Returns:
+            float: The error rate between 0 and 1, or 0 if nothing was recorded.
+        """
+        with self._lock:
+            self._trim(self._clock())
+            return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    def get_retry_in(self) -> float:
+        """
+        Get the time until an open circuit lets a probe through.
+
+        Returns:
+            float: Seconds until probing, 0 unless the circuit is open.
+        """
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(self.reset_timeout - (self._clock() - self._opened_at), 0.0)
+
+    def reset(self) -> None:
+        """Close the circuit and forget every recorded outcome."""
+        with self._lock:
+            self.state = CLOSED
+            self._outcomes.clear()
+            self._failures = 0
+            self._probes = 0
+
+    def __str__(self) -> str:
+        return f"CircuitBreaker for {self.host} ({self.state}, error rate {self.get_error_rate():.0%}, {self.trips} trips)"
+
+class CircuitBreakers:
+    """
+    Keeps one CircuitBreaker per host, created on first use with shared settings.
+
+    Attributes:
+        settings (dict): The keyword arguments every new CircuitBreaker is created with.
+    """
+
+    def __init__(self, **settings: Any) -> None:
+        """
+        Args:
+            **settings: Keyword arguments for CircuitBreaker, such as failure_threshold or reset_timeout.
+        """
+        self.settings: dict[str, Any] = settings
+        self._lock: threading.Lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        """
+        Get the breaker of a URL's host.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            CircuitBreaker: The breaker shared by every URL of the host.
+        """
+        host = urlparse(url).netloc or url
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(host, **self.settings)
+            return breaker
+
+    def list_hosts(self) -> list[str]:
+        """
+        List the hosts with a breaker.
+
+        Returns:
+            list of str: The hosts, sorted.
+        """
+        with self._lock:
+            return sorted(self._breakers)
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def __str__(self) -> str:
+        return f"CircuitBreakers for {', '.join(self.list_hosts()) or 'no hosts'}"
+
+# Shared by the default transports so every manager sees the same state per host
+DEFAULT_CIRCUIT_BREAKERS: CircuitBreakers = CircuitBreakers()
@@ -0,0 +1,494 @@
+import json
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any
+import numpy as np
+
+MAGIC: bytes = b'HYPXCOL1'
+FORMAT_VERSION: int = 1
+
+# Fixed-width storage of each column kind; strings are indices into the file's string table
+STR: str = 'str'
+INT: str = 'int'
+FLOAT: str = 'float'
+BOOL: str = 'bool'
+STR_LIST: str = 'str_list'
+RECORDS: str = 'records'
+
+_DTYPES: dict[str, str] = {STR: '<i4', INT: '<i8', FLOAT: '<f8', BOOL: '<i1'}
+_NULL_INT: int = int(np.iinfo(np.int64).min)
+_NULL_INDEX: int = -1
+_ALIGNMENT: int = 8
+_PREAMBLE = struct.Struct('<8sQ')
+
+class Column:
+    """
+    Describes one column of a columnar file.
+
+    Dotted names address nested dictionaries, e.g. 'quick_status.sellPrice'. A records column
+    holds a list of dictionaries per row, stored as child columns plus per-row offsets.
+
+    Attributes:
+        name (str): The key of the value in a row, dotted for nested dictionaries.
+        kind (str): 'str', 'int', 'float', 'bool', 'str_list' or 'records'.
+        children (list of Column): The columns of each record, for records columns.
+    """
+
+    def __init__(self, name: str, kind: str, children: list['Column'] | None = None) -> None:
+        if kind not in _DTYPES and kind not in (STR_LIST, RECORDS):
+            raise ValueError(f"Unknown column kind '{kind}'")
+        if (kind == RECORDS) != bool(children):
+            raise ValueError("Only records columns have child columns")
+        self.name: str = name
+        self.kind: str = kind
+        self.children: list[Column] = list(children or [])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the column to its JSON header representation."""
+        data = {'name': self.name, 'kind': self.kind}
+        if self.children:
+            data['children'] = [child.to_dict() for child in self.children]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'Column':
+        """Read a column from its JSON header representation."""
+        return cls(data['name'], data['kind'], [cls.from_dict(child) for child in data.get('children', [])])
+
+    def __str__(self) -> str:
+        return f"Column {self.name} ({self.kind})"
+
+def _get_path(row: dict, name: str) -> Any:
+    value = row
+    for part in name.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def _get_values(rows: list[dict], name: str) -> list[Any]:
+    if '.' not in name:
+        return [row.get(name) if isinstance(row, dict) else None for row in rows]
+    return [_get_path(row, name) for row in rows]
+
+def _set_path(row: dict, name: str, value: Any) -> None:
+    *parents, last = name.split('.')
+    for part in parents:
+        row = row.setdefault(part, {})
+    row[last] = value
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.indices: dict[str, int] = {}
+        self.encoded: list[bytes] = []
+
+    def add(self, value: Any) -> int:
+        if value is None:
+            return _NULL_INDEX
+        value = str(value)
+        index = self.indices.get(value)
+        if index is None:
+            index = self.indices[value] = len(self.encoded)
+            self.encoded.append(value.encode('utf-8'))
+        return index
+
+def _encode_scalars(kind: str, values: list[Any], strings: _StringTable) -> np.ndarray:
+    if kind == STR:
+        encoded = [strings.add(value) for value in values]
+    elif kind == INT:
+        encoded = [_NULL_INT if value is None else int(value) for value in values]
+    elif kind == FLOAT:
+        encoded = [float('nan') if value is None else float(value) for value in values]
+    else:
+        encoded = [-1 if value is None else int(bool(value)) for value in values]
+    return np.array(encoded, dtype=_DTYPES[kind])
+
+def _encode_columns(columns: list[Column], rows: list[dict], strings: _StringTable, prefix: str, sections: dict[str, np.ndarray]) -> None:
+    for column in columns:
+        key = prefix + column.name
+        values = _get_values(rows, column.name)
+        if column.kind in _DTYPES:
+            sections[key] = _encode_scalars(column.kind, values, strings)
+            continue
+        values = [value or [] for value in values]
+        sections[key + '#offsets'] = np.cumsum([0] + [len(value) for value in values], dtype='<i8')
+        flattened = [item for value in values for item in value]
+        if column.kind == STR_LIST:
+            sections[key] = _encode_scalars(STR, flattened, strings)
+        else:
+            _encode_columns(column.children, flattened, strings, key + '/', sections)
+
+def _serialize(sections: dict[str, np.ndarray], rows: int, columns: list[Column], metadata: dict[str, Any] | None) -> bytes:
+    layout = {}
+    header = {'version': FORMAT_VERSION, 'rows': rows, 'metadata': metadata or {}, 'columns': [column.to_dict() for column in columns], 'sections': layout}
+    # The section offsets depend on the header length, so lay out until the header stops growing
+    header_size = 0
+    while True:
+        offset = _align(_PREAMBLE.size + header_size)
+        for name, array in sections.items():
+            layout[name] = [array.dtype.str, offset, len(array)]
+            offset = _align(offset + array.nbytes)
+        encoded = json.dumps(header).encode('utf-8')
+        if len(encoded) <= header_size:
+            break
+        header_size = len(encoded)
+
+    buffer = bytearray(offset)
+    _PREAMBLE.pack_into(buffer, 0, MAGIC, header_size)
+    buffer[_PREAMBLE.size:_PREAMBLE.size + len(encoded)] = encoded
+    buffer[_PREAMBLE.size + len(encoded):_PREAMBLE.size + header_size] = b' ' * (header_size - len(encoded))
+    for name, array in sections.items():
+        position = layout[name][1]
+        buffer[position:position + array.nbytes] = array.tobytes()
+    return bytes(buffer)
+
+def encode_table(rows: Iterable[dict], columns: list[Column], metadata: dict[str, Any] | None = None) -> bytes:
+    """
+    Encode rows in the columnar format.
+
+    Every column is stored as a fixed-width, 8-byte aligned array and every string, deduplicated,
+    in a single string table, so the result can be read without parsing.
+
+    Args:
+        rows (iterable of dict): The rows, shaped like the API's JSON objects.
+        columns (list of Column): The columns to store; other keys are dropped.
+        metadata (dict, optional): JSON-serializable metadata stored in the header.
+
+    Returns:
+        bytes: The encoded table.
+    """
+    rows = list(rows)
+    strings = _StringTable()
+    sections: dict[str, np.ndarray] = {}
+    _encode_columns(columns, rows, strings, '', sections)
+    sections['#strings.offsets'] = np.cumsum([0] + [len(value) for value in strings.encoded], dtype='<i8')
+    sections['#strings.data'] = np.frombuffer(b''.join(strings.encoded), dtype='u1')
+    return _serialize(sections, len(rows), columns, metadata)
+
+def _merge_columns(columns: list[Column], tables: Sequence['ColumnarTable'], string_bases: list[int], prefix: str, sections: dict[str, np.ndarray]) -> None:
+    for column in columns:
+        key = prefix + column.name
+        if column.kind in (STR, STR_LIST):
+            sections[key] = np.concatenate([np.where(table._sections[key] >= 0, table._sections[key] + base, _NULL_INDEX).astype(_DTYPES[STR])
+                                            for table, base in zip(tables, string_bases)])
+        elif column.kind != RECORDS:
+            sections[key] = np.concatenate([table._sections[key] for table in tables])
+        if column.kind in (STR_LIST, RECORDS):
+            sections[key + '#offsets'] = _merge_offsets([table._sections[key + '#offsets'] for table in tables])
+        if column.kind == RECORDS:
+            _merge_columns(column.children, tables, string_bases, key + '/', sections)
+
+def _merge_offsets(parts: list[np.ndarray]) -> np.ndarray:
+    merged, base = [], 0
+    for offsets in parts:
+        merged.append(offsets[:-1] + base)
+        base += int(offsets[-1])
+    return np.concatenate(merged + [np.array([base], dtype='<i8')])
+
+def merge_tables(tables: Sequence['ColumnarTable'], metadata: dict[str, Any] | None = None) -> bytes:
+    """
+    Concatenate the rows of tables with the same columns into one encoded table.
+
+    Nothing is decoded: the columns and string tables are concatenated as arrays and string
+    indices shifted, so merging costs little more than copying. Strings repeated across tables
+    are stored once per table.
+
+    Args:
+        tables (sequence of ColumnarTable): The tables, in row order.
+        metadata (dict, optional): JSON-serializable metadata stored in the header.
+
+    Returns:
+        bytes: The encoded table.
+
+    Raises:
+        ValueError: If no tables are given or their columns differ.
+    """
+    if not tables:
+        raise ValueError("At least one table is required")
+    columns = tables[0].columns
+    if any([column.to_dict() for column in table.columns] != [column.to_dict() for column in columns] for table in tables):
+        raise ValueError("Only tables with the same columns can be merged")
+
+    string_bases = np.cumsum([0] + [len(table._string_offsets) - 1 for table in tables]).tolist()
+    sections: dict[str, np.ndarray] = {}
+    _merge_columns(columns, tables, string_bases, '', sections)
+    sections['#strings.offsets'] = _merge_offsets([table._string_offsets for table in tables])
+    sections['#strings.data'] = np.concatenate([table._string_data for table in tables])
+    return _serialize(sections, sum(len(table) for table in tables), columns, metadata)
+
+def write_table(path: str, rows: Iterable[dict], columns: list[Column], metadata: dict[str, Any] | None = None) -> int:
+    """
+    Write rows to a columnar file that can be memory-mapped and read without parsing.
+
+    The file is written to a temporary name and renamed, so readers never see a partial file.
+
+    Args:
+        path (str): The path of the file.
+        rows (iterable of dict): The rows, shaped like the API's JSON objects.
+        columns (list of Column): The columns to store; other keys are dropped.
+        metadata (dict, optional): JSON-serializable metadata stored in the header.
+
+    Returns:
+        int: The number of rows written.
+    """
+    rows = list(rows)
+    write_bytes(path, encode_table(rows, columns, metadata))
+    return len(rows)
+
+def write_bytes(path: str, data: bytes) -> None:
+    """
+    Atomically write an encoded table, such as the result of merge_tables, to a file.
+
+    Args:
+        path (str): The path of the file.
+        data (bytes): The encoded table.
+    """
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+class ColumnarTable:
+    """
+    A read-only columnar table, memory-mapped from a file or read from encoded bytes.
+
+    Columns are NumPy views of the mapping, so opening a file copies nothing and every process
+    mapping the same file shares its pages through the operating system's page cache. Rows are
+    rebuilt as dictionaries only when requested.
+
+    Attributes:
+        path (str or None): The path of the file, or None for a table read from bytes.
+        columns (list of Column): The stored columns.
+        metadata (dict): The metadata stored in the header.
+    """
+
+    def __init__(self, source: str | bytes) -> None:
+        """
+        Args:
+            source (str or bytes): The path of the file to map, or an encoded table.
+
+        Raises:
+            ValueError: If the source is not a columnar table or has an unsupported version.
+        """
+        self.path: str | None = source if isinstance(source, str) else None
+        self._mmap: mmap.mmap | None = None
+        if self.path is not None:
+            with open(source, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            source = self._mmap
+        name = self.path or "Data"
+        magic, header_size = _PREAMBLE.unpack_from(source, 0) if len(source) >= _PREAMBLE.size else (b'', 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{name} is not a columnar snapshot")
+        header = json.loads(source[_PREAMBLE.size:_PREAMBLE.size + header_size])
+        if header.get('version') != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot version {header.get('version')} in {name}")
+        self.columns: list[Column] = [Column.from_dict(column) for column in header['columns']]
+        self.metadata: dict[str, Any] = header['metadata']
+        self._rows: int = header['rows']
+        self._sections: dict[str, np.ndarray] = {
+            name: np.frombuffer(source, dtype=dtype, count=count, offset=offset)
+            for name, (dtype, offset, count) in header['sections'].items()
+        }
+        self._string_offsets: np.ndarray = self._sections['#strings.offsets']
+        self._string_data: np.ndarray = self._sections['#strings.data']
+
+    def get_string(self, index: int) -> str | None:
+        """
+        Decode an entry of the string table.
+
+        Args:
+            index (int): The index stored in a string column.
+
+        Returns:
+            str or None: The string, or None for a null index.
+        """
+        if index < 0:
+            return None
+        start, end = self._string_offsets[index], self._string_offsets[index + 1]
+        return self._string_data[start:end].tobytes().decode('utf-8')
+
+    def get_column(self, name: str) -> np.ndarray:
+        """
+        Get the raw array of a column without copying it.
+
+        Integers use the minimum int64 and floats NaN for missing values; strings are indices
+        into the string table, -1 for missing values.
+
+        Args:
+            name (str): The column name, e.g. 'starting_bid', or 'bids/amount' for a child column.
+
+        Returns:
+            np.ndarray: The read-only column.
+
+        Raises:
+            KeyError: If there is no such column.
+        """
+        return self._sections[name]
+
+    def get_counts(self, name: str) -> np.ndarray:
+        """
+        Get the number of values of a list or records column in every row.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            np.ndarray: The count per row.
+        """
+        return np.diff(self._sections[name + '#offsets'])
+
+    def match_strings(self, name: str, predicate: Callable[[str], bool]) -> np.ndarray:
+        """
+        Evaluate a predicate on a string column, decoding each distinct string only once.
+
+        Args:
+            name (str): The string column.
+            predicate (callable): Takes a string and returns whether the row matches.
+
+        Returns:
+            np.ndarray: A boolean mask of the matching rows; missing values never match.
+        """
+        indices = self._sections[name]
+        unique = np.unique(indices)
+        matching = [index for index in unique if index >= 0 and predicate(self.get_string(int(index)))]
+        return np.isin(indices, np.array(matching, dtype=indices.dtype))
+
+    def _decode(self, column: Column, key: str, index: int) -> Any:
+        if column.kind == STR:
+            return self.get_string(int(self._sections[key][index]))
+        if column.kind == INT:
+            value = int(self._sections[key][index])
+            return None if value == _NULL_INT else value
+        if column.kind == FLOAT:
+            value = float(self._sections[key][index])
+            return None if value != value else value
+        if column.kind == BOOL:
+            value = int(self._sections[key][index])
+            return None if value < 0 else bool(value)
+        offsets = self._sections[key + '#offsets']
+        start, end = int(offsets[index]), int(offsets[index + 1])
+        if column.kind == STR_LIST:
+            return [self.get_string(int(value)) for value in self._sections[key][start:end]]
+        return [self._decode_row(column.children, key + '/', position) for position in range(start, end)]
+
+    def _decode_row(self, columns: list[Column], prefix: str, index: int) -> dict:
+        row = {}
+        for column in columns:
+            value = self._decode(column, prefix + column.name, index)
+            if value is not None:
+                _set_path(row, column.name, value)
+        return row
+
+    def get_row(self, index: int) -> dict:
+        """
+        Rebuild a row as a dictionary shaped like the API's JSON object; missing values are omitted.
+
+        Args:
+            index (int): The row number.
+
+        Returns:
+            dict: The row.
+
+        Raises:
+            IndexError: If the row does not exist.
+        """
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError(f"Row {index} out of range")
+        return self._decode_row(self.columns, '', index)
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+
+        Raises:
+            BufferError: If arrays returned by get_column are still referenced.
+        """
+        self._sections = {}
+        self._string_offsets = self._string_data = None
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> 'ColumnarTable':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __str__(self) -> str:
+        return f"ColumnarTable {self.path or 'in memory'} ({self._rows} rows, {len(self.columns)} columns)"
+
+class LazyRows(Sequence):
+    """
+    A read-only sequence building objects from the rows of a table as they are accessed.
+
+    Attributes:
+        table (ColumnarTable): The table holding the rows.
+        factory (callable): Builds an object from a row dictionary.
+    """
+
+    def __init__(self, table: ColumnarTable, factory: Callable[[dict], Any]) -> None:
+        self.table: ColumnarTable = table
+        self.factory: Callable[[dict], Any] = factory
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return self.factory(self.table.get_row(index))
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self.table)):
+            yield self.factory(self.table.get_row(index))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __str__(self) -> str:
+        return f"LazyRows of {self.table}"
+
+class LazyMapping(Mapping):
+    """
+    A read-only mapping building objects from the rows of a table as they are accessed.
+
+    Attributes:
+        table (ColumnarTable): The table holding the rows.
+        factory (callable): Builds an object from a row dictionary.
+    """
+
+    def __init__(self, table: ColumnarTable, key_column: str, factory: Callable[[dict], Any]) -> None:
+        """
+        Args:
+            table (ColumnarTable): The table holding the rows.
+            key_column (str): The string column holding the unique key of every row.
+            factory (callable): Builds an object from a row dictionary.
+        """
+        self.table: ColumnarTable = table
+        self.factory: Callable[[dict], Any] = factory
+        self._rows: dict[str, int] = {table.get_string(int(index)): row for row, index in enumerate(table.get_column(key_column))}
+
+    def __getitem__(self, key: str) -> Any:
+        return self.factory(self.table.get_row(self._rows[key]))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __str__(self) -> str:
+        return f"LazyMapping of {self.table}"
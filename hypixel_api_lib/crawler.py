@@ -0,0 +1,666 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid as uuid_module
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from hypixel_api_lib.Profiles import SkyBlockProfile, SkyBlockProfiles
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# How long a claimed player stays assigned to a worker before another one may take it over
+DEFAULT_LEASE: float = 300.0
+
+# The default Hypixel API key limit: 300 requests per 5 minutes
+DEFAULT_KEY_LIMIT: int = 300
+DEFAULT_KEY_WINDOW: float = 300.0
+
+PENDING: str = 'pending'
+LEASED: str = 'leased'
+DONE: str = 'done'
+FAILED: str = 'failed'
+
+def key_id(api_key: str) -> str:
+    """
+    Derive the identifier under which the rate budget of an API key is shared, without storing the key.
+
+    Args:
+        api_key (str): The API key.
+
+    Returns:
+        str: A short hash of the key.
+    """
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+class CrawlQueue(ABC):
+    """
+    Base class for the work queue shared by the crawlers of every node.
+
+    Each player UUID is a task that is pending, leased to a worker, done or failed. Claiming leases
+    pending tasks, and tasks whose lease expired because their worker died, so the players are
+    sharded across workers as they ask for work and a crawl resumes where it stopped. Only the
+    worker holding a player's lease can record its outcome; a worker whose lease was taken over
+    is told so, but it may already have fetched the player, so delivery is at-least-once. The queue
+    also tracks the requests made with every API key, so all workers sharing a key share its budget.
+    """
+
+    @abstractmethod
+    def add(self, player_uuids: Iterable[str]) -> int:
+        """
+        Add players to crawl, ignoring players already in the queue.
+
+        Args:
+            player_uuids (iterable of str): The player UUIDs.
+
+        Returns:
+            int: The number of players added.
+        """
+
+    @abstractmethod
+    def claim(self, worker: str, count: int = 1, lease: float = DEFAULT_LEASE, now: float | None = None) -> list[str]:
+        """
+        Lease pending players, or players whose lease expired, to a worker.
+
+        Args:
+            worker (str): The identifier of the worker.
+            count (int, optional): The maximum number of players to claim.
+            lease (float, optional): Seconds before the players may be claimed by another worker.
+            now (float, optional): The current time in seconds since the epoch.
+
+        Returns:
+            list of str: The claimed player UUIDs, empty when no work is available.
+        """
+
+    @abstractmethod
+    def complete(self, player_uuid: str, worker: str, now: float | None = None) -> bool:
+        """
+        Mark a player as crawled, if the worker still holds its lease.
+
+        Args:
+            player_uuid (str): The player UUID.
+            worker (str): The identifier of the worker that crawled the player.
+            now (float, optional): The current time in seconds since the epoch.
+
+        Returns:
+            bool: True if the player was marked, False if another worker took it over.
+        """
+
+    @abstractmethod
+    def fail(self, player_uuid: str, worker: str, error: str, max_attempts: int = 3, now: float | None = None) -> bool:
+        """
+        Record a failed attempt, if the worker still holds the player's lease, returning the player
+        to the queue until max_attempts is reached.
+
+        Args:
+            player_uuid (str): The player UUID.
+            worker (str): The identifier of the worker that attempted the player.
+            error (str): A description of the failure.
+            max_attempts (int, optional): The number of attempts before the player is marked failed.
+            now (float, optional): The current time in seconds since the epoch.
+
+        Returns:
+            bool: True if the attempt was recorded, False if another worker took the player over.
+        """
+
+    @abstractmethod
+    def release(self, worker: str) -> int:
+        """
+        Return the players leased to a worker to the queue, e.g. when it shuts down.
+
+        Args:
+            worker (str): The identifier of the worker.
+
+        Returns:
+            int: The number of players released.
+        """
+
+    @abstractmethod
+    def reserve(self, key: str, limit: int, window: float, now: float | None = None) -> float:
+        """
+        Reserve one request of a key's budget.
+
+        Args:
+            key (str): The key identifier, see key_id.
+            limit (int): The number of requests allowed per window.
+            window (float): The length of the window in seconds.
+            now (float, optional): The current time in seconds since the epoch.
+
+        Returns:
+            float: 0.0 if the request was reserved, otherwise the seconds to wait before trying again.
+        """
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """
+        Count the players by status.
+
+        Returns:
+            dict of str to int: The number of pending, leased, done and failed players.
+        """
+
+    def is_finished(self) -> bool:
+        """
+        Check whether every player is done or failed.
+
+        Returns:
+            bool: True if no player is pending or leased.
+        """
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    uuid TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_until);
+CREATE TABLE IF NOT EXISTS budget (
+    key TEXT NOT NULL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS budget_key ON budget (key, at);
+"""
+
+class SQLiteQueue(CrawlQueue):
+    """
+    A crawl queue in a SQLite database, shared by the processes of one machine or a network file system.
+
+    Every change is committed immediately, so the database is the checkpoint of the crawl.
+
+    Attributes:
+        path (str): The database file.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str): The database file, created if needed.
+            timeout (float, optional): Seconds to wait for another process holding the database lock.
+        """
+        self.path: str = path
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def _transaction(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent claims never interleave
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation(self._connection)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+            return result
+
+    def add(self, player_uuids: Iterable[str]) -> int:
+        rows = [(player_uuid, PENDING) for player_uuid in player_uuids]
+        def insert(connection: sqlite3.Connection) -> int:
+            before = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO tasks (uuid, status) VALUES (?, ?)", rows)
+            return connection.total_changes - before
+        return self._transaction(insert)
+
+    def claim(self, worker: str, count: int = 1, lease: float = DEFAULT_LEASE, now: float | None = None) -> list[str]:
+        now = time.time() if now is None else now
+        def lease_tasks(connection: sqlite3.Connection) -> list[str]:
+            claimed = [row[0] for row in connection.execute(
+                "SELECT uuid FROM tasks WHERE status = ? OR (status = ? AND lease_until <= ?) ORDER BY rowid LIMIT ?",
+                (PENDING, LEASED, now, count))]
+            connection.executemany("UPDATE tasks SET status = ?, worker = ?, lease_until = ?, updated = ? WHERE uuid = ?",
+                                   [(LEASED, worker, now + lease, now, player_uuid) for player_uuid in claimed])
+            return claimed
+        return self._transaction(lease_tasks)
+
+    def complete(self, player_uuid: str, worker: str, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        def record(connection: sqlite3.Connection) -> bool:
+            return connection.execute("UPDATE tasks SET status = ?, lease_until = NULL, error = NULL, updated = ? WHERE uuid = ? AND status = ? AND worker = ?",
+                                      (DONE, now, player_uuid, LEASED, worker)).rowcount == 1
+        return self._transaction(record)
+
+    def fail(self, player_uuid: str, worker: str, error: str, max_attempts: int = 3, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        def record(connection: sqlite3.Connection) -> bool:
+            return connection.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts + 1 < ? THEN ? ELSE ? END, worker = NULL, lease_until = NULL, "
+                "attempts = attempts + 1, error = ?, updated = ? WHERE uuid = ? AND status = ? AND worker = ?",
+                (max_attempts, PENDING, FAILED, error, now, player_uuid, LEASED, worker)).rowcount == 1
+        return self._transaction(record)
+
+    def release(self, worker: str) -> int:
+        def release_tasks(connection: sqlite3.Connection) -> int:
+            return connection.execute("UPDATE tasks SET status = ?, worker = NULL, lease_until = NULL WHERE status = ? AND worker = ?",
+                                      (PENDING, LEASED, worker)).rowcount
+        return self._transaction(release_tasks)
+
+    def reserve(self, key: str, limit: int, window: float, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        def reserve_request(connection: sqlite3.Connection) -> float:
+            connection.execute("DELETE FROM budget WHERE key = ? AND at <= ?", (key, now - window))
+            used, oldest = connection.execute("SELECT COUNT(*), MIN(at) FROM budget WHERE key = ?", (key,)).fetchone()
+            if used >= limit:
+                return max(oldest + window - now, 0.0)
+            connection.execute("INSERT INTO budget (key, at) VALUES (?, ?)", (key, now))
+            return 0.0
+        return self._transaction(reserve_request)
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(rows)
+        return counts
+
+    def get_errors(self) -> dict[str, str]:
+        """
+        Get the last error of every failed player.
+
+        Returns:
+            dict of str to str: The error message by player UUID.
+        """
+        with self._lock:
+            return dict(self._connection.execute("SELECT uuid, error FROM tasks WHERE status = ?", (FAILED,)).fetchall())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __str__(self) -> str:
+        return f"SQLiteQueue {self.path} {self.counts()}"
+
+class FileLock:
+    """
+    An exclusive lock on a file, held by at most one thread of any process at a time.
+
+    Attributes:
+        path (str): The lock file, created if needed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._local: threading.local = threading.local()
+
+    def acquire(self) -> None:
+        """Block until the lock is held."""
+        f = open(self.path, 'a+b')
+        try:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        except BaseException:
+            f.close()
+            raise
+        self._local.file = f
+
+    def release(self) -> None:
+        """Release the lock held by this thread."""
+        f = self._local.file
+        self._local.file = None
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        f.close()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def __str__(self) -> str:
+        return f"FileLock {self.path}"
+
+class FileQueue(CrawlQueue):
+    """
+    A crawl queue in a JSON file, rewritten under a FileLock by every operation.
+
+    It needs nothing but a shared file system and suits tests and small crawls; every operation
+    reads and writes the whole state, so large crawls should use a SQLiteQueue.
+
+    Attributes:
+        path (str): The JSON state file.
+        lock (FileLock): The lock coordinating the processes using the file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.lock: FileLock = FileLock(path + '.lock')
+
+    def _update(self, operation: Callable[[dict], Any], write: bool = True) -> Any:
+        with self.lock:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except FileNotFoundError:
+                state = {'tasks': {}, 'budgets': {}}
+            result = operation(state)
+            if write:
+                temporary_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temporary_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                os.replace(temporary_path, self.path)
+            return result
+
+    def add(self, player_uuids: Iterable[str]) -> int:
+        player_uuids = list(player_uuids)
+        def insert(state: dict) -> int:
+            tasks = state['tasks']
+            added = 0
+            for player_uuid in player_uuids:
+                if player_uuid not in tasks:
+                    tasks[player_uuid] = {'status': PENDING, 'worker': None, 'lease_until': None, 'attempts': 0, 'error': None}
+                    added += 1
+            return added
+        return self._update(insert)
+
+    def claim(self, worker: str, count: int = 1, lease: float = DEFAULT_LEASE, now: float | None = None) -> list[str]:
+        now = time.time() if now is None else now
+        def lease_tasks(state: dict) -> list[str]:
+            claimed = []
+            for player_uuid, task in state['tasks'].items():
+                if len(claimed) >= count:
+                    break
+                if task['status'] == PENDING or (task['status'] == LEASED and task['lease_until'] <= now):
+                    task.update(status=LEASED, worker=worker, lease_until=now + lease)
+                    claimed.append(player_uuid)
+            return claimed
+        return self._update(lease_tasks)
+
+    def complete(self, player_uuid: str, worker: str, now: float | None = None) -> bool:
+        def record(state: dict) -> bool:
+            task = state['tasks'].get(player_uuid)
+            if task is None or task['status'] != LEASED or task['worker'] != worker:
+                return False
+            task.update(status=DONE, lease_until=None, error=None)
+            return True
+        return self._update(record)
+
+    def fail(self, player_uuid: str, worker: str, error: str, max_attempts: int = 3, now: float | None = None) -> bool:
+        def record(state: dict) -> bool:
+            task = state['tasks'].get(player_uuid)
+            if task is None or task['status'] != LEASED or task['worker'] != worker:
+                return False
+            task['attempts'] += 1
+            status = PENDING if task['attempts'] < max_attempts else FAILED
+            task.update(status=status, worker=None, lease_until=None, error=error)
+            return True
+        return self._update(record)
+
+    def release(self, worker: str) -> int:
+        def release_tasks(state: dict) -> int:
+            released = 0
+            for task in state['tasks'].values():
+                if task['status'] == LEASED and task['worker'] == worker:
+                    task.update(status=PENDING, worker=None, lease_until=None)
+                    released += 1
+            return released
+        return self._update(release_tasks)
+
+    def reserve(self, key: str, limit: int, window: float, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        def reserve_request(state: dict) -> float:
+            requests_made = [at for at in state['budgets'].get(key, []) if at > now - window]
+            state['budgets'][key] = requests_made
+            if len(requests_made) >= limit:
+                return max(min(requests_made) + window - now, 0.0)
+            requests_made.append(now)
+            return 0.0
+        return self._update(reserve_request)
+
+    def counts(self) -> dict[str, int]:
+        def count(state: dict) -> dict[str, int]:
+            counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+            for task in state['tasks'].values():
+                counts[task['status']] += 1
+            return counts
+        return self._update(count, write=False)
+
+    def __str__(self) -> str:
+        return f"FileQueue {self.path} {self.counts()}"
+
+class CrawlStats:
+    """
+    Counts what a crawler did.
+
+    Attributes:
+        crawled (int): The players whose profiles were fetched and handled.
+        failed (int): The failed attempts, including retried ones.
+        profiles (int): The profiles fetched.
+        discovered (int): The coop members added to the queue.
+        lost (int): The players another worker took over before their outcome was recorded.
+        waited (float): Seconds spent waiting for the key's rate budget.
+    """
+
+    def __init__(self) -> None:
+        self.crawled: int = 0
+        self.failed: int = 0
+        self.profiles: int = 0
+        self.discovered: int = 0
+        self.lost: int = 0
+        self.waited: float = 0.0
+
+    def __str__(self) -> str:
+        return (f"Crawled {self.crawled} players ({self.profiles} profiles, {self.discovered} discovered), "
+                f"{self.failed} failed attempts, {self.lost} lost, waited {self.waited:.1f}s for the rate budget")
+
+class ProfileCrawler:
+    """
+    Crawls the profiles of the players in a shared CrawlQueue with one API key.
+
+    Run one crawler per API key, on as many nodes as there are keys: every crawler claims batches of
+    players from the queue, so the work is sharded without duplicates and the total throughput grows
+    with the number of keys. Each request first reserves one request of the key's budget in the
+    queue, so threads and processes sharing a key stay within its limit together.
+
+    A failure is recorded in the queue and the player retried until max_attempts is reached. An
+    invalid API key stops the crawler, returning its claimed players to the queue. The handler can
+    be called more than once for a player whose lease expired while it was being crawled, so it
+    should store profiles idempotently, e.g. keyed by profile ID.
+
+    Attributes:
+        queue (CrawlQueue): The shared work queue.
+        profiles (SkyBlockProfiles): The profile manager using this crawler's API key.
+        handler (callable or None): Called with each player UUID and its profiles.
+        worker_id (str): The identifier of this crawler in the queue.
+        key_limit (int): The requests allowed per key_window for the API key.
+        key_window (float): The length of the rate limit window in seconds.
+        discover (bool): Whether to add the coop members of crawled profiles to the queue.
+        stats (CrawlStats): What this crawler did so far.
+    """
+
+    def __init__(self, queue: CrawlQueue, api_key: str, handler: Callable[[str, list[SkyBlockProfile]], None] | None = None, worker_id: str | None = None,
+                 key_limit: int = DEFAULT_KEY_LIMIT, key_window: float = DEFAULT_KEY_WINDOW, batch_size: int = 10, lease: float = DEFAULT_LEASE,
+                 max_attempts: int = 3, discover: bool = False, profiles: SkyBlockProfiles | None = None,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.time) -> None:
+        """
+        Args:
+            queue (CrawlQueue): The shared work queue.
+            api_key (str): The API key of this crawler.
+            handler (callable, optional): Called with each player UUID and its profiles, e.g. to store them.
+            worker_id (str, optional): The identifier of this crawler, unique by default.
+            key_limit (int, optional): The requests allowed per key_window for the API key.
+            key_window (float, optional): The length of the rate limit window in seconds.
+            batch_size (int, optional): The number of players claimed at once.
+            lease (float, optional): Seconds before players claimed by a dead crawler are reassigned.
+            max_attempts (int, optional): The attempts per player before it is marked failed.
+            discover (bool, optional): Whether to add the coop members of crawled profiles to the queue.
+            profiles (SkyBlockProfiles, optional): The profile manager to use, built from api_key by default.
+            sleep (callable, optional): Waits for the rate budget, time.sleep by default.
+            clock (callable, optional): Returns the current time in seconds since the epoch.
+
+        Raises:
+            ValueError: If key_limit or batch_size is not positive.
+        """
+        if key_limit < 1 or batch_size < 1:
+            raise ValueError("key_limit and batch_size must be positive")
+        self.queue: CrawlQueue = queue
+        self.profiles: SkyBlockProfiles = profiles if profiles is not None else SkyBlockProfiles(api_key)
+        self.handler: Callable[[str, list[SkyBlockProfile]], None] | None = handler
+        self.worker_id: str = worker_id or f"{os.getpid()}-{uuid_module.uuid4().hex[:8]}"
+        self.key_limit: int = key_limit
+        self.key_window: float = key_window
+        self.discover: bool = discover
+        self.stats: CrawlStats = CrawlStats()
+        self._key: str = key_id(api_key)
+        self._batch_size: int = batch_size
+        self._lease: float = lease
+        self._max_attempts: int = max_attempts
+        self._sleep: Callable[[float], None] = sleep
+        self._clock: Callable[[], float] = clock
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._stop: threading.Event = threading.Event()
+
+    def _wait_for_budget(self) -> bool:
+        # Only a reserved request may be sent, so a stopped crawler gives up without one
+        while not self._stop.is_set():
+            delay = self.queue.reserve(self._key, self.key_limit, self.key_window, self._clock())
+            if delay <= 0:
+                return True
+            with self._stats_lock:
+                self.stats.waited += delay
+            self._sleep(delay)
+        return False
+
+    def crawl_player(self, player_uuid: str) -> bool:
+        """
+        Fetch and handle the profiles of one claimed player, recording the outcome in the queue.
+
+        If the crawler is stopped before a request of the key's budget could be reserved, the
+        player is skipped and stays leased until the crawler releases it.
+
+        Args:
+            player_uuid (str): The player UUID.
+
+        Returns:
+            bool: True if the player was crawled.
+
+        Raises:
+            PermissionError: If the API key is invalid.
+        """
+        if not self._wait_for_budget():
+            return False
+        try:
+            player_profiles = self.profiles.get_profiles_by_player_uuid(player_uuid)
+            if self.handler is not None:
+                self.handler(player_uuid, player_profiles)
+        except PermissionError:
+            self.stop()
+            raise
+        except Exception as e:
+            recorded = self.queue.fail(player_uuid, self.worker_id, f"{type(e).__name__}: {e}", self._max_attempts, self._clock())
+            with self._stats_lock:
+                self.stats.failed += 1
+                self.stats.lost += not recorded
+            return False
+
+        discovered = 0
+        if self.discover:
+            members = {member for profile in player_profiles for member in profile.members}
+            discovered = self.queue.add(members - {player_uuid})
+        if not self.queue.complete(player_uuid, self.worker_id, self._clock()):
+            with self._stats_lock:
+                self.stats.lost += 1
+            return False
+        with self._stats_lock:
+            self.stats.crawled += 1
+            self.stats.profiles += len(player_profiles)
+            self.stats.discovered += discovered
+        return True
+
+    def _crawl_unless_stopped(self, player_uuid: str) -> bool:
+        return not self._stop.is_set() and self.crawl_player(player_uuid)
+
+    def run_once(self, threads: int = 1) -> int:
+        """
+        Claim one batch of players and crawl it.
+
+        Args:
+            threads (int, optional): The number of players crawled concurrently.
+
+        Returns:
+            int: The number of players claimed, 0 when no work is available.
+
+        Raises:
+            PermissionError: If the API key is invalid.
+        """
+        claimed = self.queue.claim(self.worker_id, self._batch_size, self._lease, self._clock())
+        try:
+            if threads <= 1:
+                for player_uuid in claimed:
+                    if self._stop.is_set():
+                        break
+                    self.crawl_player(player_uuid)
+            else:
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    list(executor.map(self._crawl_unless_stopped, claimed))
+        except PermissionError:
+            self.stop()
+            raise
+        finally:
+            if self._stop.is_set():
+                self.queue.release(self.worker_id)
+        return len(claimed)
+
+    def run(self, threads: int = 1, max_players: int | None = None, poll_interval: float = 5.0) -> CrawlStats:
+        """
+        Crawl until the queue is finished, max_players were claimed or stop is called.
+
+        While other crawlers still hold leases the queue is polled every poll_interval seconds, so
+        their players are taken over if they die.
+
+        Args:
+            threads (int, optional): The number of players crawled concurrently.
+            max_players (int, optional): Stop after claiming this many players.
+            poll_interval (float, optional): Seconds between polls while no work is available.
+
+        Returns:
+            CrawlStats: What this crawler did.
+
+        Raises:
+            PermissionError: If the API key is invalid.
+        """
+        claimed = 0
+        while not self._stop.is_set() and (max_players is None or claimed < max_players):
+            batch = self.run_once(threads)
+            claimed += batch
+            if batch == 0:
+                if self.queue.is_finished():
+                    break
+                self._stop.wait(poll_interval)
+        self.queue.release(self.worker_id)
+        return self.stats
+
+    def stop(self) -> None:
+        """Ask the crawler to stop after the players being crawled."""
+        self._stop.set()
+
+    def __str__(self) -> str:
+        return f"ProfileCrawler {self.worker_id}: {self.stats}"
@@ -0,0 +1,173 @@
+from collections.abc import Iterable, Sequence
+import numpy as np
+from hypixel_api_lib.columnar import Column, ColumnarTable, _get_values, STR, INT, FLOAT, BOOL, STR_LIST, RECORDS
+
+def _require_pyarrow():
+    # pyarrow is an optional dependency, imported on first export so the library loads without it
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Exporting to Arrow requires pyarrow, install it with 'pip install hypixel_api_lib[arrow]'") from e
+    return pyarrow
+
+def _arrow_type(column: Column, timestamps: frozenset[str], key: str):
+    pa = _require_pyarrow()
+    if column.kind == STR:
+        return pa.string()
+    if column.kind == INT:
+        return pa.timestamp('ms', tz='UTC') if key in timestamps else pa.int64()
+    if column.kind == FLOAT:
+        return pa.float64()
+    if column.kind == BOOL:
+        return pa.bool_()
+    if column.kind == STR_LIST:
+        return pa.list_(pa.string())
+    return pa.list_(pa.struct([(child.name, _arrow_type(child, timestamps, f"{key}/{child.name}")) for child in column.children]))
+
+def arrow_schema(columns: list[Column], timestamps: Iterable[str] = ()) -> 'pyarrow.Schema':
+    """
+    Build the Arrow schema of columns.
+
+    Args:
+        columns (list of Column): The columns, as used for columnar snapshots.
+        timestamps (iterable of str): The integer columns holding epoch milliseconds, exported as
+            UTC timestamps. Columns of records are named 'parent/child', e.g. 'bids/timestamp'.
+
+    Returns:
+        pyarrow.Schema: The schema, with one field per column named after it.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    timestamps = frozenset(timestamps)
+    return pa.schema([(column.name, _arrow_type(column, timestamps, column.name)) for column in columns])
+
+def rows_to_arrow(rows: Sequence[dict], columns: list[Column], timestamps: Iterable[str] = ()) -> 'pyarrow.RecordBatch':
+    """
+    Build an Arrow record batch from raw API objects, one column at a time.
+
+    The values of each column are collected from the dictionaries and converted by Arrow in a
+    single call, so no model objects are built.
+
+    Args:
+        rows (sequence of dict): The objects as returned by the API.
+        columns (list of Column): The columns to export; other keys are dropped.
+        timestamps (iterable of str): The integer columns holding epoch milliseconds.
+
+    Returns:
+        pyarrow.RecordBatch: The rows, missing values as nulls.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    schema = arrow_schema(columns, timestamps)
+    arrays = []
+    for column, field in zip(columns, schema):
+        values = _get_values(rows, column.name)
+        if column.kind in (STR_LIST, RECORDS):
+            # Missing lists are empty, as in the models and columnar snapshots
+            values = [value or [] for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def batches_to_table(batches: Iterable['pyarrow.RecordBatch'], columns: list[Column], timestamps: Iterable[str] = ()) -> 'pyarrow.Table':
+    """
+    Combine record batches built by rows_to_arrow, such as one per page, into a table.
+
+    Args:
+        batches (iterable of pyarrow.RecordBatch): The batches, in row order.
+        columns (list of Column): The columns the batches were built with.
+        timestamps (iterable of str): The integer columns holding epoch milliseconds.
+
+    Returns:
+        pyarrow.Table: The rows of every batch, without copying them.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    return pa.Table.from_batches(list(batches), schema=arrow_schema(columns, timestamps))
+
+def _table_array(table: ColumnarTable, column: Column, key: str, timestamps: frozenset[str], strings):
+    pa = _require_pyarrow()
+    values = table.get_column(key) if column.kind != RECORDS else None
+    if column.kind in (STR, STR_LIST):
+        indices = pa.array(values, mask=values < 0)
+        array = pa.DictionaryArray.from_arrays(indices, strings).dictionary_decode().cast(pa.string())
+    elif column.kind == INT:
+        array = pa.array(values, mask=values == np.iinfo(np.int64).min, type=_arrow_type(column, timestamps, key))
+    elif column.kind == FLOAT:
+        array = pa.array(values, mask=np.isnan(values))
+    elif column.kind == BOOL:
+        array = pa.array(values.astype(bool), mask=values < 0)
+    if column.kind in (STR, INT, FLOAT, BOOL):
+        return array
+
+    offsets = pa.array(table.get_column(key + '#offsets').astype(np.int32))
+    if column.kind == RECORDS:
+        children = [_table_array(table, child, f"{key}/{child.name}", timestamps, strings) for child in column.children]
+        array = pa.StructArray.from_arrays(children, names=[child.name for child in column.children])
+    return pa.ListArray.from_arrays(offsets, array)
+
+def table_to_arrow(table: ColumnarTable, timestamps: Iterable[str] = ()) -> 'pyarrow.Table':
+    """
+    Convert a columnar snapshot to an Arrow table.
+
+    The fixed-width columns are handed to Arrow as they are and strings are looked up in the
+    string table by Arrow, so no rows are decoded in Python.
+
+    Args:
+        table (ColumnarTable): The snapshot, e.g. the table of an ActiveAuctions LazyRows.
+        timestamps (iterable of str): The integer columns holding epoch milliseconds.
+
+    Returns:
+        pyarrow.Table: The rows, missing values as nulls.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    timestamps = frozenset(timestamps)
+    string_offsets = table.get_column('#strings.offsets')
+    strings = pa.LargeStringArray.from_buffers(len(string_offsets) - 1, pa.py_buffer(string_offsets), pa.py_buffer(table.get_column('#strings.data')))
+    arrays = [_table_array(table, column, column.name, timestamps, strings) for column in table.columns]
+    return pa.Table.from_arrays(arrays, schema=arrow_schema(table.columns, timestamps))
+
+def write_parquet(data: 'pyarrow.Table | pyarrow.RecordBatch', path: str, compression: str = 'zstd') -> None:
+    """
+    Write an exported table to a Parquet file.
+
+    Args:
+        data (pyarrow.Table or pyarrow.RecordBatch): The exported rows.
+        path (str): The path of the Parquet file.
+        compression (str, optional): The Parquet compression codec.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    if isinstance(data, pa.RecordBatch):
+        data = pa.Table.from_batches([data])
+    pa.parquet.write_table(data, path, compression=compression)
+
+def flatten_stats(data: dict, prefix: str = '') -> dict[str, float]:
+    """
+    Flatten nested statistics into dotted names, keeping only the numeric values.
+
+    Args:
+        data (dict): The nested statistics, e.g. the player_stats of a profile member.
+        prefix (str, optional): Prepended to every name.
+
+    Returns:
+        dict of str to float: The values keyed by dotted name, e.g. 'kills.zombie'.
+    """
+    flat = {}
+    for name, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten_stats(value, f"{prefix}{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[prefix + name] = float(value)
+    return flat
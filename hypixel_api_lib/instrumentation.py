@@ -0,0 +1,358 @@
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NULL_TIMER = nullcontext()
+
+class RequestEvent:
+    """
+    Represents the timings of one API request, from the network to the built models.
+
+    Attributes:
+        endpoint (str): The endpoint URL, without query parameters.
+        status (int or None): The HTTP status code of the final response, or None if none was received.
+        bytes (int or None): The size of the response body, or None if unknown.
+        network_ms (float): Milliseconds spent waiting on the network, including retries.
+        decode_ms (float): Milliseconds spent decoding the JSON body.
+        build_ms (float): Milliseconds spent building model objects from the decoded data.
+        cache (str or None): 'hit', 'miss' or 'stale' if a response cache was consulted, otherwise None.
+        retries (int): The number of retried attempts.
+        error (str or None): The name of the exception that ended the request, if any.
+    """
+
+    __slots__ = ('endpoint', 'status', 'bytes', 'network_ms', 'decode_ms', 'build_ms', 'cache', 'retries', 'error')
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint: str = endpoint
+        self.status: int | None = None
+        self.bytes: int | None = None
+        self.network_ms: float = 0.0
+        self.decode_ms: float = 0.0
+        self.build_ms: float = 0.0
+        self.cache: str | None = None
+        self.retries: int = 0
+        self.error: str | None = None
+
+    def time(self, phase: str) -> '_PhaseTimer':
+        """
+        Time a phase of the request.
+
+        Args:
+            phase (str): 'network', 'decode' or 'build'.
+
+        Returns:
+            context manager: Adds the elapsed time of its block to the phase.
+        """
+        return _PhaseTimer(self, phase + '_ms')
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the event to a dictionary, e.g. for structured logging.
+
+        Returns:
+            dict: The event's attributes.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self) -> str:
+        return (f"{self.endpoint} {self.status}: network {self.network_ms:.1f}ms, decode {self.decode_ms:.1f}ms, "
+                f"build {self.build_ms:.1f}ms, {self.bytes} bytes, cache {self.cache}, {self.retries} retries")
+
+class _PhaseTimer:
+    __slots__ = ('_event', '_attribute', '_started')
+
+    def __init__(self, event: RequestEvent, attribute: str) -> None:
+        self._event = event
+        self._attribute = attribute
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = (time.perf_counter() - self._started) * 1000
+        setattr(self._event, self._attribute, getattr(self._event, self._attribute) + elapsed)
+
+class _NullEvent:
+    """Stands in for a RequestEvent while instrumentation is disabled, ignoring every update."""
+
+    __slots__ = ()
+
+    def time(self, phase: str) -> nullcontext:
+        return _NULL_TIMER
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+_NULL_EVENT = _NullEvent()
+
+_current_event: ContextVar[RequestEvent | None] = ContextVar('hypixel_api_lib_request_event', default=None)
+
+def get_current_event() -> RequestEvent | None:
+    """
+    Get the event of the request being tracked in the current thread or task.
+
+    Returns:
+        RequestEvent or None: The tracked event, or None if no request is tracked.
+    """
+    return _current_event.get()
+
+def time_phase(phase: str) -> '_PhaseTimer | nullcontext':
+    """
+    Time a phase of the request being tracked, if any.
+
+    Args:
+        phase (str): 'network', 'decode' or 'build'.
+
+    Returns:
+        context manager: Adds the elapsed time of its block to the tracked event, or does nothing.
+    """
+    event = _current_event.get()
+    return _NULL_TIMER if event is None else _PhaseTimer(event, phase + '_ms')
+
+class _Tracker:
+    __slots__ = ('_instrumentation', '_event', '_token')
+
+    def __init__(self, instrumentation: 'Instrumentation', endpoint: str) -> None:
+        self._instrumentation = instrumentation
+        self._event = RequestEvent(endpoint)
+
+    def __enter__(self) -> RequestEvent:
+        self._token = _current_event.set(self._event)
+        return self._event
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        _current_event.reset(self._token)
+        if exc_type is not None and self._event.error is None:
+            self._event.error = exc_type.__name__
+        self._instrumentation.emit(self._event)
+
+class _NullTracker:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullEvent:
+        return _NULL_EVENT
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+_NULL_TRACKER = _NullTracker()
+
+class Instrumentation:
+    """
+    Dispatches a RequestEvent per API request to pluggable hooks.
+
+    Managers wrap each request in track, the transport fills in the network timings, status,
+    size and retries, and response caches record hits and misses. Without hooks, track returns
+    a shared no-op tracker, so instrumentation costs almost nothing while disabled.
+
+    Attributes:
+        enabled (bool): Whether at least one hook is registered.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._hooks: tuple[Callable[[RequestEvent], None], ...] = ()
+        self.enabled: bool = False
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Register a hook called with every finished RequestEvent.
+
+        Args:
+            hook (callable): The hook, e.g. a MetricsCollector or a logging function.
+        """
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+            self.enabled = True
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Unregister a hook.
+
+        Args:
+            hook (callable): The hook to remove.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        with self._lock:
+            hooks = list(self._hooks)
+            hooks.remove(hook)
+            self._hooks = tuple(hooks)
+            self.enabled = bool(hooks)
+
+    def track(self, endpoint: str) -> _Tracker | _NullTracker:
+        """
+        Track a request, emitting its event when the block exits.
+
+        Args:
+            endpoint (str): The endpoint URL, without query parameters.
+
+        Returns:
+            context manager: Yields the RequestEvent to time the decode and build phases with.
+        """
+        if not self.enabled:
+            return _NULL_TRACKER
+        return _Tracker(self, endpoint)
+
+    def emit(self, event: RequestEvent) -> None:
+        """
+        Pass an event to every hook.
+
+        Args:
+            event (RequestEvent): The finished event.
+        """
+        for hook in self._hooks:
+            hook(event)
+
+    def __str__(self) -> str:
+        return f"Instrumentation with {len(self._hooks)} hooks"
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, index: int, value: float) -> None:
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    pairs = (f'{name}="{_escape_label(value)}"' for name, value in labels)
+    return '{' + ','.join(pairs) + '}'
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+class MetricsCollector:
+    """
+    A hook aggregating RequestEvents into counters and latency histograms per endpoint.
+
+    Attributes:
+        buckets (tuple of float): The upper bounds in seconds of the histogram buckets.
+        prefix (str): The prefix of every exported metric name.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = 'hypixel_api') -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.prefix: str = prefix
+        self._lock: threading.Lock = threading.Lock()
+        self._counters: dict[str, dict[tuple[tuple[str, str], ...], float]] = {}
+        self._histograms: dict[str, dict[tuple[tuple[str, str], ...], _Histogram]] = {}
+
+    def _increment(self, name: str, labels: tuple[tuple[str, str], ...], amount: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + amount
+
+    def _observe(self, name: str, labels: tuple[tuple[str, str], ...], seconds: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = _Histogram(self.buckets)
+        histogram.observe(bisect_left(self.buckets, seconds), seconds)
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Record an event.
+
+        Args:
+            event (RequestEvent): The finished event.
+        """
+        endpoint = (('endpoint', event.endpoint),)
+        with self._lock:
+            status = str(event.status) if event.status is not None else (event.error or 'none')
+            self._increment('requests_total', endpoint + (('status', status),))
+            if event.bytes is not None:
+                self._increment('response_bytes_total', endpoint, event.bytes)
+            if event.retries:
+                self._increment('retries_total', endpoint, event.retries)
+            if event.cache is not None:
+                self._increment('cache_lookups_total', endpoint + (('result', event.cache),))
+            if event.cache != 'hit' and event.status is not None:
+                self._observe('network_seconds', endpoint, event.network_ms / 1000)
+            if event.decode_ms:
+                self._observe('decode_seconds', endpoint, event.decode_ms / 1000)
+            if event.build_ms:
+                self._observe('build_seconds', endpoint, event.build_ms / 1000)
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """
+        Get the value of a counter series.
+
+        Args:
+            name (str): The counter name without prefix, e.g. 'requests_total'.
+            **labels: The series labels, e.g. endpoint and status.
+
+        Returns:
+            float: The counter value, 0 if the series does not exist.
+        """
+        with self._lock:
+            return self._counters.get(name, {}).get(tuple(labels.items()), 0)
+
+    def get_histogram(self, name: str, endpoint: str) -> tuple[int, float]:
+        """
+        Get the number and total of observations of a histogram series.
+
+        Args:
+            name (str): The histogram name without prefix, e.g. 'network_seconds'.
+            endpoint (str): The endpoint label.
+
+        Returns:
+            tuple of (int, float): The observation count and the sum in seconds.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get((('endpoint', endpoint),))
+            return (histogram.count, histogram.sum) if histogram is not None else (0, 0.0)
+
+    def to_prometheus(self) -> str:
+        """
+        Export every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, ready to serve from a /metrics endpoint.
+        """
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {_format_value(value)}")
+            for name in sorted(self._histograms):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + (float('inf'),), histogram.counts):
+                        cumulative += count
+                        le = '+Inf' if bound == float('inf') else repr(bound)
+                        lines.append(f"{metric}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return ''.join(line + '\n' for line in lines)
+
+    def reset(self) -> None:
+        """Forget every recorded metric."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def __str__(self) -> str:
+        return f"MetricsCollector with {sum(len(series) for series in self._counters.values())} counter series"
+
+# Used by every manager, transport and response cache
+DEFAULT_INSTRUMENTATION: Instrumentation = Instrumentation()
@@ -612,8 +612,10 @@ class PlayerStats:
         sea_creature_kills (dict[str,int]): Dictionary of sea creature kills.
         rift (dict[str,int]): Dictionary of Rift dimension stats.
         spooky (dict[str,int]): Dictionary of spooky event stats.
+        raw (dict): The statistics as returned by the API, for bulk export.
     """
     def __init__(self, player_stats: dict) -> None:
+        self.raw: dict = player_stats
         self.candy_collected: CandyCollected = CandyCollected(player_stats.get('candy_collected', {}))
         self.highest_critical_damage: float = player_stats.get('highest_critical_damage', 0.0)
         self.highest_damage: float = player_stats.get('highest_damage', 0.0)
@@ -1,7 +1,4 @@
-import zlib
-import base64
-import gzip
-from io import BytesIO
+from hypixel_api_lib.ItemBytes import decompress_item_bytes
 
 class InventoryData:
     """
@@ -23,21 +20,9 @@ class InventoryData:
         """Attempt to decode and decompress the inventory data."""
         if not data:
             return "No data available"
-        
         try:
-            decoded_data = base64.b64decode(data)
-            
-            try:
-                decompressed_data = zlib.decompress(decoded_data)
-                return decompressed_data.decode('utf-8', errors='ignore')
-            except zlib.error as e:
-                try:
-                    with gzip.open(BytesIO(decoded_data), 'rb') as f:
-                        return f.read().decode('utf-8', errors='ignore')
-                except gzip.BadGzipFile as e:
-                    return f"Error decoding inventory: Gzip decompression failed - {e}"
-
-        except (base64.binascii.Error, zlib.error) as e:
+            return decompress_item_bytes(data).decode('utf-8', errors='ignore')
+        except ValueError as e:
             return f"Error decoding inventory: {e}"
 
     def __str__(self) -> str:
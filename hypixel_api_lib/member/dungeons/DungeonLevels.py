@@ -0,0 +1,67 @@
+from bisect import bisect_right
+from itertools import accumulate
+import numpy as np
+
+# XP needed to go from each level to the next, shared by Catacombs and every dungeon class
+CATACOMBS_XP_PER_LEVEL: list[int] = [
+    50, 75, 110, 160, 230, 330, 470, 670, 950, 1340,
+    1890, 2665, 3760, 5260, 7380, 10300, 14400, 20000, 27600, 38000,
+    52500, 71500, 97000, 132000, 180000, 243000, 328000, 445000, 600000, 800000,
+    1065000, 1410000, 1900000, 2500000, 3300000, 4300000, 5600000, 7200000, 9200000, 12000000,
+    15000000, 19000000, 24000000, 30000000, 38000000, 48000000, 60000000, 75000000, 93000000, 116250000,
+]
+CATACOMBS_CUMULATIVE_XP: list[int] = list(accumulate(CATACOMBS_XP_PER_LEVEL))
+CATACOMBS_MAX_LEVEL: int = len(CATACOMBS_XP_PER_LEVEL)
+OVERFLOW_XP_PER_LEVEL: int = 200000000
+DUNGEON_CLASSES: tuple[str, ...] = ('healer', 'mage', 'berserk', 'archer', 'tank')
+
+_CUMULATIVE_XP_ARRAY: np.ndarray = np.array(CATACOMBS_CUMULATIVE_XP, dtype=np.float64)
+_XP_PER_LEVEL_ARRAY: np.ndarray = np.array(CATACOMBS_XP_PER_LEVEL, dtype=np.float64)
+_MAX_LEVEL_XP: int = CATACOMBS_CUMULATIVE_XP[-1]
+
+def get_dungeon_level(experience: float, overflow: bool = False) -> float:
+    """
+    Convert Catacombs or dungeon class experience into a level with fractional progress.
+
+    Args:
+        experience (float): The total experience earned.
+        overflow (bool): Whether to keep counting levels past 50 at 200M XP per level.
+
+    Returns:
+        float: The level reached plus the fraction of the way to the next level, e.g. 24.5.
+    """
+    reached = bisect_right(CATACOMBS_CUMULATIVE_XP, experience)
+    if reached >= CATACOMBS_MAX_LEVEL:
+        if overflow:
+            return CATACOMBS_MAX_LEVEL + (experience - _MAX_LEVEL_XP) / OVERFLOW_XP_PER_LEVEL
+        return float(CATACOMBS_MAX_LEVEL)
+    previous = CATACOMBS_CUMULATIVE_XP[reached - 1] if reached else 0
+    return reached + (experience - previous) / CATACOMBS_XP_PER_LEVEL[reached]
+
+def get_dungeon_levels(experience: np.ndarray, overflow: bool = False) -> np.ndarray:
+    """
+    Convert many experience amounts into fractional levels at once.
+
+    Args:
+        experience (np.ndarray): The total experience amounts.
+        overflow (bool): Whether to keep counting levels past 50 at 200M XP per level.
+
+    Returns:
+        np.ndarray: The fractional level for each amount, as returned by get_dungeon_level.
+    """
+    experience = np.asarray(experience, dtype=np.float64)
+    reached = np.searchsorted(_CUMULATIVE_XP_ARRAY, experience, side='right')
+    previous = np.where(reached > 0, _CUMULATIVE_XP_ARRAY[np.maximum(reached - 1, 0)], 0.0)
+    step = _XP_PER_LEVEL_ARRAY[np.minimum(reached, CATACOMBS_MAX_LEVEL - 1)]
+    levels = np.where(
+        reached < CATACOMBS_MAX_LEVEL,
+        reached + (experience - previous) / step,
+        float(CATACOMBS_MAX_LEVEL),
+    )
+    if overflow:
+        levels = np.where(
+            reached >= CATACOMBS_MAX_LEVEL,
+            CATACOMBS_MAX_LEVEL + (experience - _MAX_LEVEL_XP) / OVERFLOW_XP_PER_LEVEL,
+            levels,
+        )
+    return levels
@@ -4,6 +4,8 @@ from .DailyRuns import DailyRuns
 from .DungeonHubRaceSettings import DungeonHubRaceSettings
 from .DungeonTypes import DungeonTypes
 from .Treasures import Treasures
+from .DungeonLevels import get_dungeon_level, get_dungeon_levels, DUNGEON_CLASSES
+import numpy as np
 
 class Dungeons:
     """
@@ -35,6 +37,39 @@ class Dungeons:
         self.last_dungeon_run: str | None = dungeons_data.get("last_dungeon_run", None)
         self.secrets: int = dungeons_data.get("secrets", 0)
 
+    def get_catacombs_level(self, overflow: bool = False) -> float:
+        """
+        Get the Catacombs level with fractional progress towards the next level.
+
+        Args:
+            overflow (bool): Whether to keep counting levels past 50.
+
+        Returns:
+            float: The fractional Catacombs level.
+        """
+        return get_dungeon_level(self.dungeon_types.catacombs.experience, overflow)
 
     def __str__(self) -> str:
-        return f"Dungeons Data Class containing: {self.dungeons_data.keys()}"
\ No newline at end of file
+        return f"Dungeons Data Class containing: {self.dungeons_data.keys()}"
+
+def compute_dungeon_levels(dungeons: list[Dungeons], overflow: bool = False) -> dict[str,np.ndarray]:
+    """
+    Compute the Catacombs and class levels of many members at once, for leaderboards.
+
+    Args:
+        dungeons (list of Dungeons): The dungeon data of each member.
+        overflow (bool): Whether to keep counting levels past 50.
+
+    Returns:
+        dict of str to np.ndarray: Fractional levels keyed by 'catacombs', each class name and
+            'class_average', with one entry per member in the order given.
+    """
+    count = len(dungeons)
+    experience = {
+        'catacombs': np.fromiter((d.dungeon_types.catacombs.experience for d in dungeons), dtype=np.float64, count=count)
+    }
+    for name in DUNGEON_CLASSES:
+        experience[name] = np.fromiter((getattr(d.player_classes, name).experience for d in dungeons), dtype=np.float64, count=count)
+    levels = {key: get_dungeon_levels(values, overflow) for key, values in experience.items()}
+    levels['class_average'] = np.mean([levels[name] for name in DUNGEON_CLASSES], axis=0) if count else np.zeros(0)
+    return levels
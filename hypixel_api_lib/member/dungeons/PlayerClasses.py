@@ -1,3 +1,5 @@
+from .DungeonLevels import get_dungeon_level, DUNGEON_CLASSES
+
 class ClassExperience:
     """
     Represents a specific dungeon class experience.
@@ -7,6 +9,18 @@ class ClassExperience:
     """
     def __init__(self, data: dict[str,float]) -> None:
         self.experience: float = data.get("experience", 0.0)
+
+    def get_level(self, overflow: bool = False) -> float:
+        """
+        Get the class level with fractional progress towards the next level.
+
+        Args:
+            overflow (bool): Whether to keep counting levels past 50.
+
+        Returns:
+            float: The fractional class level.
+        """
+        return get_dungeon_level(self.experience, overflow)
     
     def __str__(self) -> str:
         return f"Experience: {self.experience}"
@@ -30,6 +44,31 @@ class PlayerClasses:
         self.archer: ClassExperience = ClassExperience(data.get("archer", {}))
         self.tank: ClassExperience = ClassExperience(data.get("tank", {}))
 
+    def get_class_levels(self, overflow: bool = False) -> dict[str,float]:
+        """
+        Get the fractional level of every class.
+
+        Args:
+            overflow (bool): Whether to keep counting levels past 50.
+
+        Returns:
+            dict of str to float: The fractional levels keyed by class name.
+        """
+        return {name: getattr(self, name).get_level(overflow) for name in DUNGEON_CLASSES}
+
+    def get_class_average(self, overflow: bool = False) -> float:
+        """
+        Get the average fractional level across all classes.
+
+        Args:
+            overflow (bool): Whether to keep counting levels past 50.
+
+        Returns:
+            float: The class average.
+        """
+        levels = self.get_class_levels(overflow)
+        return sum(levels.values()) / len(levels)
+
     def __str__(self) -> str:
         return f"Healer {self.healer}, Mage {self.mage}, Berserk {self.berserk}, Archer {self.archer}, Tank {self.tank}"
         
@@ -1 +1 @@
-from .Dungeons import Dungeons
\ No newline at end of file
+from .Dungeons import Dungeons, compute_dungeon_levels
\ No newline at end of file
@@ -0,0 +1,275 @@
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+import requests
+from requests.structures import CaseInsensitiveDict
+from hypixel_api_lib.circuitbreaker import DEFAULT_CIRCUIT_BREAKERS
+from hypixel_api_lib.transport import RetryPolicy, Transport, DEFAULT_TIMEOUT
+
+CASSETTE_VERSION: int = 1
+
+# Query parameters left out of cassettes, so they can be shared without leaking the API key
+DEFAULT_REDACTED_PARAMS: frozenset[str] = frozenset({'key'})
+
+# Headers describing the transfer rather than the body, which is stored decoded
+_TRANSFER_HEADERS: frozenset[str] = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+
+class ReplayMissError(requests.exceptions.RequestException):
+    """
+    Raised by a ReplayTransport for a request that is not in its cassette.
+
+    It is a requests RequestException, so managers report it like any other request failure,
+    but it is never retried.
+
+    Attributes:
+        url (str): The URL of the request.
+        params (dict): The query parameters of the request, without redacted parameters.
+    """
+
+    def __init__(self, url: str, params: dict[str, str]) -> None:
+        super().__init__(f"No recorded response for {url} with params {params}")
+        self.url: str = url
+        self.params: dict[str, str] = params
+
+def _normalize_params(params: dict | None, redacted: Iterable[str]) -> dict[str, str]:
+    if not params:
+        return {}
+    return {str(name): str(value) for name, value in sorted(params.items()) if name not in redacted and value is not None}
+
+def _interaction_key(url: str, params: dict[str, str]) -> tuple:
+    return (url, tuple(sorted(params.items())))
+
+class Cassette:
+    """
+    The recorded request and response exchanges of a session, stored as gzip compressed JSON lines.
+
+    The first line is a header with the format version and recording time. Every other line holds
+    one exchange: the URL and query parameters, and either the response status, reason, headers
+    and base64 encoded body as received, or the name and message of the error the request raised.
+    The time the response took and its offset from the start of the session are kept for
+    replaying at recorded timing.
+
+    Attributes:
+        interactions (list of dict): The recorded exchanges, in recording order.
+        recorded_at (str or None): When the recording started, in ISO 8601.
+    """
+
+    def __init__(self, interactions: list[dict[str, Any]] | None = None, recorded_at: str | None = None) -> None:
+        self.interactions: list[dict[str, Any]] = list(interactions or [])
+        self.recorded_at: str | None = recorded_at
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        """
+        Load a cassette from a file.
+
+        Args:
+            path (str): The path of the cassette.
+
+        Returns:
+            Cassette: The loaded cassette.
+
+        Raises:
+            ValueError: If the file is not a cassette or has an unsupported version.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline() or '{}')
+            if header.get('version') != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version {header.get('version')} in {path}")
+            interactions = [json.loads(line) for line in f if line.strip()]
+        return cls(interactions, header.get('recorded_at'))
+
+    def save(self, path: str) -> None:
+        """
+        Write the cassette to a file.
+
+        Args:
+            path (str): The path of the cassette.
+        """
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION, 'recorded_at': self.recorded_at}) + '\n')
+            for interaction in self.interactions:
+                f.write(json.dumps(interaction) + '\n')
+
+    def list_urls(self) -> list[str]:
+        """
+        List the URLs recorded in the cassette.
+
+        Returns:
+            list of str: The distinct URLs, sorted.
+        """
+        return sorted({interaction['url'] for interaction in self.interactions})
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __str__(self) -> str:
+        return f"Cassette with {len(self.interactions)} interactions recorded at {self.recorded_at}"
+
+class RecordingTransport(Transport):
+    """
+    A Transport that writes every exchange to a cassette file as it happens.
+
+    Every attempt is recorded, including retried ones, so a replay goes through the same retries.
+    The file is written incrementally and finalized by close, or when leaving a with block.
+
+    Attributes:
+        path (str): The path of the cassette being written.
+        redacted_params (frozenset of str): Query parameters left out of the cassette.
+        recorded (int): The number of exchanges recorded.
+    """
+
+    def __init__(self, path: str, redacted_params: Iterable[str] = DEFAULT_REDACTED_PARAMS, **settings: Any) -> None:
+        """
+        Args:
+            path (str): The path of the cassette to write.
+            redacted_params (iterable of str, optional): Query parameters left out of the cassette.
+            **settings: Keyword arguments for Transport, such as policy or breakers. The timeout
+                and breakers default to those of DEFAULT_TRANSPORT, as a recorded session talks
+                to the live API.
+        """
+        settings.setdefault('timeout', DEFAULT_TIMEOUT)
+        settings.setdefault('breakers', DEFAULT_CIRCUIT_BREAKERS)
+        super().__init__(**settings)
+        self.path: str = path
+        self.redacted_params: frozenset[str] = frozenset(redacted_params)
+        self.recorded: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._started: float = time.perf_counter()
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        recorded_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self._file.write(json.dumps({'version': CASSETTE_VERSION, 'recorded_at': recorded_at}) + '\n')
+
+    def _send(self, url: str, kwargs: dict) -> requests.Response:
+        interaction = {'url': url, 'params': _normalize_params(kwargs.get('params'), self.redacted_params)}
+        started = time.perf_counter()
+        try:
+            response = super()._send(url, kwargs)
+            # Reading the content downloads the whole body, so it is replayed byte for byte
+            interaction.update({
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': {name: value for name, value in response.headers.items() if name.lower() not in _TRANSFER_HEADERS},
+                'body': base64.b64encode(response.content).decode('ascii'),
+            })
+        except requests.exceptions.RequestException as e:
+            interaction.update({'error': type(e).__name__, 'message': str(e)})
+            self._write(interaction, started)
+            raise
+        self._write(interaction, started)
+        return response
+
+    def _write(self, interaction: dict[str, Any], started: float) -> None:
+        interaction['elapsed'] = time.perf_counter() - started
+        interaction['offset'] = started - self._started
+        line = json.dumps(interaction) + '\n'
+        with self._lock:
+            if self._file.closed:
+                raise ValueError(f"Cassette {self.path} is already closed")
+            self._file.write(line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        """Finish writing the cassette."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> 'RecordingTransport':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"RecordingTransport to {self.path} ({self.recorded} recorded)"
+
+class ReplayTransport(Transport):
+    """
+    A Transport that answers requests from a cassette instead of the network.
+
+    Requests are matched by URL and query parameters, ignoring redacted ones. Exchanges recorded
+    for the same request are served in recording order, and the last one keeps being served once
+    they run out, so repeated polls replay the recorded sequence. Recorded errors are raised again.
+
+    By default responses are served immediately. With a speed, each response is delayed by its
+    recorded duration divided by speed, and retry delays are shortened the same way: 1.0 replays
+    at recorded timing, 10.0 ten times faster.
+
+    Attributes:
+        cassette (Cassette): The recorded exchanges.
+        speed (float or None): The replay speed relative to the recording, or None for no delays.
+        redacted_params (frozenset of str): Query parameters ignored when matching requests.
+        replayed (int): The number of responses served.
+    """
+
+    def __init__(self, cassette: Cassette | str, speed: float | None = None, redacted_params: Iterable[str] = DEFAULT_REDACTED_PARAMS, policy: RetryPolicy | None = None, **settings: Any) -> None:
+        """
+        Args:
+            cassette (Cassette or str): The cassette, or the path to load it from.
+            speed (float, optional): The replay speed relative to the recording, None for no delays.
+            redacted_params (iterable of str, optional): Query parameters ignored when matching requests.
+            policy (RetryPolicy, optional): The retry policy, the default one if not given.
+            **settings: Other keyword arguments for Transport. The timeout defaults to
+                DEFAULT_TIMEOUT, as in a live session.
+
+        Raises:
+            ValueError: If speed is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        settings.setdefault('sleep', self._sleep_scaled)
+        settings.setdefault('timeout', DEFAULT_TIMEOUT)
+        super().__init__(policy, **settings)
+        self.cassette: Cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        self.speed: float | None = speed
+        self.redacted_params: frozenset[str] = frozenset(redacted_params)
+        self.replayed: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._queues: dict[tuple, deque[dict[str, Any]]] = {}
+        for interaction in self.cassette.interactions:
+            key = _interaction_key(interaction['url'], {name: value for name, value in interaction['params'].items() if name not in self.redacted_params})
+            self._queues.setdefault(key, deque()).append(interaction)
+
+    def _sleep_scaled(self, delay: float) -> None:
+        if self.speed is not None:
+            time.sleep(delay / self.speed)
+
+    def _next_interaction(self, url: str, params: dict[str, str]) -> dict[str, Any]:
+        with self._lock:
+            queue = self._queues.get(_interaction_key(url, params))
+            if not queue:
+                raise ReplayMissError(url, params)
+            self.replayed += 1
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def _send(self, url: str, kwargs: dict) -> requests.Response:
+        params = _normalize_params(kwargs.get('params'), self.redacted_params)
+        interaction = self._next_interaction(url, params)
+        if self.speed is not None and interaction.get('elapsed'):
+            time.sleep(interaction['elapsed'] / self.speed)
+
+        if 'error' in interaction:
+            error_type = getattr(requests.exceptions, interaction['error'], requests.exceptions.RequestException)
+            if not (isinstance(error_type, type) and issubclass(error_type, requests.exceptions.RequestException)):
+                error_type = requests.exceptions.RequestException
+            raise error_type(interaction.get('message', ''))
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction.get('headers', {}))
+        response._content = base64.b64decode(interaction.get('body', ''))
+        response._content_consumed = True
+        response.url = requests.Request('GET', url, params=params).prepare().url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def __str__(self) -> str:
+        speed = f"{self.speed}x" if self.speed is not None else "no delays"
+        return f"ReplayTransport of {len(self.cassette)} interactions at {speed} ({self.replayed} replayed)"
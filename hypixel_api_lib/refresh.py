@@ -0,0 +1,230 @@
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+class RefreshingManager:
+    """
+    Serves a long-lived manager object, such as Bazaar, Elections, FireSales or Items, and
+    rebuilds it in the background once it gets old (stale-while-revalidate).
+
+    Managers fetch and parse their data in their constructor, so a refresh builds a completely
+    new instance off-thread and swaps it in only once it is ready. Callers of get always receive
+    a fully built snapshot and never wait on a download, unless the snapshot is older than
+    max_staleness. A failed refresh keeps serving the previous snapshot.
+
+    Attributes:
+        factory (callable): Builds a new manager, e.g. the Bazaar class or a functools.partial.
+        max_age (float): Seconds after which get starts a background refresh.
+        max_staleness (float or None): Seconds after which get blocks on a refresh instead of serving
+            the current snapshot, or None to always serve it.
+        on_refresh (callable or None): Called with the new manager and the refresh duration in seconds.
+        on_error (callable or None): Called with the exception and duration of a failed refresh.
+        last_updated (datetime or None): When the current snapshot was swapped in.
+        last_duration (float or None): How long the last successful refresh took, in seconds.
+        last_error (Exception or None): The exception of the last failed refresh.
+        refreshes (int): The number of successful refreshes.
+        failures (int): The number of failed refreshes.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_age: float = 60.0, max_staleness: float | None = None, on_refresh: Callable[[Any, float], None] | None = None, on_error: Callable[[Exception, float], None] | None = None, manager: Any | None = None) -> None:
+        """
+        Args:
+            factory (callable): Builds a new manager.
+            max_age (float): Seconds after which get starts a background refresh.
+            max_staleness (float, optional): Seconds after which get refreshes synchronously.
+            on_refresh (callable, optional): Observes successful refreshes.
+            on_error (callable, optional): Observes failed refreshes.
+            manager (object, optional): An already built manager to serve first; built with
+                the factory when omitted.
+
+        Raises:
+            ValueError: If max_staleness is smaller than max_age.
+        """
+        if max_staleness is not None and max_staleness < max_age:
+            raise ValueError("max_staleness must not be smaller than max_age.")
+        self.factory: Callable[[], Any] = factory
+        self.max_age: float = max_age
+        self.max_staleness: float | None = max_staleness
+        self.on_refresh: Callable[[Any, float], None] | None = on_refresh
+        self.on_error: Callable[[Exception, float], None] | None = on_error
+        self.last_updated: datetime | None = None
+        self.last_duration: float | None = None
+        self.last_error: Exception | None = None
+        self.refreshes: int = 0
+        self.failures: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._refresh_lock: threading.Lock = threading.Lock()
+        self._current: Any | None = None
+        self._loaded_at: float | None = None
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        if manager is not None:
+            self._swap(manager, None)
+        else:
+            self.refresh()
+
+    def _swap(self, manager: Any, duration: float | None) -> None:
+        with self._lock:
+            self._current = manager
+            self._loaded_at = time.monotonic()
+            self.last_updated = datetime.now(timezone.utc)
+            if duration is not None:
+                self.last_duration = duration
+                self.refreshes += 1
+
+    def _rebuild(self) -> Any:
+        """Build a new manager and swap it in. Must hold the refresh lock."""
+        started = time.monotonic()
+        try:
+            manager = self.factory()
+        except Exception as e:
+            self.failures += 1
+            self.last_error = e
+            if self.on_error is not None:
+                self.on_error(e, time.monotonic() - started)
+            raise
+        duration = time.monotonic() - started
+        self._swap(manager, duration)
+        if self.on_refresh is not None:
+            self.on_refresh(manager, duration)
+        return manager
+
+    def _background_refresh(self) -> None:
+        try:
+            self._rebuild()
+        except Exception:
+            # Reported through on_error and last_error, the current snapshot stays in place
+            pass
+        finally:
+            self._refresh_lock.release()
+
+    @property
+    def age(self) -> float | None:
+        """
+        Get the age of the current snapshot.
+
+        Returns:
+            float or None: Seconds since the snapshot was swapped in, or None if there is none.
+        """
+        with self._lock:
+            loaded_at = self._loaded_at
+        return None if loaded_at is None else time.monotonic() - loaded_at
+
+    def is_refreshing(self) -> bool:
+        """
+        Check whether a refresh is currently running.
+
+        Returns:
+            bool: True if a refresh is in progress.
+        """
+        return self._refresh_lock.locked()
+
+    def get(self) -> Any:
+        """
+        Get the current manager, starting a background refresh if it is older than max_age.
+
+        Returns:
+            object: The current manager.
+
+        Raises:
+            ConnectionError: If a required synchronous refresh failed to fetch.
+            ValueError: If a required synchronous refresh received an unsuccessful response.
+        """
+        with self._lock:
+            manager = self._current
+        age = self.age
+        if manager is None or (self.max_staleness is not None and age > self.max_staleness):
+            with self._refresh_lock:
+                # Another caller may have finished a refresh while this one waited
+                age = self.age
+                if self._current is not None and (self.max_staleness is None or age <= self.max_staleness):
+                    return self._current
+                return self._rebuild()
+        if age >= self.max_age:
+            self.refresh_in_background()
+        return manager
+
+    def refresh(self) -> Any:
+        """
+        Rebuild the manager now, waiting for any refresh already in progress first.
+
+        Returns:
+            object: The new manager.
+
+        Raises:
+            ConnectionError: If fetching the data failed.
+            ValueError: If the API response was not successful.
+        """
+        with self._refresh_lock:
+            return self._rebuild()
+
+    def refresh_in_background(self) -> bool:
+        """
+        Start rebuilding the manager in a background thread, unless a refresh is already running.
+
+        Returns:
+            bool: True if a refresh was started.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            threading.Thread(target=self._background_refresh, daemon=True).start()
+        except BaseException:
+            self._refresh_lock.release()
+            raise
+        return True
+
+    def run(self) -> None:
+        """
+        Refresh whenever the snapshot reaches max_age, until stopped.
+
+        A failed refresh is retried after max_age seconds.
+        """
+        failed = False
+        while not self._stop.is_set():
+            age = self.age
+            delay = self.max_age if failed or age is None else max(self.max_age - age, 0.0)
+            if self._stop.wait(delay):
+                break
+            self._refresh_lock.acquire()
+            age = self.age
+            if age is not None and age < self.max_age:
+                # Another caller refreshed while this one waited
+                self._refresh_lock.release()
+                failed = False
+                continue
+            failures = self.failures
+            self._background_refresh()
+            failed = self.failures > failures
+
+    def start(self) -> None:
+        """
+        Start refreshing proactively in a background thread, so get never finds a stale snapshot.
+
+        Raises:
+            ValueError: If the refresher is already running.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise ValueError("Refresher is already running.")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            self._stop.clear()
+
+    def __str__(self) -> str:
+        last_updated_str = self.last_updated.strftime("%Y-%m-%d %H:%M:%S %Z") if self.last_updated else "N/A"
+        return f"RefreshingManager for {type(self._current).__name__} as of {last_updated_str} ({self.refreshes} refreshes, {self.failures} failures)"
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+class _Call:
+    """An in-flight call whose outcome is shared by every caller with the same key."""
+
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.task: asyncio.Task | None = None
+
+def _resolve_future(future: asyncio.Future, call: _Call) -> None:
+    if future.done():
+        return
+    if call.error is not None:
+        future.set_exception(call.error)
+    else:
+        future.set_result(call.result)
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so they share one execution and one result.
+
+    The first caller for a key runs the function; callers arriving while it is still running
+    wait for it and receive the same return value, or the same exception. Nothing is cached:
+    once the call finishes, the next caller runs the function again. Threaded callers and
+    asyncio callers share the same registry.
+
+    Attributes:
+        coalesced (int): The number of calls that were served by another caller's execution.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.coalesced: int = 0
+
+    def _join(self, key: Hashable) -> tuple[_Call, bool]:
+        """Get the in-flight call for a key, creating it if needed. Must hold the lock."""
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            return call, False
+        call = _Call()
+        self._calls[key] = call
+        return call, True
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        with self._lock:
+            del self._calls[key]
+            waiters = list(call.waiters)
+        call.done.set()
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve_future, future, call)
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a function, or wait for the identical call already in flight.
+
+        Args:
+            key (hashable): Identifies identical calls, e.g. from request_key.
+            func (callable): The function to run.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any: The function's return value, shared by every coalesced caller.
+
+        Raises:
+            Exception: Whatever the function raised, re-raised in every coalesced caller.
+        """
+        with self._lock:
+            call, leader = self._join(key)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+    async def _run_async(self, key: Hashable, call: _Call, func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        """Run the leader's function in a worker thread, sharing its outcome. Never raises."""
+        try:
+            call.result = await asyncio.to_thread(func, *args, **kwargs)
+        except BaseException as e:
+            call.error = e
+        finally:
+            self._finish(key, call)
+
+    async def do_async(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking function in a worker thread, or await the identical call already in flight.
+
+        The function runs in a task of its own, so cancelling the caller that started it cancels
+        only that caller's wait; the other callers still receive the result.
+
+        Args:
+            key (hashable): Identifies identical calls, e.g. from request_key.
+            func (callable): The blocking function to run.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any: The function's return value, shared by every coalesced caller.
+
+        Raises:
+            Exception: Whatever the function raised, re-raised in every coalesced caller.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call, leader = self._join(key)
+            if not leader:
+                future = loop.create_future()
+                call.waiters.append((loop, future))
+        if not leader:
+            return await future
+        # The call keeps a reference to the task so it is not garbage collected while running
+        call.task = loop.create_task(self._run_async(key, call, func, args, kwargs))
+        await asyncio.shield(call.task)
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self) -> int:
+        """
+        Get the number of distinct calls currently running.
+
+        Returns:
+            int: The number of in-flight keys.
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def __str__(self) -> str:
+        return f"SingleFlight with {self.in_flight()} calls in flight, {self.coalesced} coalesced"
+
+def request_key(endpoint: str, params: dict | None = None) -> tuple:
+    """
+    Build a single-flight key for an HTTP GET request.
+
+    Args:
+        endpoint (str): The request URL.
+        params (dict, optional): The query parameters.
+
+    Returns:
+        tuple: A hashable key that is equal for identical requests.
+    """
+    return (endpoint, tuple(sorted((params or {}).items())))
+
+# Shared by every manager so identical requests coalesce across instances
+DEFAULT_SINGLE_FLIGHT: SingleFlight = SingleFlight()
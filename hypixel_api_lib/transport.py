@@ -0,0 +1,261 @@
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+import requests
+from hypixel_api_lib.circuitbreaker import CircuitBreakers, CircuitOpenError, DEFAULT_CIRCUIT_BREAKERS, is_upstream_failure
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, get_current_event
+
+# Gateway and server errors that are worth another attempt for an idempotent GET
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({408, 500, 502, 503, 504})
+
+# Rate limit responses, retried only when the server says when to come back
+THROTTLED_STATUS_CODES: frozenset[int] = frozenset({429})
+
+def parse_retry_after(response: Any) -> float | None:
+    """
+    Read how long the server asked to wait before retrying.
+
+    Both the standard Retry-After header, in seconds or as an HTTP date, and the RateLimit-Reset
+    header sent by the Hypixel API are supported.
+
+    Args:
+        response (requests.Response): The response.
+
+    Returns:
+        float or None: The number of seconds to wait, or None if the response gives no hint.
+    """
+    headers = getattr(response, 'headers', None)
+    if headers is None:
+        return None
+    for header in ('Retry-After', 'RateLimit-Reset'):
+        value = headers.get(header)
+        if isinstance(value, (int, float)):
+            return max(float(value), 0.0)
+        if not isinstance(value, str) or not value.strip():
+            continue
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            continue
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    return None
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed GET request is retried.
+
+    Connection errors, timeouts and gateway or server errors are retried with exponential
+    backoff and full jitter. Rate limit responses are retried only when they carry a
+    Retry-After or RateLimit-Reset header, after the requested delay. Client errors such as
+    400, 403 and 404 are never retried.
+
+    Attributes:
+        max_attempts (int): The total number of attempts, including the first one.
+        base_delay (float): The backoff ceiling of the first retry, in seconds.
+        max_delay (float): The largest backoff ceiling, in seconds.
+        max_retry_after (float): The longest server-requested delay that is waited for; longer
+            delays fail immediately.
+        retry_statuses (frozenset of int): The status codes retried with backoff.
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0, max_retry_after: float = 60.0, retry_statuses: frozenset[int] = RETRYABLE_STATUS_CODES) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.max_retry_after: float = max_retry_after
+        self.retry_statuses: frozenset[int] = retry_statuses
+
+    def get_backoff(self, attempt: int, rng: Callable[[], float] = random.random) -> float:
+        """
+        Get the jittered backoff delay after a failed attempt.
+
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+            rng (callable, optional): Returns a random float in [0, 1).
+
+        Returns:
+            float: The number of seconds to wait, between 0 and the exponential ceiling.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return ceiling * rng()
+
+    def get_response_delay(self, response: Any, attempt: int, rng: Callable[[], float] = random.random) -> float | None:
+        """
+        Get the delay before retrying a response, or None if it should not be retried.
+
+        Args:
+            response (requests.Response): The response of the failed attempt.
+            attempt (int): The number of the attempt, starting at 1.
+            rng (callable, optional): Returns a random float in [0, 1).
+
+        Returns:
+            float or None: The number of seconds to wait, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        status_code = getattr(response, 'status_code', None)
+        if status_code in THROTTLED_STATUS_CODES:
+            retry_after = parse_retry_after(response)
+            if retry_after is None or retry_after > self.max_retry_after:
+                return None
+            return retry_after
+        if status_code in self.retry_statuses:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None and retry_after <= self.max_retry_after:
+                return max(retry_after, self.get_backoff(attempt, rng))
+            return self.get_backoff(attempt, rng)
+        return None
+
+    def get_error_delay(self, error: Exception, attempt: int, rng: Callable[[], float] = random.random) -> float | None:
+        """
+        Get the delay before retrying a request that raised, or None if it should not be retried.
+
+        Args:
+            error (Exception): The exception raised by the request.
+            attempt (int): The number of the attempt, starting at 1.
+            rng (callable, optional): Returns a random float in [0, 1).
+
+        Returns:
+            float or None: The number of seconds to wait, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return self.get_backoff(attempt, rng)
+        return None
+
+    def __str__(self) -> str:
+        return f"RetryPolicy with {self.max_attempts} attempts, backoff {self.base_delay}s to {self.max_delay}s"
+
+class Transport:
+    """
+    Performs GET requests against the API, retrying transient failures.
+
+    The final response is returned as-is, so callers keep handling status codes and errors
+    themselves; only the retry decisions are centralized here. With circuit breakers, requests
+    to a degraded host fail fast with a CircuitOpenError instead of waiting for a timeout.
+
+    Attributes:
+        policy (RetryPolicy): The policy of endpoints without their own entry in policies.
+        policies (dict of str to RetryPolicy): Retry policies by endpoint URL.
+        timeout (float, tuple or None): The timeout of every request in seconds, as one value or a
+            (connect, read) pair, or None to wait forever.
+        breakers (CircuitBreakers or None): The per-host circuit breakers, or None to always send.
+        retries (int): The number of retries made.
+    """
+
+    def __init__(self, policy: RetryPolicy | None = None, policies: dict[str, RetryPolicy] | None = None, timeout: float | tuple[float, float] | None = None, breakers: CircuitBreakers | None = None, sleep: Callable[[float], None] = time.sleep, rng: Callable[[], float] = random.random) -> None:
+        self.policy: RetryPolicy = policy if policy is not None else RetryPolicy()
+        self.policies: dict[str, RetryPolicy] = dict(policies or {})
+        self.timeout: float | tuple[float, float] | None = timeout
+        self.breakers: CircuitBreakers | None = breakers
+        self.retries: int = 0
+        self._sleep: Callable[[float], None] = sleep
+        self._rng: Callable[[], float] = rng
+
+    def get_policy(self, url: str) -> RetryPolicy:
+        """
+        Get the retry policy of an endpoint.
+
+        Args:
+            url (str): The endpoint URL.
+
+        Returns:
+            RetryPolicy: The endpoint's policy.
+        """
+        return self.policies.get(url, self.policy)
+
+    def get(self, url: str, params: dict | None = None) -> requests.Response:
+        """
+        Send a GET request, retrying according to the endpoint's policy.
+
+        Args:
+            url (str): The endpoint URL.
+            params (dict, optional): The query parameters.
+
+        Returns:
+            requests.Response: The response of the last attempt.
+
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint's host is open.
+            requests.exceptions.RequestException: The error of the last attempt, if it raised.
+        """
+        if DEFAULT_INSTRUMENTATION.enabled and get_current_event() is None:
+            # Requests made outside a tracked manager call still get their own event
+            with DEFAULT_INSTRUMENTATION.track(url):
+                return self._get(url, params)
+        return self._get(url, params)
+
+    def _get(self, url: str, params: dict | None) -> requests.Response:
+        event = get_current_event()
+        policy = self.get_policy(url)
+        breaker = self.breakers.get(url) if self.breakers is not None else None
+        kwargs = {'params': params}
+        if self.timeout is not None:
+            kwargs['timeout'] = self.timeout
+        attempt = 1
+        while True:
+            if breaker is not None and not breaker.allow_request():
+                raise CircuitOpenError(breaker.host, breaker.get_retry_in())
+            started = time.perf_counter() if event is not None else 0.0
+            try:
+                response = self._send(url, kwargs)
+                if event is not None:
+                    # Reading the body here counts its download as network time
+                    content = response.content
+                    event.bytes = len(content) if isinstance(content, (bytes, bytearray)) else None
+                    event.status = response.status_code
+            except requests.exceptions.RequestException as e:
+                if breaker is not None:
+                    breaker.record(is_upstream_failure(error=e))
+                delay = policy.get_error_delay(e, attempt, self._rng)
+                if delay is None:
+                    raise
+            except BaseException:
+                # An interrupted request says nothing about the host
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record(is_upstream_failure(response))
+                delay = policy.get_response_delay(response, attempt, self._rng)
+                if delay is None:
+                    return response
+                response.close()
+            finally:
+                if event is not None:
+                    event.network_ms += (time.perf_counter() - started) * 1000
+            self.retries += 1
+            if event is not None:
+                event.retries += 1
+            self._sleep(delay)
+            attempt += 1
+
+    def _send(self, url: str, kwargs: dict) -> requests.Response:
+        """Send a single attempt; subclasses override this to record or replay responses."""
+        return requests.get(url, **kwargs)
+
+    def __str__(self) -> str:
+        return f"Transport using {self.policy} ({self.retries} retries)"
+
+# The (connect, read) timeout of the shared transports in seconds, so a stalled connection
+# fails and reaches the retry policy and circuit breakers instead of hanging forever
+DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 30.0)
+
+# Shared by every manager that is not given its own transport
+DEFAULT_TRANSPORT: Transport = Transport(timeout=DEFAULT_TIMEOUT, breakers=DEFAULT_CIRCUIT_BREAKERS)
+
+# For callers that retry on their own schedule
+NO_RETRY_TRANSPORT: Transport = Transport(RetryPolicy(max_attempts=1), timeout=DEFAULT_TIMEOUT, breakers=DEFAULT_CIRCUIT_BREAKERS)
@@ -1,7 +1,23 @@
 from datetime import datetime, timezone
 import requests
+from hypixel_api_lib.singleflight import DEFAULT_SINGLE_FLIGHT, request_key
+from hypixel_api_lib.transport import Transport, DEFAULT_TRANSPORT
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, time_phase
 
 MOJANG_API_URL = r"https://api.mojang.com/users/profiles/minecraft/"
+MOJANG_SESSION_API_URL = r"https://sessionserver.mojang.com/session/minecraft/profile/"
+
+_mojang_transport: Transport = DEFAULT_TRANSPORT
+
+def set_mojang_transport(transport: Transport | None) -> None:
+    """
+    Set the transport used by the Mojang username and UUID lookups, e.g. to record or replay them.
+
+    Args:
+        transport (Transport or None): The transport, or None to restore the default transport.
+    """
+    global _mojang_transport
+    _mojang_transport = transport if transport is not None else DEFAULT_TRANSPORT
 
 def convert_timestamp(timestamp: int | None) -> datetime | None:
     """Convert a timestamp in milliseconds to a timezone-aware datetime object in UTC."""
@@ -9,10 +25,19 @@ def convert_timestamp(timestamp: int | None) -> datetime | None:
         return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
     return None
 
+def convert_to_millis(timestamp: datetime | None) -> int | None:
+    """Convert a datetime object to a timestamp in milliseconds, the inverse of convert_timestamp."""
+    if timestamp is not None:
+        # Rounded, as the float seconds of a converted timestamp may fall just below the millisecond
+        return round(timestamp.timestamp() * 1000)
+    return None
+
 def get_uuid_from_username(username: str) -> str:
         """
         Fetch the UUID of a player from their username using the Mojang API.
 
+        Concurrent lookups of the same username share a single request.
+
         Args:
             username (str): The username of the player.
 
@@ -23,12 +48,18 @@ def get_uuid_from_username(username: str) -> str:
             ValueError: If the username does not exist.
             ConnectionError: If there's an error contacting the Mojang API.
         """
+        url = MOJANG_API_URL + username
+        return DEFAULT_SINGLE_FLIGHT.do(request_key(url), _fetch_uuid_from_username, username, url)
+
+def _fetch_uuid_from_username(username: str, url: str) -> str:
+    with DEFAULT_INSTRUMENTATION.track(MOJANG_API_URL):
         try:
-            response = requests.get("https://api.mojang.com/users/profiles/minecraft/" + username)
+            response = _mojang_transport.get(url)
             if response.status_code == 204:
                 raise ValueError(f"Username '{username}' does not exist.")
             response.raise_for_status()
-            data = response.json()
+            with time_phase('decode'):
+                data = response.json()
             uuid = data.get('id')
             if uuid:
                 return uuid
@@ -43,6 +74,8 @@ def get_username_from_uuid(uuid: str) -> str:
     """
     Fetch the username of a player from their UUID using the Mojang API.
 
+    Concurrent lookups of the same UUID share a single request.
+
     Args:
         uuid (str): The UUID of the player without dashes.
 
@@ -53,18 +86,24 @@ def get_username_from_uuid(uuid: str) -> str:
         ValueError: If the UUID does not exist or has no associated username.
         ConnectionError: If there's an error contacting the Mojang API.
     """
-    try:
-        response = requests.get(f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid}")
-        if response.status_code == 204:
-            raise ValueError(f"UUID '{uuid}' does not exist.")
-        response.raise_for_status()
-        data = response.json()
-        username = data.get('name')
-        if username:
-            return username
-        else:
-            raise ValueError(f"Username not found for UUID '{uuid}'.")
-    except requests.exceptions.HTTPError as e:
-        raise ConnectionError(f"HTTP Error while fetching username for UUID '{uuid}': {e}")
-    except requests.exceptions.RequestException as e:
-        raise ConnectionError(f"An error occurred while fetching username for UUID '{uuid}': {e}")
+    url = MOJANG_SESSION_API_URL + uuid
+    return DEFAULT_SINGLE_FLIGHT.do(request_key(url), _fetch_username_from_uuid, uuid, url)
+
+def _fetch_username_from_uuid(uuid: str, url: str) -> str:
+    with DEFAULT_INSTRUMENTATION.track(MOJANG_SESSION_API_URL):
+        try:
+            response = _mojang_transport.get(url)
+            if response.status_code == 204:
+                raise ValueError(f"UUID '{uuid}' does not exist.")
+            response.raise_for_status()
+            with time_phase('decode'):
+                data = response.json()
+            username = data.get('name')
+            if username:
+                return username
+            else:
+                raise ValueError(f"Username not found for UUID '{uuid}'.")
+        except requests.exceptions.HTTPError as e:
+            raise ConnectionError(f"HTTP Error while fetching username for UUID '{uuid}': {e}")
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError(f"An error occurred while fetching username for UUID '{uuid}': {e}")
@@ -9,8 +9,13 @@ setup(
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
     url='https://github.com/feromond/hypixel-api-lib',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     install_requires=[  
         'requests==2.32.3',
+        'numpy',
     ],
+    extras_require={
+        'arrow': ['pyarrow'],
+        'pandas': ['pyarrow', 'pandas'],
+    },
 )
@@ -0,0 +1,13 @@
+import json
+import requests
+
+def make_response(status_code: int = 200, data: dict | None = None, headers: dict | None = None) -> requests.Response:
+    """Build a requests Response with a JSON body, as returned by requests.get."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK" if status_code < 400 else "Error"
+    response.headers.update(headers or {})
+    response._content = json.dumps(data if data is not None else {}).encode()
+    response._content_consumed = True
+    response.url = "https://api.hypixel.net/"
+    return response
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import requests
+
+from hypixel_api_lib.AuctionHistory import SaleHistory, RecentlyEndedAuctionsPoller
+from hypixel_api_lib.Auctions import RecentlyEndedAuction
+from hypixel_api_lib.ItemBytes import encode_item_bytes
+
+def _sale(auction_id: str, seller: str, buyer: str, timestamp: int, price: int, item_id: str, bin: bool = True) -> dict:
+    return {
+        "auction_id": auction_id,
+        "seller": seller,
+        "seller_profile": f"{seller}_profile",
+        "buyer": buyer,
+        "buyer_profile": f"{buyer}_profile",
+        "timestamp": timestamp,
+        "price": price,
+        "bin": bin,
+        "item_bytes": encode_item_bytes([{"id": 1, "Count": 1, "tag": {"ExtraAttributes": {"id": item_id}}}]),
+    }
+
+class TestAuctionHistory(unittest.TestCase):
+    def setUp(self):
+        self.first_response = {
+            "success": True,
+            "lastUpdated": 1728619119062,
+            "auctions": [
+                _sale("a1", "seller1", "buyer1", 1728619000000, 100, "HYPERION"),
+                _sale("a2", "seller2", "buyer1", 1728619050000, 200, "DIRT", bin=False),
+            ]
+        }
+        self.second_response = {
+            "success": True,
+            "lastUpdated": 1728619179062,
+            "auctions": [
+                _sale("a2", "seller2", "buyer1", 1728619050000, 200, "DIRT", bin=False),
+                _sale("a3", "seller1", "buyer2", 1728619150000, 300, "HYPERION"),
+            ]
+        }
+
+    def test_sale_history_queries(self):
+        """Test storing sales and querying them by seller, buyer, item and time."""
+        history = SaleHistory()
+        sales = [RecentlyEndedAuction(data) for data in self.first_response["auctions"] + self.second_response["auctions"]]
+
+        self.assertEqual(history.add_sales(sales), 3)
+        self.assertEqual(history.add_sales(sales), 0)
+        self.assertEqual(len(history), 3)
+
+        self.assertEqual([sale.auction_id for sale in history.get_sales(seller="seller1")], ["a3", "a1"])
+        self.assertEqual([sale.auction_id for sale in history.get_sales(buyer="buyer1", limit=1)], ["a2"])
+        self.assertEqual([sale.auction_id for sale in history.get_sales(item_id="HYPERION", bin_only=True)], ["a3", "a1"])
+        self.assertEqual([sale.auction_id for sale in history.get_sales(bin_only=False)], ["a2"])
+
+        start = datetime.fromtimestamp(1728619050, tz=timezone.utc)
+        end = datetime.fromtimestamp(1728619150, tz=timezone.utc)
+        sales = history.get_sales(start=start, end=end)
+        self.assertEqual([sale.auction_id for sale in sales], ["a2"])
+        self.assertEqual(sales[0].timestamp, start)
+        self.assertEqual(sales[0].item_id, "DIRT")
+        self.assertFalse(sales[0].bin)
+
+    def test_sale_history_persistence(self):
+        """Test that the history survives reopening the database."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sales.db")
+            history = SaleHistory(path)
+            history.add_sales([RecentlyEndedAuction(data) for data in self.first_response["auctions"]])
+            history.close()
+
+            history = SaleHistory(path)
+            self.assertEqual(len(history), 2)
+            history.close()
+
+    @patch("requests.get")
+    def test_poller_deduplicates(self, mock_get):
+        """Test that overlapping windows only yield each sale once."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.side_effect = [self.first_response, self.second_response]
+        history = SaleHistory()
+        poller = RecentlyEndedAuctionsPoller(history, seen_size=2)
+
+        self.assertEqual([sale.auction_id for sale in poller.poll()], ["a1", "a2"])
+        self.assertEqual([sale.auction_id for sale in poller.poll()], ["a3"])
+        self.assertEqual(len(history), 3)
+        self.assertEqual(len(poller._seen), 2)
+        self.assertEqual(poller.last_updated, datetime.fromtimestamp(1728619179.062, tz=timezone.utc))
+
+    @patch("requests.get")
+    def test_poller_run(self, mock_get):
+        """Test that run keeps polling through failures and reports new sales."""
+        mock_get.side_effect = [requests.exceptions.ConnectionError("Network error"), mock_get.return_value, mock_get.return_value]
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.side_effect = [self.first_response, self.second_response]
+        batches = []
+        poller = RecentlyEndedAuctionsPoller(retry_delay=0, margin=0)
+
+        with patch.object(poller, "get_next_delay", return_value=0):
+            poller.run(batches.append, max_polls=3)
+
+        self.assertEqual([[sale.auction_id for sale in batch] for batch in batches], [["a1", "a2"], ["a3"]])
+
+    def test_get_next_delay(self):
+        """Test scheduling the next poll after the endpoint's next update."""
+        poller = RecentlyEndedAuctionsPoller(margin=2.0)
+        self.assertEqual(poller.get_next_delay(), 0.0)
+
+        poller.last_updated = datetime.now(timezone.utc)
+        self.assertAlmostEqual(poller.get_next_delay(), 60.0, delta=1.0)
+
+        poller.last_updated = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual(poller.get_next_delay(), 2.0)
+
+if __name__ == "__main__":
+    unittest.main()
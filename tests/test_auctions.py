@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
@@ -12,6 +13,7 @@ from hypixel_api_lib.Auctions import (
     RecentlyEndedAuctions,
     RecentlyEndedAuction
 )
+from hypixel_api_lib.ItemBytes import encode_item_bytes
 
 class TestAuctionsComponent(unittest.TestCase):
     def setUp(self):
@@ -297,6 +299,116 @@ class TestAuctionsComponent(unittest.TestCase):
         matching_auctions = auctions.search_auctions(sort_by_price=True, descending=True)
         self.assertEqual(matching_auctions[0].current_price, 500000000)
 
+    def _paged_responses(self, mock_get, total_pages: int = 3) -> list[int]:
+        """Serve pages whose auctions are priced 'page * 10 + index' and record the pages fetched."""
+        fetched = []
+        def get_page(url, *args, **kwargs):
+            page = kwargs['params']['page']
+            fetched.append(page)
+            mock_response = unittest.mock.Mock(status_code=200)
+            mock_response.json.return_value = {
+                "success": True,
+                "page": page,
+                "totalPages": total_pages,
+                "auctions": [
+                    {"uuid": f"p{page}_{index}", "item_name": "Dirt", "starting_bid": page * 10 + index, "highest_bid_amount": 0, "bids": []}
+                    for index in (2, 0, 1)
+                ],
+            }
+            return mock_response
+        mock_get.side_effect = get_page
+        return fetched
+
+    @patch('requests.get')
+    def test_auctions_search_auctions_limit_and_offset(self, mock_get):
+        """
+        Test top-k selection with limit and offset when sorting by price.
+        """
+        self._paged_responses(mock_get)
+        auctions = ActiveAuctions()
+
+        cheapest = auctions.search_auctions(sort_by_price=True, limit=2, offset=1)
+        self.assertEqual([auction.current_price for auction in cheapest], [1, 2])
+
+        priciest = auctions.search_auctions(sort_by_price=True, descending=True, limit=3)
+        self.assertEqual([auction.current_price for auction in priciest], [22, 21, 20])
+        self.assertEqual(len(auctions.search_auctions(offset=7)), 2)
+
+        with self.assertRaises(ValueError):
+            auctions.search_auctions(limit=-1)
+
+    @patch('requests.get')
+    def test_auctions_search_auctions_early_exit(self, mock_get):
+        """
+        Test that unsorted searches with a limit stop fetching pages once enough matches are found.
+        """
+        fetched = self._paged_responses(mock_get, total_pages=5)
+        auctions = ActiveAuctions()
+
+        matching_auctions = auctions.search_auctions(min_price=10, limit=2)
+        self.assertEqual([auction.current_price for auction in matching_auctions], [12, 10])
+        self.assertEqual(fetched, [0, 1])
+
+        stream = auctions.iter_search_auctions(min_price=30)
+        self.assertEqual(next(stream).current_price, 32)
+        self.assertEqual(fetched, [0, 1, 2, 3])
+
+    @patch('requests.get')
+    def test_auctions_iter_pages(self, mock_get):
+        """
+        Test streaming pages sequentially and concurrently, with and without retaining them.
+        """
+        self._paged_responses(mock_get, total_pages=6)
+        auctions = ActiveAuctions()
+
+        pages = [page.page for page in auctions.iter_pages(max_pages=4, retain=False)]
+        self.assertEqual(pages, [0, 1, 2, 3])
+        self.assertEqual(auctions.cache_pages, {})
+
+        pages = [page.page for page in auctions.iter_pages(retain=False, workers=3)]
+        self.assertEqual(pages, [0, 1, 2, 3, 4, 5])
+
+        pages = [page.page for page in auctions.iter_pages(workers=3, ordered=False)]
+        self.assertEqual(sorted(pages), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(sorted(auctions.cache_pages), [0, 1, 2, 3, 4, 5])
+
+        self.assertEqual(len(list(auctions.iter_auctions(workers=2))), 18)
+
+    @patch('requests.get')
+    def test_auctions_aiter_pages(self, mock_get):
+        """
+        Test the asynchronous page and auction iterators.
+        """
+        self._paged_responses(mock_get, total_pages=5)
+        auctions = ActiveAuctions()
+
+        async def collect():
+            pages = [page.page async for page in auctions.aiter_pages(retain=False, workers=2, ordered=True)]
+            prices = [auction.current_price async for auction in auctions.aiter_auctions(max_pages=2, retain=False)]
+            return pages, prices
+
+        pages, prices = asyncio.run(collect())
+        self.assertEqual(pages, [0, 1, 2, 3, 4])
+        self.assertEqual(sorted(prices), [0, 1, 2, 10, 11, 12])
+        self.assertEqual(auctions.cache_pages, {})
+
+    @patch('requests.get')
+    def test_auctions_iter_pages_error(self, mock_get):
+        """
+        Test that errors fetching later pages are raised from the iterator.
+        """
+        self._paged_responses(mock_get, total_pages=3)
+        page_responses = mock_get.side_effect
+        def fail_on_page_two(url, *args, **kwargs):
+            if kwargs['params']['page'] == 2:
+                raise requests.exceptions.RequestException("API error")
+            return page_responses(url, *args, **kwargs)
+        mock_get.side_effect = fail_on_page_two
+
+        with self.assertRaises(ConnectionError) as context:
+            list(ActiveAuctions().iter_pages(workers=2))
+        self.assertEqual(str(context.exception), "An error occurred while fetching page 2: API error")
+
     @patch('requests.get')
     def test_auctions_get_auction_by_id(self, mock_get):
         """
@@ -608,6 +720,30 @@ class TestAuctionsComponent(unittest.TestCase):
         recently_ended_auctions = RecentlyEndedAuctions()
         self.assertEqual(len(recently_ended_auctions.auctions), 0)
 
+    @patch('requests.get')
+    def test_recently_ended_auctions_refresh(self, mock_get):
+        """
+        Test that refresh replaces the auctions and reports whether the snapshot changed.
+        """
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = self.sample_recently_ended_response
+        recently_ended_auctions = RecentlyEndedAuctions()
+
+        self.assertFalse(recently_ended_auctions.refresh())
+
+        mock_get.return_value.json.return_value = {"success": True, "lastUpdated": 1728619179062, "auctions": []}
+        self.assertTrue(recently_ended_auctions.refresh())
+        self.assertEqual(recently_ended_auctions.auctions, [])
+
+    def test_recently_ended_auction_item_id(self):
+        """
+        Test decoding the item ID from the item bytes of an ended auction.
+        """
+        item_bytes = encode_item_bytes([{"id": 1, "Count": 1, "tag": {"ExtraAttributes": {"id": "HYPERION"}}}])
+        auction = RecentlyEndedAuction({"auction_id": "a", "item_bytes": item_bytes})
+        self.assertEqual(auction.item_id, "HYPERION")
+        self.assertIsNone(RecentlyEndedAuction(self.sample_recently_ended_response["auctions"][0]).item_id)
+
     @patch('requests.get')
     def test_player_auctions_get_auction_by_uuid(self, mock_get):
         """
@@ -1,12 +1,15 @@
 import unittest
 from unittest.mock import patch
 import requests
+import numpy as np
 from datetime import datetime
 from hypixel_api_lib.Bazaar import (
     Bazaar,
     BazaarProduct,
     BazaarProductQuickStatus,
-    BazaarOrderSummaryItem
+    BazaarOrderSummaryItem,
+    BazaarOrderBook,
+    BazaarMarketDepth
 )
 
 class TestBazaarComponent(unittest.TestCase):
@@ -464,5 +467,72 @@ class TestBazaarComponent(unittest.TestCase):
 
         self.assertIsNone(top_sell_order)
 
+    def test_order_book_arrays(self):
+        """Test that order summaries are stored as NumPy arrays."""
+        product_data = self.sample_api_response['products']['INK_SACK:3']
+        product = BazaarProduct("INK_SACK:3", product_data)
+
+        self.assertIsInstance(product.buy_book.prices, np.ndarray)
+        self.assertEqual(product.buy_book.prices.tolist(), [5.0])
+        self.assertEqual(product.buy_book.amounts.tolist(), [25957])
+        self.assertEqual(product.sell_book.orders.tolist(), [1])
+        self.assertEqual(len(product.buy_book), 1)
+
+    def test_order_book_fill_cost_and_vwap(self):
+        """Test walking a single order book for fill cost and VWAP."""
+        book = BazaarOrderBook([
+            {"amount": 10, "pricePerUnit": 1.0, "orders": 1},
+            {"amount": 10, "pricePerUnit": 2.0, "orders": 2},
+        ])
+
+        self.assertEqual(book.fill_cost(5), 5.0)
+        self.assertEqual(book.fill_cost(15), 20.0)
+        self.assertIsNone(book.fill_cost(21))
+        self.assertAlmostEqual(book.vwap(15), 20.0 / 15)
+        self.assertEqual(book.vwap(100), 1.5)
+        self.assertIsNone(BazaarOrderBook([]).vwap(10))
+
+    def test_market_depth_batch_metrics(self):
+        """Test vectorized fill cost, VWAP, spread and margin across products."""
+        products = [
+            BazaarProduct("A", {
+                "buy_summary": [{"amount": 10, "pricePerUnit": 10.0, "orders": 1}, {"amount": 10, "pricePerUnit": 12.0, "orders": 1}],
+                "sell_summary": [{"amount": 5, "pricePerUnit": 8.0, "orders": 1}],
+            }),
+            BazaarProduct("B", {
+                "buy_summary": [{"amount": 100, "pricePerUnit": 1.0, "orders": 4}],
+                "sell_summary": [],
+            }),
+        ]
+        depth = BazaarMarketDepth(products)
+
+        self.assertEqual(depth.buy_prices.shape, (2, 2))
+        fill = depth.fill_cost(15)
+        self.assertEqual(fill[0], 160.0)
+        self.assertEqual(fill[1], 15.0)
+        self.assertTrue(np.isnan(depth.fill_cost(50)[0]))
+        self.assertTrue(np.isnan(depth.fill_cost(10, side='sell')[0]))
+        self.assertEqual(depth.vwap(np.array([20, 10]))[0], 11.0)
+        self.assertEqual(depth.spread()[0], 2.0)
+        self.assertTrue(np.isnan(depth.spread()[1]))
+        self.assertAlmostEqual(depth.margin_after_tax(0.0125)[0], 10.0 * 0.9875 - 8.0)
+        self.assertEqual(depth.to_dict(fill)["B"], 15.0)
+        self.assertEqual(depth.get_row("B"), 1)
+        with self.assertRaises(ValueError):
+            depth.fill_cost(1, side='middle')
+
+    @patch("requests.get")
+    def test_bazaar_get_market_depth(self, mock_get):
+        """Test that the Bazaar builds and caches its market depth."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = self.sample_api_response
+
+        bazaar = Bazaar()
+        depth = bazaar.get_market_depth()
+
+        self.assertIs(depth, bazaar.get_market_depth())
+        self.assertEqual(len(depth), 3)
+        self.assertAlmostEqual(depth.spread()[depth.get_row("INK_SACK:3")], 0.8)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks import payloads
+from benchmarks.run import BENCHMARKS, compare, load, measure, run, save
+from hypixel_api_lib.Auctions import AuctionsPage
+from hypixel_api_lib.member.Rift import InventoryData
+
+class TestPayloads(unittest.TestCase):
+    def test_payloads_are_deterministic(self):
+        """Test that the same seed always generates the same payload."""
+        self.assertEqual(payloads.generate_auctions_page(3, auctions=5), payloads.generate_auctions_page(3, auctions=5))
+        self.assertNotEqual(payloads.generate_auctions_page(3, auctions=5), payloads.generate_auctions_page(3, auctions=5, seed=1))
+        self.assertEqual(payloads.generate_bazaar(10), payloads.generate_bazaar(10))
+
+    def test_payload_sizes(self):
+        """Test that generated payloads have the requested sizes and parse."""
+        pages = payloads.generate_auction_pages(2500)
+        self.assertEqual([len(page['auctions']) for page in pages], [1000, 1000, 500])
+        self.assertEqual(pages[2]['totalPages'], 3)
+        self.assertEqual(len({auction.uuid for page in pages for auction in AuctionsPage(page).auctions}), 2500)
+
+        self.assertEqual(len(payloads.generate_bazaar(300)['products']), 300)
+        self.assertEqual(len(payloads.generate_profile(4)['profile']['members']), 4)
+        for compression in ('gzip', 'zlib'):
+            inventory = InventoryData(payloads.generate_inventory(3, compression=compression))
+            self.assertIn("ExtraAttributes", inventory.data)
+        with self.assertRaises(ValueError):
+            payloads.generate_inventory(compression='lzma')
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_smoke_run(self):
+        """Test that every benchmark runs at the smoke scale."""
+        report = run('smoke', min_time=0.001, repeat=1)
+        self.assertEqual(set(report['results']), {bench.name for bench in BENCHMARKS})
+        for result in report['results'].values():
+            self.assertGreater(result['ops_per_sec'], 0)
+            self.assertGreater(result['peak_memory'], 0)
+
+        self.assertEqual(list(run('smoke', names=['inventory'], min_time=0.001, repeat=1)['results']), ['inventory_decode', 'inventory_decode_zlib'])
+        with self.assertRaises(ValueError):
+            run('huge')
+
+    def test_measure(self):
+        """Test that cheap operations are looped to fill a round."""
+        result = measure(lambda: None, min_time=0.01, repeat=2)
+        self.assertGreater(result['loops'], 1)
+        self.assertGreaterEqual(result['ops_per_sec'], result['median_ops_per_sec'])
+        with self.assertRaises(ValueError):
+            measure(lambda: None, repeat=0)
+
+    def test_save_and_compare(self):
+        """Test that stored results load back and compare by benchmark."""
+        baseline = {'commit': 'abc1234', 'scale': 'smoke', 'results': {'a': {'ops_per_sec': 100.0, 'peak_memory': 1000}, 'b': {'ops_per_sec': 10.0, 'peak_memory': 0}}}
+        current = {'commit': 'def5678', 'scale': 'smoke', 'results': {'a': {'ops_per_sec': 80.0, 'peak_memory': 1500}, 'c': {'ops_per_sec': 1.0, 'peak_memory': 1}}}
+        with tempfile.TemporaryDirectory() as directory:
+            path = save(baseline, directory)
+            self.assertEqual(os.path.basename(path), "abc1234-smoke.json")
+            self.assertEqual(load(path), baseline)
+
+        changes = compare(baseline, current)
+        self.assertEqual(list(changes), ['a'])
+        self.assertAlmostEqual(changes['a']['ops_per_sec'], -0.2)
+        self.assertAlmostEqual(changes['a']['peak_memory'], 0.5)
+
+        with self.assertRaises(FileNotFoundError):
+            load("no-such-commit")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from hypixel_api_lib.Auctions import PlayerAuctions, PLAYER_AUCTION_API_URL
+from hypixel_api_lib.Profiles import SkyBlockProfiles, PROFILES_API_URL
+from hypixel_api_lib.cache import ResponseCache, CacheBackend, MemoryBackend, DiskBackend, RedisBackend, LocalRedis
+
+class TestResponseCache(unittest.TestCase):
+    def test_key_ignores_api_key_and_order(self):
+        """Test that the cache key ignores the API key and parameter order."""
+        self.assertEqual(
+            ResponseCache.make_key("url", {"key": "a", "uuid": "u", "page": 1}),
+            ResponseCache.make_key("url", {"page": 1, "uuid": "u", "key": "b"}),
+        )
+
+    def test_ttl_and_expiry(self):
+        """Test per-endpoint TTLs and expiry."""
+        cache = ResponseCache(ttls={"fast": 0.05, "never": 0})
+        cache.set("fast", {}, {"success": True})
+        cache.set("never", {}, {"success": True})
+
+        self.assertEqual(cache.get("fast"), {"success": True})
+        self.assertIsNone(cache.get("never"))
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("fast"))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(cache.get_ttl("other"), 60.0)
+
+    def test_get_or_fetch(self):
+        """Test that only cacheable responses are stored."""
+        cache = ResponseCache()
+        calls = []
+        def fetch():
+            calls.append(1)
+            return {"success": len(calls) > 1}
+
+        cacheable = lambda data: data["success"]
+        self.assertFalse(cache.get_or_fetch("url", {}, fetch, cacheable)["success"])
+        self.assertTrue(cache.get_or_fetch("url", {}, fetch, cacheable)["success"])
+        self.assertTrue(cache.get_or_fetch("url", {}, fetch, cacheable)["success"])
+        self.assertEqual(len(calls), 2)
+
+        cache.invalidate("url", {})
+        cache.get_or_fetch("url", {}, fetch, cacheable)
+        self.assertEqual(len(calls), 3)
+
+    def test_memory_backend_lru(self):
+        """Test that the memory backend evicts the least recently used entry."""
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", 1, time.time() + 60)
+        backend.set("b", 2, time.time() + 60)
+        backend.get("a")
+        backend.set("c", 3, time.time() + 60)
+
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("a")[1], 1)
+        self.assertEqual(len(backend), 2)
+
+    def test_disk_backend(self):
+        """Test that the disk backend persists entries and evicts by recency."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResponseCache(DiskBackend(tmp, max_entries=2))
+            cache.set("url", {"page": 1}, {"value": 1})
+            cache.set("url", {"page": 2}, {"value": 2})
+
+            reopened = ResponseCache(DiskBackend(tmp, max_entries=2))
+            self.assertEqual(reopened.get("url", {"page": 1}), {"value": 1})
+            reopened.set("url", {"page": 3}, {"value": 3})
+            self.assertIsNone(reopened.get("url", {"page": 2}))
+            self.assertEqual(len(reopened.backend), 2)
+
+            reopened.clear()
+            self.assertIsNone(reopened.get("url", {"page": 1}))
+
+    def test_redis_backend(self):
+        """Test the Redis-compatible backend."""
+        client = LocalRedis()
+        cache = ResponseCache(RedisBackend(client), default_ttl=60)
+        cache.set("url", {"uuid": "u"}, {"value": 1})
+
+        self.assertEqual(cache.get("url", {"uuid": "u"}), {"value": 1})
+        self.assertEqual(list(client.data), ["hypixel_api_lib:url?uuid=u"])
+        cache.clear()
+        self.assertEqual(client.data, {})
+
+    def test_local_redis(self):
+        """Test the in-process Redis stand-in."""
+        client = LocalRedis()
+        client.setex("short", 0.01, "value")
+        client.set("kept", "value")
+        self.assertEqual(client.get("short"), "value")
+        time.sleep(0.02)
+        self.assertIsNone(client.get("short"))
+        self.assertEqual(client.delete("kept", "missing"), 1)
+
+    def test_incomplete_backend(self):
+        """Test that a backend missing methods cannot be created."""
+        class GetOnly(CacheBackend):
+            def get(self, key):
+                return None
+        with self.assertRaises(TypeError):
+            GetOnly()
+
+    @patch("requests.get")
+    def test_profiles_use_cache(self, mock_get):
+        """Test that repeated profile lookups are served from the cache, across API keys."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"success": True, "profiles": []}
+        cache = ResponseCache(ttls={PROFILES_API_URL: 60})
+
+        SkyBlockProfiles("key1", cache=cache).get_profiles_by_player_uuid("uuid1")
+        SkyBlockProfiles("key2", cache=cache).get_profiles_by_player_uuid("uuid1")
+        self.assertEqual(mock_get.call_count, 1)
+
+        SkyBlockProfiles("key1", cache=cache).get_profiles_by_player_uuid("uuid2")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_player_auctions_use_cache(self, mock_get):
+        """Test that player auction lookups are cached but unsuccessful responses are not."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"success": True, "auctions": [{"uuid": "auction1"}]}
+        cache = ResponseCache(ttls={PLAYER_AUCTION_API_URL: 60})
+        player_auctions = PlayerAuctions("test_api_key", cache=cache)
+
+        self.assertEqual(player_auctions.get_auction_by_uuid("auction1").uuid, "auction1")
+        self.assertEqual(player_auctions.get_auction_by_uuid("auction1").uuid, "auction1")
+        self.assertEqual(mock_get.call_count, 1)
+
+        mock_get.return_value.json.return_value = {"success": False, "cause": "Invalid"}
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                player_auctions.get_auctions_by_player_uuid("player1")
+        self.assertEqual(mock_get.call_count, 3)
+
+if __name__ == "__main__":
+    unittest.main()
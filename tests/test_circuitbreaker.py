@@ -0,0 +1,161 @@
+import time
+import unittest
+from unittest.mock import patch
+import requests
+
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.Profiles import SkyBlockProfiles
+from hypixel_api_lib.cache import ResponseCache
+from hypixel_api_lib.circuitbreaker import CircuitBreaker, CircuitBreakers, CircuitOpenError, is_upstream_failure, CLOSED, OPEN, HALF_OPEN
+from hypixel_api_lib.transport import RetryPolicy, Transport
+from helpers import make_response
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.breaker = CircuitBreaker("api.hypixel.net", failure_threshold=0.5, min_requests=4, window=10, reset_timeout=5, clock=self.clock)
+
+    def test_trips_on_error_rate(self):
+        """Test that the circuit opens once the error rate reaches the threshold."""
+        for failed in (False, True, False):
+            self.assertTrue(self.breaker.allow_request())
+            self.breaker.record(failed)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertAlmostEqual(self.breaker.get_error_rate(), 1 / 3)
+
+        self.breaker.record(True)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.get_retry_in(), 5)
+        self.assertEqual(self.breaker.trips, 1)
+
+    def test_old_outcomes_leave_the_window(self):
+        """Test that failures older than the window are forgotten."""
+        self.breaker.record(True)
+        self.breaker.record(True)
+        self.clock.now = 11
+        self.breaker.record(False)
+        self.breaker.record(True)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.get_error_rate(), 0.5)
+
+    def test_half_open_probes(self):
+        """Test that an open circuit probes after the reset timeout and closes or reopens."""
+        for _ in range(4):
+            self.breaker.record(True)
+        self.clock.now = 5
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+        self.breaker.record(True)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+        self.clock.now = 10
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record(False)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.get_error_rate(), 0.0)
+
+    def test_is_upstream_failure(self):
+        """Test which outcomes count against the host."""
+        self.assertTrue(is_upstream_failure(error=requests.exceptions.ConnectTimeout()))
+        self.assertTrue(is_upstream_failure(make_response(503)))
+        self.assertFalse(is_upstream_failure(make_response(429)))
+        self.assertFalse(is_upstream_failure(make_response(403)))
+        self.assertFalse(is_upstream_failure(error=requests.exceptions.InvalidURL()))
+
+    def test_registry_is_per_host(self):
+        """Test that URLs of the same host share a breaker."""
+        breakers = CircuitBreakers(min_requests=1)
+        self.assertIs(breakers.get("https://api.hypixel.net/skyblock/auctions"), breakers.get("https://api.hypixel.net/v2/skyblock/bazaar"))
+        self.assertIsNot(breakers.get("https://api.hypixel.net/"), breakers.get("https://api.mojang.com/"))
+        self.assertEqual(breakers.list_hosts(), ["api.hypixel.net", "api.mojang.com"])
+
+        breakers.get("https://api.hypixel.net/").record(True)
+        self.assertEqual(breakers.get("https://api.hypixel.net/").state, OPEN)
+        breakers.reset()
+        self.assertEqual(breakers.get("https://api.hypixel.net/").state, CLOSED)
+
+class TestTransportCircuit(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.breakers = CircuitBreakers(min_requests=2, reset_timeout=30, clock=self.clock)
+        self.transport = Transport(RetryPolicy(max_attempts=1), breakers=self.breakers)
+
+    @patch("requests.get")
+    def test_fails_fast_while_open(self, mock_get):
+        """Test that requests to an open host are not sent and managers report a connection error."""
+        mock_get.return_value = make_response(502)
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                Bazaar(transport=self.transport)
+        self.assertEqual(mock_get.call_count, 2)
+
+        with self.assertRaises(ConnectionError) as context:
+            Bazaar(transport=self.transport)
+        self.assertIn("Circuit open for api.hypixel.net", str(context.exception))
+        self.assertEqual(mock_get.call_count, 2)
+
+        with self.assertRaises(CircuitOpenError):
+            self.transport.get("https://api.hypixel.net/v2/skyblock/bazaar")
+
+        # Once the reset timeout passed, a successful probe closes the circuit
+        self.clock.now = 30
+        mock_get.return_value = make_response(200, {"success": True, "products": {}})
+        Bazaar(transport=self.transport)
+        self.assertEqual(self.breakers.get("https://api.hypixel.net/").state, CLOSED)
+
+    @patch("requests.get")
+    def test_interrupted_probe_keeps_the_circuit_half_open(self, mock_get):
+        """Test that an interrupted probe frees its slot without closing the circuit."""
+        url = "https://api.hypixel.net/v2/skyblock/bazaar"
+        breaker = self.breakers.get(url)
+        for _ in range(2):
+            breaker.record(True)
+        self.clock.now = 30
+        mock_get.side_effect = KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self.transport.get(url)
+        self.assertEqual(breaker.state, HALF_OPEN)
+
+        # The freed slot lets the next probe through, and its failure reopens the circuit
+        mock_get.side_effect = None
+        mock_get.return_value = make_response(503)
+        self.transport.get(url)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_serves_stale_cache_while_open(self, mock_get):
+        """Test that expired cached responses are served while the host's circuit is open."""
+        cache = ResponseCache(default_ttl=0.001, stale_ttl=60)
+        profiles = SkyBlockProfiles("test_api_key", cache=cache, transport=self.transport)
+        mock_get.return_value = make_response(200, {"success": True, "profiles": []})
+        self.assertEqual(profiles.get_profiles_by_player_uuid("uuid1"), [])
+        time.sleep(0.01)
+
+        # One success and one failure reach the 50% threshold
+        mock_get.return_value = make_response(503)
+        with self.assertRaises(ConnectionError):
+            profiles.get_profiles_by_player_uuid("uuid1")
+
+        self.assertEqual(profiles.get_profiles_by_player_uuid("uuid1"), [])
+        self.assertEqual(cache.stale_hits, 1)
+        self.assertEqual(mock_get.call_count, 2)
+
+        with self.assertRaises(ConnectionError) as context:
+            profiles.get_profiles_by_player_uuid("uuid2")
+        self.assertIn("Circuit open", str(context.exception))
+
+if __name__ == "__main__":
+    unittest.main()
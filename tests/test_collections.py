@@ -6,8 +6,10 @@ from hypixel_api_lib.Collections import (
     Collections,
     CollectionCategory,
     CollectionItem,
-    CollectionTier
+    CollectionTier,
+    CollectionTierProgress
 )
+from hypixel_api_lib.member.CollectionsStats import CollectionsStats
 
 class TestCollectionsComponent(unittest.TestCase):
     def setUp(self):
@@ -190,5 +192,45 @@ class TestCollectionsComponent(unittest.TestCase):
         self.assertEqual(str(tier), expected_str)
 
 
+    def test_collection_item_tier_for_amount(self):
+        """Test resolving tiers from collected amounts with bisection."""
+        item = CollectionItem("WHEAT", self.sample_api_response["collections"]["FARMING"]["items"]["WHEAT"])
+
+        none_unlocked = item.tier_for_amount(25)
+        self.assertEqual(none_unlocked.tier, 0)
+        self.assertEqual(none_unlocked.next_tier.tier, 1)
+        self.assertEqual(none_unlocked.progress, 0.5)
+
+        exact = item.tier_for_amount(100)
+        self.assertEqual(exact.tier, 2)
+        self.assertEqual(exact.next_tier.amount_required, 250)
+        self.assertEqual(exact.progress, 0.0)
+
+        maxed = item.tier_for_amount(10000)
+        self.assertEqual(maxed.tier, 3)
+        self.assertTrue(maxed.is_maxed)
+        self.assertEqual(maxed.progress, 1.0)
+        self.assertIsInstance(maxed, CollectionTierProgress)
+
+    @patch("requests.get")
+    def test_resolve_tiers(self, mock_get):
+        """Test resolving a member's collection stats into tier progress."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = self.sample_api_response
+
+        collections = Collections()
+        stats = CollectionsStats({"WHEAT": 175, "COAL": 60, "UNKNOWN_ITEM": 5})
+
+        resolved = collections.resolve_tiers(stats)
+        self.assertEqual(set(resolved), {"WHEAT", "COAL"})
+        self.assertEqual(resolved["WHEAT"].tier, 2)
+        self.assertEqual(resolved["WHEAT"].progress, 0.5)
+        self.assertTrue(resolved["COAL"].is_maxed)
+        self.assertEqual(str(resolved["COAL"]), "COAL: Tier 2 (Maxed), Collected: 60")
+
+        batch = collections.resolve_tiers_batch([stats, CollectionsStats({"COAL": 0})])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch[1]["COAL"].tier, 0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import requests
+
+from hypixel_api_lib.Auctions import ActiveAuctions
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.columnar import Column, ColumnarTable, LazyRows, encode_table, merge_tables, write_table, STR, INT, FLOAT, BOOL, STR_LIST, RECORDS
+from helpers import make_response
+
+AUCTIONS = [
+    {"uuid": "auction1", "auctioneer": "seller1", "item_name": "Hyperion", "starting_bid": 100, "start": 1700000000123, "coop": ["seller1", "seller2"], "claimed": False, "bids": []},
+    {"uuid": "auction2", "auctioneer": "seller2", "item_name": "Aspect of the End", "starting_bid": 50, "highest_bid_amount": 400, "claimed": False,
+     "bids": [{"auction_id": "auction2", "bidder": "bidder1", "amount": 400, "timestamp": 1700000000999}]},
+    {"uuid": "auction3", "auctioneer": "seller1", "item_name": "Hyperion", "starting_bid": 900, "claimed": True, "bids": []},
+]
+
+def read_in_child(path: str, queue) -> None:
+    auctions = ActiveAuctions(snapshot=path)
+    queue.put([auction.uuid for auction in auctions.search_auctions(item_name="hyperion")])
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_round_trip(self):
+        """Test that rows are rebuilt as written, omitting missing values."""
+        columns = [Column('name', STR), Column('count', INT), Column('price', FLOAT), Column('active', BOOL),
+                   Column('tags', STR_LIST), Column('status.level', INT), Column('items', RECORDS, [Column('id', STR), Column('amount', INT)])]
+        rows = [
+            {"name": "first", "count": 3, "price": 1.5, "active": True, "tags": ["a", "b"], "status": {"level": 2}, "items": [{"id": "x", "amount": 1}, {"id": "y"}]},
+            {"name": "second", "active": False, "tags": [], "items": []},
+            {"name": "first", "count": -1, "price": 0.0, "ignored": "value"},
+        ]
+        path = os.path.join(self.directory, "table.col")
+        self.assertEqual(write_table(path, rows, columns, {"source": "test"}), 3)
+
+        with ColumnarTable(path) as table:
+            self.assertEqual(len(table), 3)
+            self.assertEqual(table.metadata, {"source": "test"})
+            self.assertEqual(table.get_row(0), rows[0])
+            self.assertEqual(table.get_row(1), {"name": "second", "active": False, "tags": [], "items": []})
+            self.assertEqual(table.get_row(-1), {"name": "first", "count": -1, "price": 0.0, "tags": [], "items": []})
+            with self.assertRaises(IndexError):
+                table.get_row(3)
+
+            # Repeated strings share one entry of the string table
+            names = table.get_column('name')
+            self.assertEqual(names[0], names[2])
+            self.assertFalse(names.flags.writeable)
+            self.assertEqual(table.get_counts('items').tolist(), [2, 0, 0])
+            self.assertEqual(table.match_strings('name', lambda name: name.startswith("f")).tolist(), [True, False, True])
+            del names
+
+    def test_merge_tables(self):
+        """Test that merged tables keep their rows in order with a combined string table."""
+        columns = [Column('name', STR), Column('tags', STR_LIST), Column('items', RECORDS, [Column('id', STR), Column('amount', INT)])]
+        first = [{"name": "a", "tags": ["x"], "items": [{"id": "one", "amount": 1}]}, {"tags": [], "items": []}]
+        second = [{"name": "b", "tags": ["y", "x"], "items": [{"id": "two"}, {"id": "one", "amount": 3}]}]
+        empty = ColumnarTable(encode_table([], columns))
+        merged = ColumnarTable(merge_tables([ColumnarTable(encode_table(first, columns)), empty, ColumnarTable(encode_table(second, columns))], {"parts": 3}))
+        self.assertIsNone(merged.path)
+        self.assertEqual(merged.metadata, {"parts": 3})
+        self.assertEqual([merged.get_row(index) for index in range(len(merged))], first + second)
+        self.assertEqual(merged.get_counts('items').tolist(), [1, 0, 2])
+
+        with self.assertRaises(ValueError):
+            merge_tables([merged, ColumnarTable(encode_table([], [Column('name', STR)]))])
+        with self.assertRaises(ValueError):
+            merge_tables([])
+
+    def test_invalid_files(self):
+        """Test that other files and unknown column kinds are rejected."""
+        path = os.path.join(self.directory, "other.bin")
+        with open(path, 'wb') as f:
+            f.write(b"not a snapshot")
+        with self.assertRaises(ValueError):
+            ColumnarTable(path)
+        with self.assertRaises(ValueError):
+            Column('name', 'complex')
+        with self.assertRaises(ValueError):
+            Column('items', RECORDS)
+
+    @patch("requests.get")
+    def test_auction_snapshot(self, mock_get):
+        """Test that auctions are served lazily from a snapshot and searched on its columns."""
+        mock_get.return_value = make_response(200, {"success": True, "page": 0, "totalPages": 1, "totalAuctions": 3, "auctions": AUCTIONS})
+        path = os.path.join(self.directory, "auctions.col")
+        self.assertEqual(ActiveAuctions().save_snapshot(path), 3)
+        mock_get.reset_mock()
+
+        auctions = ActiveAuctions(snapshot=path)
+        self.assertIsInstance(auctions.all_auctions, LazyRows)
+        self.assertEqual(len(auctions.get_all_auctions()), 3)
+        first, second = auctions.all_auctions[0], auctions.all_auctions[1]
+        self.assertEqual(first.to_dict()["start"], 1700000000123)
+        self.assertEqual(first.coop, ["seller1", "seller2"])
+        self.assertEqual(second.bids[0].amount, 400)
+        self.assertEqual(second.current_price, 400)
+        self.assertTrue(auctions.all_auctions[2].claimed)
+
+        self.assertEqual([auction.uuid for auction in auctions.search_auctions(item_name="hyper")], ["auction1", "auction3"])
+        self.assertEqual([auction.uuid for auction in auctions.search_auctions(min_price=300, sort_by_price=True)], ["auction2", "auction3"])
+        self.assertEqual([auction.uuid for auction in auctions.search_auctions(max_price=100)], ["auction1"])
+        mock_get.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            Bazaar(snapshot=path)
+
+    @patch("requests.get")
+    def test_bazaar_snapshot(self, mock_get):
+        """Test that bazaar products are loaded from a snapshot and searchable."""
+        summary = [{"amount": 10, "pricePerUnit": 5.5, "orders": 2}]
+        products = {
+            "ENCHANTMENT_SHARPNESS_5": {"product_id": "ENCHANTMENT_SHARPNESS_5", "sell_summary": summary, "buy_summary": [], "quick_status": {"productId": "ENCHANTMENT_SHARPNESS_5", "sellPrice": 5.5, "sellVolume": 10}},
+            "DIAMOND": {"product_id": "DIAMOND", "sell_summary": [], "buy_summary": summary, "quick_status": {"productId": "DIAMOND", "buyPrice": 7.0}},
+        }
+        mock_get.return_value = make_response(200, {"success": True, "lastUpdated": 1700000000000, "products": products})
+        bazaar = Bazaar()
+        path = os.path.join(self.directory, "bazaar.col")
+        self.assertEqual(bazaar.save_snapshot(path), 2)
+
+        loaded = Bazaar(snapshot=path)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(loaded.last_updated, bazaar.last_updated)
+        self.assertEqual(set(loaded.products), set(products))
+        self.assertEqual(loaded.search_product("sharpness").product_id, "ENCHANTMENT_SHARPNESS_5")
+        diamond = loaded.get_product_by_id("DIAMOND")
+        self.assertEqual(diamond.to_dict(), bazaar.products["DIAMOND"].to_dict())
+        self.assertEqual(diamond.get_top_buy_order().price_per_unit, 5.5)
+        self.assertEqual(loaded.get_market_depth().top_prices('sell').tolist()[0], 5.5)
+        self.assertIsNone(loaded.get_product_by_id("MISSING"))
+
+    @patch("requests.get")
+    def test_parse_in_processes(self, mock_get):
+        """Test that pages parsed in worker processes are merged in page order."""
+        pages = [AUCTIONS[:2], AUCTIONS[2:]]
+        mock_get.side_effect = lambda url, params=None, **kwargs: make_response(200, {"success": True, "page": params['page'], "totalPages": 2, "totalAuctions": 3, "lastUpdated": 1700000000000, "auctions": pages[params['page']]})
+        auctions = ActiveAuctions()
+        all_auctions = auctions.get_all_auctions(processes=2, workers=2)
+        self.assertIsInstance(all_auctions, LazyRows)
+        self.assertEqual([auction.uuid for auction in all_auctions], ["auction1", "auction2", "auction3"])
+        self.assertEqual(all_auctions[1].bids[0].bidder, "bidder1")
+        self.assertEqual([auction.uuid for auction in auctions.search_auctions(item_name="hyperion", max_price=500)], ["auction1"])
+        self.assertIs(auctions.get_all_auctions(processes=2), all_auctions)
+        self.assertEqual(mock_get.call_count, 2)
+
+        path = os.path.join(self.directory, "auctions.col")
+        self.assertEqual(auctions.save_snapshot(path), 3)
+        saved = ActiveAuctions(snapshot=path).all_auctions
+        self.assertEqual(saved[2].uuid, "auction3")
+        self.assertEqual(saved.table.metadata, {"kind": "auctions", "totalPages": 2, "lastUpdated": 1700000000000})
+
+        mock_get.side_effect = lambda url, params=None, **kwargs: make_response(200, {"success": False})
+        with self.assertRaises(ValueError):
+            ActiveAuctions().get_all_auctions(processes=1)
+
+    @patch("requests.get")
+    def test_shared_across_processes(self, mock_get):
+        """Test that another process can map and search the same snapshot."""
+        mock_get.return_value = make_response(200, {"success": True, "page": 0, "totalPages": 1, "totalAuctions": 3, "auctions": AUCTIONS})
+        path = os.path.join(self.directory, "auctions.col")
+        ActiveAuctions().save_snapshot(path)
+
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=read_in_child, args=(path, queue))
+        process.start()
+        self.assertEqual(queue.get(timeout=30), ["auction1", "auction3"])
+        process.join(30)
+        self.assertEqual(process.exitcode, 0)
+
+if __name__ == "__main__":
+    unittest.main()
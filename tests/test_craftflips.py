@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.Items import Items
+from hypixel_api_lib.CraftFlips import Recipe, CraftFlipEngine, CraftFlipResult, load_recipes
+
+def _book(price: float, amount: int = 1000) -> list[dict]:
+    return [{"amount": amount, "pricePerUnit": price, "orders": 1}]
+
+class TestCraftFlips(unittest.TestCase):
+    def setUp(self):
+        # Sample data to mimic the bazaar API response
+        self.sample_bazaar_response = {
+            "success": True,
+            "lastUpdated": 1731945336382,
+            "products": {
+                "DIAMOND": {"buy_summary": _book(10.0), "sell_summary": _book(9.0), "quick_status": {}},
+                "ENCHANTED_DIAMOND": {"buy_summary": _book(1700.0), "sell_summary": _book(1650.0), "quick_status": {}},
+                "GOLD_INGOT": {"buy_summary": _book(5.0), "sell_summary": _book(4.0), "quick_status": {}},
+                "ENCHANTED_GOLD": {"buy_summary": _book(900.0), "sell_summary": _book(700.0), "quick_status": {}},
+            }
+        }
+        self.sample_items_response = {
+            "success": True,
+            "items": [
+                {"id": "ENCHANTED_GOLD", "material": "GOLD_INGOT", "name": "Enchanted Gold", "npc_sell_price": 800},
+                {"id": "GOLDEN_SWORD", "material": "GOLD_SWORD", "name": "Golden Sword", "npc_sell_price": 50},
+            ]
+        }
+        self.recipes = [
+            Recipe("ENCHANTED_DIAMOND", {"ingredients": {"DIAMOND": 160}}),
+            Recipe("ENCHANTED_GOLD", {"ingredients": {"GOLD_INGOT": 160}}),
+            Recipe("GOLDEN_SWORD", {"ingredients": {"GOLD_INGOT": 2, "STICK": 1}}),
+        ]
+
+    def _bazaar(self, response: dict) -> Bazaar:
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = response
+            return Bazaar()
+
+    def _items(self) -> Items:
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = self.sample_items_response
+            return Items()
+
+    def test_recipe_initialization(self):
+        """Test recipe defaults and validation."""
+        recipe = Recipe("ENCHANTED_DIAMOND", {"ingredients": {"DIAMOND": 160}})
+
+        self.assertEqual(recipe.output, "ENCHANTED_DIAMOND")
+        self.assertEqual(recipe.output_amount, 1)
+        self.assertEqual(str(recipe), "Recipe ENCHANTED_DIAMOND: 160x DIAMOND -> 1x ENCHANTED_DIAMOND")
+        with self.assertRaises(ValueError):
+            Recipe("EMPTY", {})
+        with self.assertRaises(ValueError):
+            Recipe("BAD", {"ingredients": {"DIAMOND": 1}, "amount": 0})
+
+    def test_load_recipes(self):
+        """Test loading recipes from a local JSON file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "recipes.json")
+            with open(path, "w") as f:
+                json.dump({"DIAMOND_BLOCK": {"output": "DIAMOND_BLOCK", "amount": 1, "ingredients": {"DIAMOND": 9}}}, f)
+            recipes = load_recipes(path)
+
+            self.assertEqual(len(recipes), 1)
+            self.assertEqual(recipes[0].ingredients, {"DIAMOND": 9})
+
+            with open(path, "w") as f:
+                f.write("not json")
+            with self.assertRaises(ValueError):
+                load_recipes(path)
+
+    def test_evaluate_profit_and_margin(self):
+        """Test pricing recipes against bazaar and NPC prices."""
+        engine = CraftFlipEngine(self.recipes, items=self._items(), tax_rate=0.0)
+        results = engine.evaluate(self._bazaar(self.sample_bazaar_response))
+
+        diamond = results["ENCHANTED_DIAMOND"]
+        self.assertEqual(diamond.craft_cost, 1600.0)
+        self.assertEqual(diamond.sell_value, 1650.0)
+        self.assertEqual(diamond.profit, 50.0)
+        self.assertAlmostEqual(diamond.margin, 50.0 / 1600.0)
+
+        # NPC price beats the bazaar sell summary
+        self.assertEqual(results["ENCHANTED_GOLD"].sell_value, 800.0)
+
+        # Ingredients missing from the bazaar leave the recipe unpriced
+        sword = results["GOLDEN_SWORD"]
+        self.assertIsNone(sword.profit)
+        self.assertEqual(sword.missing, ["STICK"])
+        self.assertIsInstance(sword, CraftFlipResult)
+
+    def test_evaluate_caches_per_snapshot(self):
+        """Test that the same snapshot is only priced once."""
+        engine = CraftFlipEngine(self.recipes)
+        bazaar = self._bazaar(self.sample_bazaar_response)
+
+        with patch.object(engine, "_price_recipe", wraps=engine._price_recipe) as price_recipe:
+            engine.evaluate(bazaar)
+            engine.evaluate(bazaar)
+
+        self.assertEqual(price_recipe.call_count, 3)
+
+    def test_evaluate_recomputes_only_changed_recipes(self):
+        """Test that a new snapshot only reprices recipes whose inputs changed."""
+        engine = CraftFlipEngine(self.recipes)
+        engine.evaluate(self._bazaar(self.sample_bazaar_response))
+
+        self.sample_bazaar_response["lastUpdated"] += 60000
+        self.sample_bazaar_response["products"]["DIAMOND"]["buy_summary"] = _book(11.0)
+        bazaar = self._bazaar(self.sample_bazaar_response)
+
+        with patch.object(engine, "_price_recipe", wraps=engine._price_recipe) as price_recipe:
+            results = engine.evaluate(bazaar)
+
+        self.assertEqual(price_recipe.call_count, 1)
+        self.assertEqual(results["ENCHANTED_DIAMOND"].craft_cost, 1760.0)
+
+    def test_get_top_flips(self):
+        """Test ranking recipes by profit."""
+        engine = CraftFlipEngine(self.recipes, tax_rate=0.0)
+        top = engine.get_top_flips(self._bazaar(self.sample_bazaar_response), n=1)
+
+        self.assertEqual(len(top), 1)
+        self.assertEqual(top[0].recipe.recipe_id, "ENCHANTED_DIAMOND")
+        with self.assertRaises(ValueError):
+            engine.get_top_flips(self._bazaar(self.sample_bazaar_response), by="volume")
+
+if __name__ == "__main__":
+    unittest.main()
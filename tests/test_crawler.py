@@ -0,0 +1,287 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import requests
+
+from hypixel_api_lib.Profiles import SkyBlockProfiles
+from hypixel_api_lib.crawler import SQLiteQueue, FileQueue, FileLock, ProfileCrawler, key_id, PENDING, LEASED, DONE, FAILED
+from helpers import make_response
+
+def profiles_response(url, params=None, **kwargs) -> requests.Response:
+    player_uuid = params['uuid']
+    if player_uuid == "broken":
+        return make_response(200, {"success": False})
+    return make_response(200, {"success": True, "profiles": [
+        {"profile_id": f"profile-{player_uuid}", "members": {player_uuid: {}, "coop": {}}},
+    ]})
+
+def drain_queue(path: str, factory: str, worker: str, claimed_path: str) -> None:
+    # Runs in a separate process: claim until no work is left, logging every claim
+    queue = SQLiteQueue(path) if factory == "sqlite" else FileQueue(path)
+    with open(claimed_path, 'a', encoding='utf-8') as f:
+        while True:
+            claimed = queue.claim(worker, count=3)
+            if not claimed:
+                break
+            for player_uuid in claimed:
+                f.write(player_uuid + "\n")
+                queue.complete(player_uuid, worker)
+
+class QueueTests:
+    """Tests shared by every queue backend, mixed into a TestCase defining make_queue and factory."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "queue")
+        self.queue = self.make_queue(self.path)
+
+    def tearDown(self):
+        if hasattr(self.queue, 'close'):
+            self.queue.close()
+        self.directory.cleanup()
+
+    def test_add_ignores_duplicates(self):
+        """Test that players already in the queue are not added again."""
+        self.assertEqual(self.queue.add(["a", "b"]), 2)
+        self.assertEqual(self.queue.add(["b", "c"]), 1)
+        self.assertEqual(self.queue.counts(), {PENDING: 3, LEASED: 0, DONE: 0, FAILED: 0})
+
+    def test_claim_and_complete(self):
+        """Test that claimed players are not claimed again until the queue is finished."""
+        self.queue.add(["a", "b", "c"])
+        self.assertEqual(self.queue.claim("worker1", count=2, now=100.0), ["a", "b"])
+        self.assertEqual(self.queue.claim("worker2", count=2, now=100.0), ["c"])
+        self.assertEqual(self.queue.claim("worker2", now=100.0), [])
+        for player_uuid in ["a", "b", "c"]:
+            self.assertTrue(self.queue.complete(player_uuid, "worker1" if player_uuid != "c" else "worker2", now=101.0))
+        self.assertTrue(self.queue.is_finished())
+        self.assertEqual(self.queue.counts()[DONE], 3)
+
+    def test_expired_lease_is_reclaimed(self):
+        """Test that the players of a dead worker are taken over once their lease expires."""
+        self.queue.add(["a"])
+        self.assertEqual(self.queue.claim("worker1", lease=10.0, now=100.0), ["a"])
+        self.assertEqual(self.queue.claim("worker2", lease=10.0, now=105.0), [])
+        self.assertEqual(self.queue.claim("worker2", lease=10.0, now=110.0), ["a"])
+
+    def test_only_lease_holder_records(self):
+        """Test that a worker whose lease was taken over cannot record the player's outcome."""
+        self.queue.add(["a"])
+        self.queue.claim("worker1", lease=10.0, now=100.0)
+        self.queue.claim("worker2", lease=10.0, now=110.0)
+        self.assertFalse(self.queue.fail("a", "worker1", "timeout", max_attempts=1))
+        self.assertFalse(self.queue.complete("a", "worker1"))
+        self.assertEqual(self.queue.counts()[LEASED], 1)
+        self.assertTrue(self.queue.complete("a", "worker2"))
+        self.assertFalse(self.queue.complete("a", "worker2"))
+        self.assertEqual(self.queue.counts()[DONE], 1)
+
+    def test_fail_retries_then_gives_up(self):
+        """Test that failed players are retried until max_attempts."""
+        self.queue.add(["a"])
+        self.queue.claim("worker1")
+        self.assertTrue(self.queue.fail("a", "worker1", "boom", max_attempts=2))
+        self.assertEqual(self.queue.counts()[PENDING], 1)
+        self.assertEqual(self.queue.claim("worker1"), ["a"])
+        self.assertTrue(self.queue.fail("a", "worker1", "boom", max_attempts=2))
+        self.assertEqual(self.queue.counts()[FAILED], 1)
+        self.assertTrue(self.queue.is_finished())
+
+    def test_release(self):
+        """Test that releasing a worker returns only its players to the queue."""
+        self.queue.add(["a", "b"])
+        self.queue.claim("worker1")
+        self.queue.claim("worker2")
+        self.assertEqual(self.queue.release("worker1"), 1)
+        self.assertEqual(self.queue.claim("worker3"), ["a"])
+
+    def test_reserve(self):
+        """Test that the key budget allows limit requests per window."""
+        self.assertEqual(self.queue.reserve("key", 2, 10.0, now=100.0), 0.0)
+        self.assertEqual(self.queue.reserve("key", 2, 10.0, now=101.0), 0.0)
+        self.assertAlmostEqual(self.queue.reserve("key", 2, 10.0, now=102.0), 8.0)
+        self.assertEqual(self.queue.reserve("other", 2, 10.0, now=102.0), 0.0)
+        self.assertEqual(self.queue.reserve("key", 2, 10.0, now=110.0), 0.0)
+
+    def test_processes_claim_without_duplicates(self):
+        """Test that processes sharing the queue each crawl a distinct share of the players."""
+        players = [f"player{i}" for i in range(40)]
+        self.queue.add(players)
+        claimed_paths = [os.path.join(self.directory.name, f"claimed{i}") for i in range(3)]
+        processes = [multiprocessing.Process(target=drain_queue, args=(self.path, self.factory, f"worker{i}", claimed_paths[i])) for i in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+            self.assertEqual(process.exitcode, 0)
+        claimed = []
+        for claimed_path in claimed_paths:
+            if os.path.exists(claimed_path):
+                with open(claimed_path, encoding='utf-8') as f:
+                    claimed.extend(f.read().split())
+        self.assertEqual(sorted(claimed), sorted(players))
+        self.assertEqual(self.queue.counts()[DONE], 40)
+
+class TestSQLiteQueue(QueueTests, unittest.TestCase):
+    factory = "sqlite"
+
+    def make_queue(self, path: str):
+        return SQLiteQueue(path)
+
+    def test_resume_after_restart(self):
+        """Test that progress survives reopening the database."""
+        self.queue.add(["a", "b"])
+        self.queue.claim("worker1", now=100.0)
+        self.queue.complete("a", "worker1")
+        self.queue.close()
+        self.queue = SQLiteQueue(self.path)
+        self.assertEqual(self.queue.counts(), {PENDING: 1, LEASED: 0, DONE: 1, FAILED: 0})
+        self.assertEqual(self.queue.claim("worker2"), ["b"])
+
+class TestFileQueue(QueueTests, unittest.TestCase):
+    factory = "file"
+
+    def make_queue(self, path: str):
+        return FileQueue(path)
+
+class TestFileLock(unittest.TestCase):
+    def test_lock_is_exclusive(self):
+        """Test that a held lock blocks other holders until released."""
+        import threading
+        with tempfile.TemporaryDirectory() as directory:
+            lock = FileLock(os.path.join(directory, "lock"))
+            events = []
+            def hold():
+                with lock:
+                    events.append("second")
+            with lock:
+                thread = threading.Thread(target=hold)
+                thread.start()
+                thread.join(0.2)
+                events.append("first")
+            thread.join(5)
+            self.assertEqual(events, ["first", "second"])
+
+@patch("hypixel_api_lib.member.ProfileMember.get_username_from_uuid", return_value="Player")
+class TestProfileCrawler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = SQLiteQueue(os.path.join(self.directory.name, "crawl.db"))
+        self.now = 1000.0
+        self.slept = []
+
+    def tearDown(self):
+        self.queue.close()
+        self.directory.cleanup()
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def make_crawler(self, api_key: str = "key1", **kwargs) -> ProfileCrawler:
+        return ProfileCrawler(self.queue, api_key, sleep=self.sleep, clock=lambda: self.now, **kwargs)
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_crawl(self, mock_get, mock_username):
+        """Test that every player is fetched once and handed to the handler."""
+        self.queue.add(["p1", "p2", "p3"])
+        handled = {}
+        crawler = self.make_crawler(handler=lambda player_uuid, profiles: handled.update({player_uuid: profiles}), batch_size=2)
+        stats = crawler.run()
+        self.assertEqual(sorted(handled), ["p1", "p2", "p3"])
+        self.assertEqual(handled["p1"][0].profile_id, "profile-p1")
+        self.assertEqual((stats.crawled, stats.profiles, stats.failed), (3, 3, 0))
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertTrue(self.queue.is_finished())
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_rate_budget(self, mock_get, mock_username):
+        """Test that the crawler waits for its key's budget, shared with other crawlers using the key."""
+        self.queue.add(["p1", "p2", "p3"])
+        self.queue.reserve(key_id("key1"), 2, 60.0, now=self.now)
+        stats = self.make_crawler(key_limit=2, key_window=60.0).run()
+        self.assertEqual(stats.crawled, 3)
+        self.assertEqual(self.slept, [60.0])
+        self.assertEqual(stats.waited, 60.0)
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_keys_share_the_queue(self, mock_get, mock_username):
+        """Test that crawlers with different keys split the players between them."""
+        self.queue.add([f"p{i}" for i in range(6)])
+        first = self.make_crawler("key1", key_limit=3, key_window=60.0, batch_size=1, worker_id="first")
+        second = self.make_crawler("key2", key_limit=3, key_window=60.0, batch_size=1, worker_id="second")
+        for _ in range(3):
+            first.run_once()
+            second.run_once()
+        self.assertEqual((first.stats.crawled, second.stats.crawled), (3, 3))
+        self.assertEqual(self.slept, [])
+        self.assertTrue(self.queue.is_finished())
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_failures_are_retried(self, mock_get, mock_username):
+        """Test that failing players are retried and then marked failed."""
+        self.queue.add(["broken", "p1"])
+        stats = self.make_crawler(max_attempts=2).run()
+        self.assertEqual((stats.crawled, stats.failed), (1, 2))
+        self.assertEqual(self.queue.counts()[FAILED], 1)
+        self.assertIn("ValueError", self.queue.get_errors()["broken"])
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_discover(self, mock_get, mock_username):
+        """Test that coop members of crawled profiles are added to the queue."""
+        self.queue.add(["p1"])
+        stats = self.make_crawler(discover=True).run()
+        self.assertEqual(stats.discovered, 1)
+        self.assertEqual(stats.crawled, 2)
+        self.assertEqual(self.queue.counts()[DONE], 2)
+
+    @patch("requests.get", return_value=make_response(403, {"success": False, "cause": "Invalid API key"}))
+    def test_invalid_key_stops(self, mock_get, mock_username):
+        """Test that an invalid key stops the crawler and returns its players to the queue."""
+        self.queue.add(["p1", "p2"])
+        crawler = self.make_crawler(batch_size=2)
+        with self.assertRaises(PermissionError):
+            crawler.run()
+        self.assertEqual(self.queue.counts(), {PENDING: 2, LEASED: 0, DONE: 0, FAILED: 0})
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_stop_while_waiting_for_budget(self, mock_get, mock_username):
+        """Test that a crawler stopped while waiting for its budget sends no request without one."""
+        self.queue.add(["p1", "p2", "p3"])
+        crawler = ProfileCrawler(self.queue, "key1", key_limit=1, key_window=60.0, batch_size=3, sleep=lambda seconds: crawler.stop(), clock=lambda: self.now)
+        stats = crawler.run()
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(stats.crawled, 1)
+        self.assertEqual(self.queue.counts(), {PENDING: 2, LEASED: 0, DONE: 1, FAILED: 0})
+
+    @patch("requests.get", return_value=make_response(403, {"success": False, "cause": "Invalid API key"}))
+    def test_invalid_key_stops_threads(self, mock_get, mock_username):
+        """Test that concurrent threads stop reserving and sending once the key is rejected."""
+        self.queue.add(["p1", "p2", "p3"])
+        crawler = ProfileCrawler(self.queue, "key1", key_limit=1, key_window=60.0, batch_size=3, sleep=lambda seconds: time.sleep(0.01), clock=lambda: self.now)
+        with self.assertRaises(PermissionError):
+            crawler.run(threads=3)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.queue.counts(), {PENDING: 3, LEASED: 0, DONE: 0, FAILED: 0})
+
+    @patch("requests.get", side_effect=profiles_response)
+    def test_lease_taken_over(self, mock_get, mock_username):
+        """Test that a crawler does not record a player another worker took over while it was crawled."""
+        self.queue.add(["p1"])
+        crawler = self.make_crawler(handler=lambda player_uuid, profiles: self.queue.claim("other", now=self.now + 1000))
+        crawler.run_once()
+        self.assertEqual((crawler.stats.crawled, crawler.stats.lost), (0, 1))
+        self.assertEqual(self.queue.counts()[LEASED], 1)
+
+    def test_custom_profiles_manager(self, mock_username):
+        """Test that a configured profiles manager is used as given."""
+        profiles = SkyBlockProfiles("key1")
+        self.assertIs(self.make_crawler(profiles=profiles).profiles, profiles)
+        with self.assertRaises(ValueError):
+            self.make_crawler(key_limit=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+import requests
+
+from hypixel_api_lib.Auctions import ActiveAuctions, RecentlyEndedAuctions
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.export import flatten_stats
+from helpers import make_response
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+AUCTIONS = [
+    {"uuid": "auction1", "item_name": "Hyperion", "starting_bid": 100, "start": 1700000000123, "coop": ["seller1"], "claimed": False, "bids": []},
+    {"uuid": "auction2", "item_name": "Aspect of the End", "starting_bid": 50, "highest_bid_amount": 400, "claimed": False,
+     "bids": [{"auction_id": "auction2", "bidder": "bidder1", "amount": 400, "timestamp": 1700000000999}]},
+]
+
+def auctions_page(params: dict) -> requests.Response:
+    page = params['page']
+    return make_response(200, {"success": True, "page": page, "totalPages": 2, "totalAuctions": 2, "auctions": AUCTIONS[page:page + 1]})
+
+class TestFlattenStats(unittest.TestCase):
+    def test_flatten_stats(self):
+        """Test that nested statistics are flattened to dotted names with numeric values only."""
+        stats = {"kills": {"zombie": 3, "total": 5}, "highest_damage": 12.5, "races": {"end": {"best_time": 40}}, "flag": True, "name": "x"}
+        self.assertEqual(flatten_stats(stats), {"kills.zombie": 3.0, "kills.total": 5.0, "highest_damage": 12.5, "races.end.best_time": 40.0})
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestArrowExport(unittest.TestCase):
+    @patch("requests.get")
+    def test_active_auctions_from_raw_pages(self, mock_get):
+        """Test that auctions are exported from the raw pages with typed columns."""
+        import pyarrow as pa
+        mock_get.side_effect = lambda url, params=None, **kwargs: auctions_page(params)
+        auctions = ActiveAuctions()
+        table = auctions.to_arrow(workers=2)
+        self.assertEqual(auctions.all_auctions, [])
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column('uuid').to_pylist(), ["auction1", "auction2"])
+        self.assertEqual(table.schema.field('start').type, pa.timestamp('ms', tz='UTC'))
+        self.assertEqual(table.column('start')[0].as_py(), datetime.fromtimestamp(1700000000.123, tz=timezone.utc))
+        self.assertIsNone(table.column('highest_bid_amount')[0].as_py())
+        self.assertEqual(table.column('bids')[1].as_py()[0]['amount'], 400)
+        self.assertEqual(table.column('coop').to_pylist(), [["seller1"], []])
+
+    @patch("requests.get")
+    def test_active_auctions_every_source(self, mock_get):
+        """Test that cached objects, worker process tables and raw pages export identically."""
+        mock_get.side_effect = lambda url, params=None, **kwargs: auctions_page(params)
+        raw = ActiveAuctions().to_arrow()
+
+        cached = ActiveAuctions()
+        cached.get_all_auctions()
+        self.assertTrue(cached.to_arrow().equals(raw))
+
+        columnar = ActiveAuctions()
+        columnar.get_all_auctions(processes=1)
+        self.assertTrue(columnar.to_arrow().equals(raw))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "auctions.parquet")
+            self.assertEqual(columnar.to_parquet(path), 2)
+            import pyarrow.parquet as pq
+            self.assertTrue(pq.read_table(path).equals(raw))
+
+    @patch("requests.get")
+    def test_ended_auctions_and_bazaar(self, mock_get):
+        """Test that ended auctions and bazaar quick statuses are exported."""
+        mock_get.return_value = make_response(200, {"success": True, "lastUpdated": 1700000000000, "auctions": [
+            {"auction_id": "ended1", "seller": "seller1", "buyer": "buyer1", "timestamp": 1700000000000, "price": 500, "bin": True},
+        ]})
+        table = RecentlyEndedAuctions().to_arrow()
+        self.assertEqual(table.column('price').to_pylist(), [500])
+        self.assertEqual(table.column('bin').to_pylist(), [True])
+        self.assertEqual(table.column('timestamp')[0].as_py(), datetime.fromtimestamp(1700000000, tz=timezone.utc))
+
+        mock_get.return_value = make_response(200, {"success": True, "lastUpdated": 1700000000000, "products": {
+            "DIAMOND": {"product_id": "DIAMOND", "sell_summary": [], "buy_summary": [], "quick_status": {"productId": "DIAMOND", "sellPrice": 5.5, "buyVolume": 7}},
+        }})
+        table = Bazaar().to_arrow()
+        self.assertEqual(table.to_pylist()[0]['productId'], "DIAMOND")
+        self.assertEqual(table.column('sellPrice').to_pylist(), [5.5])
+        self.assertEqual(table.column('buyVolume').to_pylist(), [7])
+
+    @patch("hypixel_api_lib.member.ProfileMember.get_username_from_uuid", return_value="PlayerOne")
+    def test_member_stats(self, mock_username):
+        """Test that member stats are exported in long form."""
+        profile = SkyBlockProfile({"profile_id": "profile1", "members": {"uuid1": {"player_stats": {"kills": {"zombie": 3}, "highest_damage": 12.5}}}})
+        table = profile.stats_to_arrow()
+        self.assertEqual(table.column_names, ["profile_id", "uuid", "username", "stat", "value"])
+        self.assertEqual(sorted(zip(table.column('stat').to_pylist(), table.column('value').to_pylist())), [("highest_damage", 12.5), ("kills.zombie", 3.0)])
+        self.assertEqual(set(table.column('username').to_pylist()), {"PlayerOne"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import Mock, patch
+import requests
+
+from hypixel_api_lib.Auctions import ActiveAuctions, PlayerAuctions, ACTIVE_AUCTIONS_API_URL, PLAYER_AUCTION_API_URL
+from hypixel_api_lib.Bazaar import Bazaar, BAZAAR_API_URL
+from hypixel_api_lib.cache import ResponseCache
+from hypixel_api_lib.instrumentation import DEFAULT_INSTRUMENTATION, Instrumentation, MetricsCollector, RequestEvent, get_current_event, time_phase
+from hypixel_api_lib.transport import RetryPolicy, Transport
+from hypixel_api_lib.utils import get_uuid_from_username, MOJANG_API_URL
+from helpers import make_response
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.metrics = MetricsCollector()
+        DEFAULT_INSTRUMENTATION.add_hook(self.events.append)
+        DEFAULT_INSTRUMENTATION.add_hook(self.metrics)
+
+    def tearDown(self):
+        DEFAULT_INSTRUMENTATION.remove_hook(self.events.append)
+        DEFAULT_INSTRUMENTATION.remove_hook(self.metrics)
+
+    def test_disabled_is_a_no_op(self):
+        """Test that tracking without hooks records nothing."""
+        instrumentation = Instrumentation()
+        self.assertFalse(instrumentation.enabled)
+        with instrumentation.track("url") as event:
+            event.status = 200
+            with event.time("decode"):
+                pass
+            self.assertIsNone(get_current_event())
+            with time_phase("build"):
+                pass
+
+        hook = Mock()
+        instrumentation.add_hook(hook)
+        self.assertTrue(instrumentation.enabled)
+        instrumentation.remove_hook(hook)
+        self.assertFalse(instrumentation.enabled)
+        with self.assertRaises(ValueError):
+            instrumentation.remove_hook(hook)
+
+    @patch("requests.get")
+    def test_page_event(self, mock_get):
+        """Test that a page fetch reports status, size and every phase."""
+        mock_get.return_value = make_response(200, {
+            "success": True, "page": 0, "totalPages": 1, "totalAuctions": 1, "auctions": [{"uuid": "auction1"}],
+        })
+        ActiveAuctions().get_page(0, retain=False)
+
+        self.assertEqual(len(self.events), 1)
+        event = self.events[0]
+        self.assertEqual(event.endpoint, ACTIVE_AUCTIONS_API_URL)
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.bytes, len(mock_get.return_value.content))
+        self.assertGreater(event.network_ms, 0)
+        self.assertGreater(event.decode_ms, 0)
+        self.assertGreater(event.build_ms, 0)
+        self.assertIsNone(event.cache)
+        self.assertIsNone(event.error)
+        self.assertIsNone(get_current_event())
+
+    @patch("requests.get")
+    def test_retries_and_errors(self, mock_get):
+        """Test that retries and failures are recorded on the event."""
+        mock_get.side_effect = [make_response(502, {}), make_response(200, {"success": True, "products": {}})]
+        Bazaar(transport=Transport(RetryPolicy(max_attempts=2), sleep=lambda delay: None))
+        self.assertEqual((self.events[0].status, self.events[0].retries), (200, 1))
+
+        mock_get.side_effect = None
+        mock_get.return_value = make_response(503, {})
+        with self.assertRaises(ConnectionError):
+            Bazaar(transport=Transport(RetryPolicy(max_attempts=1)))
+        self.assertEqual((self.events[1].status, self.events[1].error), (503, "ConnectionError"))
+        self.assertEqual(self.metrics.get_counter("requests_total", endpoint=BAZAAR_API_URL, status="503"), 1)
+        self.assertEqual(self.metrics.get_counter("retries_total", endpoint=BAZAAR_API_URL), 1)
+
+    @patch("requests.get")
+    def test_cache_results(self, mock_get):
+        """Test that response cache hits and misses are recorded."""
+        mock_get.return_value = make_response(200, {"success": True, "auctions": []})
+        player_auctions = PlayerAuctions("test_api_key", cache=ResponseCache())
+        player_auctions.get_auctions_by_player_uuid("player1")
+        player_auctions.get_auctions_by_player_uuid("player1")
+
+        self.assertEqual([event.cache for event in self.events], ["miss", "hit"])
+        self.assertEqual(self.events[1].network_ms, 0)
+        self.assertEqual(self.metrics.get_counter("cache_lookups_total", endpoint=PLAYER_AUCTION_API_URL, result="hit"), 1)
+        self.assertEqual(self.metrics.get_histogram("network_seconds", PLAYER_AUCTION_API_URL)[0], 1)
+
+    @patch("requests.get")
+    def test_untracked_requests_and_labels(self, mock_get):
+        """Test that Mojang lookups are labelled by endpoint rather than by username."""
+        mock_get.return_value = make_response(200, {"id": "uuid1"})
+        get_uuid_from_username("PlayerOne")
+        self.assertEqual(self.events[0].endpoint, MOJANG_API_URL)
+
+        Transport().get("https://api.hypixel.net/other")
+        self.assertEqual(self.events[1].endpoint, "https://api.hypixel.net/other")
+        self.assertEqual(self.events[1].status, 200)
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text format."""
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        for network_ms in (50, 500, 5000):
+            event = RequestEvent('url"1')
+            event.status, event.bytes, event.network_ms = 200, 100, network_ms
+            metrics(event)
+
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE hypixel_api_requests_total counter', text)
+        self.assertIn('hypixel_api_requests_total{endpoint="url\\"1",status="200"} 3', text)
+        self.assertIn('hypixel_api_response_bytes_total{endpoint="url\\"1"} 300', text)
+        self.assertIn('# TYPE hypixel_api_network_seconds histogram', text)
+        self.assertIn('hypixel_api_network_seconds_bucket{endpoint="url\\"1",le="0.1"} 1', text)
+        self.assertIn('hypixel_api_network_seconds_bucket{endpoint="url\\"1",le="1.0"} 2', text)
+        self.assertIn('hypixel_api_network_seconds_bucket{endpoint="url\\"1",le="+Inf"} 3', text)
+        self.assertIn('hypixel_api_network_seconds_sum{endpoint="url\\"1"} 5.55', text)
+        self.assertIn('hypixel_api_network_seconds_count{endpoint="url\\"1"} 3', text)
+        self.assertTrue(text.endswith("\n"))
+
+        metrics.reset()
+        self.assertEqual(metrics.to_prometheus(), "")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+
+from hypixel_api_lib.Leaderboards import LeaderboardBuilder, skill_average_metric
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.Skills import Skills
+
+def _member(slayer_xp: int, kills: int, collected: int | None = None) -> dict:
+    data = {
+        "slayer": {"slayer_bosses": {"zombie": {"xp": slayer_xp}}},
+        "bestiary": {"kills": {"zombie_1": kills}},
+    }
+    if collected is not None:
+        data["collection"] = {"WHEAT": collected}
+    return data
+
+class TestLeaderboards(unittest.TestCase):
+    def setUp(self):
+        self.sample_profiles = [
+            {"profile_id": "profile1", "members": {"uuid1": _member(100, 5, 10), "uuid2": _member(300, 1)}},
+            {"profile_id": "profile2", "members": {"uuid3": _member(200, 9, 30)}},
+            {"profile_id": "profile3", "members": {"uuid4": _member(300, 0, 20)}},
+        ]
+
+    def _profiles(self):
+        with patch("hypixel_api_lib.member.ProfileMember.get_username_from_uuid", return_value="Player"):
+            for data in self.sample_profiles:
+                yield SkyBlockProfile(data)
+
+    def test_top_k(self):
+        """Test that only the top-k members are kept, best first."""
+        builder = LeaderboardBuilder(k=2)
+        builder.add_profiles(self._profiles())
+
+        top = builder.get_top("slayer_xp")
+        self.assertEqual(len(builder), 4)
+        self.assertEqual([entry.value for entry in top], [300.0, 300.0])
+        # Ties keep the member that was added first
+        self.assertEqual(top[0].uuid, "uuid2")
+        self.assertEqual(top[0].profile_id, "profile1")
+        self.assertEqual(top[0].rank, 1)
+        self.assertEqual(builder.get_top("bestiary_kills", n=1)[0].uuid, "uuid3")
+
+    def test_rank_and_percentile(self):
+        """Test rank and percentile queries over a metric column."""
+        builder = LeaderboardBuilder()
+        builder.add_profiles(self._profiles())
+
+        self.assertEqual(builder.rank("slayer_xp", 300), 1)
+        self.assertEqual(builder.rank("slayer_xp", 150), 4)
+        self.assertEqual(builder.percentile("slayer_xp", 200), 50.0)
+        self.assertEqual(builder.value_at_percentile("slayer_xp", 0), 100.0)
+        with self.assertRaises(ValueError):
+            builder.value_at_percentile("slayer_xp", 101)
+
+        # Members without any collection data count as 0 collected
+        self.assertEqual(builder.get_value("collected_items", "uuid2", "profile1"), 0.0)
+        self.assertIsNone(builder.get_value("collected_items", "missing"))
+
+    def test_missing_values_are_skipped(self):
+        """Test that metrics returning None are left out of rankings."""
+        builder = LeaderboardBuilder(metrics={"collected": lambda member: member.collection.get_total_amount_collected() or None})
+        builder.add_profiles(self._profiles())
+
+        self.assertEqual(len(builder.get_top("collected")), 3)
+        self.assertEqual(builder.percentile("collected", 20), 200.0 / 3)
+        self.assertEqual(builder.metrics["collected"].missing, 1)
+
+    def test_metric_errors_propagate(self):
+        """Test that a failing metric raises instead of being recorded as missing."""
+        builder = LeaderboardBuilder(metrics={"slayer": lambda member: member.slayer.total_xp(), "broken": lambda member: member.unknown_field})
+        with self.assertRaises(AttributeError):
+            builder.add_profiles(self._profiles())
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(len(builder.metrics["slayer"].values), 0)
+
+    def test_register(self):
+        """Test metric registration rules."""
+        builder = LeaderboardBuilder(metrics={})
+        builder.register("double_slayer", lambda member: member.slayer.total_xp() * 2, k=1)
+        with self.assertRaises(ValueError):
+            builder.register("double_slayer", lambda member: 0)
+
+        builder.add_profiles(self._profiles())
+        builder.add_profiles(self._profiles())
+        self.assertEqual(len(builder), 4)
+        self.assertEqual(builder.get_top("double_slayer")[0].value, 600.0)
+        with self.assertRaises(ValueError):
+            builder.register("late", lambda member: 0)
+        with self.assertRaises(ValueError):
+            builder.get_top("unknown")
+
+    @patch("requests.get")
+    def test_skill_average_metric(self, mock_get):
+        """Test averaging skill levels, ignoring cosmetic skills."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "success": True,
+            "lastUpdated": 0,
+            "skills": {
+                "FARMING": {"name": "Farming", "description": "", "maxLevel": 2, "levels": [{"level": 1, "totalExpRequired": 50.0, "unlocks": []}, {"level": 2, "totalExpRequired": 150.0, "unlocks": []}]},
+                "RUNECRAFTING": {"name": "Runecrafting", "description": "", "maxLevel": 2, "levels": [{"level": 1, "totalExpRequired": 50.0, "unlocks": []}, {"level": 2, "totalExpRequired": 150.0, "unlocks": []}]},
+            }
+        }
+        skills = Skills()
+        self.sample_profiles[0]["members"]["uuid1"]["player_data"] = {"experience": {"SKILL_FARMING": 100.0, "SKILL_RUNECRAFTING": 150.0}}
+
+        builder = LeaderboardBuilder(metrics={"skill_average": skill_average_metric(skills)})
+        builder.add_profiles(self._profiles())
+
+        self.assertEqual(builder.get_value("skill_average", "uuid1", "profile1"), 1.5)
+        self.assertEqual(len(builder.get_top("skill_average")), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import time
+import unittest
+import requests
+
+from benchmarks.mock_server import MockServer
+from hypixel_api_lib.Auctions import ActiveAuctions, ACTIVE_AUCTIONS_API_URL
+from hypixel_api_lib.Bazaar import Bazaar, BAZAAR_API_URL
+from hypixel_api_lib.Profiles import SkyBlockProfiles, PROFILE_API_URL, PROFILES_API_URL
+from hypixel_api_lib.transport import RetryPolicy, Transport
+from hypixel_api_lib.utils import get_uuid_from_username
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestMockServer(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.server = MockServer(auctions=1500, bazaar_products=50, coop_members=2, rollover=60, api_keys=["test_api_key"], clock=self.clock).start()
+        self.addCleanup(self.server.stop)
+        self.no_retry = Transport(RetryPolicy(max_attempts=1))
+
+    def test_paginated_auctions(self):
+        """Test that the auction house is served page by page."""
+        auctions = ActiveAuctions(api_endpoint=self.server.rewrite(ACTIVE_AUCTIONS_API_URL))
+        self.assertEqual(len(auctions.get_all_auctions()), 1500)
+        self.assertEqual(auctions.get_page(1).totalPages, 2)
+        self.assertEqual(self.server.requests['/skyblock/auctions'], 2)
+
+        response = requests.get(self.server.rewrite(ACTIVE_AUCTIONS_API_URL), params={'page': 2})
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.json()['success'])
+
+    def test_last_updated_rollover(self):
+        """Test that the bazaar changes and lastUpdated advances once per rollover."""
+        endpoint = self.server.rewrite(BAZAAR_API_URL)
+        first = Bazaar(api_endpoint=endpoint)
+        self.assertEqual(len(first.products), 50)
+        self.clock.now += 59
+        self.assertEqual(Bazaar(api_endpoint=endpoint).last_updated, first.last_updated)
+
+        self.clock.now += 1
+        second = Bazaar(api_endpoint=endpoint)
+        self.assertEqual((second.last_updated - first.last_updated).total_seconds(), 60)
+        product_id = next(iter(first.products))
+        self.assertNotEqual(first.products[product_id].quick_status.sell_price, second.products[product_id].quick_status.sell_price)
+
+    def test_last_updated_matches_the_snapshot(self):
+        """Test that a snapshot rolling over while it is built keeps its own lastUpdated."""
+        def build(seed):
+            self.clock.now += 60
+            return {"seed": seed}
+
+        first = json.loads(self.server._get_cached("test", build))
+        self.assertEqual(first["lastUpdated"], self.server._get_generation_start(0))
+        self.assertEqual(self.server.get_last_updated(), self.server._get_generation_start(1))
+
+    def test_profiles_and_mojang(self):
+        """Test that profiles and username lookups are served consistently."""
+        profiles = SkyBlockProfiles("test_api_key", transport=self.no_retry, profile_endpoint=self.server.rewrite(PROFILE_API_URL), profiles_endpoint=self.server.rewrite(PROFILES_API_URL))
+        with self.server.redirect_mojang():
+            uuid = get_uuid_from_username("PlayerOne")
+            self.assertEqual(uuid, get_uuid_from_username("playerone"))
+            player_profiles = profiles.get_profiles_by_player_uuid(uuid)
+            self.assertEqual(len(player_profiles), 2)
+            self.assertTrue(player_profiles[0].selected)
+            self.assertIn(f"Player_{uuid[:8]}", player_profiles[0].list_member_usernames())
+
+            profile = profiles.get_profile(player_profiles[1].profile_id)
+            self.assertEqual(profile.profile_id, player_profiles[1].profile_id)
+        self.assertEqual(self.server.requests['/users/profiles/minecraft/'], 2)
+
+        with self.assertRaises(PermissionError):
+            SkyBlockProfiles("wrong_key", transport=self.no_retry, profiles_endpoint=self.server.rewrite(PROFILES_API_URL)).get_profiles_by_player_uuid(uuid)
+
+    def test_rate_limit_headers(self):
+        """Test that keyed endpoints enforce a rate limit per key and report it in headers."""
+        self.server.rate_limit, self.server.rate_window = 2, 300
+        url, params = self.server.rewrite(PROFILES_API_URL), {'key': "test_api_key", 'uuid': "uuid1"}
+        first = requests.get(url, params=params)
+        self.assertEqual((first.headers['RateLimit-Limit'], first.headers['RateLimit-Remaining'], first.headers['RateLimit-Reset']), ("2", "1", "300"))
+        requests.get(url, params=params)
+
+        throttled = requests.get(url, params=params)
+        self.assertEqual(throttled.status_code, 429)
+        self.assertEqual(throttled.headers['RateLimit-Remaining'], "0")
+        self.assertEqual(throttled.json()['cause'], "Key throttle")
+        profiles = SkyBlockProfiles("test_api_key", transport=self.no_retry, profiles_endpoint=url)
+        with self.assertRaises(ConnectionError):
+            profiles.get_profiles_by_player_uuid("uuid1")
+
+        self.clock.now += 300
+        self.assertEqual(requests.get(url, params=params).status_code, 200)
+
+    def test_injected_throttling_and_latency(self):
+        """Test that injected 429 responses are retried after their Retry-After and latency is applied."""
+        self.server.throttle_rate, self.server.retry_after = 1.0, 0.5
+        delays = []
+        transport = Transport(RetryPolicy(max_attempts=3), sleep=delays.append)
+        response = transport.get(self.server.rewrite(BAZAAR_API_URL))
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(response.json()['global'])
+        self.assertEqual(delays, [0.5, 0.5])
+        self.assertEqual(self.server.throttled, 3)
+
+        self.server.throttle_rate, self.server.latency = 0.0, 0.05
+        started = time.perf_counter()
+        self.assertEqual(requests.get(self.server.rewrite(BAZAAR_API_URL)).status_code, 200)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+    def test_invalid_settings(self):
+        """Test that invalid settings are rejected."""
+        with self.assertRaises(ValueError):
+            MockServer(rollover=0)
+        with self.assertRaises(ValueError):
+            MockServer(throttle_rate=2)
+
+if __name__ == "__main__":
+    unittest.main()
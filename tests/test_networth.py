@@ -0,0 +1,166 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from hypixel_api_lib.Auctions import SkyBlockAuction
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.Items import Items
+from hypixel_api_lib.ItemBytes import decode_item_bytes, encode_item_bytes, parse_nbt, build_nbt
+from hypixel_api_lib.Networth import PriceSnapshot, NetworthEngine, get_lowest_bins
+from hypixel_api_lib.Profiles import SkyBlockProfile
+
+def _item(item_id: str, count: int = 1, uuid: str | None = None, **extra) -> dict:
+    extra_attributes = {"id": item_id, **extra}
+    if uuid is not None:
+        extra_attributes["uuid"] = uuid
+    return {"id": 1, "Count": count, "tag": {"ExtraAttributes": extra_attributes, "display": {"Name": item_id.title()}}}
+
+def _inventory(*items: dict) -> dict:
+    return {"type": 0, "data": encode_item_bytes(list(items))}
+
+class TestItemBytes(unittest.TestCase):
+    def test_round_trip(self):
+        """Test encoding and decoding item bytes."""
+        pet_info = json.dumps({"type": "BEE", "tier": "RARE"})
+        data = encode_item_bytes([_item("HYPERION", 1, "u1"), {}, _item("PET", petInfo=pet_info)])
+        items = decode_item_bytes(data)
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0].item_id, "HYPERION")
+        self.assertEqual(items[0].uuid, "u1")
+        self.assertEqual(items[0].name, "Hyperion")
+        self.assertEqual(items[1].price_key, "PET_BEE_RARE")
+
+    def test_nbt_types(self):
+        """Test that scalar, list and long values survive a round trip."""
+        root = {"a": [1, 2], "b": "text", "c": 2**40, "d": 1.5}
+        self.assertEqual(parse_nbt(build_nbt(root)), root)
+
+    def test_invalid_data(self):
+        """Test that malformed item bytes raise ValueError."""
+        with self.assertRaises(ValueError):
+            decode_item_bytes("InvalidData!")
+        with self.assertRaises(ValueError):
+            parse_nbt(b"\x0a\x00")
+
+class TestNetworth(unittest.TestCase):
+    def setUp(self):
+        self.sample_bazaar_response = {
+            "success": True,
+            "lastUpdated": 1731945336382,
+            "products": {
+                "ENCHANTED_DIAMOND": {
+                    "sell_summary": [{"amount": 100, "pricePerUnit": 1500.0, "orders": 1}],
+                    "buy_summary": [{"amount": 100, "pricePerUnit": 1600.0, "orders": 1}],
+                    "quick_status": {"sellPrice": 1500.0},
+                },
+                "ESSENCE_WITHER": {"sell_summary": [], "buy_summary": [], "quick_status": {"sellPrice": 3.0}},
+            }
+        }
+        self.sample_items_response = {
+            "success": True,
+            "items": [
+                {"id": "DIRT", "material": "DIRT", "name": "Dirt", "npc_sell_price": 1},
+                {"id": "ENCHANTED_DIAMOND", "material": "DIAMOND", "name": "Enchanted Diamond", "npc_sell_price": 1280},
+            ]
+        }
+        self.sample_profile_data = {
+            "profile_id": "profile1",
+            "banking": {"balance": 1000.0, "transactions": []},
+            "members": {
+                "uuid1": {
+                    "currencies": {"coin_purse": 500.0, "essence": {"WITHER": {"current": 10}}},
+                    "pets_data": {"pets": [{"type": "BEE", "tier": "RARE", "heldItem": "DIRT"}]},
+                    "inventory": {
+                        "inv_contents": _inventory(_item("HYPERION", 1, "u1"), _item("ENCHANTED_DIAMOND", 2)),
+                        "ender_chest_contents": _inventory(_item("HYPERION", 1, "u1")),
+                        "backpack_contents": {"0": _inventory(_item("DIRT", 64))},
+                        "bag_contents": {"talisman_bag": _inventory(_item("UNKNOWN_TALISMAN", 1, "u2"))},
+                        "sacks_counts": {"ENCHANTED_DIAMOND": 3, "DIRT": 0},
+                    },
+                },
+            },
+        }
+
+    def _prices(self) -> PriceSnapshot:
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = self.sample_bazaar_response
+            bazaar = Bazaar()
+            mock_get.return_value.json.return_value = self.sample_items_response
+            items = Items()
+        return PriceSnapshot.from_sources(bazaar, {"HYPERION": 1e9, "PET_BEE_RARE": 5000.0}, items)
+
+    def _profile(self) -> SkyBlockProfile:
+        with patch("hypixel_api_lib.member.ProfileMember.get_username_from_uuid", return_value="Player"):
+            return SkyBlockProfile(self.sample_profile_data)
+
+    def test_price_snapshot_precedence(self):
+        """Test that bazaar prices beat NPC prices and empty books fall back to quick status."""
+        prices = self._prices()
+
+        self.assertEqual(prices.get_price("ENCHANTED_DIAMOND"), 1500.0)
+        self.assertEqual(prices.get_price("ESSENCE_WITHER"), 3.0)
+        self.assertEqual(prices.get_price("DIRT"), 1.0)
+        self.assertIsNone(prices.get_price("STICK"))
+
+    def test_get_lowest_bins(self):
+        """Test picking the lowest BIN unit price per item."""
+        auctions = [
+            SkyBlockAuction({"starting_bid": 900, "item_bytes": encode_item_bytes([_item("HYPERION")])}),
+            SkyBlockAuction({"starting_bid": 800, "item_bytes": encode_item_bytes([_item("HYPERION")])}),
+            SkyBlockAuction({"starting_bid": 1, "item_bytes": encode_item_bytes([_item("HYPERION")]), "bids": [{"amount": 1}]}),
+            SkyBlockAuction({"starting_bid": 640, "item_bytes": encode_item_bytes([_item("DIRT", 64)])}),
+            SkyBlockAuction({"starting_bid": 1, "item_bytes": "InvalidData!"}),
+        ]
+        self.assertEqual(get_lowest_bins(auctions), {"HYPERION": 800.0, "DIRT": 10.0})
+
+    def test_value_profile(self):
+        """Test valuing every category of a profile."""
+        engine = NetworthEngine(self._prices())
+        networth = engine.value_profile(self._profile())
+        member = networth.members["uuid1"]
+
+        self.assertEqual(member.categories["inventory"], 1e9 + 3000.0)
+        # The duplicated item UUID in the ender chest is only counted once
+        self.assertEqual(member.categories["ender_chest"], 0.0)
+        self.assertEqual(member.categories["storage"], 64.0)
+        self.assertEqual(member.categories["accessories"], 0.0)
+        self.assertEqual(member.categories["sacks"], 4500.0)
+        self.assertEqual(member.categories["pets"], 5001.0)
+        self.assertEqual(member.categories["essence"], 30.0)
+        self.assertEqual(member.categories["purse"], 500.0)
+        self.assertEqual(member.unpriced, {"UNKNOWN_TALISMAN": 1})
+        self.assertEqual(networth.categories["bank"], 1000.0)
+        self.assertEqual(networth.total, 1000.0 + member.total)
+
+    def test_decoded_inventories_are_cached(self):
+        """Test that identical item bytes are only decoded once."""
+        engine = NetworthEngine(self._prices())
+        profile = self._profile()
+
+        with patch("hypixel_api_lib.Networth.decode_item_bytes", wraps=decode_item_bytes) as decode:
+            engine.value_profile(profile)
+            engine.value_profile(profile)
+
+        self.assertEqual(decode.call_count, 4)
+
+        # The cache is bounded
+        engine = NetworthEngine(self._prices(), cache_size=2)
+        engine.value_profile(profile)
+        self.assertEqual(len(engine._decoded), 2)
+
+    def test_set_prices(self):
+        """Test that switching price snapshots revalues items."""
+        engine = NetworthEngine(self._prices())
+        profile = self._profile()
+        engine.value_profile(profile)
+
+        engine.set_prices(PriceSnapshot({"HYPERION": 2e9}))
+        member = engine.value_member(profile.get_member("uuid1"))
+
+        self.assertEqual(member.categories["inventory"], 2e9)
+        self.assertEqual(member.unpriced["ENCHANTED_DIAMOND"], 2 + 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import math
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from hypixel_api_lib.Auctions import RecentlyEndedAuction
+from hypixel_api_lib.ItemBytes import encode_item_bytes
+from hypixel_api_lib.PriceStats import RollingPriceStats
+
+START = datetime(2024, 11, 1, tzinfo=timezone.utc)
+
+def _sale(item_id: str, price: int, minutes: float, bin: bool = True, count: int = 1) -> RecentlyEndedAuction:
+    return RecentlyEndedAuction({
+        "auction_id": f"{item_id}_{minutes}",
+        "timestamp": int((START + timedelta(minutes=minutes)).timestamp() * 1000),
+        "price": price,
+        "bin": bin,
+        "item_bytes": encode_item_bytes([{"id": 1, "Count": count, "tag": {"ExtraAttributes": {"id": item_id}}}]),
+    })
+
+class TestRollingPriceStats(unittest.TestCase):
+    def test_quantiles(self):
+        """Test median, percentiles and volume over a window."""
+        stats = RollingPriceStats()
+        self.assertEqual(stats.add_sales(_sale("HYPERION", price, minute) for minute, price in enumerate([500, 100, 300, 200, 400])), 5)
+
+        result = stats.get_stats("HYPERION", "1h")
+        self.assertEqual(result.volume, 5)
+        self.assertEqual(result.coins, 1500.0)
+        self.assertEqual(result.median, 300.0)
+        self.assertEqual(result.p10, 140.0)
+        self.assertEqual(result.p90, 460.0)
+        self.assertEqual((result.min_price, result.max_price), (100.0, 500.0))
+
+    def test_windows_expire(self):
+        """Test that old sales leave the shorter windows only."""
+        stats = RollingPriceStats()
+        stats.add_sale(_sale("HYPERION", 100, 0))
+        stats.add_sale(_sale("HYPERION", 300, 120))
+
+        self.assertEqual(stats.get_stats("HYPERION", "1h").volume, 1)
+        self.assertEqual(stats.get_stats("HYPERION", "1h").median, 300.0)
+        self.assertEqual(stats.get_stats("HYPERION", "24h").median, 200.0)
+        self.assertEqual(stats.get_stats("HYPERION", "7d", now=START + timedelta(days=8)).volume, 0)
+
+        # Sales older than a window are never added to it
+        stats.add_sale(_sale("HYPERION", 50, 30))
+        self.assertEqual(stats.get_stats("HYPERION", "1h", now=START + timedelta(minutes=120)).volume, 1)
+        self.assertEqual(stats.get_stats("HYPERION", "24h", now=START + timedelta(minutes=120)).volume, 3)
+
+    def test_bin_and_auction_are_separate(self):
+        """Test that BIN sales and regular auctions are aggregated separately, per unit."""
+        stats = RollingPriceStats()
+        stats.add_sales([_sale("DIRT", 640, 0, count=64), _sale("DIRT", 5, 1, bin=False)])
+
+        self.assertEqual(stats.get_stats("DIRT", bin=True).median, 10.0)
+        self.assertEqual(stats.get_stats("DIRT", bin=False).median, 5.0)
+        self.assertEqual(len(stats.get_all_stats("DIRT")), 6)
+        self.assertEqual(stats.list_items(), ["DIRT"])
+
+    def test_large_windows_match_a_sorted_list(self):
+        """Test that windows spanning many buckets give the same statistics as sorting every sale."""
+        stats = RollingPriceStats()
+        sales = [(minute / 10, (minute * 7919) % 1000 + 1) for minute in range(1500)]
+        self.assertEqual(stats.add_sales(_sale("DIRT", price, minute, count=3) for minute, price in sales), 1500)
+
+        # The 1h window expired the first 900 sales, the 24h window kept all of them
+        for window, kept in (("1h", sales[900:]), ("24h", sales)):
+            prices = sorted(price / 3 for _, price in kept)
+            result = stats.get_stats("DIRT", window)
+            self.assertEqual(result.volume, len(prices))
+            self.assertEqual((result.min_price, result.max_price), (prices[0], prices[-1]))
+            self.assertEqual(result.median, prices[(len(prices) - 1) // 2] if len(prices) % 2 else (prices[len(prices) // 2 - 1] + prices[len(prices) // 2]) / 2)
+            self.assertEqual(result.coins, math.fsum(prices))
+
+    def test_invalid_input(self):
+        """Test skipped sales, unknown items and unknown windows."""
+        stats = RollingPriceStats()
+        self.assertFalse(stats.add_sale(RecentlyEndedAuction({"item_bytes": "...", "timestamp": 1, "price": 1})))
+        self.assertEqual(stats.get_stats("MISSING").volume, 0)
+        self.assertIsNone(stats.get_stats("MISSING").median)
+        with self.assertRaises(ValueError):
+            stats.get_stats("HYPERION", "30d")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,8 @@ from hypixel_api_lib.member.PetsData import *
 from hypixel_api_lib.member.Rift import *
 from hypixel_api_lib.member.AccessoryBagStorage import *
 from hypixel_api_lib.member.Leveling import *
+from hypixel_api_lib.member.dungeons import Dungeons, compute_dungeon_levels
+from hypixel_api_lib.member.dungeons.DungeonLevels import *
 
 class TestSkyBlockProfiles(unittest.TestCase):
     def setUp(self):
@@ -1100,5 +1102,72 @@ class TestLevelingData(unittest.TestCase):
         self.assertIn("ExperienceData(Experience: 33493)", leveling_str)
         self.assertIn("CompletionsData({'NUCLEUS_RUNS': 21})", leveling_str)
 
+class TestDungeonLevels(unittest.TestCase):
+    def setUp(self):
+        self.sample_dungeons_data = {
+            "dungeon_types": {"catacombs": {"experience": 180.0}},
+            "player_classes": {
+                "healer": {"experience": 50.0},
+                "mage": {"experience": 125.0},
+                "berserk": {"experience": 0.0},
+                "archer": {"experience": 25.0},
+                "tank": {"experience": 569809640.0}
+            }
+        }
+
+    def test_level_table(self):
+        """
+        Test the built-in Catacombs XP table.
+        """
+        self.assertEqual(CATACOMBS_MAX_LEVEL, 50)
+        self.assertEqual(CATACOMBS_CUMULATIVE_XP[0], 50)
+        self.assertEqual(CATACOMBS_CUMULATIVE_XP[-1], 569809640)
+
+    def test_get_dungeon_level(self):
+        """
+        Test converting experience into fractional dungeon levels.
+        """
+        self.assertEqual(get_dungeon_level(0.0), 0.0)
+        self.assertEqual(get_dungeon_level(25.0), 0.5)
+        self.assertEqual(get_dungeon_level(125.0), 2.0)
+        self.assertEqual(get_dungeon_level(1e12), 50.0)
+        self.assertEqual(get_dungeon_level(569809640.0 + 100000000.0, overflow=True), 50.5)
+
+    def test_get_dungeon_levels_matches_scalar(self):
+        """
+        Test that the array conversion matches the scalar conversion.
+        """
+        experience = [0.0, 49.0, 50.0, 12345.0, 569809639.0, 569809640.0, 1e9]
+        for overflow in (False, True):
+            levels = get_dungeon_levels(experience, overflow)
+            expected = [get_dungeon_level(xp, overflow) for xp in experience]
+            for level, value in zip(levels.tolist(), expected):
+                self.assertAlmostEqual(level, value)
+
+    def test_member_level_helpers(self):
+        """
+        Test the Catacombs and class level helpers on Dungeons and PlayerClasses.
+        """
+        dungeons = Dungeons(self.sample_dungeons_data)
+
+        self.assertEqual(dungeons.get_catacombs_level(), 2.5)
+        self.assertEqual(dungeons.player_classes.mage.get_level(), 2.0)
+        levels = dungeons.player_classes.get_class_levels()
+        self.assertEqual(levels["healer"], 1.0)
+        self.assertEqual(levels["tank"], 50.0)
+        self.assertAlmostEqual(dungeons.player_classes.get_class_average(), (1.0 + 2.0 + 0.0 + 0.5 + 50.0) / 5)
+
+    def test_compute_dungeon_levels(self):
+        """
+        Test computing the levels of many members as arrays.
+        """
+        levels = compute_dungeon_levels([Dungeons(self.sample_dungeons_data), Dungeons({})])
+
+        self.assertEqual(levels["catacombs"].tolist(), [2.5, 0.0])
+        self.assertEqual(levels["mage"].tolist(), [2.0, 0.0])
+        self.assertAlmostEqual(levels["class_average"][0], 53.5 / 5)
+        self.assertEqual(levels["class_average"][1], 0.0)
+        self.assertEqual(compute_dungeon_levels([])["catacombs"].tolist(), [])
+
 if __name__ == '__main__':
     unittest.main()
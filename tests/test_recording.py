@@ -0,0 +1,146 @@
+import gzip
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import requests
+
+from hypixel_api_lib.Auctions import ActiveAuctions, ACTIVE_AUCTIONS_API_URL
+from hypixel_api_lib.Bazaar import Bazaar, BAZAAR_API_URL
+from hypixel_api_lib.Profiles import SkyBlockProfiles, PROFILES_API_URL
+from hypixel_api_lib.circuitbreaker import DEFAULT_CIRCUIT_BREAKERS
+from hypixel_api_lib.recording import Cassette, RecordingTransport, ReplayMissError, ReplayTransport
+from hypixel_api_lib.transport import RetryPolicy, DEFAULT_TIMEOUT
+from hypixel_api_lib.utils import get_uuid_from_username, set_mojang_transport, MOJANG_API_URL
+from helpers import make_response
+
+def auctions_page(page: int) -> dict:
+    return {"success": True, "page": page, "totalPages": 2, "totalAuctions": 2, "auctions": [{"uuid": f"auction{page}", "item_name": "Hyperion", "starting_bid": 100}]}
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "session.jsonl.gz")
+
+    @patch("requests.get")
+    def test_record_and_replay(self, mock_get):
+        """Test that a recorded session replays byte for byte without the network."""
+        responses = {ACTIVE_AUCTIONS_API_URL: lambda params: make_response(200, auctions_page(params['page'])), BAZAAR_API_URL: lambda params: make_response(200, {"success": True, "products": {"DIAMOND": {"product_id": "DIAMOND"}}})}
+        mock_get.side_effect = lambda url, params=None, **kwargs: responses[url](params)
+        with RecordingTransport(self.path) as recorder:
+            recorded = [auction.uuid for auction in ActiveAuctions(transport=recorder).get_all_auctions()]
+            Bazaar(transport=recorder)
+        self.assertEqual(recorder.recorded, 3)
+        self.assertEqual(mock_get.call_count, 3)
+
+        with gzip.open(self.path, 'rt') as f:
+            self.assertEqual(json.loads(f.readline())['version'], 1)
+        cassette = Cassette.load(self.path)
+        self.assertEqual(cassette.list_urls(), [ACTIVE_AUCTIONS_API_URL, BAZAAR_API_URL])
+
+        replay = ReplayTransport(self.path)
+        self.assertEqual([auction.uuid for auction in ActiveAuctions(transport=replay).get_all_auctions()], recorded)
+        self.assertIn("DIAMOND", Bazaar(transport=replay).products)
+        self.assertEqual(replay.get(BAZAAR_API_URL).content, responses[BAZAAR_API_URL](None).content)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("requests.get")
+    def test_default_timeout(self, mock_get):
+        """Test that a recording transport sends the default timeout like a live session."""
+        mock_get.return_value = make_response(200, {"success": True, "products": {}})
+        with RecordingTransport(self.path) as recorder:
+            Bazaar(transport=recorder)
+        mock_get.assert_called_once_with(BAZAAR_API_URL, params=None, timeout=DEFAULT_TIMEOUT)
+        self.assertIs(recorder.breakers, DEFAULT_CIRCUIT_BREAKERS)
+        self.assertEqual(ReplayTransport(self.path).timeout, DEFAULT_TIMEOUT)
+
+    @patch("requests.get")
+    def test_redacted_keys_and_sequences(self, mock_get):
+        """Test that API keys are not recorded and repeated requests replay in order."""
+        mock_get.side_effect = [make_response(200, {"success": True, "profiles": []}), make_response(429, {"success": False}), make_response(200, {"success": True, "profiles": []})]
+        with RecordingTransport(self.path, policy=RetryPolicy(max_attempts=1)) as recorder:
+            profiles = SkyBlockProfiles("secret_key", transport=recorder)
+            profiles.get_profiles_by_player_uuid("uuid1")
+            with self.assertRaises(ConnectionError):
+                profiles.get_profiles_by_player_uuid("uuid1")
+            profiles.get_profiles_by_player_uuid("uuid1")
+
+        with gzip.open(self.path, 'rt') as f:
+            self.assertNotIn("secret_key", f.read())
+
+        replay = ReplayTransport(self.path, policy=RetryPolicy(max_attempts=1))
+        profiles = SkyBlockProfiles("other_key", transport=replay)
+        self.assertEqual(profiles.get_profiles_by_player_uuid("uuid1"), [])
+        with self.assertRaises(ConnectionError):
+            profiles.get_profiles_by_player_uuid("uuid1")
+        # The last recorded response keeps being served
+        for _ in range(2):
+            self.assertEqual(profiles.get_profiles_by_player_uuid("uuid1"), [])
+        self.assertEqual(replay.replayed, 4)
+
+        with self.assertRaises(ReplayMissError):
+            replay.get(PROFILES_API_URL, params={'uuid': "uuid2"})
+        self.assertEqual(replay.retries, 0)
+
+    @patch("requests.get")
+    def test_replays_retries_and_errors(self, mock_get):
+        """Test that retried attempts and request errors are recorded and replayed."""
+        mock_get.side_effect = [requests.exceptions.ConnectTimeout("timed out"), make_response(503, {}), make_response(200, {"success": True, "products": {}})]
+        with RecordingTransport(self.path, policy=RetryPolicy(max_attempts=3), sleep=lambda delay: None) as recorder:
+            Bazaar(transport=recorder)
+        self.assertEqual(recorder.recorded, 3)
+
+        replay = ReplayTransport(self.path, policy=RetryPolicy(max_attempts=3))
+        Bazaar(transport=replay)
+        self.assertEqual(replay.retries, 2)
+
+        replay = ReplayTransport(self.path, policy=RetryPolicy(max_attempts=1))
+        with self.assertRaises(ConnectionError) as context:
+            Bazaar(transport=replay)
+        self.assertIn("timed out", str(context.exception))
+
+    def test_replay_timing(self):
+        """Test that responses are delayed by their recorded duration divided by the speed."""
+        interaction = {"url": BAZAAR_API_URL, "params": {}, "status": 200, "reason": "OK", "headers": {"Content-Type": "application/json; charset=utf-8"}, "body": "e30=", "elapsed": 0.1, "offset": 0.0}
+        cassette = Cassette([interaction])
+
+        started = time.perf_counter()
+        response = ReplayTransport(cassette, speed=1.0).get(BAZAAR_API_URL)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.1)
+        self.assertEqual(response.json(), {})
+        self.assertEqual(response.headers['content-type'], "application/json; charset=utf-8")
+
+        started = time.perf_counter()
+        ReplayTransport(cassette, speed=10.0).get(BAZAAR_API_URL)
+        ReplayTransport(cassette).get(BAZAAR_API_URL)
+        self.assertLess(time.perf_counter() - started, 0.1)
+
+        with self.assertRaises(ValueError):
+            ReplayTransport(cassette, speed=0)
+
+    def test_mojang_lookups(self):
+        """Test that the Mojang lookups can be replayed."""
+        interaction = {"url": MOJANG_API_URL + "PlayerOne", "params": {}, "status": 200, "reason": "OK", "headers": {}, "body": "eyJpZCI6ICJ1dWlkMSJ9", "elapsed": 0.0, "offset": 0.0}
+        set_mojang_transport(ReplayTransport(Cassette([interaction])))
+        self.addCleanup(set_mojang_transport, None)
+        self.assertEqual(get_uuid_from_username("PlayerOne"), "uuid1")
+        with self.assertRaises(ConnectionError):
+            get_uuid_from_username("PlayerTwo")
+
+    def test_cassette_save_and_load(self):
+        """Test that cassettes round-trip and unknown versions are rejected."""
+        cassette = Cassette([{"url": "url", "params": {}, "status": 200}], recorded_at="2024-01-01T00:00:00+00:00")
+        cassette.save(self.path)
+        loaded = Cassette.load(self.path)
+        self.assertEqual((loaded.interactions, loaded.recorded_at), (cassette.interactions, cassette.recorded_at))
+
+        with gzip.open(self.path, 'wt') as f:
+            f.write(json.dumps({"version": 99}) + "\n")
+        with self.assertRaises(ValueError):
+            Cassette.load(self.path)
+
+if __name__ == "__main__":
+    unittest.main()
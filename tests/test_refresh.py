@@ -0,0 +1,117 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from hypixel_api_lib.Bazaar import Bazaar
+from hypixel_api_lib.refresh import RefreshingManager
+
+class Factory:
+    """Builds numbered managers, optionally blocking until released or failing."""
+
+    def __init__(self):
+        self.builds = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.fail = False
+
+    def __call__(self):
+        self.release.wait(5)
+        if self.fail:
+            raise ConnectionError("An error occurred: timeout")
+        self.builds += 1
+        return {"build": self.builds}
+
+def wait_for(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+class TestRefreshingManager(unittest.TestCase):
+    def test_serves_stale_while_revalidating(self):
+        """Test that a stale snapshot keeps being served until the new one is swapped in."""
+        factory = Factory()
+        refreshed = []
+        manager = RefreshingManager(factory, max_age=0.01, on_refresh=lambda m, duration: refreshed.append((m, duration)))
+        self.assertEqual(manager.get(), {"build": 1})
+
+        time.sleep(0.02)
+        factory.release.clear()
+        self.assertEqual(manager.get(), {"build": 1})
+        self.assertTrue(manager.is_refreshing())
+        self.assertFalse(manager.refresh_in_background())
+        self.assertEqual(manager.get(), {"build": 1})
+
+        factory.release.set()
+        wait_for(lambda: not manager.is_refreshing())
+        self.assertEqual(manager.get(), {"build": 2})
+        self.assertEqual(factory.builds, 2)
+        self.assertEqual(manager.refreshes, 2)
+        self.assertEqual([m for m, _ in refreshed], [{"build": 1}, {"build": 2}])
+        self.assertTrue(all(duration >= 0 for _, duration in refreshed))
+
+    def test_failed_refresh_keeps_snapshot(self):
+        """Test that a failed background refresh is reported and the old snapshot is kept."""
+        factory = Factory()
+        errors = []
+        manager = RefreshingManager(factory, max_age=0.01, on_error=lambda e, duration: errors.append(e))
+        time.sleep(0.02)
+        factory.fail = True
+
+        self.assertEqual(manager.get(), {"build": 1})
+        wait_for(lambda: manager.failures == 1 and not manager.is_refreshing())
+        self.assertEqual(manager.get(), {"build": 1})
+        self.assertIsInstance(manager.last_error, ConnectionError)
+        self.assertIsInstance(errors[0], ConnectionError)
+
+    def test_max_staleness_blocks(self):
+        """Test that a snapshot older than max_staleness is refreshed synchronously."""
+        factory = Factory()
+        manager = RefreshingManager(factory, max_age=0.005, max_staleness=0.01)
+        time.sleep(0.02)
+        self.assertEqual(manager.get(), {"build": 2})
+
+        time.sleep(0.02)
+        factory.fail = True
+        with self.assertRaises(ConnectionError):
+            manager.get()
+
+        with self.assertRaises(ValueError):
+            RefreshingManager(factory, max_age=10, max_staleness=5, manager={})
+
+    def test_initial_manager_and_background_thread(self):
+        """Test serving a prebuilt manager and refreshing proactively."""
+        factory = Factory()
+        manager = RefreshingManager(factory, max_age=0.01, manager={"build": 0})
+        self.assertEqual(factory.builds, 0)
+        self.assertEqual(manager.get(), {"build": 0})
+
+        manager.start()
+        with self.assertRaises(ValueError):
+            manager.start()
+        wait_for(lambda: factory.builds >= 2)
+        manager.stop(timeout=5)
+        self.assertGreaterEqual(manager.get()["build"], 2)
+
+    @patch("requests.get")
+    def test_bazaar(self, mock_get):
+        """Test refreshing a real manager."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "success": True,
+            "lastUpdated": 1700000000000,
+            "products": {"ENCHANTED_SUGAR": {"quick_status": {"sellPrice": 1.0}}},
+        }
+        manager = RefreshingManager(Bazaar, max_age=60)
+        first = manager.get()
+        self.assertIsInstance(first, Bazaar)
+
+        mock_get.return_value.json.return_value["products"]["ENCHANTED_SUGAR"]["quick_status"]["sellPrice"] = 2.0
+        second = manager.refresh()
+        self.assertIsNot(first, second)
+        self.assertIs(manager.get(), second)
+        self.assertEqual(first.products["ENCHANTED_SUGAR"].quick_status.sell_price, 1.0)
+        self.assertEqual(second.products["ENCHANTED_SUGAR"].quick_status.sell_price, 2.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from hypixel_api_lib.Profiles import SkyBlockProfiles
+from hypixel_api_lib.singleflight import SingleFlight, request_key
+
+class TestSingleFlight(unittest.TestCase):
+    def _blocking(self, release: threading.Event, calls: list, result=None, error: Exception | None = None):
+        def func():
+            calls.append(1)
+            release.wait(5)
+            if error is not None:
+                raise error
+            return result
+        return func
+
+    def _wait_for(self, condition) -> None:
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_threads_share_one_call(self):
+        """Test that concurrent threads with the same key share one execution and result."""
+        flight = SingleFlight()
+        release, calls = threading.Event(), []
+        func = self._blocking(release, calls, result=object())
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(flight.do, "key", func) for _ in range(5)]
+            self._wait_for(lambda: flight.coalesced == 4)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.in_flight(), 0)
+
+        # Finished calls are not cached
+        flight.do("key", func)
+        self.assertEqual(len(calls), 2)
+
+    def test_errors_are_shared(self):
+        """Test that every coalesced caller receives the leader's exception."""
+        flight = SingleFlight()
+        release, calls = threading.Event(), []
+        func = self._blocking(release, calls, error=ConnectionError("API error"))
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(flight.do, "key", func) for _ in range(3)]
+            self._wait_for(lambda: flight.coalesced == 2)
+            release.set()
+            for future in futures:
+                with self.assertRaises(ConnectionError):
+                    future.result()
+        self.assertEqual(len(calls), 1)
+
+    def test_async_and_threads_share_one_call(self):
+        """Test coalescing between asyncio tasks and a threaded caller."""
+        flight = SingleFlight()
+        release, calls = threading.Event(), []
+        func = self._blocking(release, calls, result="profile")
+
+        async def run():
+            tasks = [asyncio.create_task(flight.do_async("key", func)) for _ in range(3)]
+            await asyncio.sleep(0)
+            thread_result = asyncio.create_task(asyncio.to_thread(flight.do, "key", func))
+            await asyncio.to_thread(self._wait_for, lambda: flight.coalesced == 3)
+            release.set()
+            return await asyncio.gather(*tasks, thread_result)
+
+        self.assertEqual(asyncio.run(run()), ["profile"] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_cancelled_leader(self):
+        """Test that cancelling the leader does not cancel the callers awaiting its call."""
+        flight = SingleFlight()
+        release, calls = threading.Event(), []
+        func = self._blocking(release, calls, result="profile")
+
+        async def run():
+            leader = asyncio.create_task(flight.do_async("key", func))
+            await asyncio.to_thread(self._wait_for, lambda: calls)
+            waiter = asyncio.create_task(flight.do_async("key", func))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            self.assertFalse(waiter.done())
+            release.set()
+            return await waiter
+
+        self.assertEqual(asyncio.run(run()), "profile")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_request_key(self):
+        """Test that parameter order does not affect the key."""
+        self.assertEqual(request_key("url", {"a": 1, "b": 2}), request_key("url", {"b": 2, "a": 1}))
+        self.assertNotEqual(request_key("url", {"a": 1}), request_key("other", {"a": 1}))
+
+    @patch("requests.get")
+    def test_profiles_coalesce(self, mock_get):
+        """Test that concurrent profile lookups for the same player share one request."""
+        release = threading.Event()
+        def get(url, *args, **kwargs):
+            release.wait(5)
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {"success": True, "profiles": []}
+            return mock_get.return_value
+        mock_get.side_effect = get
+        flight = SingleFlight()
+        profiles = SkyBlockProfiles("test_api_key", single_flight=flight)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(profiles.get_profiles_by_player_uuid, "uuid1") for _ in range(4)]
+            self._wait_for(lambda: flight.coalesced == 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(results, [[]] * 4)
+
+        async def run():
+            return await asyncio.gather(*(profiles.aget_profiles_by_player_uuid("uuid2") for _ in range(3)))
+        self.assertEqual(asyncio.run(run()), [[]] * 3)
+        self.assertEqual(mock_get.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
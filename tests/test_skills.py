@@ -1,8 +1,10 @@
 import unittest
 from unittest.mock import patch
 import requests
+import numpy as np
 
 from hypixel_api_lib.Skills import Skills, Skill, SkillLevel
+from hypixel_api_lib.member.PlayerData import SkillExperience
 
 class TestSkills(unittest.TestCase):
     def setUp(self):
@@ -210,5 +212,72 @@ class TestSkills(unittest.TestCase):
         with self.assertRaises(KeyError):
             Skills()
 
+    def test_skill_level_for_xp(self):
+        """
+        Test converting XP into fractional levels with bisection.
+        """
+        skill = Skill("Farming", "", 3, [
+            {"level": 2, "totalExpRequired": 125.0, "unlocks": []},
+            {"level": 1, "totalExpRequired": 50.0, "unlocks": []},
+            {"level": 3, "totalExpRequired": 325.0, "unlocks": []},
+        ])
+
+        self.assertEqual(skill.cumulative_xp.tolist(), [50.0, 125.0, 325.0])
+        self.assertEqual(skill.level_for_xp(0), 0.0)
+        self.assertEqual(skill.level_for_xp(25), 0.5)
+        self.assertEqual(skill.level_for_xp(50), 1.0)
+        self.assertEqual(skill.level_for_xp(225), 2.5)
+        self.assertEqual(skill.level_for_xp(1000000), 3.0)
+        self.assertEqual(skill.get_level(2).total_exp_required, 125.0)
+
+    def test_skill_levels_for_xp_matches_scalar(self):
+        """
+        Test that the batch conversion matches the scalar conversion.
+        """
+        skill = Skill("Mining", "", 2, [
+            {"level": 1, "totalExpRequired": 50.0, "unlocks": []},
+            {"level": 2, "totalExpRequired": 175.0, "unlocks": []},
+        ])
+        xp = [0.0, 10.0, 50.0, 100.0, 175.0, 500.0]
+
+        levels = skill.levels_for_xp(np.array(xp))
+        self.assertEqual(levels.tolist(), [skill.level_for_xp(value) for value in xp])
+
+    @patch('requests.get')
+    def test_skills_level_for_xp(self, mock_get):
+        """
+        Test converting XP into levels by skill name.
+        """
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = self.sample_api_response
+
+        skills_manager = Skills()
+
+        self.assertEqual(skills_manager.level_for_xp("farming", 87.5), 1.5)
+        self.assertEqual(skills_manager.level_for_xp("SKILL_MINING", 175.0), 2.0)
+        with self.assertRaises(ValueError):
+            skills_manager.level_for_xp("Fishing", 10.0)
+
+    @patch('requests.get')
+    def test_levels_for_players(self, mock_get):
+        """
+        Test converting the skill experience of many players at once.
+        """
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = self.sample_api_response
+
+        skills_manager = Skills()
+        players = [
+            [SkillExperience("SKILL_FARMING", 125.0), SkillExperience("SKILL_COMBAT", 100.0)],
+            [SkillExperience("SKILL_FARMING", 25.0), SkillExperience("SKILL_RUNECRAFTING", 10.0)],
+            [],
+        ]
+
+        levels = skills_manager.levels_for_players(players)
+        self.assertEqual(set(levels), {"FARMING", "MINING", "COMBAT"})
+        self.assertEqual(levels["FARMING"].tolist(), [2.0, 0.5, 0.0])
+        self.assertEqual(levels["COMBAT"].tolist(), [1.5, 0.0, 0.0])
+        self.assertEqual(levels["MINING"].tolist(), [0.0, 0.0, 0.0])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from hypixel_api_lib.Profiles import SkyBlockProfile
+from hypixel_api_lib.Snapshots import SnapshotStore, extract_member_stats, BLOCKS_FILE, FIELDS_FILE, INDEX_FILE
+
+class TestSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "snapshots")
+        self.start = datetime(2024, 11, 1, tzinfo=timezone.utc)
+        self.sample_profile_data = {
+            "profile_id": "profile1",
+            "banking": {"balance": 1000.0, "transactions": []},
+            "members": {
+                "uuid1": {
+                    "player_data": {"experience": {"SKILL_FARMING": 100.0}},
+                    "slayer": {"slayer_bosses": {"zombie": {"xp": 50}}},
+                    "collection": {"WHEAT": 10},
+                    "currencies": {"coin_purse": 500.0},
+                    "dungeons": {"dungeon_types": {"catacombs": {"experience": 180.0}}, "player_classes": {"mage": {"experience": 75.0}}},
+                },
+            },
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _profile(self, farming: float, wheat: int | None = None) -> SkyBlockProfile:
+        member = self.sample_profile_data["members"]["uuid1"]
+        member["player_data"]["experience"]["SKILL_FARMING"] = farming
+        if wheat is not None:
+            member["collection"]["CARROT_ITEM"] = wheat
+        with patch("hypixel_api_lib.member.ProfileMember.get_username_from_uuid", return_value="Player"):
+            return SkyBlockProfile(self.sample_profile_data)
+
+    def test_extract_member_stats(self):
+        """Test flattening a member into stat fields."""
+        stats = extract_member_stats(self._profile(100.0).get_member("uuid1"), bank=1000.0)
+
+        self.assertEqual(stats["skill.SKILL_FARMING"], 100.0)
+        self.assertEqual(stats["slayer.zombie"], 50.0)
+        self.assertEqual(stats["collection.WHEAT"], 10.0)
+        self.assertEqual(stats["coins.purse"], 500.0)
+        self.assertEqual(stats["coins.bank"], 1000.0)
+        self.assertEqual(stats["dungeons.catacombs"], 180.0)
+        self.assertEqual(stats["dungeons.class.mage"], 75.0)
+        self.assertEqual(stats["dungeons.class.tank"], 0.0)
+
+    def test_diff_and_rates(self):
+        """Test deltas and hourly rates between two snapshots."""
+        with SnapshotStore(self.path, block_size=2) as store:
+            store.add_profile(self._profile(100.0), self.start)
+            store.add_profile(self._profile(160.0), self.start + timedelta(hours=2))
+            store.add_profile(self._profile(400.0, wheat=5), self.start + timedelta(hours=3))
+
+            diff = store.diff("uuid1", "profile1", self.start, self.start + timedelta(hours=2, minutes=30))
+            self.assertEqual(diff.deltas["skill.SKILL_FARMING"], 60.0)
+            self.assertEqual(diff.get_rates()["skill.SKILL_FARMING"], 30.0)
+            self.assertEqual(diff.get_changed(), {"skill.SKILL_FARMING": 60.0})
+
+            # New fields count from zero and the latest snapshot may still be buffered
+            latest = store.diff("uuid1", "profile1", self.start)
+            self.assertEqual(latest.deltas["collection.CARROT_ITEM"], 5.0)
+            self.assertEqual(latest.seconds, 3 * 3600)
+
+            with self.assertRaises(ValueError):
+                store.diff("uuid1", "profile1", self.start - timedelta(days=1))
+            self.assertIsNone(store.get_snapshot("missing", "profile1"))
+
+    def test_persistence(self):
+        """Test that snapshots survive reopening the store."""
+        with SnapshotStore(self.path) as store:
+            store.add_profile(self._profile(100.0), self.start)
+            store.add_profile(self._profile(200.0), self.start + timedelta(days=7))
+
+        store = SnapshotStore(self.path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get_timestamps("uuid1", "profile1"), [self.start, self.start + timedelta(days=7)])
+        snapshot = store.get_snapshot("uuid1", "profile1", self.start + timedelta(days=1))
+        self.assertEqual(snapshot.stats["skill.SKILL_FARMING"], 100.0)
+        self.assertEqual(snapshot.profile_id, "profile1")
+
+        store.add_profile(self._profile(300.0), self.start + timedelta(days=14))
+        store.close()
+        self.assertEqual(len(SnapshotStore(self.path)), 3)
+
+    def test_member_of_several_profiles(self):
+        """Test that snapshots of one member in different profiles are kept apart."""
+        with SnapshotStore(self.path, block_size=3) as store:
+            store.add_profile(self._profile(100.0), self.start)
+            self.sample_profile_data["profile_id"] = "profile2"
+            store.add_profile(self._profile(5000.0), self.start + timedelta(hours=1))
+            self.sample_profile_data["profile_id"] = "profile1"
+            store.add_profile(self._profile(130.0), self.start + timedelta(hours=2))
+            store.add_profile(self._profile(160.0), self.start + timedelta(hours=3))
+
+            self.assertEqual(store.diff("uuid1", "profile1", self.start, self.start + timedelta(hours=1)).deltas["skill.SKILL_FARMING"], 0.0)
+            self.assertEqual(store.diff("uuid1", "profile1", self.start).deltas["skill.SKILL_FARMING"], 60.0)
+            self.assertEqual(store.get_snapshot("uuid1", "profile2").stats["skill.SKILL_FARMING"], 5000.0)
+            with self.assertRaises(ValueError):
+                store.diff("uuid1", "profile2", self.start)
+
+        store = SnapshotStore(self.path)
+        self.assertEqual(sorted(store.get_profile_ids("uuid1")), ["profile1", "profile2"])
+        self.assertEqual(len(store.get_timestamps("uuid1", "profile1")), 3)
+        self.assertEqual(store.diff("uuid1", "profile1", self.start).deltas["skill.SKILL_FARMING"], 60.0)
+
+    def test_incomplete_block_is_ignored(self):
+        """Test that index entries pointing past the end of the block file are dropped."""
+        with SnapshotStore(self.path) as store:
+            store.add_profile(self._profile(100.0), self.start)
+        blocks = os.path.join(self.path, BLOCKS_FILE)
+        first_block_size = os.path.getsize(blocks)
+        with SnapshotStore(self.path) as store:
+            store.add_profile(self._profile(200.0), self.start + timedelta(days=1))
+
+        # Simulate a block file that lost its last block
+        with open(blocks, "r+b") as f:
+            f.truncate(first_block_size)
+
+        self.assertEqual(len(SnapshotStore(self.path)), 1)
+
+    def test_torn_writes_are_repaired(self):
+        """Test that torn tails of every file are dropped, so later snapshots are not misaligned."""
+        with SnapshotStore(self.path) as store:
+            store.add_stats("a" * 32, {"coins.purse": 1.0}, self.start, "profile1")
+        with open(os.path.join(self.path, INDEX_FILE), "ab") as f:
+            f.write(b"\x01" * 10)
+        with open(os.path.join(self.path, BLOCKS_FILE), "ab") as f:
+            f.write(b"\x00\x00\x00\x05\x00")
+        with open(os.path.join(self.path, FIELDS_FILE), "a", encoding="utf-8") as f:
+            f.write("coins.ba")
+
+        with SnapshotStore(self.path) as store:
+            self.assertEqual(len(store), 1)
+            store.add_stats("b" * 32, {"coins.bank": 2.0}, self.start, "profile2")
+
+        store = SnapshotStore(self.path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get_profile_ids("b" * 32), ["profile2"])
+        self.assertEqual(store.get_snapshot("b" * 32, "profile2").stats, {"coins.bank": 2.0})
+        self.assertEqual(store.get_snapshot("a" * 32, "profile1").stats, {"coins.purse": 1.0})
+
+    def test_rejects_long_identifiers(self):
+        """Test that identifiers that do not fit the index are rejected."""
+        store = SnapshotStore(self.path)
+        with self.assertRaises(ValueError):
+            store.add_stats("x" * 37, {"coins.purse": 1.0})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+import requests
+
+from hypixel_api_lib.Auctions import ActiveAuctions, PlayerAuctions
+from hypixel_api_lib.transport import RetryPolicy, Transport, parse_retry_after, DEFAULT_TIMEOUT, DEFAULT_TRANSPORT, NO_RETRY_TRANSPORT
+from helpers import make_response
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_is_jittered_and_capped(self):
+        """Test the exponential backoff ceiling and full jitter."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        self.assertEqual([policy.get_backoff(attempt, lambda: 0.999999) for attempt in (1, 2, 3, 4)], [
+            1.0 * 0.999999, 2.0 * 0.999999, 4.0 * 0.999999, 5.0 * 0.999999,
+        ])
+        self.assertEqual(policy.get_backoff(3, lambda: 0.0), 0.0)
+
+    def test_retry_decisions(self):
+        """Test which responses and errors are retried."""
+        policy = RetryPolicy(max_attempts=3, max_retry_after=10)
+        rng = lambda: 0.5
+        self.assertEqual(policy.get_response_delay(make_response(502), 1, rng), 0.25)
+        self.assertIsNone(policy.get_response_delay(make_response(502), 3, rng))
+        self.assertIsNone(policy.get_response_delay(make_response(403), 1, rng))
+        self.assertIsNone(policy.get_response_delay(make_response(200), 1, rng))
+        self.assertIsNone(policy.get_response_delay(make_response(429), 1, rng))
+        self.assertEqual(policy.get_response_delay(make_response(429, headers={"Retry-After": "7"}), 1, rng), 7.0)
+        self.assertIsNone(policy.get_response_delay(make_response(429, headers={"Retry-After": "30"}), 1, rng))
+        self.assertEqual(policy.get_response_delay(make_response(503, headers={"RateLimit-Reset": "3"}), 1, rng), 3.0)
+
+        self.assertEqual(policy.get_error_delay(requests.exceptions.ConnectTimeout(), 1, rng), 0.25)
+        self.assertEqual(policy.get_error_delay(requests.exceptions.ConnectionError(), 2, rng), 0.5)
+        self.assertIsNone(policy.get_error_delay(requests.exceptions.ConnectionError(), 3, rng))
+        self.assertIsNone(policy.get_error_delay(requests.exceptions.InvalidURL(), 1, rng))
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_parse_retry_after(self):
+        """Test reading delays in seconds and as HTTP dates."""
+        self.assertEqual(parse_retry_after(make_response(429, headers={"Retry-After": "12"})), 12.0)
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(make_response(429, headers={"Retry-After": retry_at})), 30, delta=2)
+        self.assertIsNone(parse_retry_after(make_response(429, headers={"Retry-After": "soon"})))
+        self.assertIsNone(parse_retry_after(make_response(429)))
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.transport = Transport(RetryPolicy(max_attempts=3), sleep=self.delays.append, rng=lambda: 0.5)
+
+    @patch("requests.get")
+    def test_retries_until_success(self, mock_get):
+        """Test that transient failures are retried and the final response returned."""
+        ok = make_response(200, {"success": True})
+        mock_get.side_effect = [requests.exceptions.ConnectionError("reset"), make_response(502), ok]
+
+        self.assertIs(self.transport.get("url", params={"page": 1}), ok)
+        self.assertEqual(self.delays, [0.25, 0.5])
+        self.assertEqual(self.transport.retries, 2)
+        mock_get.assert_called_with("url", params={"page": 1})
+
+    @patch("requests.get")
+    def test_gives_up(self, mock_get):
+        """Test that the last failure is surfaced once attempts run out."""
+        mock_get.return_value = make_response(503)
+        self.assertEqual(self.transport.get("url").status_code, 503)
+        self.assertEqual(mock_get.call_count, 3)
+
+        mock_get.reset_mock()
+        mock_get.side_effect = requests.exceptions.ReadTimeout("timed out")
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.transport.get("url")
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("requests.get")
+    def test_per_endpoint_policy_and_timeout(self, mock_get):
+        """Test that endpoints can have their own policy and that the timeout is passed on."""
+        transport = Transport(policies={"fast": RetryPolicy(max_attempts=1)}, timeout=10, sleep=self.delays.append)
+        mock_get.return_value = make_response(502)
+
+        transport.get("fast")
+        self.assertEqual(mock_get.call_count, 1)
+        mock_get.assert_called_with("fast", params=None, timeout=10)
+        self.assertEqual(transport.get_policy("other").max_attempts, 4)
+
+    @patch("requests.get")
+    def test_shared_transports_time_out(self, mock_get):
+        """Test that the shared transports never wait forever for a response."""
+        mock_get.return_value = make_response(200)
+        for transport in (DEFAULT_TRANSPORT, NO_RETRY_TRANSPORT):
+            transport.get("url")
+            mock_get.assert_called_with("url", params=None, timeout=DEFAULT_TIMEOUT)
+
+    @patch("requests.get")
+    def test_sweep_survives_transient_error(self, mock_get):
+        """Test that a transient 502 on one page does not abort a full auction sweep."""
+        failed = []
+        def get(url, params=None, **kwargs):
+            if params["page"] == 1 and not failed:
+                failed.append(1)
+                return make_response(502)
+            return make_response(200, {
+                "success": True, "page": params["page"], "totalPages": 3, "totalAuctions": 3,
+                "auctions": [{"uuid": f"auction{params['page']}"}],
+            })
+        mock_get.side_effect = get
+
+        auctions = ActiveAuctions(transport=self.transport).get_all_auctions()
+        self.assertEqual([auction.uuid for auction in auctions], ["auction0", "auction1", "auction2"])
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(self.delays, [0.25])
+
+    @patch("requests.get")
+    def test_player_auctions_honor_retry_after(self, mock_get):
+        """Test that a rate limit with Retry-After is waited out, and reported when attempts run out."""
+        throttled = make_response(429, {"success": False, "cause": "Key throttle"}, headers={"Retry-After": "2"})
+        mock_get.side_effect = [throttled, make_response(200, {"success": True, "auctions": []})]
+        player_auctions = PlayerAuctions("test_api_key", transport=self.transport)
+
+        self.assertEqual(player_auctions.get_auctions_by_player_uuid("player1"), [])
+        self.assertEqual(self.delays, [2.0])
+
+        mock_get.side_effect = None
+        mock_get.return_value = throttled
+        with self.assertRaises(ConnectionError) as context:
+            player_auctions.get_auctions_by_player_uuid("player1")
+        self.assertEqual(str(context.exception), "Rate Limit Exceeded (429): Key throttle")
+
+if __name__ == "__main__":
+    unittest.main()